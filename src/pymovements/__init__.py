@@ -17,37 +17,55 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-"""Provides top-level access to submodules."""
-from pymovements import _version
-from pymovements import datasets
-from pymovements import events
-from pymovements import exceptions
-from pymovements import gaze
-from pymovements import measure
-from pymovements import plotting
-from pymovements import reading_measures
-from pymovements import stimulus
-from pymovements import synthetic
-from pymovements import utils
-from pymovements.dataset import Dataset
-from pymovements.dataset import DatasetDefinition
-from pymovements.dataset import DatasetLibrary
-from pymovements.dataset import DatasetPaths
-from pymovements.dataset import register_dataset
-from pymovements.dataset import ResourceDefinition
-from pymovements.dataset import ResourceDefinitions
-from pymovements.events import EventDataFrame
-from pymovements.events import EventGazeProcessor
-from pymovements.events import EventProcessor
-from pymovements.events import Events
-from pymovements.gaze import Experiment
-from pymovements.gaze import EyeTracker
-from pymovements.gaze import Gaze
-from pymovements.gaze import GazeDataFrame
-from pymovements.gaze import Screen
-from pymovements.measure import register_sample_measure
-from pymovements.measure import SampleMeasureLibrary
-from pymovements.stimulus import text
+"""Provides top-level access to submodules.
+
+Submodules and their members are imported lazily on first attribute access. This keeps
+``import pymovements`` fast, as heavy dependencies like matplotlib and scipy and the registry of
+shipped datasets are only loaded when they are actually used.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pymovements import datasets
+    from pymovements import events
+    from pymovements import exceptions
+    from pymovements import gaze
+    from pymovements import measure
+    from pymovements import plotting
+    from pymovements import reading_measures
+    from pymovements import stimulus
+    from pymovements import synthetic
+    from pymovements import utils
+    from pymovements.dataset import Dataset
+    from pymovements.dataset import DatasetDefinition
+    from pymovements.dataset import DatasetLibrary
+    from pymovements.dataset import DatasetPaths
+    from pymovements.dataset import PipelineCache
+    from pymovements.dataset import register_dataset
+    from pymovements.dataset import ResourceDefinition
+    from pymovements.dataset import ResourceDefinitions
+    from pymovements.events import EventDataFrame
+    from pymovements.events import EventGazeProcessor
+    from pymovements.events import EventProcessor
+    from pymovements.events import Events
+    from pymovements.gaze import Experiment
+    from pymovements.gaze import EyeTracker
+    from pymovements.gaze import Gaze
+    from pymovements.gaze import GazeDataFrame
+    from pymovements.gaze import GazeStreamServer
+    from pymovements.gaze import Instrumentation
+    from pymovements.gaze import LiveGaze
+    from pymovements.gaze import Screen
+    from pymovements.gaze import VisualAngleConverter
+    from pymovements.measure import register_sample_measure
+    from pymovements.measure import SampleMeasureLibrary
+    from pymovements.stimulus import text
+
+    __version__: str
 
 
 __all__ = [
@@ -56,6 +74,7 @@ __all__ = [
     'DatasetLibrary',
     'DatasetPaths',
     'datasets',
+    'PipelineCache',
     'register_dataset',
     'ResourceDefinition',
     'ResourceDefinitions',
@@ -70,8 +89,12 @@ __all__ = [
     'Experiment',
     'EyeTracker',
     'Screen',
+    'VisualAngleConverter',
     'Gaze',
     'GazeDataFrame',
+    'GazeStreamServer',
+    'Instrumentation',
+    'LiveGaze',
 
     'exceptions',
 
@@ -88,4 +111,71 @@ __all__ = [
     'text',
 ]
 
-__version__ = _version.get_versions()['version']
+_SUBMODULES = {
+    'datasets',
+    'events',
+    'exceptions',
+    'gaze',
+    'measure',
+    'plotting',
+    'reading_measures',
+    'stimulus',
+    'synthetic',
+    'utils',
+}
+
+# Maps the names of lazily imported members to the modules they are imported from.
+_MEMBER_MODULES = {
+    'Dataset': 'pymovements.dataset',
+    'DatasetDefinition': 'pymovements.dataset',
+    'DatasetLibrary': 'pymovements.dataset',
+    'DatasetPaths': 'pymovements.dataset',
+    'PipelineCache': 'pymovements.dataset',
+    'register_dataset': 'pymovements.dataset',
+    'ResourceDefinition': 'pymovements.dataset',
+    'ResourceDefinitions': 'pymovements.dataset',
+    'EventDataFrame': 'pymovements.events',
+    'EventGazeProcessor': 'pymovements.events',
+    'EventProcessor': 'pymovements.events',
+    'Events': 'pymovements.events',
+    'Experiment': 'pymovements.gaze',
+    'EyeTracker': 'pymovements.gaze',
+    'Gaze': 'pymovements.gaze',
+    'GazeDataFrame': 'pymovements.gaze',
+    'GazeStreamServer': 'pymovements.gaze',
+    'Instrumentation': 'pymovements.gaze',
+    'LiveGaze': 'pymovements.gaze',
+    'Screen': 'pymovements.gaze',
+    'VisualAngleConverter': 'pymovements.gaze',
+    'register_sample_measure': 'pymovements.measure',
+    'SampleMeasureLibrary': 'pymovements.measure',
+    'text': 'pymovements.stimulus',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules and their members on first access.
+
+    Importing pymovements only imports the modules which are accessed. Dependencies which are
+    slow to import and only needed by a few functions, e.g. scipy and matplotlib, are imported
+    inside these functions for the same reason.
+    """
+    if name in _SUBMODULES:
+        value = importlib.import_module(f'{__name__}.{name}')
+    elif name in _MEMBER_MODULES:
+        value = getattr(importlib.import_module(_MEMBER_MODULES[name]), name)
+    elif name == '__version__':
+        # Computing the version may call git, so it is deferred as well.
+        from pymovements import _version  # pylint: disable=import-outside-toplevel
+        value = _version.get_versions()['version']
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    # Cache the value so that this function is only called once for each name.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List all module attributes including the lazily imported ones."""
+    return sorted(set(globals()) | set(__all__) | {'__version__'})
@@ -20,8 +20,17 @@
 """Provides path specific funtions."""
 from __future__ import annotations
 
+import json
+import os
 import re
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from pathlib import Path
+from typing import Any
 
 
 def get_filepaths(
@@ -76,14 +85,202 @@ def get_filepaths(
     return filepaths
 
 
+def list_directory(path: Path) -> tuple[list[str], list[str]]:
+    """List the names of all subdirectories and files in a directory.
+
+    Parameters
+    ----------
+    path: Path
+        Path to the directory.
+
+    Returns
+    -------
+    tuple[list[str], list[str]]
+        Sorted names of subdirectories and sorted names of files.
+    """
+    dirnames = []
+    filenames = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirnames.append(entry.name)
+            else:
+                filenames.append(entry.name)
+    return sorted(dirnames), sorted(filenames)
+
+
+class DirectoryIndex:
+    """Persisted index of directory listings.
+
+    Listing large directory trees can be slow, especially on network storage. The index stores
+    the listing of each visited directory together with its modification time. As adding,
+    removing or renaming an entry updates the modification time of its parent directory, a
+    directory only needs to be listed again if its modification time has changed.
+
+    Parameters
+    ----------
+    filepath: str | Path
+        Path to the index file. Directories are stored relative to the parent directory of the
+        index file. The index file is created on the first call of :py:meth:`write`.
+
+    Attributes
+    ----------
+    racy_interval: float
+        Listings of directories modified less than this many seconds before being listed are not
+        trusted on the next lookup, as further modifications in the same timestamp tick would go
+        unnoticed. (default: 2.0)
+    """
+
+    racy_interval: float = 2.0
+
+    def __init__(self, filepath: str | Path):
+        self.filepath = Path(filepath)
+
+        self.directories: dict[str, dict[str, Any]] = {}
+        if self.filepath.is_file():
+            with open(self.filepath, encoding='utf-8') as f:
+                self.directories = json.load(f).get('directories', {})
+
+        self._visited: set[str] = set()
+        self._modified = False
+
+    def list_directory(self, path: Path) -> tuple[list[str], list[str]]:
+        """List the names of all subdirectories and files in a directory.
+
+        The directory is only listed if it is not indexed yet or if its modification time has
+        changed since it has been indexed.
+
+        Parameters
+        ----------
+        path: Path
+            Path to the directory.
+
+        Returns
+        -------
+        tuple[list[str], list[str]]
+            Sorted names of subdirectories and sorted names of files.
+        """
+        key = os.path.relpath(path, self.filepath.parent)
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        record = self.directories.get(key)
+        if record is None or record['mtime_ns'] != mtime_ns:
+            dirnames, filenames = list_directory(path)
+            is_racy = time.time_ns() - mtime_ns < self.racy_interval * 1e9
+            record = {
+                'mtime_ns': None if is_racy else mtime_ns,
+                'dirs': dirnames,
+                'files': filenames,
+            }
+            self.directories[key] = record
+            self._modified = True
+
+        self._visited.add(key)
+        return record['dirs'], record['files']
+
+    def write(self) -> None:
+        """Write the index file if any directory listing has changed.
+
+        Directories which have not been listed since the index has been loaded are removed from
+        the index.
+        """
+        unvisited = set(self.directories) - self._visited
+        if not self._modified and not unvisited:
+            return
+
+        for key in unvisited:
+            del self.directories[key]
+
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_filepath = self.filepath.with_name(self.filepath.name + '.tmp')
+        with open(tmp_filepath, 'w', encoding='utf-8') as f:
+            json.dump({'directories': self.directories}, f)
+        os.replace(tmp_filepath, self.filepath)
+        self._modified = False
+
+
+def walk_directory(
+        path: Path,
+        *,
+        index: DirectoryIndex | None = None,
+        max_workers: int = 1,
+) -> list[tuple[Path, list[str]]]:
+    """Walk a directory tree and list the files of each directory.
+
+    Listing directories on network storage is dominated by latency. With ``max_workers > 1``,
+    subdirectories are listed concurrently by a pool of threads as soon as they are discovered.
+    The result does not depend on the number of workers.
+
+    Parameters
+    ----------
+    path: Path
+        Root path to be traversed.
+    index: DirectoryIndex | None
+        Use this index for listing directories. If None, all directories are listed.
+        (default: None)
+    max_workers: int
+        Maximum number of threads listing directories concurrently. (default: 1)
+
+    Returns
+    -------
+    list[tuple[Path, list[str]]]
+        Path and sorted filenames of each directory. Subdirectories are sorted alphabetically and
+        precede their parent directory.
+
+    Raises
+    ------
+    ValueError
+        If ``max_workers`` is not positive.
+    """
+    if max_workers < 1:
+        raise ValueError(f'max_workers must be positive, but is {max_workers}')
+
+    list_function: Callable[[Path], tuple[list[str], list[str]]]
+    list_function = list_directory if index is None else index.list_directory
+
+    listings: dict[Path, tuple[list[str], list[str]]] = {}
+    if max_workers == 1:
+        dirpaths = [path]
+        while dirpaths:
+            dirpath = dirpaths.pop()
+            listings[dirpath] = list_function(dirpath)
+            dirpaths.extend(dirpath / dirname for dirname in listings[dirpath][0])
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: dict[Future, Path] = {executor.submit(list_function, path): path}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dirpath = pending.pop(future)
+                    listings[dirpath] = future.result()
+                    for dirname in listings[dirpath][0]:
+                        subdirpath = dirpath / dirname
+                        pending[executor.submit(list_function, subdirpath)] = subdirpath
+
+    walk: list[tuple[Path, list[str]]] = []
+
+    def visit(dirpath: Path) -> None:
+        dirnames, filenames = listings[dirpath]
+        for dirname in dirnames:
+            visit(dirpath / dirname)
+        walk.append((dirpath, filenames))
+
+    visit(path)
+    return walk
+
+
 def match_filepaths(
         path: str | Path,
         regex: re.Pattern,
         relative: bool = True,
         relative_anchor: Path | None = None,
+        index: DirectoryIndex | None = None,
+        max_workers: int = 1,
 ) -> list[dict[str, str]]:
     """Traverse path and match regular expression.
 
+    Subdirectories and files are traversed in alphabetical order.
+
     Parameters
     ----------
     path: str | Path
@@ -95,6 +292,11 @@ def match_filepaths(
     relative_anchor: Path | None
         Specifies root path in case of ``relative == True``. If None, ``path`` will be chosen
         as `relative_anchor` for recursive calls. (default: None)
+    index: DirectoryIndex | None
+        Use this index for listing directories. If None, all directories are listed.
+        (default: None)
+    max_workers: int
+        Maximum number of threads listing directories concurrently. (default: 1)
 
     Returns
     -------
@@ -104,7 +306,7 @@ def match_filepaths(
     Raises
     ------
     ValueError
-        If ``path`` does not point to a directory.
+        If ``path`` does not point to a directory or if ``max_workers`` is not positive.
     """
     path = Path(path)
 
@@ -118,22 +320,17 @@ def match_filepaths(
         relative_anchor = path
 
     match_dicts: list[dict[str, str]] = []
-    for childpath in path.iterdir():
-        if childpath.is_dir():
-            recursive_results = match_filepaths(
-                path=childpath, regex=regex,
-                relative=relative, relative_anchor=relative_anchor,
-            )
-            match_dicts.extend(recursive_results)
-        elif match := regex.match(childpath.name):
-            match_dict = match.groupdict()
-
-            filepath = childpath
-            if relative:
-                # mypy is unaware that 'relative_anchor' can never be None (l.116)
-                assert relative_anchor is not None
-                filepath = filepath.relative_to(relative_anchor)
-
-            match_dict['filepath'] = str(filepath)
-            match_dicts.append(match_dict)
+    for dirpath, filenames in walk_directory(path, index=index, max_workers=max_workers):
+        for filename in filenames:
+            if match := regex.match(filename):
+                match_dict = match.groupdict()
+
+                filepath = dirpath / filename
+                if relative:
+                    # mypy is unaware that 'relative_anchor' can never be None
+                    assert relative_anchor is not None
+                    filepath = filepath.relative_to(relative_anchor)
+
+                match_dict['filepath'] = str(filepath)
+                match_dicts.append(match_dict)
     return match_dicts
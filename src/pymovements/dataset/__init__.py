@@ -23,6 +23,8 @@ from pymovements.dataset.dataset_definition import DatasetDefinition
 from pymovements.dataset.dataset_library import DatasetLibrary
 from pymovements.dataset.dataset_library import register_dataset
 from pymovements.dataset.dataset_paths import DatasetPaths
+from pymovements.dataset.lazy_gaze_list import LazyGazeList
+from pymovements.dataset.pipeline_cache import PipelineCache
 from pymovements.dataset.resources import ResourceDefinition
 from pymovements.dataset.resources import ResourceDefinitions
 
@@ -32,6 +34,8 @@ __all__ = [
     'DatasetDefinition',
     'DatasetLibrary',
     'DatasetPaths',
+    'LazyGazeList',
+    'PipelineCache',
     'register_dataset',
     'ResourceDefinition',
     'ResourceDefinitions',
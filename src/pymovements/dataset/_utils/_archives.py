@@ -29,6 +29,11 @@ import sys
 import tarfile
 import zipfile
 from collections.abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from functools import partial
 from pathlib import Path
 from typing import IO
 
@@ -47,12 +52,18 @@ def extract_archive(
         remove_top_level: bool = True,
         resume: bool = True,
         verbose: int = 1,
+        member_filter: Callable[[str], bool] | None = None,
+        max_workers: int = 1,
 ) -> Path:
     """Extract an archive.
 
     The archive type and a possible compression is automatically detected from the file name.
     If the file is compressed but not an archive the call is dispatched to :func:`_decompress`.
 
+    If a ``member_filter`` is specified, only archive members whose file name passes the filter are
+    extracted. Directories and nested archives are always extracted, with the filter being applied
+    to the members of nested archives as well.
+
     Parameters
     ----------
     source_path: Path
@@ -73,12 +84,26 @@ def extract_archive(
         Verbosity levels: (1) Print messages for extracting each dataset resource without printing
         messages for recursive archives. (2) Print additional messages for each recursive archive
         extract. (default: 1)
+    member_filter: Callable[[str], bool] | None
+        Callable that is passed the file name of each archive member. Members for which it returns
+        ``False`` are not extracted. If ``None``, all members are extracted. (default: None)
+    max_workers: int
+        Maximum number of threads used for extracting zip archive members and nested archives
+        concurrently. Members of tar archives are always extracted sequentially. (default: 1)
 
     Returns
     -------
     Path
         Path to the directory the file was extracted to.
+
+    Raises
+    ------
+    ValueError
+        If ``max_workers`` is not a positive integer.
     """
+    if max_workers < 1:
+        raise ValueError(f'max_workers must be positive, but is {max_workers}')
+
     archive_type, compression_type = _detect_file_type(source_path)
 
     if not archive_type:
@@ -104,6 +129,8 @@ def extract_archive(
         compression_type,
         resume=resume,
         verbose=verbose,
+        member_filter=member_filter,
+        max_workers=max_workers,
     )
     if remove_finished:
         source_path.unlink()
@@ -124,28 +151,37 @@ def extract_archive(
 
     if recursive:
         # Get filepaths of all archives in extracted directory.
-        archive_extensions = [
-            *_ARCHIVE_EXTRACTORS.keys(),
-            *_ARCHIVE_TYPE_ALIASES.keys(),
-            *_COMPRESSED_FILE_OPENERS.keys(),
-        ]
-        archive_filepaths = get_filepaths(path=destination_path, extension=archive_extensions)
+        archive_filepaths = get_filepaths(path=destination_path, extension=_get_valid_suffixes())
         archive_filepaths = [filepath for filepath in archive_filepaths if filepath != source_path]
 
-        # Extract all found archives.
-        for archive_filepath in archive_filepaths:
-            extract_destination = archive_filepath.parent / archive_filepath.stem
-
-            extract_archive(
+        def extract_nested_archive(archive_filepath: Path, nested_max_workers: int) -> Path:
+            return extract_archive(
                 source_path=archive_filepath,
-                destination_path=extract_destination,
+                destination_path=archive_filepath.parent / archive_filepath.stem,
                 recursive=recursive,
                 remove_finished=remove_finished,
                 remove_top_level=remove_top_level,
                 verbose=0 if verbose < 2 else 2,
                 resume=resume,
+                member_filter=member_filter,
+                max_workers=nested_max_workers,
             )
 
+        # Extract all found archives. Each nested archive has its own destination directory.
+        if max_workers == 1 or len(archive_filepaths) < 2:
+            for archive_filepath in archive_filepaths:
+                extract_nested_archive(archive_filepath, nested_max_workers=max_workers)
+        else:
+            # Each nested archive is extracted by a single thread, so that no more than
+            # max_workers threads are used.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Consume the results to raise the first error of any nested extraction.
+                list(
+                    executor.map(
+                        partial(extract_nested_archive, nested_max_workers=1), archive_filepaths,
+                    ),
+                )
+
     return destination_path
 
 
@@ -156,9 +192,14 @@ def _extract_tar(
         *,
         resume: bool,
         verbose: int,
+        member_filter: Callable[[str], bool] | None = None,
+        max_workers: int = 1,  # pylint: disable=unused-argument
 ) -> None:
     """Extract a tar archive.
 
+    Tar archives can only be read sequentially, which is why members are always extracted one after
+    another.
+
     Parameters
     ----------
     source_path: Path
@@ -171,22 +212,26 @@ def _extract_tar(
         Resume if archive was already previous extracted.
     verbose: int
         Print messages for resuming each dataset resource.
+    member_filter: Callable[[str], bool] | None
+        Only extract members whose file name passes this filter. (default: None)
+    max_workers: int
+        Unused, kept for a common signature of all archive extractors. (default: 1)
     """
     mode = f'r:{compression[1:]}' if compression else 'r'
 
     # ignore mypy error for now, see issue #1020
     with tarfile.open(source_path, mode) as archive:  # type: ignore[call-overload]
-        for member in tqdm(archive.getmembers()):
-            if resume:
-                member_dest_path = os.path.join(destination_path, member.name)
-                if (
-                        os.path.exists(member_dest_path) and
-                        member.name[-4:] in _ARCHIVE_EXTRACTORS and
-                        member.size == os.path.getsize(member_dest_path)
-                ):
-                    if verbose:
-                        print(f'Skipping {member.name} due to previous extraction')
-                    continue
+        members = [
+            member for member in archive.getmembers()
+            if member.isdir() or _is_selected_member(member.name, member_filter)
+        ]
+        for member in tqdm(members):
+            if resume and _is_previously_extracted(
+                    os.path.join(destination_path, member.name), member.name, member.size,
+            ):
+                if verbose:
+                    print(f'Skipping {member.name} due to previous extraction')
+                continue
             if sys.version_info < (3, 12):  # pragma: <3.12 cover
                 archive.extract(member.name, destination_path)
             else:  # pragma: >=3.12 cover
@@ -200,9 +245,14 @@ def _extract_zip(
         *,
         resume: bool,
         verbose: int,
+        member_filter: Callable[[str], bool] | None = None,
+        max_workers: int = 1,
 ) -> None:
     """Extract a zip archive.
 
+    Zip archives support random access, so members can be extracted by several threads, each
+    reading from its own handle of the archive.
+
     Parameters
     ----------
     source_path: Path
@@ -215,21 +265,198 @@ def _extract_zip(
         Resume if archive was already previous extracted.
     verbose: int
         Print messages for resuming each dataset resource.
+    member_filter: Callable[[str], bool] | None
+        Only extract members whose file name passes this filter. (default: None)
+    max_workers: int
+        Maximum number of threads used for extracting members concurrently. (default: 1)
     """
     compression_id = _ZIP_COMPRESSION_MAP[compression] if compression else zipfile.ZIP_STORED
     with zipfile.ZipFile(source_path, 'r', compression=compression_id) as archive:
-        for member in tqdm(archive.filelist):
-            if resume:
-                member_dest_path = os.path.join(destination_path, member.filename)
-                if (
-                    os.path.exists(member_dest_path) and
-                    member.filename[-4:] in _ARCHIVE_EXTRACTORS and
-                    member.file_size == os.path.getsize(member_dest_path)
-                ):
-                    if verbose:
-                        print(f'Skipping {member.filename} due to previous extraction')
-                    continue
-            archive.extract(member.filename, destination_path)
+        members = []
+        for member in archive.filelist:
+            if not member.is_dir() and not _is_selected_member(member.filename, member_filter):
+                continue
+            if resume and _is_previously_extracted(
+                os.path.join(destination_path, member.filename), member.filename, member.file_size,
+            ):
+                if verbose:
+                    print(f'Skipping {member.filename} due to previous extraction')
+                continue
+            members.append(member)
+
+        if max_workers == 1 or len(members) < 2:
+            for member in tqdm(members):
+                archive.extract(member.filename, destination_path)
+            return
+
+        # Directory members are created upfront, the files are extracted concurrently.
+        for member in members:
+            if member.is_dir():
+                archive.extract(member.filename, destination_path)
+        file_members = [member for member in members if not member.is_dir()]
+
+    progress_bar = tqdm(total=len(file_members))
+
+    def extract_members(chunk: list[zipfile.ZipInfo]) -> None:
+        with zipfile.ZipFile(source_path, 'r', compression=compression_id) as chunk_archive:
+            for member in chunk:
+                try:
+                    chunk_archive.extract(member.filename, destination_path)
+                except FileExistsError:
+                    # Another thread created a parent directory of the member after it was
+                    # checked for by ZipFile.extract. The directory exists now.
+                    chunk_archive.extract(member.filename, destination_path)
+                progress_bar.update(1)
+
+    # Distribute members round-robin to balance chunks of differently sized files.
+    chunks = [file_members[worker::max_workers] for worker in range(max_workers)]
+    with progress_bar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results to raise the first error of any worker.
+        list(executor.map(extract_members, [chunk for chunk in chunks if chunk]))
+
+
+def _is_selected_member(member_name: str, member_filter: Callable[[str], bool] | None) -> bool:
+    """Check if an archive member is to be extracted.
+
+    Nested archives are always selected, as their members are filtered after extraction.
+    """
+    if member_filter is None:
+        return True
+    filename = os.path.basename(member_name.rstrip('/'))
+    if Path(filename).suffix in _get_valid_suffixes():
+        return True
+    return member_filter(filename)
+
+
+def _is_previously_extracted(member_dest_path: str, member_name: str, member_size: int) -> bool:
+    """Check if a nested archive member was already extracted with the correct size."""
+    return (
+        os.path.exists(member_dest_path) and
+        member_name[-4:] in _ARCHIVE_EXTRACTORS and
+        member_size == os.path.getsize(member_dest_path)
+    )
+
+
+def list_archive_members(source_path: Path) -> list[str]:
+    """List the names of all regular file members of an archive.
+
+    Nested archives are listed as members but are not opened.
+
+    Parameters
+    ----------
+    source_path: Path
+        Path to the archive.
+
+    Returns
+    -------
+    list[str]
+        Names of all file members in the archive in archive order.
+
+    Raises
+    ------
+    UnknownFileType
+        If the file is not an archive.
+    """
+    archive_type, compression_type = _detect_archive_type(source_path)
+
+    if archive_type == '.zip':
+        with zipfile.ZipFile(source_path, 'r') as archive:
+            return [member.filename for member in archive.infolist() if not member.is_dir()]
+
+    tar_members = _index_tar_members(source_path, compression_type)
+    return [name for name, member in tar_members.items() if member.isfile()]
+
+
+@contextmanager
+def open_archive_member(source_path: Path, member_name: str) -> Iterator[IO]:
+    """Open a file member of an archive for reading without extracting it.
+
+    Tar archives are indexed on first access, so that subsequent members are opened without
+    reading all member headers again. Members of compressed tar archives still need to be
+    decompressed from the start of the archive.
+
+    Parameters
+    ----------
+    source_path: Path
+        Path to the archive.
+    member_name: str
+        Name of the member in the archive.
+
+    Yields
+    ------
+    IO
+        Binary file object of the archive member.
+
+    Raises
+    ------
+    FileNotFoundError
+        If there is no file member with this name in the archive.
+    UnknownFileType
+        If the file is not an archive.
+    """
+    archive_type, compression_type = _detect_archive_type(source_path)
+
+    if archive_type == '.zip':
+        with zipfile.ZipFile(source_path, 'r') as archive:
+            try:
+                member_info = archive.getinfo(member_name)
+            except KeyError as exception:
+                raise FileNotFoundError(
+                    f"No member '{member_name}' in archive '{source_path}'.",
+                ) from exception
+            with archive.open(member_info, 'r') as member_file:
+                yield member_file
+        return
+
+    tar_member = _index_tar_members(source_path, compression_type).get(member_name)
+    if tar_member is None or not tar_member.isfile():
+        raise FileNotFoundError(f"No member '{member_name}' in archive '{source_path}'.")
+
+    mode = f'r:{compression_type[1:]}' if compression_type else 'r'
+    # ignore mypy error for now, see issue #1020
+    with tarfile.open(source_path, mode) as archive:  # type: ignore[call-overload]
+        # The indexed member holds the data offset, so no member headers need to be read here.
+        with archive.extractfile(tar_member) as member_file:
+            yield member_file
+
+
+def _detect_archive_type(source_path: Path) -> tuple[str, str | None]:
+    """Detect the archive type of a file and raise an error if it is not an archive."""
+    archive_type, compression_type = _detect_file_type(source_path)
+    if archive_type is None:
+        raise UnknownFileType(
+            f"File '{source_path}' is a compressed file but not an archive.",
+        )
+    return archive_type, compression_type
+
+
+def _index_tar_members(
+        source_path: Path,
+        compression: str | None,
+) -> dict[str, tarfile.TarInfo]:
+    """Get all members of a tar archive by name.
+
+    The index is cached as long as the modification time and size of the archive are unchanged.
+    """
+    stat = source_path.stat()
+    return _read_tar_members(str(source_path), compression, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _read_tar_members(
+        source_path: str,
+        compression: str | None,
+        mtime_ns: int,  # pylint: disable=unused-argument
+        size: int,  # pylint: disable=unused-argument
+) -> dict[str, tarfile.TarInfo]:
+    """Read all members of a tar archive by name.
+
+    The modification time and size of the archive are only part of the cache key.
+    """
+    mode = f'r:{compression[1:]}' if compression else 'r'
+    # ignore mypy error for now, see issue #1020
+    with tarfile.open(source_path, mode) as archive:  # type: ignore[call-overload]
+        return {member.name: member for member in archive.getmembers()}
 
 
 _ARCHIVE_EXTRACTORS = {
@@ -21,6 +21,10 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
+import re
+import urllib.error
 import urllib.request
 from pathlib import Path
 from typing import Any
@@ -31,6 +35,8 @@ from pymovements._version import get_versions
 
 USER_AGENT: str = f"pymovements/{get_versions()['version']}"
 
+VERIFIED_SUFFIX: str = '.verified.json'
+
 
 def download_file(
         url: str,
@@ -40,6 +46,7 @@ def download_file(
         *,
         max_redirect_hops: int = 3,
         verbose: bool = True,
+        position: int | None = None,
 ) -> Path:
     """Download a file from a URL and place it in root.
 
@@ -57,6 +64,10 @@ def download_file(
         Maximum number of redirect hops allowed. (default: 3)
     verbose : bool
         If True, show progress bar and print info messages on downloading file. (default: True)
+    position : int | None
+        Line offset of the progress bar. Concurrent downloads need distinct positions so that
+        their progress bars don't overwrite each other. If None, the position is chosen by tqdm.
+        (default: None)
 
     Returns
     -------
@@ -88,7 +99,9 @@ def download_file(
 
     # download the file
     try:
-        _download_url(url=url, destination=filepath, verbose=verbose)
+        file_md5 = _download_url(
+            url=url, destination=filepath, verbose=verbose, position=position,
+        )
 
     except OSError as e:
         if url[:5] == 'https':
@@ -97,15 +110,19 @@ def download_file(
 
             if verbose:
                 print(f'Downloading {url} to {filepath}')
-            _download_url(url=url, destination=filepath, verbose=verbose)
+            file_md5 = _download_url(
+                url=url, destination=filepath, verbose=verbose, position=position,
+            )
         else:
             raise e
 
-    # check integrity of downloaded file
+    # check integrity of downloaded file, the checksum has been calculated during download.
     if verbose:
         print(f'Checking integrity of {filepath.name}')
-    if not _check_integrity(filepath=filepath, md5=md5):
+    if not filepath.is_file() or (md5 is not None and file_md5 != md5):
         raise RuntimeError(f'File {filepath} not found or download corrupted.')
+    if md5 is not None:
+        _write_verified(filepath, md5)
 
     return filepath
 
@@ -151,11 +168,7 @@ def _get_redirected_url(url: str, max_hops: int = 3) -> str:
 # have to ignore pylint since tqdm 2.45.0 broke incosistent-mro
 # https://github.com/tqdm/tqdm/blob/0bb91857eca0d4aea08f66cf1c8949abe0cd6b7a/tqdm/auto.py#L27
 class _DownloadProgressBar(tqdm):  # pylint: disable=inconsistent-mro
-    """Progress bar for downloads.
-
-    Provides `update_to(n)` which uses `tqdm.update(delta_n)`.
-
-    Reference: https://github.com/tqdm/tqdm#hooks-and-callbacks
+    """Progress bar for downloads, counting transferred bytes.
 
     Parameters
     ----------
@@ -165,32 +178,25 @@ class _DownloadProgressBar(tqdm):  # pylint: disable=inconsistent-mro
     def __init__(self, **kwargs: Any):
         super().__init__(unit='B', unit_scale=True, unit_divisor=1024, miniters=1, **kwargs)
 
-    def update_to(self, b: int = 1, bsize: int = 1, tsize: int | None = None) -> bool | None:
-        """Update progress bar.
-
-        Parameters
-        ----------
-        b  : int
-            Number of blocks transferred so far (default: 1).
-        bsize  : int
-            Size of each block (in tqdm units) (default: 1).
-        tsize  : int | None
-            Total size (in tqdm units). If None it remains unchanged (default: None).
-
-        Returns
-        -------
-        bool | None
-            Returns `None` if the update was successful, `False` if the update was skipped
-            because the last update was too recent.
-        """
-        if tsize is not None:
-            self.total = tsize
-        return self.update(b * bsize - self.n)  # also sets self.n = b * bsize
-
-
-def _download_url(url: str, destination: Path, verbose: bool = True) -> None:
+
+def _download_url(
+        url: str,
+        destination: Path,
+        verbose: bool = True,
+        chunk_size: int = 1024 * 1024,
+        position: int | None = None,
+) -> str:
     """Download file from URL and save to destination.
 
+    The file is downloaded into a ``.part`` file next to the destination, which is renamed to the
+    destination after the download has finished. If a ``.part`` file of an interrupted download
+    exists, the download is resumed from its end with an HTTP range request. If the server does
+    not support range requests or responds with a range that doesn't start at the end of the
+    ``.part`` file, the file is downloaded from the beginning.
+
+    The MD5 checksum is calculated on the fly while writing the downloaded chunks, so that the
+    file does not have to be read again for checking its integrity.
+
     Parameters
     ----------
     url : str
@@ -198,16 +204,88 @@ def _download_url(url: str, destination: Path, verbose: bool = True) -> None:
     destination : Path
         Destination path of downloaded file.
     verbose : bool
-        If True, show progressbar.
+        If True, show progressbar. (default: True)
+    chunk_size : int
+        Byte size of chunks written to the file. (default: 1024 * 1024)
+    position : int | None
+        Line offset of the progress bar. If None, the position is chosen by tqdm. (default: None)
+
+    Returns
+    -------
+    str
+        MD5 checksum of the downloaded file.
+    """
+    part_filepath = destination.with_name(destination.name + '.part')
+    offset = part_filepath.stat().st_size if part_filepath.is_file() else 0
+
+    headers = {'User-Agent': USER_AGENT}
+    if offset > 0:
+        headers['Range'] = f'bytes={offset}-'
+
+    try:
+        response = urllib.request.urlopen(urllib.request.Request(url, headers=headers))
+    except urllib.error.HTTPError as error:
+        if error.code != 416 or offset == 0:
+            raise
+        # The requested range is not satisfiable, the partial file can't be resumed.
+        part_filepath.unlink()
+        return _download_url(
+            url=url, destination=destination, verbose=verbose, chunk_size=chunk_size,
+            position=position,
+        )
+
+    if response.getcode() == 206 and _content_range_start(response) != offset:
+        # Appending a range that doesn't continue the partial file would corrupt the download.
+        response.close()
+        part_filepath.unlink()
+        return _download_url(
+            url=url, destination=destination, verbose=verbose, chunk_size=chunk_size,
+            position=position,
+        )
+
+    with response:
+        if response.getcode() == 206:
+            # Only the already downloaded part needs to be read for calculating the checksum.
+            file_md5 = _calculate_md5_object(part_filepath, chunk_size=chunk_size)
+        else:  # server sends the complete file.
+            offset = 0
+            file_md5 = hashlib.new('md5', usedforsecurity=False)
+
+        content_length = response.headers.get('Content-Length')
+        total = None if content_length is None else offset + int(content_length)
+        with _DownloadProgressBar(
+                desc=destination.name, disable=not verbose, total=total, initial=offset,
+                position=position,
+        ) as t:
+            with open(part_filepath, 'ab' if offset > 0 else 'wb') as f:
+                for chunk in iter(lambda: response.read(chunk_size), b''):
+                    f.write(chunk)
+                    file_md5.update(chunk)
+                    t.update(len(chunk))
+
+    os.replace(part_filepath, destination)
+    return file_md5.hexdigest()
+
+
+def _content_range_start(response: Any) -> int | None:
+    """Get the first byte position of a partial response from its ``Content-Range`` header.
+
+    Returns None if the header is missing or malformed.
     """
-    with _DownloadProgressBar(desc=destination.name, disable=not verbose) as t:
-        urllib.request.urlretrieve(url=url, filename=destination, reporthook=t.update_to)
-        t.total = t.n
+    content_range = response.headers.get('Content-Range', '')
+    match = re.fullmatch(r'bytes (\d+)-\d+/(\d+|\*)', content_range.strip())
+    if match is None:
+        return None
+    return int(match.group(1))
 
 
 def _check_integrity(filepath: Path, md5: str | None = None) -> bool:
     """Check file integrity by MD5 checksum.
 
+    After a successful check, the checksum is recorded in a sidecar file together with the size
+    and modification time of the file. The checksum is not calculated again as long as the
+    recorded checksum matches and the file size and modification time are unchanged.
+
     Parameters
     ----------
     filepath : Path
@@ -225,10 +303,45 @@ def _check_integrity(filepath: Path, md5: str | None = None) -> bool:
         return False
     if md5 is None:
         return True
+    if _is_verified(filepath, md5):
+        return True
 
     # Calculate checksum and check for match.
     file_md5 = _calculate_md5(filepath)
-    return file_md5 == md5
+    if file_md5 != md5:
+        return False
+
+    _write_verified(filepath, md5)
+    return True
+
+
+def _is_verified(filepath: Path, md5: str) -> bool:
+    """Check if the file has been verified with this checksum and has not changed since."""
+    try:
+        with open(_verified_filepath(filepath), encoding='utf-8') as f:
+            verified = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    stat = filepath.stat()
+    return (
+        verified.get('md5') == md5
+        and verified.get('size') == stat.st_size
+        and verified.get('mtime_ns') == stat.st_mtime_ns
+    )
+
+
+def _write_verified(filepath: Path, md5: str) -> None:
+    """Record the verified checksum, size and modification time of a file in a sidecar file."""
+    stat = filepath.stat()
+    verified = {'md5': md5, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    with open(_verified_filepath(filepath), 'w', encoding='utf-8') as f:
+        json.dump(verified, f)
+
+
+def _verified_filepath(filepath: Path) -> Path:
+    """Get the path of the sidecar file recording the verified checksum of a file."""
+    return filepath.with_name(filepath.name + VERIFIED_SUFFIX)
 
 
 def _calculate_md5(filepath: Path, chunk_size: int = 1024 * 1024) -> str:
@@ -246,6 +359,11 @@ def _calculate_md5(filepath: Path, chunk_size: int = 1024 * 1024) -> str:
     str
         Calculated MD5 checksum.
     """
+    return _calculate_md5_object(filepath, chunk_size=chunk_size).hexdigest()
+
+
+def _calculate_md5_object(filepath: Path, chunk_size: int = 1024 * 1024) -> Any:
+    """Calculate MD5 hash object, which can be updated with further data."""
     # Setting the `usedforsecurity` flag does not change anything about the functionality, but
     # indicates that we are not using the MD5 checksum for cryptography.
     # This enables its usage in restricted environments like FIPS without raising an error.
@@ -254,4 +372,4 @@ def _calculate_md5(filepath: Path, chunk_size: int = 1024 * 1024) -> str:
     with open(filepath, 'rb') as f:
         for chunk in iter(lambda: f.read(chunk_size), b''):
             file_md5.update(chunk)
-    return file_md5.hexdigest()
+    return file_md5
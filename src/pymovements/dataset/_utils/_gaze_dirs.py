@@ -0,0 +1,90 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Utils module for storing Gaze objects in directories."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import polars as pl
+
+from pymovements.events import Events
+from pymovements.gaze.experiment import Experiment
+from pymovements.gaze.gaze import Gaze
+
+
+def write_gaze_dir(gaze: Gaze, dirpath: Path) -> None:
+    """Write samples, events and metadata of a gaze to a directory.
+
+    Parameters
+    ----------
+    gaze: Gaze
+        The gaze to write.
+    dirpath: Path
+        Path to the directory. It is created if it does not exist.
+    """
+    dirpath.mkdir(parents=True, exist_ok=True)
+    gaze.samples.write_ipc(dirpath / 'samples.feather')
+    gaze.events.frame.write_ipc(dirpath / 'events.feather')
+    metadata = {
+        'experiment': None if gaze.experiment is None else gaze.experiment.to_dict(),
+        'trial_columns': gaze.trial_columns,
+        'n_components': gaze.n_components,
+    }
+    with open(dirpath / 'metadata.json', 'w', encoding='utf-8') as f:
+        json.dump(metadata, f)
+
+
+def read_gaze_dir(dirpath: Path) -> Gaze:
+    """Read a gaze from a directory written by :py:func:`write_gaze_dir`.
+
+    Parameters
+    ----------
+    dirpath: Path
+        Path to the directory.
+
+    Returns
+    -------
+    Gaze
+        The gaze with the same samples, events, experiment and trial columns as the written gaze.
+
+    Raises
+    ------
+    FileNotFoundError
+        If any of the files is missing in the directory.
+    """
+    with open(dirpath / 'metadata.json', encoding='utf-8') as f:
+        metadata = json.load(f)
+    samples = pl.read_ipc(dirpath / 'samples.feather', memory_map=False)
+    events = pl.read_ipc(dirpath / 'events.feather', memory_map=False)
+
+    if metadata['experiment'] is None:
+        experiment = None
+    else:
+        experiment = Experiment.from_dict(metadata['experiment'])
+
+    # Samples have already been validated before writing, so they are assigned directly.
+    return Gaze._from_validated(  # pylint: disable=protected-access
+        samples,
+        experiment=experiment,
+        events=Events(events, trial_columns=metadata['trial_columns']),
+        trial_columns=metadata['trial_columns'],
+        n_components=metadata['n_components'],
+    )
@@ -0,0 +1,209 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Utils module for tracking preprocessing progress in completion manifests."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from pymovements._version import get_versions
+from pymovements.dataset._utils._archives import open_archive_member
+from pymovements.dataset._utils._downloads import _calculate_md5
+
+MANIFEST_FILENAME: str = 'manifest.json'
+
+
+def pipeline_fingerprint(
+        pipeline: list[tuple[str, dict[str, Any]]],
+        **context: Any,
+) -> str:
+    """Calculate a fingerprint that uniquely identifies a preprocessing pipeline.
+
+    The fingerprint covers the ordered pipeline steps including their keyword arguments, any
+    additional context like the output file format or the dataset definition and the installed
+    pymovements version.
+
+    Parameters
+    ----------
+    pipeline: list[tuple[str, dict[str, Any]]]
+        Ordered list of pipeline steps. Each step is a tuple of the function name and its keyword
+        arguments.
+    **context: Any
+        Additional context that influences the pipeline output.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest of the pipeline.
+    """
+    data = {
+        'pipeline': [[function, kwargs] for function, kwargs in pipeline],
+        'context': context,
+        'version': get_versions()['version'],
+    }
+    serialized = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+class PipelineManifest:
+    """Completion manifest of a preprocessing pipeline.
+
+    The manifest keeps a record for each processed input file. A record consists of the MD5
+    checksum, size and modification time of the input file, the fingerprint of the pipeline that
+    was applied and the list of written output files. For input files read from an archive, the
+    checksum is calculated from the archive member and size and modification time are taken
+    from the archive. The manifest is written to disk after each
+    completed file, such that an interrupted run can be resumed from the last completed file.
+
+    Parameters
+    ----------
+    filepath: Path
+        Path to the manifest JSON file. The file is created on the first completed record.
+    fingerprint: str
+        Fingerprint of the current pipeline. Records with a different fingerprint are considered
+        outdated.
+    """
+
+    def __init__(self, filepath: Path, fingerprint: str):
+        self.filepath = filepath
+        self.fingerprint = fingerprint
+        self.records: dict[str, dict[str, Any]] = {}
+
+        if self.filepath.is_file():
+            with open(self.filepath, encoding='utf-8') as f:
+                self.records = json.load(f).get('files', {})
+
+    def input_hash(
+            self,
+            key: str,
+            input_filepath: Path,
+            archive_path: Path | None = None,
+    ) -> str:
+        """Get the MD5 checksum of an input file.
+
+        The checksum is only recalculated if size or modification time of the file differ from
+        the existing record.
+
+        Parameters
+        ----------
+        key: str
+            Identifier of the input file in the manifest.
+        input_filepath: Path
+            Path to the input file. If ``archive_path`` is specified, this is the member name in
+            the archive.
+        archive_path: Path | None
+            Path of an archive containing the input file. (default: None)
+
+        Returns
+        -------
+        str
+            MD5 checksum of the input file.
+        """
+        stat = (input_filepath if archive_path is None else archive_path).stat()
+        record = self.records.get(key)
+        if (
+                record is not None and
+                record['size'] == stat.st_size and
+                record['mtime_ns'] == stat.st_mtime_ns
+        ):
+            return record['md5']
+        if archive_path is None:
+            return _calculate_md5(input_filepath)
+
+        file_md5 = hashlib.new('md5', usedforsecurity=False)
+        with open_archive_member(archive_path, input_filepath.as_posix()) as member_file:
+            for chunk in iter(lambda: member_file.read(1024 * 1024), b''):
+                file_md5.update(chunk)
+        return file_md5.hexdigest()
+
+    def is_complete(self, key: str, input_hash: str) -> bool:
+        """Check if the outputs of an input file are up to date.
+
+        Parameters
+        ----------
+        key: str
+            Identifier of the input file in the manifest.
+        input_hash: str
+            Current MD5 checksum of the input file.
+
+        Returns
+        -------
+        bool
+            ``True`` if the input file has been processed with the current pipeline, the input file
+            has not changed since and all recorded output files exist.
+        """
+        record = self.records.get(key)
+        if record is None:
+            return False
+        if record['fingerprint'] != self.fingerprint or record['md5'] != input_hash:
+            return False
+        return all((self.filepath.parent / output).is_file() for output in record['outputs'])
+
+    def mark_complete(
+            self,
+            key: str,
+            input_filepath: Path,
+            input_hash: str,
+            outputs: list[Path],
+            archive_path: Path | None = None,
+    ) -> None:
+        """Record an input file as completely processed and write the manifest to disk.
+
+        Parameters
+        ----------
+        key: str
+            Identifier of the input file in the manifest.
+        input_filepath: Path
+            Path to the input file. If ``archive_path`` is specified, this is the member name in
+            the archive.
+        input_hash: str
+            MD5 checksum of the input file.
+        outputs: list[Path]
+            Paths to all output files written for this input file.
+        archive_path: Path | None
+            Path of an archive containing the input file. (default: None)
+        """
+        stat = (input_filepath if archive_path is None else archive_path).stat()
+        self.records[key] = {
+            'md5': input_hash,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'fingerprint': self.fingerprint,
+            'outputs': [
+                Path(os.path.relpath(output, self.filepath.parent)).as_posix()
+                for output in outputs
+            ],
+        }
+        self.write()
+
+    def write(self) -> None:
+        """Write manifest to disk.
+
+        The manifest is first written to a temporary file which then replaces the existing
+        manifest. This way the manifest on disk is never left in a corrupted state.
+        """
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_filepath = self.filepath.with_name(self.filepath.name + '.tmp')
+        with open(tmp_filepath, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.records}, f, indent=2, sort_keys=True)
+        os.replace(tmp_filepath, self.filepath)
@@ -36,9 +36,14 @@ from pymovements.dataset import dataset_files
 from pymovements.dataset.dataset_definition import DatasetDefinition
 from pymovements.dataset.dataset_library import DatasetLibrary
 from pymovements.dataset.dataset_paths import DatasetPaths
+from pymovements.dataset.lazy_gaze_list import LazyGazeList
+from pymovements.dataset.pipeline_cache import PipelineCache
+from pymovements.events import EventGazeProcessor
 from pymovements.events import Events
 from pymovements.events.precomputed import PrecomputedEventDataFrame
 from pymovements.gaze import Gaze
+from pymovements.gaze.instrumentation import file_context
+from pymovements.gaze.instrumentation import recorded_step
 from pymovements.reading_measures import ReadingMeasures
 
 
@@ -67,7 +72,7 @@ class Dataset:
             path: str | Path | DatasetPaths,
     ):
         self.fileinfo: pl.DataFrame = pl.DataFrame()
-        self.gaze: list[Gaze] = []
+        self.gaze: list[Gaze] | LazyGazeList = []
         self.events: list[Events] = []
         self.precomputed_events: list[PrecomputedEventDataFrame] = []
         self.precomputed_reading_measures: list[ReadingMeasures] = []
@@ -104,6 +109,12 @@ class Dataset:
             events_dirname: str | None = None,
             preprocessed_dirname: str | None = None,
             extension: str = 'feather',
+            use_index: bool = False,
+            max_workers: int = 1,
+            lazy: bool = False,
+            max_memory: int | None = None,
+            spill: bool = False,
+            from_archives: bool = False,
     ) -> Dataset:
         """Parse file information and load all gaze files.
 
@@ -133,15 +144,34 @@ class Dataset:
             :py:meth:`pymovements.Dataset.preprocessed_rootpath`. (default: None)
         extension: str
             Specifies the file format for loading data. Valid options are: `csv`, `feather`,
-            `tsv`, `txt`, `asc`.
+            `parquet`, `tsv`, `txt`, `asc`.
             (default: 'feather')
+        use_index: bool
+            If ``True``, use a persisted index of directory listings for scanning the dataset.
+            See :py:meth:`~pymovements.Dataset.scan` for details. (default: False)
+        max_workers: int
+            Maximum number of threads listing directories concurrently while scanning the
+            dataset. See :py:meth:`~pymovements.Dataset.scan` for details. (default: 1)
+        lazy: bool
+            If ``True``, gaze files are loaded on first access instead of all at once.
+            See :py:meth:`~pymovements.Dataset.load_gaze_files` for details. (default: False)
+        max_memory: int | None
+            Maximum estimated size of all gazes held in memory in bytes if ``lazy`` is ``True``.
+            If None, gazes are never evicted. (default: None)
+        spill: bool
+            If ``True`` and ``lazy`` is ``True``, modified gazes are written to the preprocessed
+            directory on eviction. (default: False)
+        from_archives: bool
+            If ``True``, raw gaze files are read directly from the downloaded archives without
+            extracting them. See :py:meth:`~pymovements.Dataset.scan` for details.
+            (default: False)
 
         Returns
         -------
         Dataset
             Returns self, useful for method cascading.
         """
-        self.scan()
+        self.scan(use_index=use_index, max_workers=max_workers, from_archives=from_archives)
         self.fileinfo = dataset_files.take_subset(fileinfo=self.fileinfo, subset=subset)
 
         if self.definition.resources.has_content('gaze'):
@@ -149,6 +179,9 @@ class Dataset:
                 preprocessed=preprocessed,
                 preprocessed_dirname=preprocessed_dirname,
                 extension=extension,
+                lazy=lazy,
+                max_memory=max_memory,
+                spill=spill,
             )
 
         # Event files precomputed by authors of the dataset
@@ -165,14 +198,50 @@ class Dataset:
                 events_dirname=events_dirname,
                 extension=extension,
             )
-            for loaded_gaze, loaded_events in zip(self.gaze, self.events):
-                loaded_gaze.events = loaded_events
+            if isinstance(self.gaze, LazyGazeList):
+                self.gaze.events = self.events
+            else:
+                for loaded_gaze, loaded_events in zip(self.gaze, self.events):
+                    loaded_gaze.events = loaded_events
 
         return self
 
-    def scan(self) -> Dataset:
+    def scan(
+            self,
+            *,
+            use_index: bool = False,
+            max_workers: int = 1,
+            from_archives: bool = False,
+    ) -> Dataset:
         """Infer information from filepaths and filenames.
 
+        Scanning requires listing all directories below the raw data directory, which can take a
+        long time for large datasets on network storage. With ``use_index=True``, the directory
+        listings are persisted in a ``.scan_index.json`` file in the dataset directory together
+        with the modification time of each directory. Subsequent scans then only list directories
+        which have been modified since, i.e., where files have been added, removed or renamed.
+
+        On network storage, listing directories is dominated by latency. With
+        ``max_workers > 1``, directories are listed concurrently by a pool of threads. The
+        resulting file information does not depend on the number of workers.
+
+        With ``from_archives=True``, the members of the downloaded gaze resource archives are
+        scanned instead of the raw data directory, so that the archives don't need to be
+        extracted. The ``filepath`` column then holds the member names and an additional
+        ``archive`` column holds the archive filenames. Gaze files are read directly from the
+        archives on loading. Nested archives are not opened.
+
+        Parameters
+        ----------
+        use_index: bool
+            If ``True``, use and update the persisted index of directory listings.
+            (default: False)
+        max_workers: int
+            Maximum number of threads listing directories concurrently. (default: 1)
+        from_archives: bool
+            If ``True``, scan the members of the downloaded gaze resource archives instead of the
+            extracted raw data directory. (default: False)
+
         Returns
         -------
         Dataset
@@ -184,8 +253,16 @@ class Dataset:
             If no regular expression for parsing filenames is defined.
         RuntimeError
             If an error occurred during matching filenames or no files have been found.
+        ValueError
+            If ``max_workers`` is not positive.
         """
-        self.fileinfo = dataset_files.scan_dataset(definition=self.definition, paths=self.paths)
+        self.fileinfo = dataset_files.scan_dataset(
+            definition=self.definition,
+            paths=self.paths,
+            use_index=use_index,
+            max_workers=max_workers,
+            from_archives=from_archives,
+        )
         return self
 
     def load_gaze_files(
@@ -193,9 +270,22 @@ class Dataset:
             preprocessed: bool = False,
             preprocessed_dirname: str | None = None,
             extension: str = 'feather',
+            *,
+            lazy: bool = False,
+            max_memory: int | None = None,
+            spill: bool = False,
     ) -> Dataset:
         """Load all available gaze data files.
 
+        With ``lazy=True``, :py:attr:`gaze` is a :py:class:`~pymovements.dataset.LazyGazeList`
+        and each gaze file is loaded on first access. This way, iterating over a large dataset
+        does not require holding all gaze files in memory at once. If ``max_memory`` is set, the
+        least recently used gazes are evicted as soon as the estimated total size of all held
+        gazes exceeds it. Evicted gazes are loaded again on their next access, losing all
+        modifications, e.g., by :py:meth:`pix2deg`. With ``spill=True``, modified gazes are
+        instead written to a ``.spill`` directory in the preprocessed directory on eviction and
+        loaded from there on their next access.
+
         Parameters
         ----------
         preprocessed: bool
@@ -208,8 +298,16 @@ class Dataset:
             :py:meth:`pymovements.Dataset.preprocessed_rootpath`. (default: None)
         extension: str
             Specifies the file format for loading data. Valid options are: `csv`, `feather`,
-            `tsv`, `txt`, `asc`.
+            `parquet`, `tsv`, `txt`, `asc`.
             (default: 'feather')
+        lazy: bool
+            If ``True``, load each gaze file on first access. (default: False)
+        max_memory: int | None
+            Maximum estimated size of all gazes held in memory in bytes if ``lazy`` is ``True``.
+            If None, gazes are never evicted. (default: None)
+        spill: bool
+            If ``True`` and ``lazy`` is ``True``, modified gazes are written to the preprocessed
+            directory on eviction. (default: False)
 
         Returns
         -------
@@ -231,6 +329,9 @@ class Dataset:
             preprocessed=preprocessed,
             preprocessed_dirname=preprocessed_dirname,
             extension=extension,
+            lazy=lazy,
+            max_memory=max_memory,
+            spill=spill,
         )
 
         return self
@@ -427,9 +528,126 @@ class Dataset:
         self._check_gaze()
 
         disable_progressbar = not verbose
-        for gaze in tqdm(self.gaze, disable=disable_progressbar):
-            gaze.apply(function, **kwargs)
+        for gaze, filepath in tqdm(
+                zip(self.gaze, self._gaze_filepaths()),
+                total=len(self.gaze),
+                disable=disable_progressbar,
+        ):
+            with file_context(filepath):
+                gaze.apply(function, **kwargs)
+
+        return self
+
+    def process(
+            self,
+            pipeline: str | tuple[str, dict[str, Any]] | list[str | tuple[str, dict[str, Any]]],
+            *,
+            preprocessed_dirname: str | None = None,
+            events_dirname: str | None = None,
+            extension: str = 'feather',
+            resume: bool = True,
+            cache: PipelineCache | str | Path | None = None,
+            verbose: int = 1,
+    ) -> Dataset:
+        """Apply a preprocessing pipeline to each raw gaze file and save the results.
+
+        In contrast to :py:meth:`~pymovements.Dataset.apply` followed by
+        :py:meth:`~pymovements.Dataset.save`, files are processed one at a time and saved right
+        away. Completed files are recorded in a ``manifest.json`` in the preprocessed directory
+        together with the checksum of the raw file and a fingerprint of the pipeline.
+        If ``resume`` is ``True``, files with up-to-date outputs are skipped. This way an
+        interrupted run continues from the last completed file, and only new or changed raw files
+        are processed if the dataset grows.
+
+        If a ``cache`` is passed, the intermediate result after each pipeline step is stored in a
+        :py:class:`~pymovements.PipelineCache`. Files are then processed starting from the
+        longest cached prefix of the pipeline. The cache directory can be shared by several users.
+
+        The processed data is not kept in memory. Use ``load(preprocessed=True)`` and
+        ``load(events=True)`` to load the results afterwards.
+
+        Parameters
+        ----------
+        pipeline: str | tuple[str, dict[str, Any]] | list[str | tuple[str, dict[str, Any]]]
+            Ordered pipeline steps. Each step is either the name of a transformation or event
+            detection method, or a tuple of the name and a dictionary of keyword arguments.
+        preprocessed_dirname: str | None
+            One-time usage of an alternative directory name to save data relative to dataset path.
+            This argument is used only for this single call and does not alter
+            :py:meth:`pymovements.Dataset.preprocessed_rootpath`. (default: None)
+        events_dirname: str | None
+            One-time usage of an alternative directory name to save data relative to dataset path.
+            This argument is used only for this single call and does not alter
+            :py:meth:`pymovements.Dataset.events_rootpath`. (default: None)
+        extension: str
+            Specifies the file format for saving data. Valid options are: `csv`, `feather`,
+            `parquet`. (default: 'feather')
+        resume: bool
+            If ``True``, skip files whose outputs are up to date. (default: True)
+        cache: PipelineCache | str | Path | None
+            Cache for intermediate pipeline results. If a path is passed, a
+            :py:class:`~pymovements.PipelineCache` without size limit is used in this
+            directory. If None, no cache is used. (default: None)
+        verbose: int
+            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths)
+            (default: 1)
+
+        Returns
+        -------
+        Dataset
+            Returns self, useful for method cascading.
+
+        Raises
+        ------
+        AttributeError
+            If `fileinfo` is None or the `fileinfo` dataframe is empty.
+        ValueError
+            If a pipeline step is not a supported transformation or event detection method or if
+            extension is not in list of valid extensions.
+
+        Examples
+        --------
+        >>> import pymovements as pm
+        >>>
+        >>> dataset = pm.Dataset("ToyDataset", path='toy_dataset')
+        >>> dataset.download()# doctest:+ELLIPSIS
+        Downloading ... to toy_dataset...downloads...
+        Checking integrity of ...
+        Extracting ... to toy_dataset...raw
+        <pymovements.dataset.dataset.Dataset object at ...>
+        >>> dataset.scan()# doctest:+ELLIPSIS
+        <pymovements.dataset.dataset.Dataset object at ...>
+
+        Process all files with a pipeline of transformations and event detection methods:
+        >>> dataset.process(
+        ...     ['pix2deg', ('pos2vel', {'method': 'neighbors'}), 'ivt'],
+        ...     verbose=0,
+        ... )# doctest:+ELLIPSIS
+        <pymovements.dataset.dataset.Dataset object at ...>
+
+        Running the same pipeline again skips all files that are already up to date:
+        >>> dataset.process(
+        ...     ['pix2deg', ('pos2vel', {'method': 'neighbors'}), 'ivt'],
+        ...     verbose=0,
+        ... )# doctest:+ELLIPSIS
+        <pymovements.dataset.dataset.Dataset object at ...>
+        """
+        self._check_fileinfo()
+        if isinstance(cache, (str, Path)):
+            cache = PipelineCache(cache)
 
+        dataset_files.process_gaze_files(
+            definition=self.definition,
+            fileinfo=self.fileinfo['gaze'],
+            paths=self.paths,
+            pipeline=pipeline,
+            preprocessed_dirname=preprocessed_dirname,
+            events_dirname=events_dirname,
+            extension=extension,
+            resume=resume,
+            cache=cache,
+            verbose=verbose,
+        )
         return self
 
     def clip(
@@ -766,7 +984,8 @@ class Dataset:
                 enumerate(zip(self.gaze, self.fileinfo['gaze'].to_dicts())),
                 disable=disable_progressbar,
         ):
-            gaze.detect(method, eye=eye, clear=clear, **kwargs)
+            with file_context(fileinfo_row.get('filepath')):
+                gaze.detect(method, eye=eye, clear=clear, **kwargs)
             # workaround until events are fully part of the Gaze
             gaze.events.frame = dataset_files.add_fileinfo(
                 definition=self.definition,
@@ -834,8 +1053,45 @@ class Dataset:
         Dataset
             Returns self, useful for method cascading.
         """
-        for gaze in tqdm(self.gaze, disable=not verbose):
-            gaze.compute_event_properties(event_properties, name=name)
+        # Lazily loaded gazes are processed one at a time to keep memory usage low. Gazes can only
+        # be processed at once if they have the same trial columns.
+        if isinstance(self.gaze, LazyGazeList):
+            trial_columns = set()
+        else:
+            trial_columns = {
+                None if gaze.trial_columns is None else tuple(gaze.trial_columns)
+                for gaze in self.gaze
+            }
+        if len(trial_columns) != 1:
+            for gaze, filepath in tqdm(
+                    zip(self.gaze, self._gaze_filepaths()),
+                    total=len(self.gaze),
+                    disable=not verbose,
+            ):
+                with file_context(filepath):
+                    gaze.compute_event_properties(event_properties, name=name)
+            return self
+
+        # Otherwise the event properties of all gazes are computed at once.
+        processor = EventGazeProcessor(event_properties)
+        for gaze in self.gaze:
+            gaze._check_event_properties(processor)  # pylint: disable=protected-access
+
+        identifiers = list(trial_columns.pop() or [])
+        with recorded_step('compute_event_properties', event_properties, self.gaze):
+            new_properties = processor.process_batch(
+                [gaze.events for gaze in self.gaze], self.gaze, identifiers=identifiers, name=name,
+            )
+
+        join_on = identifiers + ['name', 'onset', 'offset']
+        for gaze, filepath, gaze_properties in tqdm(
+                zip(self.gaze, self._gaze_filepaths(), new_properties),
+                total=len(self.gaze),
+                disable=not verbose,
+        ):
+            with file_context(filepath):
+                with recorded_step('compute_event_properties', event_properties, [gaze]):
+                    gaze.events.add_event_properties(gaze_properties, join_on=join_on)
         return self
 
     def compute_properties(
@@ -993,8 +1249,8 @@ class Dataset:
             Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths)
             (default: 1)
         extension: str
-            Specifies the file format for loading data. Valid options are: `csv`, `feather`.
-            (default: 'feather')
+            Specifies the file format for saving data. Valid options are: `csv`, `feather`,
+            `parquet`. (default: 'feather')
 
         Returns
         -------
@@ -1016,12 +1272,83 @@ class Dataset:
         )
         return self
 
+    def ingest(
+            self,
+            *,
+            subset: dict[
+                str, bool | float | int | str | list[bool | float | int | str],
+            ] | None = None,
+            from_archives: bool = True,
+            preprocessed_dirname: str | None = None,
+            extension: str = 'feather',
+            max_workers: int = 1,
+            verbose: int = 1,
+    ) -> Dataset:
+        """Convert raw gaze files to columnar files in a single pass.
+
+        This replaces extracting the dataset, loading all raw gaze files and saving them with
+        :py:meth:`~pymovements.Dataset.save_preprocessed`. Each raw gaze file is read from the
+        downloaded archives, parsed by its load function and directly written to the preprocessed
+        directory as an IPC/feather or parquet file. The raw files are never written to disk and
+        only the gazes currently being converted are held in memory.
+
+        The fileinfo columns are kept in the written samples as partition columns. Afterwards,
+        the converted files can be loaded with ``load(preprocessed=True, from_archives=True)``
+        and the same ``extension``.
+
+        Parameters
+        ----------
+        subset: dict[str, bool | float | int | str | list[bool | float | int | str]] | None
+            If specified, only convert a subset of the dataset. All keys in the dictionary must be
+            present in the fileinfo dataframe inferred by :py:meth:`~pymovements.Dataset.scan`.
+            Values can be either bool, float, int, str or a list of these. (default: None)
+        from_archives: bool
+            If ``True``, read the raw gaze files from the downloaded archives. Otherwise, read
+            them from the extracted raw data directory. (default: True)
+        preprocessed_dirname: str | None
+            One-time usage of an alternative directory name to save data relative to dataset path.
+            This argument is used only for this single call and does not alter
+            :py:meth:`pymovements.Dataset.preprocessed_rootpath`. (default: None)
+        extension: str
+            Specifies the file format for saving data. Valid options are: `feather`, `parquet`.
+            (default: 'feather')
+        max_workers: int
+            Maximum number of threads converting files concurrently. (default: 1)
+        verbose: int
+            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths)
+            (default: 1)
+
+        Returns
+        -------
+        Dataset
+            Returns self, useful for method cascading.
+
+        Raises
+        ------
+        ValueError
+            If extension is not in list of valid extensions or if ``max_workers`` is not positive.
+        """
+        self.scan(from_archives=from_archives)
+        self.fileinfo = dataset_files.take_subset(fileinfo=self.fileinfo, subset=subset)
+
+        dataset_files.convert_gaze_files(
+            definition=self.definition,
+            fileinfo=self.fileinfo['gaze'],
+            paths=self.paths,
+            preprocessed_dirname=preprocessed_dirname,
+            extension=extension,
+            max_workers=max_workers,
+            verbose=verbose,
+        )
+        return self
+
     def download(
             self,
             *,
             extract: bool = True,
             remove_finished: bool = False,
             resume: bool = True,
+            max_workers: int = 1,
             verbose: int = 1,
     ) -> Dataset:
         """Download dataset resources.
@@ -1035,7 +1362,12 @@ class Dataset:
         checked against the expected checksum.
         Downloading will be evaded if the integrity of the existing file can be verified.
         If the existing file does not match the expected checksum it is overwritten with the
-        downloaded new file.
+        downloaded new file. Verified checksums are recorded in a ``.verified.json`` file next to
+        each downloaded file, so that unchanged files are not hashed again on subsequent calls.
+
+        Interrupted downloads are resumed from the partially downloaded ``.part`` file if the
+        server supports HTTP range requests. With ``max_workers > 1``, several resources are
+        downloaded concurrently, each with its own progress bar.
 
         Parameters
         ----------
@@ -1046,6 +1378,8 @@ class Dataset:
         resume: bool
             Resume previous extraction by skipping existing files.
             Checks for correct size of existing files but not integrity. (default: True)
+        max_workers: int
+            Maximum number of resources downloaded concurrently. (default: 1)
         verbose: int
             Verbosity levels: (1) Show download progress bar and print info messages on downloading
             and extracting archive files without printing messages for recursive archive extraction.
@@ -1062,6 +1396,8 @@ class Dataset:
             If number of mirrors or number of resources specified for dataset is zero.
         RuntimeError
             If downloading a resource failed for all given mirrors.
+        ValueError
+            If ``max_workers`` is not positive.
         """
         logger.info(self._disclaimer())
 
@@ -1071,6 +1407,7 @@ class Dataset:
             extract=extract,
             remove_finished=remove_finished,
             resume=resume,
+            max_workers=max_workers,
             verbose=bool(verbose),
         )
         return self
@@ -1082,9 +1419,16 @@ class Dataset:
             remove_top_level: bool = True,
             resume: bool = True,
             verbose: int = 1,
+            subset: dict[
+                str, bool | float | int | str | list[bool | float | int | str],
+            ] | None = None,
+            max_workers: int = 1,
     ) -> Dataset:
         """Extract downloaded dataset archive files.
 
+        If a ``subset`` is specified, only the files of this subset are extracted. Archive members
+        that do not match the ``filename_pattern`` of their resource are skipped as well.
+
         Parameters
         ----------
         remove_finished: bool
@@ -1098,11 +1442,24 @@ class Dataset:
             Verbosity levels: (1) Print messages for extracting each dataset resource without
             printing messages for recursive archives. (2) Print additional messages for each
             recursive archive extract. (default: 1)
+        subset: dict[str, bool | float | int | str | list[bool | float | int | str]] | None
+            If specified, only extract the files of this subset. All keys in the dictionary must be
+            named groups in the ``filename_pattern`` of each gaze resource. Values can be either
+            bool, float, int, str or a list of these. An empty dictionary extracts all files
+            matching the resource filename patterns. (default: None)
+        max_workers: int
+            Maximum number of threads used for extracting zip archive members and nested archives
+            concurrently. (default: 1)
 
         Returns
         -------
         Dataset
             Returns self, useful for method cascading.
+
+        Raises
+        ------
+        ValueError
+            If a subset key is not a named group in the ``filename_pattern`` of a gaze resource.
         """
         dataset_download.extract_dataset(
             definition=self.definition,
@@ -1111,6 +1468,8 @@ class Dataset:
             remove_top_level=remove_top_level,
             resume=resume,
             verbose=verbose,
+            subset=subset,
+            max_workers=max_workers,
         )
         return self
 
@@ -1161,6 +1520,17 @@ class Dataset:
         if len(self.fileinfo) == 0:
             raise AttributeError('no files present in fileinfo attribute')
 
+    def _gaze_filepaths(self) -> list[str | None]:
+        """Return the raw filepath of each gaze in fileinfo or None if it is not known."""
+        fileinfo = self.fileinfo.get('gaze') if isinstance(self.fileinfo, dict) else None
+        if (
+                fileinfo is None
+                or 'filepath' not in fileinfo.columns
+                or len(fileinfo) != len(self.gaze)
+        ):
+            return [None] * len(self.gaze)
+        return fileinfo['filepath'].to_list()
+
     def _check_gaze(self) -> None:
         """Check if gaze attribute is set and there is at least one gaze dataframe available."""
         if self.gaze is None:
@@ -20,18 +20,23 @@
 """Provides private functions for downloading and extracting datasets."""
 from __future__ import annotations
 
+import queue
 import shutil
+from collections.abc import Callable
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.error import URLError
 from warnings import warn
 
+import polars as pl
+
+from pymovements._utils._strings import curly_to_regex
 from pymovements.dataset._utils._archives import extract_archive
 from pymovements.dataset._utils._downloads import download_file
 from pymovements.dataset.dataset_definition import DatasetDefinition
 from pymovements.dataset.dataset_paths import DatasetPaths
 from pymovements.dataset.resources import ResourceDefinition
-from pymovements.dataset.resources import ResourceDefinitions
 from pymovements.exceptions import UnknownFileType
 
 
@@ -42,6 +47,7 @@ def download_dataset(
         extract: bool = True,
         remove_finished: bool = False,
         resume: bool = True,
+        max_workers: int = 1,
         verbose: bool = True,
 ) -> None:
     """Download dataset resources.
@@ -55,7 +61,12 @@ def download_dataset(
     checked against the expected checksum.
     Downloading will be evaded if the integrity of the existing file can be verified.
     If the existing file does not match the expected checksum it is overwritten with the
-    downloaded new file.
+    downloaded new file. Verified checksums are recorded in a ``.verified.json`` file next to
+    each downloaded file, so that unchanged files are not hashed again on subsequent calls.
+
+    Interrupted downloads are resumed from the partially downloaded ``.part`` file if the server
+    supports HTTP range requests. With ``max_workers > 1``, several resources are downloaded
+    concurrently, each with its own progress bar.
 
     Parameters
     ----------
@@ -70,6 +81,8 @@ def download_dataset(
     resume: bool
         Resume previous extraction by skipping existing files.
         Checks for correct size of existing files but not integrity. (default: True)
+    max_workers: int
+        Maximum number of resources downloaded concurrently. (default: 1)
     verbose: bool
         If True, show progress of download and print status messages for integrity checking and
         file extraction. (default: True)
@@ -80,10 +93,15 @@ def download_dataset(
         If number of mirrors or number of resources specified for dataset is zero.
     RuntimeError
         If downloading a resource failed for all given mirrors.
+    ValueError
+        If ``max_workers`` is not positive.
     """
     if not definition.resources:
         raise AttributeError('resources must be specified to download a dataset.')
+    if max_workers < 1:
+        raise ValueError(f'max_workers must be positive, but is {max_workers}')
 
+    mirrors_and_resources: list[tuple[Sequence[str] | None, ResourceDefinition]] = []
     for content in ('gaze', 'precomputed_events', 'precomputed_reading_measures'):
         if definition.resources.has_content(content):
             if not definition.mirrors:
@@ -91,13 +109,17 @@ def download_dataset(
             else:
                 mirrors = definition.mirrors.get(content, None)
 
-            _download_resources(
-                mirrors=mirrors,
-                resources=definition.resources.filter(content),
-                target_dirpath=paths.downloads,
-                verbose=verbose,
+            mirrors_and_resources.extend(
+                (mirrors, resource) for resource in definition.resources.filter(content)
             )
 
+    _download_resources(
+        mirrors_and_resources=mirrors_and_resources,
+        target_dirpath=paths.downloads,
+        max_workers=max_workers,
+        verbose=verbose,
+    )
+
     if extract:
         extract_dataset(
             definition=definition,
@@ -116,9 +138,15 @@ def extract_dataset(
         remove_top_level: bool = True,
         resume: bool = True,
         verbose: int = 1,
+        subset: dict[str, bool | float | int | str | list[bool | float | int | str]] | None = None,
+        max_workers: int = 1,
 ) -> None:
     """Extract downloaded dataset archive files.
 
+    If a ``subset`` is specified, only archive members matching the ``filename_pattern`` of their
+    resource are extracted. For gaze resources, the values of the named pattern groups must
+    additionally match the values of the subset.
+
     Parameters
     ----------
     definition: DatasetDefinition
@@ -136,6 +164,19 @@ def extract_dataset(
         Verbosity levels: (1) Print messages for extracting each dataset resource without printing
         messages for recursive archives. (2) Print messages for extracting each dataset resource and
         each recursive archive extract. (default: 1)
+    subset: dict[str, bool | float | int | str | list[bool | float | int | str]] | None
+        If specified, only extract the files of this subset. All keys in the dictionary must be
+        named groups in the ``filename_pattern`` of each gaze resource. Values can be either bool,
+        float, int, str or a list of these. An empty dictionary extracts all files matching the
+        resource filename patterns. (default: None)
+    max_workers: int
+        Maximum number of threads used for extracting zip archive members and nested archives
+        concurrently. (default: 1)
+
+    Raises
+    ------
+    ValueError
+        If a subset key is not a named group in the ``filename_pattern`` of a gaze resource.
     """
     content_dirnames = {
         'gaze': 'raw',
@@ -149,6 +190,11 @@ def extract_dataset(
             destination_dirpath.mkdir(parents=True, exist_ok=True)
             for resource in definition.resources.filter(content):
                 source_path = paths.downloads / resource.filename
+                member_filter = None
+                if subset is not None:
+                    member_filter = _get_member_filter(
+                        resource, subset if content == 'gaze' else {},
+                    )
 
                 try:
                     extract_archive(
@@ -159,30 +205,112 @@ def extract_dataset(
                         remove_top_level=remove_top_level,
                         resume=resume,
                         verbose=verbose,
+                        member_filter=member_filter,
+                        max_workers=max_workers,
                     )
                 except UnknownFileType:  # just copy file to target if not an archive.
                     shutil.copy(source_path, destination_dirpath / resource.filename)
 
 
+def _get_member_filter(
+        resource: ResourceDefinition,
+        subset: dict[str, bool | float | int | str | list[bool | float | int | str]],
+) -> Callable[[str], bool] | None:
+    """Get a filter for archive member file names from the resource filename pattern and subset.
+
+    Values of named pattern groups are cast according to the resource
+    ``filename_pattern_schema_overrides`` before being compared to the subset values.
+    """
+    if resource.filename_pattern is None:
+        return None
+
+    regex = curly_to_regex(resource.filename_pattern)
+
+    subset_values = {}
+    for subset_key, subset_value in subset.items():
+        if subset_key not in regex.groupindex:
+            raise ValueError(
+                f'subset key {subset_key} must be a named group in the filename pattern'
+                f" '{resource.filename_pattern}' of resource '{resource.filename}'.",
+            )
+        if isinstance(subset_value, (list, tuple, range)):
+            subset_values[subset_key] = list(subset_value)
+        else:
+            subset_values[subset_key] = [subset_value]
+
+    schema_overrides = resource.filename_pattern_schema_overrides or {}
+
+    def member_filter(filename: str) -> bool:
+        if (match := regex.match(filename)) is None:
+            return False
+
+        for key, values in subset_values.items():
+            value = match.group(key)
+            if key in schema_overrides:
+                value = pl.Series([value]).cast(schema_overrides[key]).item()
+            if value not in values:
+                return False
+        return True
+
+    return member_filter
+
+
 def _download_resources(
-        mirrors: Sequence[str] | None,
-        resources: ResourceDefinitions,
+        mirrors_and_resources: list[tuple[Sequence[str] | None, ResourceDefinition]],
         target_dirpath: Path,
+        max_workers: int,
         verbose: bool,
 ) -> None:
-    """Download resources."""
-    for resource in resources:
+    """Download resources, concurrently if ``max_workers > 1``.
+
+    If downloading any resource fails, the error of the first failed resource is raised after all
+    other downloads have finished.
+    """
+    def download_resource(
+            mirrors: Sequence[str] | None,
+            resource: ResourceDefinition,
+            position: int | None = None,
+    ) -> None:
         if not mirrors:
-            _download_resource_without_mirrors(resource, target_dirpath, verbose)
+            _download_resource_without_mirrors(resource, target_dirpath, verbose, position)
         else:
-            assert mirrors is not None
-            _download_resource_with_mirrors(mirrors, resource, target_dirpath, verbose)
+            _download_resource_with_mirrors(mirrors, resource, target_dirpath, verbose, position)
+
+    if max_workers == 1:
+        for mirrors, resource in mirrors_and_resources:
+            download_resource(mirrors, resource)
+        return
+
+    # Each running download takes a free progress bar line, so that the bars of concurrent
+    # downloads don't overwrite each other.
+    positions: queue.SimpleQueue[int] = queue.SimpleQueue()
+    for position in range(max_workers):
+        positions.put(position)
+
+    def download_resource_at_free_position(
+            mirrors: Sequence[str] | None,
+            resource: ResourceDefinition,
+    ) -> None:
+        position = positions.get()
+        try:
+            download_resource(mirrors, resource, position)
+        finally:
+            positions.put(position)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(download_resource_at_free_position, mirrors, resource)
+            for mirrors, resource in mirrors_and_resources
+        ]
+    for future in futures:
+        future.result()
 
 
 def _download_resource_without_mirrors(
         resource: ResourceDefinition,
         target_dirpath: Path,
         verbose: bool,
+        position: int | None = None,
 ) -> None:
     """Download resource without mirrors."""
     if resource.url is None:
@@ -197,6 +325,7 @@ def _download_resource_without_mirrors(
             filename=resource.filename,
             md5=resource.md5,
             verbose=verbose,
+            position=position,
         )
 
     # pylint: disable=overlapping-except
@@ -211,6 +340,7 @@ def _download_resource_with_mirrors(
         resource: ResourceDefinition,
         target_dirpath: Path,
         verbose: bool,
+        position: int | None = None,
 ) -> None:
     """Download resource with mirrors."""
     if resource.url is None:
@@ -228,6 +358,7 @@ def _download_resource_with_mirrors(
                 filename=resource.filename,
                 md5=resource.md5,
                 verbose=verbose,
+                position=position,
             )
             success = True
 
@@ -20,37 +20,83 @@
 """Functionality to scan, load and save dataset files."""
 from __future__ import annotations
 
+import re
 import warnings
+from collections.abc import Sequence
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from copy import deepcopy
 from pathlib import Path
+from pathlib import PurePosixPath
 from typing import Any
+from typing import IO
 
 import polars as pl
 import pyreadr
 from tqdm.auto import tqdm
 
+from pymovements._utils._paths import DirectoryIndex
 from pymovements._utils._paths import match_filepaths
 from pymovements._utils._strings import curly_to_regex
+from pymovements.dataset._utils._archives import list_archive_members
+from pymovements.dataset._utils._archives import open_archive_member
+from pymovements.dataset._utils._manifest import MANIFEST_FILENAME
+from pymovements.dataset._utils._manifest import pipeline_fingerprint
+from pymovements.dataset._utils._manifest import PipelineManifest
 from pymovements.dataset.dataset_definition import DatasetDefinition
 from pymovements.dataset.dataset_paths import DatasetPaths
+from pymovements.dataset.lazy_gaze_list import LazyGazeList
+from pymovements.dataset.pipeline_cache import PipelineCache
+from pymovements.events import EventDetectionLibrary
 from pymovements.events import Events
 from pymovements.events.precomputed import PrecomputedEventDataFrame
 from pymovements.gaze.gaze import Gaze
+from pymovements.gaze.instrumentation import file_context
 from pymovements.gaze.io import from_asc
 from pymovements.gaze.io import from_csv
 from pymovements.gaze.io import from_ipc
+from pymovements.gaze.io import from_parquet
+from pymovements.gaze.transforms import TransformLibrary
 from pymovements.reading_measures import ReadingMeasures
 
 
-def scan_dataset(definition: DatasetDefinition, paths: DatasetPaths) -> dict[str, pl.DataFrame]:
+SCAN_INDEX_FILENAME = '.scan_index.json'
+
+SPILL_DIRNAME = '.spill'
+
+
+def scan_dataset(
+        definition: DatasetDefinition,
+        paths: DatasetPaths,
+        *,
+        use_index: bool = False,
+        max_workers: int = 1,
+        from_archives: bool = False,
+) -> dict[str, pl.DataFrame]:
     """Infer information from filepaths and filenames.
 
+    If ``from_archives`` is ``True``, gaze files are matched against the members of the downloaded
+    gaze resource archives instead of the files in the raw data directory. The fileinfo dataframe
+    then has an additional ``archive`` column holding the archive filename in the downloads
+    directory, and the ``filepath`` column holds the member name in the archive.
+
     Parameters
     ----------
     definition: DatasetDefinition
         The dataset definition.
     paths: DatasetPaths
         The dataset paths.
+    use_index: bool
+        If ``True``, directory listings are persisted in an index file in the dataset directory.
+        On subsequent scans, only directories which have been modified since are listed again.
+        (default: False)
+    max_workers: int
+        Maximum number of threads listing directories concurrently. (default: 1)
+    from_archives: bool
+        If ``True``, scan the members of the gaze resource archives instead of the extracted
+        files. Other resources are still scanned from their extracted files. Nested archives are
+        not opened. (default: False)
 
     Returns
     -------
@@ -63,7 +109,11 @@ def scan_dataset(definition: DatasetDefinition, paths: DatasetPaths) -> dict[str
         If no regular expression for parsing filenames is defined.
     RuntimeError
         If an error occurred during matching filenames or no files have been found.
+    ValueError
+        If ``max_workers`` is not positive.
     """
+    index = DirectoryIndex(paths.dataset / SCAN_INDEX_FILENAME) if use_index else None
+
     # Get all filepaths that match regular expression.
     _fileinfo_dicts: dict[str, pl.DataFrame] = {}
 
@@ -84,11 +134,20 @@ def scan_dataset(definition: DatasetDefinition, paths: DatasetPaths) -> dict[str
             )
             continue
 
-        filepaths = match_filepaths(
-            path=resource_dirpath,
-            regex=curly_to_regex(resource_definition.filename_pattern),
-            relative=True,
-        )
+        if from_archives and content_type == 'gaze':
+            resource_dirpath = paths.downloads / resource_definition.filename
+            filepaths = _match_archive_members(
+                archive_path=resource_dirpath,
+                regex=curly_to_regex(resource_definition.filename_pattern),
+            )
+        else:
+            filepaths = match_filepaths(
+                path=resource_dirpath,
+                regex=curly_to_regex(resource_definition.filename_pattern),
+                relative=True,
+                index=index,
+                max_workers=max_workers,
+            )
 
         if not filepaths:
             raise RuntimeError(f'no matching files found in {resource_dirpath}')
@@ -112,9 +171,28 @@ def scan_dataset(definition: DatasetDefinition, paths: DatasetPaths) -> dict[str
         else:
             _fileinfo_dicts[content_type] = fileinfo_df
 
+    if index is not None:
+        index.write()
+
     return _fileinfo_dicts
 
 
+def _match_archive_members(archive_path: Path, regex: re.Pattern) -> list[dict[str, str]]:
+    """Match the file names of archive members against a regular expression.
+
+    Each match dictionary additionally holds the member name as ``filepath`` and the archive
+    filename as ``archive``.
+    """
+    match_dicts = []
+    for member_name in list_archive_members(archive_path):
+        if match := regex.match(PurePosixPath(member_name).name):
+            match_dict = match.groupdict()
+            match_dict['filepath'] = member_name
+            match_dict['archive'] = archive_path.name
+            match_dicts.append(match_dict)
+    return match_dicts
+
+
 def load_event_files(
         definition: DatasetDefinition,
         fileinfo: pl.DataFrame,
@@ -196,7 +274,11 @@ def load_gaze_files(
         preprocessed: bool = False,
         preprocessed_dirname: str | None = None,
         extension: str = 'feather',
-) -> list[Gaze]:
+        *,
+        lazy: bool = False,
+        max_memory: int | None = None,
+        spill: bool = False,
+) -> list[Gaze] | LazyGazeList:
     """Load all available gaze data files.
 
     Parameters
@@ -219,11 +301,20 @@ def load_gaze_files(
         Specifies the file format for loading data. Valid options are: `csv`, `feather`,
         `txt`, `tsv`.
         (default: 'feather')
+    lazy: bool
+        If ``True``, return a :py:class:`~pymovements.dataset.LazyGazeList` which loads each
+        gaze file on first access. (default: False)
+    max_memory: int | None
+        Maximum estimated size of all gazes held in memory in bytes if ``lazy`` is ``True``.
+        If None, gazes are never evicted. (default: None)
+    spill: bool
+        If ``True`` and ``lazy`` is ``True``, modified gazes are written to a ``.spill``
+        directory in the preprocessed directory on eviction. (default: False)
 
     Returns
     -------
-    list[Gaze]
-        Returns self, useful for method cascading.
+    list[Gaze] | LazyGazeList
+        The loaded gazes.
 
     Raises
     ------
@@ -232,28 +323,53 @@ def load_gaze_files(
     RuntimeError
         If file type of gaze file is not supported.
     """
-    gazes: list[Gaze] = []
+    fileinfo_rows = fileinfo.to_dicts()
 
-    # Read gaze files from fileinfo attribute.
-    for fileinfo_row in tqdm(fileinfo.to_dicts()):
-        filepath = Path(fileinfo_row['filepath'])
-        filepath = paths.raw / filepath
+    def load_gaze_file_by_index(index: int) -> Gaze:
+        fileinfo_row = fileinfo_rows[index]
 
         if preprocessed:
             filepath = paths.get_preprocessed_filepath(
-                filepath, preprocessed_dirname=preprocessed_dirname,
+                paths.raw / fileinfo_row['filepath'], preprocessed_dirname=preprocessed_dirname,
                 extension=extension,
             )
+            archive_path = None
+        else:
+            filepath, archive_path = _get_raw_gaze_filepath(fileinfo_row, paths)
 
-        gaze = load_gaze_file(
+        return load_gaze_file(
             filepath=filepath,
             fileinfo_row=fileinfo_row,
             definition=deepcopy(definition),
             preprocessed=preprocessed,
+            archive_path=archive_path,
         )
-        gazes.append(gaze)
 
-    return gazes
+    if lazy:
+        spill_dirpaths = None
+        if spill:
+            spill_rootpath = paths.preprocessed / SPILL_DIRNAME
+            spill_dirpaths = [spill_rootpath / row['filepath'] for row in fileinfo_rows]
+
+        return LazyGazeList(
+            load_gaze_file_by_index,
+            len(fileinfo_rows),
+            max_memory=max_memory,
+            spill_dirpaths=spill_dirpaths,
+        )
+
+    # Read gaze files from fileinfo attribute.
+    return [load_gaze_file_by_index(index) for index in tqdm(range(len(fileinfo_rows)))]
+
+
+def _get_raw_gaze_filepath(
+        fileinfo_row: dict[str, Any],
+        paths: DatasetPaths,
+) -> tuple[Path, Path | None]:
+    """Get the path of a raw gaze file and the path of the archive containing it, if any."""
+    if fileinfo_row.get('archive') is not None:
+        return Path(fileinfo_row['filepath']), paths.downloads / fileinfo_row['archive']
+    return paths.raw / fileinfo_row['filepath'], None
 
 
 def load_gaze_file(
@@ -261,13 +377,15 @@ def load_gaze_file(
         fileinfo_row: dict[str, Any],
         definition: DatasetDefinition,
         preprocessed: bool = False,
+        archive_path: Path | None = None,
 ) -> Gaze:
     """Load a gaze data file as Gaze.
 
     Parameters
     ----------
     filepath: Path
-        Path of gaze file.
+        Path of gaze file. If ``archive_path`` is specified, this is the member name in the
+        archive.
     fileinfo_row: dict[str, Any]
         A dictionary holding file information.
     definition: DatasetDefinition
@@ -275,6 +393,9 @@ def load_gaze_file(
     preprocessed: bool
         If ``True``, saved preprocessed data will be loaded, otherwise raw data will be loaded.
         (default: False)
+    archive_path: Path | None
+        Path of an archive containing the gaze file. If specified, the gaze file is read from the
+        archive without extracting it to disk. (default: None)
 
     Returns
     -------
@@ -288,7 +409,7 @@ def load_gaze_file(
     ValueError
         If extension is not in list of valid extensions.
     """
-    ignored_fileinfo_columns = {'filepath', 'load_function', 'load_kwargs'}
+    ignored_fileinfo_columns = {'filepath', 'archive', 'load_function', 'load_kwargs'}
     fileinfo_columns = {
         column: fileinfo_row[column] for column in
         [column for column in fileinfo_row.keys() if column not in ignored_fileinfo_columns]
@@ -324,10 +445,12 @@ def load_gaze_file(
             load_function_name = 'from_csv'
         elif filepath.suffix == '.feather':
             load_function_name = 'from_ipc'
+        elif filepath.suffix == '.parquet':
+            load_function_name = 'from_parquet'
         elif filepath.suffix == '.asc':
             load_function_name = 'from_asc'
         else:
-            valid_extensions = ['csv', 'tsv', 'txt', 'feather', 'asc']
+            valid_extensions = ['csv', 'tsv', 'txt', 'feather', 'parquet', 'asc']
             raise ValueError(
                 f'Unknown file extension "{filepath.suffix}". '
                 f'Known extensions are: {valid_extensions}\n'
@@ -338,22 +461,57 @@ def load_gaze_file(
     if load_function_kwargs is None:
         load_function_kwargs = {}
 
-    if load_function_name == 'from_csv':
-        if preprocessed:
-            # Time unit is always milliseconds for preprocessed data if a time column is present.
-            time_unit = 'ms'
-
-            gaze = from_csv(
-                filepath,
-                time_unit=time_unit,
-                auto_column_detect=True,
+    with ExitStack() as stack:
+        file: Path | IO[bytes] = filepath
+        if archive_path is not None:
+            # The member is streamed to the reader instead of being copied into memory first.
+            file = stack.enter_context(open_archive_member(archive_path, filepath.as_posix()))
+
+        if load_function_name == 'from_csv':
+            if preprocessed:
+                # Time unit is always milliseconds for preprocessed data if a time column is
+                # present.
+                time_unit = 'ms'
+
+                gaze = from_csv(
+                    file,
+                    time_unit=time_unit,
+                    auto_column_detect=True,
+                    trial_columns=trial_columns,  # this includes all fileinfo_columns.
+                    add_columns=fileinfo_columns,
+                    column_schema_overrides=column_schema_overrides,
+                )
+            else:
+                gaze = from_csv(
+                    file,
+                    definition=definition,
+                    trial_columns=trial_columns,  # this includes all fileinfo_columns.
+                    add_columns=fileinfo_columns,
+                    # column_schema_overrides is used for fileinfo_columns passed as add_columns.
+                    column_schema_overrides=column_schema_overrides,
+                    **load_function_kwargs,
+                )
+        elif load_function_name == 'from_ipc':
+            gaze = from_ipc(
+                file,
+                experiment=definition.experiment,
                 trial_columns=trial_columns,  # this includes all fileinfo_columns.
                 add_columns=fileinfo_columns,
+                # column_schema_overrides is used for fileinfo_columns passed as add_columns.
                 column_schema_overrides=column_schema_overrides,
             )
-        else:
-            gaze = from_csv(
-                filepath,
+        elif load_function_name == 'from_parquet':
+            gaze = from_parquet(
+                file,
+                experiment=definition.experiment,
+                trial_columns=trial_columns,  # this includes all fileinfo_columns.
+                add_columns=fileinfo_columns,
+                # column_schema_overrides is used for fileinfo_columns passed as add_columns.
+                column_schema_overrides=column_schema_overrides,
+            )
+        elif load_function_name == 'from_asc':
+            gaze = from_asc(
+                file,
                 definition=definition,
                 trial_columns=trial_columns,  # this includes all fileinfo_columns.
                 add_columns=fileinfo_columns,
@@ -361,35 +519,355 @@ def load_gaze_file(
                 column_schema_overrides=column_schema_overrides,
                 **load_function_kwargs,
             )
-    elif load_function_name == 'from_ipc':
-        gaze = from_ipc(
-            filepath,
-            experiment=definition.experiment,
-            trial_columns=trial_columns,  # this includes all fileinfo_columns.
-            add_columns=fileinfo_columns,
-            # column_schema_overrides is used for fileinfo_columns passed as add_columns.
-            column_schema_overrides=column_schema_overrides,
+        else:
+            valid_load_functions = ['from_csv', 'from_ipc', 'from_parquet', 'from_asc']
+            raise ValueError(
+                f'Unsupported load_function "{load_function_name}". '
+                f'Available options are: {valid_load_functions}',
+            )
+
+    return gaze
+
+
+def convert_gaze_files(
+        definition: DatasetDefinition,
+        fileinfo: pl.DataFrame,
+        paths: DatasetPaths,
+        *,
+        preprocessed_dirname: str | None = None,
+        extension: str = 'feather',
+        max_workers: int = 1,
+        verbose: int = 1,
+) -> None:
+    """Convert raw gaze files to columnar files in the preprocessed directory.
+
+    Each raw gaze file is read with its load function and directly written as an IPC/feather or
+    parquet file, without keeping all gazes in memory. If the fileinfo dataframe has an
+    ``archive`` column, the raw files are read from the archives in the downloads directory, so
+    the raw files never need to be extracted to disk.
+
+    In contrast to :py:func:`save_preprocessed`, the fileinfo columns are kept in the samples as
+    partition columns. The converted files can thus also be scanned as a single table, e.g., with
+    :py:func:`polars.scan_parquet`.
+
+    Parameters
+    ----------
+    definition: DatasetDefinition
+        The dataset definition.
+    fileinfo: pl.DataFrame
+        A dataframe holding file information.
+    paths: DatasetPaths
+        The dataset paths.
+    preprocessed_dirname: str | None
+        One-time usage of an alternative directory name to save data relative to dataset path.
+        This argument is used only for this single call and does not alter
+        :py:meth:`pymovements.Dataset.preprocessed_rootpath`. (default: None)
+    extension: str
+        Specifies the file format for saving data. Valid options are: `feather`, `parquet`.
+        (default: 'feather')
+    max_workers: int
+        Maximum number of threads converting files concurrently. (default: 1)
+    verbose: int
+        Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths)
+        (default: 1)
+
+    Raises
+    ------
+    ValueError
+        If extension is not in list of valid extensions or if ``max_workers`` is not positive.
+    """
+    valid_extensions = ['feather', 'parquet']
+    if extension not in valid_extensions:
+        raise ValueError(
+            f'unsupported file format "{extension}".'
+            f'Supported formats are: {valid_extensions}',
         )
-    elif load_function_name == 'from_asc':
-        gaze = from_asc(
-            filepath,
-            definition=definition,
-            trial_columns=trial_columns,  # this includes all fileinfo_columns.
-            add_columns=fileinfo_columns,
-            # column_schema_overrides is used for fileinfo_columns passed as add_columns.
-            column_schema_overrides=column_schema_overrides,
-            **load_function_kwargs,
+    if max_workers < 1:
+        raise ValueError(f'max_workers must be positive, but is {max_workers}')
+
+    def convert_gaze_file(fileinfo_row: dict[str, Any]) -> None:
+        filepath, archive_path = _get_raw_gaze_filepath(fileinfo_row, paths)
+        gaze = load_gaze_file(
+            filepath=filepath,
+            fileinfo_row=fileinfo_row,
+            definition=deepcopy(definition),
+            archive_path=archive_path,
         )
-    else:
-        valid_load_functions = ['from_csv', 'from_ipc', 'from_asc']
+
+        preprocessed_filepath = paths.get_preprocessed_filepath(
+            paths.raw / fileinfo_row['filepath'], preprocessed_dirname=preprocessed_dirname,
+            extension=extension,
+        )
+        if verbose >= 2:
+            print('Save file to', preprocessed_filepath)
+
+        # Fileinfo columns are not dropped and kept as partition columns.
+        save_preprocessed_file(
+            gaze=gaze,
+            filepath=preprocessed_filepath,
+            fileinfo_columns=[],
+            extension=extension,
+        )
+
+    fileinfo_rows = fileinfo.to_dicts()
+    with tqdm(total=len(fileinfo_rows), disable=not verbose) as progress_bar:
+        if max_workers == 1:
+            for fileinfo_row in fileinfo_rows:
+                convert_gaze_file(fileinfo_row)
+                progress_bar.update(1)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(convert_gaze_file, fileinfo_row) for fileinfo_row in fileinfo_rows
+            ]
+            for future in as_completed(futures):
+                future.result()
+                progress_bar.update(1)
+
+
+def process_gaze_files(
+        definition: DatasetDefinition,
+        fileinfo: pl.DataFrame,
+        paths: DatasetPaths,
+        pipeline: str | tuple[str, dict[str, Any]] | list[str | tuple[str, dict[str, Any]]],
+        *,
+        preprocessed_dirname: str | None = None,
+        events_dirname: str | None = None,
+        extension: str = 'feather',
+        resume: bool = True,
+        cache: PipelineCache | None = None,
+        verbose: int = 1,
+) -> list[str]:
+    """Apply a preprocessing pipeline to each raw gaze file and save the results.
+
+    Files are processed one at a time: each raw gaze file is loaded, all pipeline steps are
+    applied and the resulting samples are saved before the next file is loaded. If the pipeline
+    includes event detection methods, the detected events are saved as well.
+    If the fileinfo has an ``archive`` column, the raw gaze files are read from the archives in
+    the downloads directory.
+    Completed files are recorded in a manifest in the preprocessed directory together with the
+    MD5 checksum of the raw file and a fingerprint of the pipeline. With ``resume=True``, files
+    whose outputs are up to date with respect to both are skipped. This way an interrupted run
+    continues from the last completed file and only new or changed raw files are processed
+    when a dataset grows.
+
+    If a :py:class:`~pymovements.PipelineCache` is passed, the result after each pipeline
+    step is stored in the cache. Processing a file then starts from the longest cached prefix of
+    the pipeline instead of loading and processing the raw file from scratch.
+
+    Parameters
+    ----------
+    definition: DatasetDefinition
+        The dataset definition.
+    fileinfo: pl.DataFrame
+        A dataframe holding file information.
+    paths: DatasetPaths
+        The dataset paths.
+    pipeline: str | tuple[str, dict[str, Any]] | list[str | tuple[str, dict[str, Any]]]
+        Ordered pipeline steps. Each step is either the name of a transformation or event
+        detection method, or a tuple of the name and a dictionary of keyword arguments.
+    preprocessed_dirname: str | None
+        One-time usage of an alternative directory name to save data relative to dataset path.
+        This argument is used only for this single call and does not alter
+        :py:meth:`pymovements.Dataset.preprocessed_rootpath`. (default: None)
+    events_dirname: str | None
+        One-time usage of an alternative directory name to save data relative to dataset path.
+        This argument is used only for this single call and does not alter
+        :py:meth:`pymovements.Dataset.events_rootpath`. (default: None)
+    extension: str
+        Specifies the file format for saving data. Valid options are: `csv`, `feather`,
+        `parquet`. (default: 'feather')
+    resume: bool
+        If ``True``, skip files whose outputs are up to date according to the manifest.
+        (default: True)
+    cache: PipelineCache | None
+        Cache for loaded and processed gaze. If None, no cache is used. (default: None)
+    verbose: int
+        Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths)
+        (default: 1)
+
+    Returns
+    -------
+    list[str]
+        Relative filepaths of all raw gaze files that have been processed in this call.
+
+    Raises
+    ------
+    TypeError
+        If a pipeline step is neither a string nor a tuple of a string and a dictionary.
+    ValueError
+        If a pipeline step is not a supported transformation or event detection method or if
+        extension is not in list of valid extensions.
+    """
+    steps = _check_pipeline(pipeline)
+    detects_events = any(function in EventDetectionLibrary.methods for function, _ in steps)
+
+    valid_extensions = ['csv', 'feather', 'parquet']
+    if extension not in valid_extensions:
         raise ValueError(
-            f'Unsupported load_function "{load_function_name}". '
-            f'Available options are: {valid_load_functions}',
+            f'unsupported file format "{extension}".'
+            f'Supported formats are: {valid_extensions}',
         )
 
+    if preprocessed_dirname is None:
+        preprocessed_rootpath = paths.preprocessed
+    else:
+        preprocessed_rootpath = paths.dataset / preprocessed_dirname
+
+    manifest = PipelineManifest(
+        filepath=preprocessed_rootpath / MANIFEST_FILENAME,
+        fingerprint=pipeline_fingerprint(
+            steps, extension=extension, definition=definition.to_dict(),
+        ),
+    )
+
+    processed_filepaths: list[str] = []
+    for fileinfo_row in tqdm(fileinfo.to_dicts(), disable=not verbose):
+        key = fileinfo_row['filepath']
+        # Output paths are derived from the raw path, also for files read from an archive.
+        raw_filepath = paths.raw / Path(key)
+        input_filepath, archive_path = _get_raw_gaze_filepath(fileinfo_row, paths)
+
+        input_hash = manifest.input_hash(key, input_filepath, archive_path=archive_path)
+        if resume and manifest.is_complete(key, input_hash):
+            continue
+
+        with file_context(key):
+            if cache is None:
+                gaze = load_gaze_file(
+                    filepath=input_filepath,
+                    fileinfo_row=fileinfo_row,
+                    definition=deepcopy(definition),
+                    archive_path=archive_path,
+                )
+                for function, kwargs in steps:
+                    gaze.apply(function, **deepcopy(kwargs))
+            else:
+                gaze = _apply_pipeline_cached(
+                    cache=cache,
+                    steps=steps,
+                    input_hash=input_hash,
+                    raw_filepath=input_filepath,
+                    fileinfo_row=fileinfo_row,
+                    definition=definition,
+                    archive_path=archive_path,
+                )
+
+        preprocessed_filepath = paths.get_preprocessed_filepath(
+            raw_filepath, preprocessed_dirname=preprocessed_dirname, extension=extension,
+        )
+        if verbose >= 2:
+            print('Save file to', preprocessed_filepath)
+        save_preprocessed_file(
+            gaze=gaze,
+            filepath=preprocessed_filepath,
+            fileinfo_columns=fileinfo.columns,
+            extension=extension,
+        )
+        outputs = [preprocessed_filepath]
+
+        if detects_events:
+            events_filepath = paths.raw_to_event_filepath(
+                raw_filepath, events_dirname=events_dirname, extension=extension,
+            )
+            if verbose >= 2:
+                print('Save file to', events_filepath)
+            save_events_file(
+                events=gaze.events,
+                filepath=events_filepath,
+                fileinfo_columns=fileinfo.columns,
+                extension=extension,
+            )
+            outputs.append(events_filepath)
+
+        manifest.mark_complete(
+            key, input_filepath, input_hash, outputs, archive_path=archive_path,
+        )
+        processed_filepaths.append(key)
+
+    return processed_filepaths
+
+
+def _apply_pipeline_cached(
+        cache: PipelineCache,
+        steps: list[tuple[str, dict[str, Any]]],
+        input_hash: str,
+        raw_filepath: Path,
+        fileinfo_row: dict[str, Any],
+        definition: DatasetDefinition,
+        archive_path: Path | None = None,
+) -> Gaze:
+    """Apply pipeline steps to a raw gaze file, reusing and storing intermediate results in cache.
+
+    The cache key of the result after ``n`` steps is computed from the raw file checksum, the
+    first ``n`` pipeline steps, the file information and the dataset definition. Only the steps
+    after the longest cached prefix are applied.
+    """
+    context = {'fileinfo': fileinfo_row, 'definition': definition.to_dict()}
+    keys = [
+        PipelineCache.key(input_hash, steps[:n_steps], **context)
+        for n_steps in range(len(steps) + 1)
+    ]
+
+    gaze = None
+    n_cached_steps = len(steps)
+    while n_cached_steps >= 0:
+        gaze = cache.get(keys[n_cached_steps])
+        if gaze is not None:
+            break
+        n_cached_steps -= 1
+
+    if gaze is None:
+        gaze = load_gaze_file(
+            filepath=raw_filepath,
+            fileinfo_row=fileinfo_row,
+            definition=deepcopy(definition),
+            archive_path=archive_path,
+        )
+        cache.put(keys[0], gaze)
+        n_cached_steps = 0
+
+    for n_steps in range(n_cached_steps + 1, len(steps) + 1):
+        function, kwargs = steps[n_steps - 1]
+        gaze.apply(function, **deepcopy(kwargs))
+        cache.put(keys[n_steps], gaze)
+
     return gaze
 
 
+def _check_pipeline(
+        pipeline: str | tuple[str, dict[str, Any]] | list[str | tuple[str, dict[str, Any]]],
+) -> list[tuple[str, dict[str, Any]]]:
+    """Validate pipeline steps and return them as a list of tuples with keyword arguments."""
+    if isinstance(pipeline, (str, tuple)):
+        pipeline = [pipeline]
+
+    steps: list[tuple[str, dict[str, Any]]] = []
+    for step in pipeline:
+        if isinstance(step, str):
+            step = (step, {})
+
+        if (
+                not isinstance(step, tuple) or len(step) != 2 or
+                not isinstance(step[0], str) or not isinstance(step[1], dict)
+        ):
+            raise TypeError(
+                'each pipeline step must be either a string or a tuple of a string '
+                f'and a dictionary, but received {step}',
+            )
+
+        function = step[0]
+        if (
+                function not in TransformLibrary.methods and
+                function not in EventDetectionLibrary.methods
+        ):
+            raise ValueError(f"unsupported method '{function}'")
+
+        steps.append(step)
+    return steps
+
+
 def load_precomputed_reading_measures(
         definition: DatasetDefinition,
         fileinfo: pl.DataFrame,
@@ -605,7 +1083,7 @@ def add_fileinfo(
     pl.DataFrame
         Dataframe with added columns from fileinfo dictionary keys.
     """
-    ignored_fileinfo_columns = {'filepath', 'load_function', 'load_kwargs'}
+    ignored_fileinfo_columns = {'filepath', 'archive', 'load_function', 'load_kwargs'}
     df = df.select(
         [
             pl.lit(value).alias(column)
@@ -672,29 +1150,62 @@ def save_events(
             extension=extension,
         )
 
-        events_out = events_in.frame.clone()
-        for column in events_out.columns:
-            if column in fileinfo.columns:
-                events_out = events_out.drop(column)
-
         if verbose >= 2:
             print('Save file to', events_filepath)
 
-        events_filepath.parent.mkdir(parents=True, exist_ok=True)
-        if extension == 'feather':
-            events_out.write_ipc(events_filepath)
-        elif extension == 'csv':
-            events_out.write_csv(events_filepath)
-        else:
-            valid_extensions = ['csv', 'feather']
-            raise ValueError(
-                f'unsupported file format "{extension}".'
-                f'Supported formats are: {valid_extensions}',
-            )
+        save_events_file(
+            events=events_in,
+            filepath=events_filepath,
+            fileinfo_columns=fileinfo.columns,
+            extension=extension,
+        )
+
+
+def save_events_file(
+        events: Events,
+        filepath: Path,
+        fileinfo_columns: list[str],
+        extension: str = 'feather',
+) -> None:
+    """Save a single event file.
+
+    Parameters
+    ----------
+    events: Events
+        The events to save.
+    filepath: Path
+        Path of the event file.
+    fileinfo_columns: list[str]
+        Columns of the fileinfo dataframe. These columns are dropped before saving.
+    extension: str
+        Specifies the file format for saving data. Valid options are: `csv`, `feather`.
+        (default: 'feather')
+
+    Raises
+    ------
+    ValueError
+        If extension is not in list of valid extensions.
+    """
+    events_out = events.frame.clone()
+    for column in events_out.columns:
+        if column in fileinfo_columns:
+            events_out = events_out.drop(column)
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    if extension == 'feather':
+        events_out.write_ipc(filepath)
+    elif extension == 'csv':
+        events_out.write_csv(filepath)
+    else:
+        valid_extensions = ['csv', 'feather']
+        raise ValueError(
+            f'unsupported file format "{extension}".'
+            f'Supported formats are: {valid_extensions}',
+        )
 
 
 def save_preprocessed(
-        gazes: list[Gaze],
+        gazes: Sequence[Gaze],
         fileinfo: pl.DataFrame,
         paths: DatasetPaths,
         preprocessed_dirname: str | None = None,
@@ -708,7 +1219,7 @@ def save_preprocessed(
 
     Parameters
     ----------
-    gazes: list[Gaze]
+    gazes: Sequence[Gaze]
         The gaze objects to save.
     fileinfo: pl.DataFrame
         A dataframe holding file information.
@@ -722,8 +1233,8 @@ def save_preprocessed(
         Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths)
         (default: 1)
     extension: str
-        Specifies the file format for loading data. Valid options are: `csv`, `feather`.
-        (default: 'feather')
+        Specifies the file format for saving data. Valid options are: `csv`, `feather`,
+        `parquet`. (default: 'feather')
 
     Raises
     ------
@@ -733,35 +1244,70 @@ def save_preprocessed(
     disable_progressbar = not verbose
 
     for file_id, gaze in enumerate(tqdm(gazes, disable=disable_progressbar)):
-        gaze = gaze.clone()
-
         raw_filepath = paths.raw / Path(fileinfo[file_id, 'filepath'])
         preprocessed_filepath = paths.get_preprocessed_filepath(
             raw_filepath, preprocessed_dirname=preprocessed_dirname,
             extension=extension,
         )
 
-        if extension == 'csv':
-            gaze.unnest()
-
-        for column in gaze.columns:
-            if column in fileinfo.columns:
-                gaze.samples = gaze.samples.drop(column)
-
         if verbose >= 2:
             print('Save file to', preprocessed_filepath)
 
-        preprocessed_filepath.parent.mkdir(parents=True, exist_ok=True)
-        if extension == 'feather':
-            gaze.samples.write_ipc(preprocessed_filepath)
-        elif extension == 'csv':
-            gaze.samples.write_csv(preprocessed_filepath)
-        else:
-            valid_extensions = ['csv', 'feather']
-            raise ValueError(
-                f'unsupported file format "{extension}".'
-                f'Supported formats are: {valid_extensions}',
-            )
+        save_preprocessed_file(
+            gaze=gaze,
+            filepath=preprocessed_filepath,
+            fileinfo_columns=fileinfo.columns,
+            extension=extension,
+        )
+
+
+def save_preprocessed_file(
+        gaze: Gaze,
+        filepath: Path,
+        fileinfo_columns: list[str],
+        extension: str = 'feather',
+) -> None:
+    """Save a single preprocessed gaze file.
+
+    Parameters
+    ----------
+    gaze: Gaze
+        The gaze object to save.
+    filepath: Path
+        Path of the preprocessed file.
+    fileinfo_columns: list[str]
+        Columns of the fileinfo dataframe. These columns are dropped before saving.
+    extension: str
+        Specifies the file format for saving data. Valid options are: `csv`, `feather`,
+        `parquet`. (default: 'feather')
+
+    Raises
+    ------
+    ValueError
+        If extension is not in list of valid extensions.
+    """
+    gaze = gaze.clone()
+
+    if extension == 'csv':
+        gaze.unnest()
+
+    for column in gaze.columns:
+        if column in fileinfo_columns:
+            gaze.samples = gaze.samples.drop(column)
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    if extension == 'feather':
+        gaze.samples.write_ipc(filepath)
+    elif extension == 'parquet':
+        gaze.samples.write_parquet(filepath)
+    elif extension == 'csv':
+        gaze.samples.write_csv(filepath)
+    else:
+        valid_extensions = ['csv', 'feather', 'parquet']
+        raise ValueError(
+            f'unsupported file format "{extension}".'
+            f'Supported formats are: {valid_extensions}',
+        )
 
 
 def take_subset(
@@ -20,6 +20,8 @@
 """DatasetLibrary module."""
 from __future__ import annotations
 
+from collections.abc import Iterator
+from collections.abc import MutableMapping
 from copy import deepcopy
 from importlib import resources
 from pathlib import Path
@@ -31,17 +33,74 @@ from pymovements import datasets
 from pymovements.dataset.dataset_definition import DatasetDefinition
 
 
+class _DatasetDefinitions(MutableMapping[str, DatasetDefinition]):
+    """Dictionary of :py:class:`~pymovements.DatasetDefinition` with lazily parsed YAML files.
+
+    Definitions added via :py:meth:`add_file` are only registered by name. Their YAML file is
+    parsed on first access and the resulting definition is kept for subsequent accesses.
+    """
+
+    def __init__(self) -> None:
+        self._definitions: dict[str, DatasetDefinition] = {}
+        self._definition_files: dict[str, Path] = {}
+
+    def add_file(self, name: str, path: Path) -> None:
+        """Register a YAML definition file under a name without parsing it.
+
+        Parameters
+        ----------
+        name: str
+            The name of the dataset definition in the YAML file.
+        path: Path
+            Path to the YAML file.
+        """
+        self._definitions.pop(name, None)
+        self._definition_files[name] = path
+
+    def __getitem__(self, name: str) -> DatasetDefinition:
+        if name not in self._definitions:
+            if name not in self._definition_files:
+                raise KeyError(name)
+            definition = DatasetDefinition.from_yaml(self._definition_files[name])
+            del self._definition_files[name]
+            self._definitions[name] = definition
+        return self._definitions[name]
+
+    def __setitem__(self, name: str, definition: DatasetDefinition) -> None:
+        self._definition_files.pop(name, None)
+        self._definitions[name] = definition
+
+    def __delitem__(self, name: str) -> None:
+        if name in self._definition_files:
+            del self._definition_files[name]
+        else:
+            del self._definitions[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._definitions or name in self._definition_files
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._definitions
+        yield from self._definition_files
+
+    def __len__(self) -> int:
+        return len(self._definitions) + len(self._definition_files)
+
+
 class DatasetLibrary:
     """Provides access by name to :py:class:`~pymovements.DatasetDefinition`.
 
+    Shipped dataset definitions are only registered by name on import. Their YAML files are parsed
+    on first access.
+
     Attributes
     ----------
-    definitions: dict[str, DatasetDefinition]
+    definitions: MutableMapping[str, DatasetDefinition]
         Dictionary of :py:class:`~pymovements.DatasetDefinition`,
         either as classes or instances.
     """
 
-    definitions: dict[str, DatasetDefinition] = {}
+    definitions: MutableMapping[str, DatasetDefinition] = _DatasetDefinitions()
 
     @classmethod
     def add(cls, definition: type[DatasetDefinition] | Path | str) -> None:
@@ -126,8 +185,36 @@ def register_dataset(cls: DatasetDefinitionClass) -> DatasetDefinitionClass:
     return cls
 
 
+def _read_definition_name(path: Path) -> str:
+    """Read the dataset name from a YAML definition file without parsing the whole file.
+
+    Parameters
+    ----------
+    path: Path
+        Path to the YAML definition file.
+
+    Returns
+    -------
+    str
+        The name of the dataset definition.
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('name:'):
+                name = yaml.safe_load(line)['name']
+                if isinstance(name, str):
+                    return name
+                break
+
+    # Fall back to parsing the whole file if the name is not given in a single top level line.
+    return DatasetDefinition.from_yaml(path).name
+
+
 def _add_shipped_datasets() -> None:
-    """Add available public datasets via `src/pymovements/datasets/datasets.yaml`."""
+    """Add available public datasets via `src/pymovements/datasets/datasets.yaml`.
+
+    Only the dataset names are read here. The definitions are parsed on first access.
+    """
     dataset_definition_files = resources.files(datasets)
 
     datasets_list_yaml = dataset_definition_files / 'datasets.yaml'
@@ -136,11 +223,14 @@ def _add_shipped_datasets() -> None:
     with open(datasets_list_yaml, encoding='utf-8') as f:
         datasets_list = yaml.safe_load(f)
 
+    definitions = DatasetLibrary.definitions
+    assert isinstance(definitions, _DatasetDefinitions)
+
     for definition_basename in datasets_list:
         yaml_file_name = dataset_definition_files / f'{definition_basename}.yaml'
         # https://github.com/aeye-lab/pymovements/pull/952#issuecomment-2690742187
         assert isinstance(yaml_file_name, Path)
-        DatasetLibrary.add(yaml_file_name)
+        definitions.add_file(_read_definition_name(yaml_file_name), yaml_file_name)
 
 
 _add_shipped_datasets()
@@ -0,0 +1,183 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""LazyGazeList module."""
+from __future__ import annotations
+
+import shutil
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from pathlib import Path
+from typing import overload
+
+from pymovements.dataset._utils._gaze_dirs import read_gaze_dir
+from pymovements.dataset._utils._gaze_dirs import write_gaze_dir
+from pymovements.events import Events
+from pymovements.gaze.gaze import Gaze
+
+
+class LazyGazeList(Sequence[Gaze]):
+    """Sequence of gaze files which are loaded on first access.
+
+    Each :py:class:`~pymovements.Gaze` is loaded when it is accessed for the first time and then
+    held in memory. If ``max_memory`` is set, the least recently used gazes are evicted as soon
+    as the estimated total size of all held gazes exceeds it. The most recently accessed gaze is
+    never evicted. An evicted gaze is loaded again on its next access.
+
+    Gazes are usually modified in place, e.g., by :py:meth:`pymovements.Dataset.pix2deg`. Without
+    spill directories, these modifications are lost on eviction. If ``spill_dirpaths`` is
+    passed, modified gazes are written to their spill directory on eviction and loaded from there
+    on their next access.
+
+    Modifications of a gaze after it has been evicted are not tracked. Always access gazes via
+    this sequence instead of keeping references to them.
+
+    Parameters
+    ----------
+    load_function: Callable[[int], Gaze]
+        Function which loads the gaze with the given index.
+    length: int
+        Number of gazes.
+    max_memory: int | None
+        Maximum estimated size of all held gazes in bytes. If None, gazes are never evicted.
+        (default: None)
+    spill_dirpaths: list[Path] | None
+        Spill directory of each gaze. Existing spill directories are removed on initialization.
+        If None, modified gazes are not spilled. (default: None)
+
+    Raises
+    ------
+    ValueError
+        If ``max_memory`` is negative or if the number of spill directories does not match
+        ``length``.
+    """
+
+    def __init__(
+            self,
+            load_function: Callable[[int], Gaze],
+            length: int,
+            *,
+            max_memory: int | None = None,
+            spill_dirpaths: list[Path] | None = None,
+    ):
+        if max_memory is not None and max_memory < 0:
+            raise ValueError(f'max_memory must not be negative, but is {max_memory}')
+        if spill_dirpaths is not None and len(spill_dirpaths) != length:
+            raise ValueError(
+                f'number of spill directories ({len(spill_dirpaths)}) '
+                f'must match number of gazes ({length})',
+            )
+
+        self.load_function = load_function
+        self.max_memory = max_memory
+        self.spill_dirpaths = spill_dirpaths
+        self.events: list[Events] | None = None
+
+        self._length = length
+        self._held: OrderedDict[int, Gaze] = OrderedDict()
+        self._loaded_frames: dict[int, tuple[weakref.ref, weakref.ref]] = {}
+        self._spilled: set[int] = set()
+
+        if spill_dirpaths is not None:
+            for spill_dirpath in spill_dirpaths:
+                shutil.rmtree(spill_dirpath, ignore_errors=True)
+
+    def __len__(self) -> int:
+        """Get the number of gazes."""
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Gaze:  # noqa: D105
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Gaze]:  # noqa: D105
+        ...
+
+    def __getitem__(self, index: int | slice) -> Gaze | list[Gaze]:
+        """Get the gaze at an index, loading it if it is not held in memory."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        if not -self._length <= index < self._length:
+            raise IndexError(f'index {index} out of range for {self._length} gazes')
+        index %= self._length
+
+        if index in self._held:
+            self._held.move_to_end(index)
+            return self._held[index]
+
+        gaze = self._load(index)
+        self._held[index] = gaze
+        self._loaded_frames[index] = (weakref.ref(gaze.samples), weakref.ref(gaze.events.frame))
+        self._evict()
+        return gaze
+
+    def __iter__(self) -> Iterator[Gaze]:
+        """Iterate over all gazes."""
+        for index in range(self._length):
+            yield self[index]
+
+    @property
+    def held_indices(self) -> list[int]:
+        """Indices of all gazes held in memory, from least to most recently used."""
+        return list(self._held)
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated size of all held gazes in bytes."""
+        return sum(_estimated_size(gaze) for gaze in self._held.values())
+
+    def _load(self, index: int) -> Gaze:
+        """Load a gaze from its spill directory or with the load function."""
+        if index in self._spilled:
+            assert self.spill_dirpaths is not None
+            return read_gaze_dir(self.spill_dirpaths[index])
+
+        gaze = self.load_function(index)
+        if self.events is not None:
+            gaze.events = self.events[index]
+        return gaze
+
+    def _evict(self) -> None:
+        """Evict least recently used gazes until ``max_memory`` is not exceeded anymore."""
+        if self.max_memory is None:
+            return
+
+        sizes = {index: _estimated_size(gaze) for index, gaze in self._held.items()}
+        total_size = sum(sizes.values())
+        while total_size > self.max_memory and len(self._held) > 1:
+            index, gaze = self._held.popitem(last=False)
+            samples_ref, events_ref = self._loaded_frames.pop(index)
+            is_modified = samples_ref() is not gaze.samples or events_ref() is not gaze.events.frame
+
+            if self.spill_dirpaths is not None and is_modified:
+                shutil.rmtree(self.spill_dirpaths[index], ignore_errors=True)
+                write_gaze_dir(gaze, self.spill_dirpaths[index])
+                self._spilled.add(index)
+
+            total_size -= sizes[index]
+
+
+def _estimated_size(gaze: Gaze) -> int:
+    """Estimate the size of samples and events of a gaze in bytes."""
+    return int(gaze.samples.estimated_size() + gaze.events.frame.estimated_size())
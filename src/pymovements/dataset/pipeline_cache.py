@@ -0,0 +1,206 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""PipelineCache module."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any
+
+from pymovements._version import get_versions
+from pymovements.dataset._utils._gaze_dirs import read_gaze_dir
+from pymovements.dataset._utils._gaze_dirs import write_gaze_dir
+from pymovements.gaze.gaze import Gaze
+
+
+class PipelineCache:
+    """Content-addressed cache of preprocessing results.
+
+    Each entry holds the samples and events of a :py:class:`~pymovements.Gaze` after applying a
+    sequence of pipeline steps to a raw gaze file. Entries are addressed by a key computed from
+    the checksum of the raw file, the ordered pipeline steps with their keyword arguments, any
+    additional context (e.g., the dataset definition) and the pymovements version.
+
+    The cache is stored in a plain directory, which can be shared between users and processes.
+    Entries are written to a temporary directory first and then moved into place, so readers never
+    observe partially written entries. If ``max_size`` is set, least recently used entries are
+    evicted as soon as the total size of the cache exceeds it.
+
+    Parameters
+    ----------
+    dirpath: str | Path
+        Path to the cache directory. It is created if it does not exist yet.
+    max_size: int | None
+        Maximum total size of all cache entries in bytes. If None, entries are never evicted.
+        (default: None)
+
+    Examples
+    --------
+    Pass a cache to :py:meth:`pymovements.Dataset.process` to serve all pipeline steps which have
+    already been computed from the cache:
+
+    >>> import pymovements as pm
+    >>>
+    >>> cache = pm.PipelineCache('/path/to/cache', max_size=10 * 1024 ** 3)# doctest: +SKIP
+    >>> dataset = pm.Dataset('ToyDataset', path='/path/to/dataset')# doctest: +SKIP
+    >>> dataset.scan().process(['pix2deg', 'pos2vel', 'ivt'], cache=cache)# doctest: +SKIP
+    """
+
+    def __init__(self, dirpath: str | Path, max_size: int | None = None):
+        if max_size is not None and max_size < 0:
+            raise ValueError(f'max_size must not be negative, but is {max_size}')
+
+        self.dirpath = Path(dirpath)
+        self.max_size = max_size
+
+        self.dirpath.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(
+            input_hash: str,
+            pipeline: list[tuple[str, dict[str, Any]]],
+            **context: Any,
+    ) -> str:
+        """Compute the cache key of a preprocessing result.
+
+        Parameters
+        ----------
+        input_hash: str
+            Checksum of the raw input file.
+        pipeline: list[tuple[str, dict[str, Any]]]
+            Ordered list of applied pipeline steps. Each step is a tuple of the function name and
+            its keyword arguments.
+        **context: Any
+            Additional context that influences the result.
+
+        Returns
+        -------
+        str
+            SHA-256 hex digest which addresses the cache entry.
+        """
+        data = {
+            'input': input_hash,
+            'pipeline': [[function, kwargs] for function, kwargs in pipeline],
+            'context': context,
+            'version': get_versions()['version'],
+        }
+        serialized = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Gaze | None:
+        """Get the cached preprocessing result for a key.
+
+        A successful lookup marks the entry as most recently used.
+
+        Parameters
+        ----------
+        key: str
+            The cache key.
+
+        Returns
+        -------
+        Gaze | None
+            The cached gaze or None if there is no entry for the key.
+        """
+        entry_dirpath = self._entry_dirpath(key)
+        try:
+            gaze = read_gaze_dir(entry_dirpath)
+        except FileNotFoundError:  # entry does not exist or has just been evicted.
+            return None
+
+        # Marking the entry is best-effort, as entries of other users in a shared cache can't be
+        # touched and the entry may have been evicted in the meantime.
+        try:
+            os.utime(entry_dirpath)
+        except OSError:
+            pass
+        return gaze
+
+    def put(self, key: str, gaze: Gaze) -> None:
+        """Store a preprocessing result in the cache.
+
+        If there already is an entry for this key, the cache is left unchanged.
+
+        Parameters
+        ----------
+        key: str
+            The cache key.
+        gaze: Gaze
+            The gaze to store.
+        """
+        entry_dirpath = self._entry_dirpath(key)
+        if entry_dirpath.is_dir():
+            return
+
+        entry_dirpath.parent.mkdir(parents=True, exist_ok=True)
+        # Unlike tempfile.mkdtemp(), mkdir() respects the umask, so that entries are readable by
+        # other users of a shared cache.
+        tmp_dirpath = entry_dirpath.parent / f'.tmp-{uuid.uuid4().hex}'
+        tmp_dirpath.mkdir()
+        try:
+            write_gaze_dir(gaze, tmp_dirpath)
+            os.rename(tmp_dirpath, entry_dirpath)
+        except OSError:
+            # Another process has stored the same entry in the meantime.
+            shutil.rmtree(tmp_dirpath, ignore_errors=True)
+            if not entry_dirpath.is_dir():
+                raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Evict least recently used entries until the cache size does not exceed ``max_size``."""
+        if self.max_size is None:
+            return
+
+        entries = []
+        total_size = 0
+        for entry_dirpath in self.dirpath.glob('*/*'):
+            if entry_dirpath.name.startswith('.tmp-'):
+                continue
+            try:
+                entry_size = sum(filepath.stat().st_size for filepath in entry_dirpath.iterdir())
+                entries.append((entry_dirpath.stat().st_mtime_ns, entry_size, entry_dirpath))
+            except FileNotFoundError:  # entry has been evicted by another process.
+                continue
+            total_size += entry_size
+
+        for _, entry_size, entry_dirpath in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(entry_dirpath, ignore_errors=True)
+            total_size -= entry_size
+
+    @property
+    def size(self) -> int:
+        """Total size of all cache entries in bytes."""
+        return sum(
+            filepath.stat().st_size
+            for filepath in self.dirpath.glob('*/*/*')
+            if not filepath.parent.name.startswith('.tmp-')
+        )
+
+    def _entry_dirpath(self, key: str) -> Path:
+        """Get the directory path of a cache entry."""
+        return self.dirpath / key[:2] / key
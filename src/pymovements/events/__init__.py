@@ -22,6 +22,9 @@ from pymovements.events.detection import fill
 from pymovements.events.detection import idt
 from pymovements.events.detection import ivt
 from pymovements.events.detection import microsaccades
+from pymovements.events.detection import StreamingIDT
+from pymovements.events.detection import StreamingIVT
+from pymovements.events.detection import StreamingMicrosaccades
 from pymovements.events.detection._library import EventDetectionLibrary
 from pymovements.events.detection._library import register_event_detection
 from pymovements.events.events import Events
@@ -46,6 +49,9 @@ __all__ = [
     'idt',
     'ivt',
     'microsaccades',
+    'StreamingIDT',
+    'StreamingIVT',
+    'StreamingMicrosaccades',
 
     'PrecomputedEventDataFrame',
     'Events',
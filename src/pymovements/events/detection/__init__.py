@@ -30,6 +30,16 @@
     pymovements.events.ivt
     pymovements.events.microsaccades
 
+.. rubric:: Streaming Detection
+
+.. autosummary::
+   :toctree:
+   :recursive:
+
+    pymovements.events.StreamingIDT
+    pymovements.events.StreamingIVT
+    pymovements.events.StreamingMicrosaccades
+
 """
 from pymovements.events.detection._fill import fill
 from pymovements.events.detection._idt import idt
@@ -37,6 +47,9 @@ from pymovements.events.detection._ivt import ivt
 from pymovements.events.detection._library import EventDetectionLibrary
 from pymovements.events.detection._library import register_event_detection
 from pymovements.events.detection._microsaccades import microsaccades
+from pymovements.events.detection._streaming import StreamingIDT
+from pymovements.events.detection._streaming import StreamingIVT
+from pymovements.events.detection._streaming import StreamingMicrosaccades
 
 __all__ = [
     'EventDetectionLibrary',
@@ -46,4 +59,8 @@ __all__ = [
     'idt',
     'ivt',
     'microsaccades',
+
+    'StreamingIDT',
+    'StreamingIVT',
+    'StreamingMicrosaccades',
 ]
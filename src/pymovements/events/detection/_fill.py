@@ -23,6 +23,7 @@ from __future__ import annotations
 import numpy as np
 
 from pymovements.events.detection._library import register_event_detection
+from pymovements.events.detection._properties import add_event_properties
 from pymovements.events.events import Events
 from pymovements.gaze.transforms_numpy import consecutive
 
@@ -33,6 +34,9 @@ def fill(
         timesteps: list[int] | np.ndarray,
         minimum_duration: int = 1,
         name: str = 'unclassified',
+        event_properties: str | tuple[str, dict] | list[str | tuple[str, dict]] | None = None,
+        positions: list[list[float]] | list[tuple[float, float]] | np.ndarray | None = None,
+        velocities: list[list[float]] | list[tuple[float, float]] | np.ndarray | None = None,
 ) -> Events:
     """Classify all previously unclassified timesteps as events.
 
@@ -42,12 +46,24 @@ def fill(
         The already detected events.
     timesteps: list[int] | np.ndarray
         shape (N, )
-        Continuous 1D timestep time series.
+        Continuous 1D timestep time series in ascending order.
     minimum_duration: int
         Minimum fixation duration. The duration is specified in the units used in ``timesteps``.
         (default: 1)
     name: str
         Name for detected events in Events. (default: 'unclassified')
+    event_properties: str | tuple[str, dict] | list[str | tuple[str, dict]] | None
+        Event properties to compute from the sample arrays during detection. Supported are
+        ``amplitude``, ``dispersion``, ``disposition``, ``duration``, ``location`` and
+        ``peak_velocity``. (default: None)
+    positions: list[list[float]] | list[tuple[float, float]] | np.ndarray | None
+        shape (N, 2)
+        Corresponding continuous 2D position time series. Only used for computing
+        ``event_properties``. (default: None)
+    velocities: list[list[float]] | list[tuple[float, float]] | np.ndarray | None
+        shape (N, 2)
+        Corresponding continuous 2D velocity time series. Only used for computing
+        ``event_properties``. (default: None)
 
     Returns
     -------
@@ -57,26 +73,35 @@ def fill(
     timesteps = np.array(timesteps)
 
     # Create binary mask where each existing event is marked.
-    events_mask = np.zeros(len(timesteps), dtype=bool)
-
-    for row in events.frame.iter_rows(named=True):
-        if row['onset'] > np.max(timesteps):  # event onset after last timestep
-            continue
-
-        if row['offset'] - 1 < np.min(timesteps):  # event offset before first timestep
-            continue
-
-        if row['onset'] < np.min(timesteps):  # event onset before first timestep
-            idx_onset = 0
-        else:
-            idx_onset = np.where(timesteps == row['onset'])[0][0]
-
-        if row['offset'] > np.max(timesteps):  # event offset after last timestep
-            idx_offset = len(timesteps) - 1
-        else:
-            idx_offset = np.where(timesteps == row['offset'] - 1)[0][0]
-
-        events_mask[idx_onset:idx_offset + 1] = True
+    events_mask: np.ndarray = np.zeros(len(timesteps), dtype=bool)
+
+    if len(events) > 0 and len(timesteps) > 0:
+        onsets = events.frame.get_column('onset').to_numpy()
+        offsets = events.frame.get_column('offset').to_numpy()
+
+        # Skip events with onset after last timestep or offset before first timestep.
+        in_range = (onsets <= np.max(timesteps)) & (offsets - 1 >= np.min(timesteps))
+        onsets = onsets[in_range]
+        offsets = offsets[in_range]
+
+        # Look up the sample indices of all events at once. Events with onset before the first
+        # timestep start at the first sample, events with offset after the last timestep end at
+        # the last sample.
+        idx_onsets = np.searchsorted(timesteps, onsets, side='left')
+        idx_offsets = np.where(
+            offsets > np.max(timesteps),
+            len(timesteps) - 1,
+            np.searchsorted(timesteps, offsets - 1, side='right') - 1,
+        )
+
+        # Mark the sample ranges of all events with a cumulative sum over a difference array.
+        starts = idx_onsets[idx_onsets <= idx_offsets]
+        stops = idx_offsets[idx_onsets <= idx_offsets] + 1
+        coverage = np.cumsum(
+            np.bincount(starts, minlength=len(timesteps) + 1)
+            - np.bincount(stops, minlength=len(timesteps) + 1),
+        )
+        events_mask = coverage[:-1] > 0
 
     # Mask all indices where there is no event.
     candidate_mask = ~events_mask
@@ -97,10 +122,19 @@ def fill(
     ]
 
     # Onset of each event candidate is first index in candidate indices.
-    onsets = timesteps[[candidate_indices[0] for candidate_indices in candidates]].flatten()
+    onset_indices = [candidate_indices[0] for candidate_indices in candidates]
+    onsets = timesteps[onset_indices].flatten()
     # Offset of each event candidate is last event in candidate indices.
-    offsets = timesteps[[candidate_indices[-1] for candidate_indices in candidates]].flatten()
+    offset_indices = [candidate_indices[-1] for candidate_indices in candidates]
+    offsets = timesteps[offset_indices].flatten()
 
     # Create event dataframe from onsets and offsets.
     events = Events(name=name, onsets=onsets, offsets=offsets)
+
+    if event_properties is not None:
+        events = add_event_properties(
+            events, event_properties, onset_indices, offset_indices,
+            positions=None if positions is None else np.array(positions),
+            velocities=None if velocities is None else np.array(velocities),
+        )
     return events
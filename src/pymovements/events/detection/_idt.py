@@ -26,6 +26,7 @@ from pymovements._utils import _checks
 from pymovements.events._utils._filters import events_split_nans
 from pymovements.events._utils._filters import filter_candidates_remove_nans
 from pymovements.events.detection._library import register_event_detection
+from pymovements.events.detection._properties import add_event_properties
 from pymovements.events.events import Events
 
 
@@ -56,6 +57,8 @@ def idt(
         dispersion_threshold: float = 1.0,
         include_nan: bool = False,
         name: str = 'fixation',
+        event_properties: str | tuple[str, dict] | list[str | tuple[str, dict]] | None = None,
+        velocities: list[list[float]] | list[tuple[float, float]] | np.ndarray | None = None,
 ) -> Events:
     """Fixation identification based on dispersion threshold (I-DT).
 
@@ -89,6 +92,14 @@ def idt(
         (default: False)
     name: str
         Name for detected events in Events. (default: 'fixation')
+    event_properties: str | tuple[str, dict] | list[str | tuple[str, dict]] | None
+        Event properties to compute from the sample arrays during detection. Supported are
+        ``amplitude``, ``dispersion``, ``disposition``, ``duration``, ``location`` and
+        ``peak_velocity``. (default: None)
+    velocities: list[list[float]] | list[tuple[float, float]] | np.ndarray | None
+        shape (N, 2)
+        Corresponding continuous 2D velocity time series. Only used for computing
+        ``event_properties``. (default: None)
 
     Returns
     -------
@@ -130,8 +141,8 @@ def idt(
             f' but is of type {type(minimum_duration)}',
         )
 
-    onsets = []
-    offsets = []
+    onset_indices = []
+    offset_indices = []
 
     # Infer minimum duration in number of samples.
     # This implementation is currently very restrictive.
@@ -189,14 +200,14 @@ def idt(
                     if len(candidate) >= minimum_sample_duration
                 ]
                 for candidate in tmp_candidates:
-                    onsets.append(timesteps[candidate[0]])
-                    offsets.append(timesteps[candidate[-1]])
+                    onset_indices.append(candidate[0])
+                    offset_indices.append(candidate[-1])
 
             else:
                 # Note a fixation at the centroid of the window points.
 
-                onsets.append(timesteps[win_start])
-                offsets.append(timesteps[win_end - 1])
+                onset_indices.append(win_start)
+                offset_indices.append(win_end - 1)
 
             # Remove window points from points.
             # Initialize new window excluding the previous window
@@ -207,8 +218,15 @@ def idt(
             win_start += 1
 
     # Create proper flat numpy arrays.
-    onsets_arr = np.array(onsets).flatten()
-    offsets_arr = np.array(offsets).flatten()
+    onsets_arr = timesteps[np.array(onset_indices, dtype=np.int64)].flatten()
+    offsets_arr = timesteps[np.array(offset_indices, dtype=np.int64)].flatten()
 
     events = Events(name=name, onsets=onsets_arr, offsets=offsets_arr)
+
+    if event_properties is not None:
+        events = add_event_properties(
+            events, event_properties, onset_indices, offset_indices,
+            positions=positions,
+            velocities=None if velocities is None else np.array(velocities),
+        )
     return events
@@ -25,6 +25,7 @@ import numpy as np
 from pymovements._utils import _checks
 from pymovements.events._utils._filters import filter_candidates_remove_nans
 from pymovements.events.detection._library import register_event_detection
+from pymovements.events.detection._properties import add_event_properties
 from pymovements.events.events import Events
 from pymovements.gaze.transforms_numpy import consecutive
 from pymovements.gaze.transforms_numpy import norm
@@ -38,6 +39,8 @@ def ivt(
         velocity_threshold: float = 20.0,
         include_nan: bool = False,
         name: str = 'fixation',
+        event_properties: str | tuple[str, dict] | list[str | tuple[str, dict]] | None = None,
+        positions: list[list[float]] | list[tuple[float, float]] | np.ndarray | None = None,
 ) -> Events:
     """Identification of fixations based on velocity-threshold (I-VT).
 
@@ -69,6 +72,14 @@ def ivt(
         (default: False)
     name: str
         Name for detected events in Events. (default: 'fixation')
+    event_properties: str | tuple[str, dict] | list[str | tuple[str, dict]] | None
+        Event properties to compute from the sample arrays during detection. Supported are
+        ``amplitude``, ``dispersion``, ``disposition``, ``duration``, ``location`` and
+        ``peak_velocity``. (default: None)
+    positions: list[list[float]] | list[tuple[float, float]] | np.ndarray | None
+        shape (N, 2)
+        Corresponding continuous 2D position time series. Only used for computing
+        ``event_properties``. (default: None)
 
     Returns
     -------
@@ -125,10 +136,19 @@ def ivt(
     ]
 
     # Onset of each event candidate is first index in candidate indices.
-    onsets = timesteps[[candidate_indices[0] for candidate_indices in candidates]].flatten()
+    onset_indices = [candidate_indices[0] for candidate_indices in candidates]
+    onsets = timesteps[onset_indices].flatten()
     # Offset of each event candidate is last event in candidate indices.
-    offsets = timesteps[[candidate_indices[-1] for candidate_indices in candidates]].flatten()
+    offset_indices = [candidate_indices[-1] for candidate_indices in candidates]
+    offsets = timesteps[offset_indices].flatten()
 
     # Create event dataframe from onsets and offsets.
     events = Events(name=name, onsets=onsets, offsets=offsets)
+
+    if event_properties is not None:
+        events = add_event_properties(
+            events, event_properties, onset_indices, offset_indices,
+            positions=None if positions is None else np.array(positions),
+            velocities=velocities,
+        )
     return events
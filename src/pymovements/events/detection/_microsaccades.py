@@ -27,6 +27,7 @@ import numpy as np
 from pymovements._utils import _checks
 from pymovements.events._utils._filters import filter_candidates_remove_nans
 from pymovements.events.detection._library import register_event_detection
+from pymovements.events.detection._properties import add_event_properties
 from pymovements.events.events import Events
 from pymovements.gaze.transforms_numpy import consecutive
 
@@ -41,6 +42,8 @@ def microsaccades(
         minimum_threshold: float = 1e-10,
         include_nan: bool = False,
         name: str = 'saccade',
+        event_properties: str | tuple[str, dict] | list[str | tuple[str, dict]] | None = None,
+        positions: list[list[float]] | list[tuple[float, float]] | np.ndarray | None = None,
 ) -> Events:
     """Detect micro-saccades from velocity gaze sequence.
 
@@ -78,6 +81,14 @@ def microsaccades(
         (default: False)
     name: str
         Name for detected events in Events. (default: 'saccade')
+    event_properties: str | tuple[str, dict] | list[str | tuple[str, dict]] | None
+        Event properties to compute from the sample arrays during detection. Supported are
+        ``amplitude``, ``dispersion``, ``disposition``, ``duration``, ``location`` and
+        ``peak_velocity``. (default: None)
+    positions: list[list[float]] | list[tuple[float, float]] | np.ndarray | None
+        shape (N, 2)
+        Corresponding continuous 2D position time series. Only used for computing
+        ``event_properties``. (default: None)
 
     Returns
     -------
@@ -138,12 +149,21 @@ def microsaccades(
     ]
 
     # Onset of each event candidate is first index in candidate indices.
-    onsets = timesteps[[candidate_indices[0] for candidate_indices in candidates]].flatten()
+    onset_indices = [candidate_indices[0] for candidate_indices in candidates]
+    onsets = timesteps[onset_indices].flatten()
     # Offset of each event candidate is last event in candidate indices.
-    offsets = timesteps[[candidate_indices[-1] for candidate_indices in candidates]].flatten()
+    offset_indices = [candidate_indices[-1] for candidate_indices in candidates]
+    offsets = timesteps[offset_indices].flatten()
 
     # Create event dataframe from onsets and offsets.
     events = Events(name=name, onsets=onsets, offsets=offsets)
+
+    if event_properties is not None:
+        events = add_event_properties(
+            events, event_properties, onset_indices, offset_indices,
+            positions=None if positions is None else np.array(positions),
+            velocities=velocities,
+        )
     return events
 
 
@@ -0,0 +1,195 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides event properties computed from the sample arrays of an event detection method."""
+from __future__ import annotations
+
+import warnings
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from pymovements.events.events import Events
+from pymovements.events.processing import _event_properties_with_kwargs
+from pymovements.exceptions import InvalidProperty
+from pymovements.gaze.transforms_numpy import norm
+
+
+def add_event_properties(
+        events: Events,
+        event_properties: str | tuple[str, dict[str, Any]]
+        | list[str | tuple[str, dict[str, Any]]],
+        onset_indices: list[int] | np.ndarray,
+        offset_indices: list[int] | np.ndarray,
+        *,
+        positions: np.ndarray | None = None,
+        velocities: np.ndarray | None = None,
+) -> Events:
+    """Add event properties to detected events without scanning the gaze samples again.
+
+    The properties are computed from the sample arrays which were used for detection. Each event
+    covers the samples from its onset index up to and including its offset index. Events must be
+    ordered and must not overlap, which holds for all events detected in a single pass.
+
+    Parameters
+    ----------
+    events: Events
+        The detected events.
+    event_properties: str | tuple[str, dict[str, Any]] | list[str | tuple[str, dict[str, Any]]]
+        The event properties to compute.
+    onset_indices: list[int] | np.ndarray
+        shape (M, )
+        Sample index of each event onset.
+    offset_indices: list[int] | np.ndarray
+        shape (M, )
+        Sample index of each event offset.
+    positions: np.ndarray | None
+        shape (N, 2)
+        Continuous 2D position time series. (default: None)
+    velocities: np.ndarray | None
+        shape (N, 2)
+        Continuous 2D velocity time series. (default: None)
+
+    Returns
+    -------
+    Events
+        The events with the event properties added as columns.
+
+    Raises
+    ------
+    InvalidProperty
+        If a property can not be computed during event detection.
+    ValueError
+        If the sample array required by a property is missing.
+    """
+    sample_arrays = {'positions': positions, 'velocities': velocities}
+    starts = np.asarray(onset_indices, dtype=np.int64)
+    stops = np.asarray(offset_indices, dtype=np.int64) + 1
+
+    property_columns = []
+    for property_name, property_kwargs in _event_properties_with_kwargs(event_properties):
+        # The duration is already part of every event dataframe.
+        if property_name == 'duration':
+            continue
+
+        if property_name not in _ARRAY_PROPERTIES:
+            raise InvalidProperty(
+                property_name=property_name,
+                valid_properties=['duration', *_ARRAY_PROPERTIES],
+            )
+
+        array_name, property_function = _ARRAY_PROPERTIES[property_name]
+        values = sample_arrays[array_name]
+        if values is None:
+            raise ValueError(f"event property '{property_name}' requires {array_name}")
+
+        result = property_function(starts, stops, np.asarray(values), **property_kwargs)
+        column = pl.Series(property_name, result)
+        if result.ndim == 2:
+            column = column.cast(pl.List(pl.Float64))
+        property_columns.append(column)
+
+    events.frame = events.frame.with_columns(property_columns)
+    return events
+
+
+def _reduce_segments(
+        ufunc: np.ufunc,
+        values: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+) -> np.ndarray:
+    """Reduce the values of each half-open segment ``[start, stop)`` along the first axis."""
+    if len(starts) == 0:
+        return np.empty((0, *values.shape[1:]), dtype=np.float64)
+
+    # Interleaving starts and stops makes every second reduction cover a segment.
+    indices: np.ndarray = np.column_stack([starts, stops]).ravel()
+    # reduceat only accepts valid indices, the last segment is then reduced to the end.
+    if indices[-1] == len(values):
+        indices = indices[:-1]
+    return ufunc.reduceat(values, indices, axis=0)[::2]
+
+
+def _ranges(starts: np.ndarray, stops: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Range of each position component during each event, ignoring NaN values."""
+    return (
+        _reduce_segments(np.fmax, positions, starts, stops)
+        - _reduce_segments(np.fmin, positions, starts, stops)
+    )
+
+
+def _amplitude(starts: np.ndarray, stops: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Array equivalent of :py:func:`pymovements.events.amplitude`."""
+    return np.sqrt(np.sum(_ranges(starts, stops, positions) ** 2, axis=1))
+
+
+def _dispersion(starts: np.ndarray, stops: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Array equivalent of :py:func:`pymovements.events.dispersion`."""
+    return np.sum(_ranges(starts, stops, positions), axis=1)
+
+
+def _disposition(starts: np.ndarray, stops: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Array equivalent of :py:func:`pymovements.events.disposition`."""
+    return norm(positions[starts] - positions[stops - 1], axis=1)
+
+
+def _location(
+        starts: np.ndarray,
+        stops: np.ndarray,
+        positions: np.ndarray,
+        method: str = 'mean',
+) -> np.ndarray:
+    """Array equivalent of :py:func:`pymovements.events.location`."""
+    # Missing samples are ignored, as they are in the post-hoc computation.
+    is_valid = ~np.isnan(positions)
+    if method == 'mean':
+        sums = _reduce_segments(np.add, np.where(is_valid, positions, 0.0), starts, stops)
+        counts = _reduce_segments(np.add, is_valid.astype(np.int64), starts, stops)
+        with np.errstate(invalid='ignore'):
+            return sums / counts
+    if method == 'median':
+        with warnings.catch_warnings():
+            # Components without any valid sample are NaN.
+            warnings.simplefilter('ignore', RuntimeWarning)
+            medians = [
+                np.nanmedian(positions[start:stop], axis=0) for start, stop in zip(starts, stops)
+            ]
+        return np.array(medians, dtype=np.float64).reshape(len(starts), positions.shape[1])
+    raise ValueError(
+        f"Method '{method}' not supported. "
+        f"Please choose one of the following: ['mean', 'median'].",
+    )
+
+
+def _peak_velocity(starts: np.ndarray, stops: np.ndarray, velocities: np.ndarray) -> np.ndarray:
+    """Array equivalent of :py:func:`pymovements.events.peak_velocity`."""
+    return _reduce_segments(np.fmax, norm(velocities, axis=1), starts, stops)
+
+
+# Event properties that can be computed during event detection with their required sample array.
+_ARRAY_PROPERTIES: dict[str, tuple[str, Callable[..., np.ndarray]]] = {
+    'amplitude': ('positions', _amplitude),
+    'dispersion': ('positions', _dispersion),
+    'disposition': ('positions', _disposition),
+    'location': ('positions', _location),
+    'peak_velocity': ('velocities', _peak_velocity),
+}
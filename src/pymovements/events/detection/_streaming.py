@@ -0,0 +1,615 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides stateful event detectors for streams of gaze samples."""
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+from collections import deque
+from collections.abc import Sized
+
+import numpy as np
+
+from pymovements._utils import _checks
+from pymovements.events._utils._filters import events_split_nans
+from pymovements.events._utils._filters import filter_candidates_remove_nans
+from pymovements.events.events import Events
+from pymovements.gaze.transforms_numpy import norm
+
+
+class _StreamingRunDetector(ABC):
+    """Base class for streaming detectors which merge consecutive candidate samples to events.
+
+    Subclasses classify each sample as event candidate in :py:meth:`_candidate_mask`.
+
+    Parameters
+    ----------
+    minimum_duration: int
+        Minimum event duration in the units of the timesteps.
+    include_nan: bool
+        Indicator, whether missing values are included in candidates.
+    name: str
+        Name for detected events.
+    """
+
+    def __init__(self, minimum_duration: int, include_nan: bool, name: str):
+        self.minimum_duration = minimum_duration
+        self.include_nan = include_nan
+        self.name = name
+
+        self._n_samples = 0
+        self._in_run = False
+        self._run_onset: float | None = None
+        self._run_offset: float | None = None
+
+    def process(
+            self,
+            velocities: list[list[float]] | list[tuple[float, float]] | np.ndarray,
+            timesteps: list[int] | np.ndarray | None = None,
+    ) -> Events:
+        """Process a batch of samples and return all events completed by this batch.
+
+        An event is completed by the first sample that is not an event candidate. The last event
+        of a stream is only returned by :py:meth:`flush`.
+
+        Parameters
+        ----------
+        velocities: list[list[float]] | list[tuple[float, float]] | np.ndarray
+            shape (N, 2)
+            Continuous 2D velocity time series of the batch.
+        timesteps: list[int] | np.ndarray | None
+            shape (N, )
+            Corresponding continuous 1D timestep time series. If None, sample based timesteps
+            continuing over all processed batches are assumed. (default: None)
+
+        Returns
+        -------
+        Events
+            The events completed by this batch.
+        """
+        velocities = np.array(velocities, dtype=np.float64)
+        _checks.check_shapes(velocities=velocities)
+
+        if timesteps is None:
+            timesteps = np.arange(self._n_samples, self._n_samples + len(velocities))
+        timesteps = np.array(timesteps)
+        _checks.check_is_length_matching(velocities=velocities, timesteps=timesteps)
+        self._n_samples += len(velocities)
+
+        candidate_mask = self._candidate_mask(velocities)
+        nan_mask = np.isnan(velocities).any(axis=1)
+        if self.include_nan:
+            candidate_mask = np.logical_or(candidate_mask, nan_mask)
+        # Leading and trailing missing values are not part of an event.
+        valid_mask = candidate_mask & ~nan_mask
+
+        # Find all runs of candidates in the batch. An open run of the previous batch continues
+        # at the start of this batch, possibly with zero length.
+        changes = np.diff(np.concatenate([[self._in_run], candidate_mask, [False]]).astype(np.int8))
+        run_starts = np.flatnonzero(changes == 1)
+        if self._in_run:
+            run_starts = np.concatenate([[0], run_starts])
+        run_stops = np.flatnonzero(changes == -1)
+        open_at_end = bool(candidate_mask[-1]) if len(candidate_mask) > 0 else self._in_run
+
+        onsets: list[float] = []
+        offsets: list[float] = []
+        for run_index, (run_start, run_stop) in enumerate(zip(run_starts, run_stops)):
+            valid_indices = run_start + np.flatnonzero(valid_mask[run_start:run_stop])
+            if len(valid_indices) > 0:
+                if self._run_onset is None:
+                    self._run_onset = timesteps[valid_indices[0]]
+                self._run_offset = timesteps[valid_indices[-1]]
+
+            if open_at_end and run_index == len(run_starts) - 1:
+                self._in_run = True
+                return self._to_events(onsets, offsets)
+
+            self._close_run(onsets, offsets)
+
+        self._in_run = False
+        return self._to_events(onsets, offsets)
+
+    def flush(self) -> Events:
+        """Complete the event at the end of the stream.
+
+        Returns
+        -------
+        Events
+            The event at the end of the stream, if there is one.
+        """
+        onsets: list[float] = []
+        offsets: list[float] = []
+        if self._in_run:
+            self._close_run(onsets, offsets)
+        self._in_run = False
+        return self._to_events(onsets, offsets)
+
+    @abstractmethod
+    def _candidate_mask(self, velocities: np.ndarray) -> np.ndarray:
+        """Classify each sample as event candidate."""
+
+    def _close_run(self, onsets: list[float], offsets: list[float]) -> None:
+        """Add the current run as event if it has valid samples and the minimum duration."""
+        if self._run_onset is not None and self._run_offset is not None:
+            if self._run_offset - self._run_onset >= self.minimum_duration:
+                onsets.append(self._run_onset)
+                offsets.append(self._run_offset)
+        self._run_onset = None
+        self._run_offset = None
+
+    def _to_events(self, onsets: list[float], offsets: list[float]) -> Events:
+        """Create events from onsets and offsets."""
+        return Events(name=self.name, onsets=np.array(onsets), offsets=np.array(offsets))
+
+
+class StreamingIVT(_StreamingRunDetector):
+    """Streaming identification of fixations based on velocity-threshold (I-VT).
+
+    The detector keeps its state across calls to :py:meth:`process`, so that velocities can be
+    passed in batches as they arrive from the eye tracker. Each sample is processed once and a
+    fixation is returned as soon as the first sample above the velocity threshold arrives. After
+    passing all samples and calling :py:meth:`flush`, the detected fixations are the same as
+    those of :py:func:`~pymovements.events.ivt`.
+
+    Parameters
+    ----------
+    minimum_duration: int
+        Minimum fixation duration. The duration is specified in the units used in ``timesteps``.
+        If ``timesteps`` is None, then ``minimum_duration`` is specified in numbers of samples.
+        (default: 100)
+    velocity_threshold: float
+        Threshold for a point to be classified as a fixation. If the
+        velocity is below the threshold, the point is classified as a fixation. (default: 20.0)
+    include_nan: bool
+        Indicator, whether we want to split events on missing/corrupt value (np.nan)
+        (default: False)
+    name: str
+        Name for detected events in Events. (default: 'fixation')
+
+    Raises
+    ------
+    ValueError
+        If velocity threshold is None.
+        If velocity threshold is not greater than 0.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> detector = StreamingIVT(minimum_duration=2, velocity_threshold=1.0)
+    >>> detector.process(np.zeros((4, 2))).frame.height
+    0
+    >>> detector.process(np.ones((2, 2)))
+    shape: (1, 4)
+    ┌──────────┬───────┬────────┬──────────┐
+    │ name     ┆ onset ┆ offset ┆ duration │
+    │ ---      ┆ ---   ┆ ---    ┆ ---      │
+    │ str      ┆ i64   ┆ i64    ┆ i64      │
+    ╞══════════╪═══════╪════════╪══════════╡
+    │ fixation ┆ 0     ┆ 3      ┆ 3        │
+    └──────────┴───────┴────────┴──────────┘
+    """
+
+    def __init__(
+            self,
+            minimum_duration: int = 100,
+            velocity_threshold: float = 20.0,
+            include_nan: bool = False,
+            name: str = 'fixation',
+    ):
+        if velocity_threshold is None:
+            raise ValueError('velocity threshold must not be None')
+        if velocity_threshold <= 0:
+            raise ValueError('velocity threshold must be greater than 0')
+
+        super().__init__(minimum_duration=minimum_duration, include_nan=include_nan, name=name)
+        self.velocity_threshold = velocity_threshold
+
+    def _candidate_mask(self, velocities: np.ndarray) -> np.ndarray:
+        """Classify samples with norm-velocities below threshold as fixation candidates."""
+        return norm(velocities, axis=1) < self.velocity_threshold
+
+
+class StreamingMicrosaccades(_StreamingRunDetector):
+    """Streaming detection of micro-saccades from velocity gaze sequences.
+
+    The detector keeps its state across calls to :py:meth:`process`, so that velocities can be
+    passed in batches as they arrive from the eye tracker. Each sample is processed once and a
+    saccade is returned as soon as the first sample inside the elliptic threshold arrives. After
+    passing all samples and calling :py:meth:`flush`, the detected saccades are the same as those
+    of :py:func:`~pymovements.events.microsaccades` with the same explicit threshold.
+
+    A data-driven threshold depends on all samples of a recording and is therefore not supported.
+    Instead, an explicit threshold can be determined on calibration data before streaming.
+
+    Parameters
+    ----------
+    threshold: np.ndarray | tuple[float, float]
+        Explicit elliptic velocity threshold for horizontal and vertical direction.
+    minimum_duration: int
+        Minimum saccade duration. The duration is specified in the units used in ``timesteps``.
+        If ``timesteps`` is None, then ``minimum_duration`` is specified in numbers of samples.
+        (default: 6)
+    threshold_factor: float
+        factor for relative velocity threshold computation. (default: 6)
+    minimum_threshold: float
+        minimal threshold value. Raises ValueError if threshold is too low. (default: 1e-10)
+    include_nan: bool
+        Indicator, whether we want to split events on missing/corrupt value (np.nan)
+        (default: False)
+    name: str
+        Name for detected events in Events. (default: 'saccade')
+
+    Raises
+    ------
+    ValueError
+        If `threshold` is not two-dimensional.
+        If `threshold` value is below `min_threshold` value.
+    """
+
+    def __init__(
+            self,
+            threshold: np.ndarray | tuple[float, float],
+            minimum_duration: int = 6,
+            threshold_factor: float = 6,
+            minimum_threshold: float = 1e-10,
+            include_nan: bool = False,
+            name: str = 'saccade',
+    ):
+        if isinstance(threshold, str) or (isinstance(threshold, Sized) and len(threshold) != 2):
+            raise ValueError('threshold must be two-dimensional')
+        threshold = np.array(threshold)
+
+        if (threshold < minimum_threshold).any():
+            raise ValueError(
+                'threshold does not provide enough variance as required by min_threshold'
+                f' ({threshold} < {minimum_threshold})',
+            )
+
+        super().__init__(minimum_duration=minimum_duration, include_nan=include_nan, name=name)
+        self.threshold = threshold
+        self.threshold_factor = threshold_factor
+
+    def _candidate_mask(self, velocities: np.ndarray) -> np.ndarray:
+        """Classify samples outside the elliptic threshold as saccade candidates."""
+        radius = self.threshold * self.threshold_factor
+        return np.greater(np.sum(np.power(velocities / radius, 2), axis=1), 1)
+
+
+class StreamingIDT:
+    """Streaming fixation identification based on dispersion threshold (I-DT).
+
+    The detector keeps its state across calls to :py:meth:`process`, so that positions can be
+    passed in batches as they arrive from the eye tracker. Only the samples of the current window
+    are kept. Its dispersion is updated with monotonic queues of the window extrema, which takes
+    amortized constant time per sample. A fixation is returned as soon as the sample exceeding
+    the dispersion threshold arrives. After passing all samples and calling :py:meth:`flush`, the
+    detected fixations are the same as those of :py:func:`~pymovements.events.idt`.
+
+    Parameters
+    ----------
+    minimum_duration: int
+        Minimum fixation duration. The duration is specified in the units used in ``timesteps``.
+        If ``timesteps`` is None, then ``minimum_duration`` is specified in numbers of samples.
+        (default: 100)
+    dispersion_threshold: float
+        Threshold for dispersion for a group of consecutive samples to be identified as fixation.
+        (default: 1.0)
+    include_nan: bool
+        Indicator, whether we want to split events on missing/corrupt value (np.nan).
+        (default: False)
+    name: str
+        Name for detected events in Events. (default: 'fixation')
+
+    Raises
+    ------
+    TypeError
+        If minimum_duration is not of type ``int``.
+    ValueError
+        If dispersion_threshold is not greater than 0
+        If minimum_duration is not greater than 0
+    """
+
+    def __init__(
+            self,
+            minimum_duration: int = 100,
+            dispersion_threshold: float = 1.0,
+            include_nan: bool = False,
+            name: str = 'fixation',
+    ):
+        if dispersion_threshold <= 0:
+            raise ValueError('dispersion_threshold must be greater than 0')
+        if minimum_duration <= 0:
+            raise ValueError('minimum_duration must be greater than 0')
+        if not isinstance(minimum_duration, int):
+            raise TypeError(
+                'minimum_duration must be of type int'
+                f' but is of type {type(minimum_duration)}',
+            )
+
+        self.minimum_duration = minimum_duration
+        self.dispersion_threshold = dispersion_threshold
+        self.include_nan = include_nan
+        self.name = name
+
+        self._minimum_sample_duration: int | None = None
+        self._timestep_interval: int | None = None
+
+        # Buffered samples, starting at the absolute sample index _buffer_start.
+        self._buffer_start = 0
+        self._timesteps: list[int] = []
+        self._positions: tuple[list[float], list[float]] = ([], [])
+
+        # Current window of absolute sample indices [_window_start, _window_end).
+        self._window_start = 0
+        self._window_end = 0
+        self._expanding = False
+        # Monotonic queues of sample indices with decreasing maxima and increasing minima.
+        self._maxima: tuple[deque[int], deque[int]] = (deque(), deque())
+        self._minima: tuple[deque[int], deque[int]] = (deque(), deque())
+
+        self._onsets: list[int] = []
+        self._offsets: list[int] = []
+
+    def process(
+            self,
+            positions: list[list[float]] | list[tuple[float, float]] | np.ndarray,
+            timesteps: list[int] | np.ndarray | None = None,
+    ) -> Events:
+        """Process a batch of samples and return all fixations completed by this batch.
+
+        A fixation is completed by the first sample exceeding the dispersion threshold. The last
+        fixation of a stream is only returned by :py:meth:`flush`.
+
+        Parameters
+        ----------
+        positions: list[list[float]] | list[tuple[float, float]] | np.ndarray
+            shape (N, 2)
+            Continuous 2D position time series of the batch.
+        timesteps: list[int] | np.ndarray | None
+            shape (N, )
+            Corresponding continuous 1D timestep time series. If None, sample based timesteps
+            continuing over all processed batches are assumed. (default: None)
+
+        Returns
+        -------
+        Events
+            The fixations completed by this batch.
+
+        Raises
+        ------
+        TypeError
+            If timesteps are not of type ``int``.
+        ValueError
+            If positions is not shaped (N, 2).
+            If the interval between timesteps is not constant.
+            If minimum_duration is not divisible by the interval between timesteps.
+            If minimum_duration is not longer than the equivalent of 2 samples.
+        """
+        positions = np.array(positions, dtype=np.float64)
+        _checks.check_shapes(positions=positions)
+
+        n_samples = self._buffer_start + len(self._timesteps)
+        if timesteps is None:
+            timesteps = np.arange(n_samples, n_samples + len(positions), dtype=np.int64)
+        timesteps = np.array(timesteps).flatten()
+
+        # Check that timesteps are integers or are floats without a fractional part.
+        timesteps_int = timesteps.astype(int)
+        if np.any((timesteps - timesteps_int) != 0):
+            raise TypeError('timesteps must be of type int')
+        _checks.check_is_length_matching(positions=positions, timesteps=timesteps_int)
+
+        self._check_timestep_intervals(timesteps_int)
+
+        self._timesteps.extend(timesteps_int.tolist())
+        self._positions[0].extend(positions[:, 0].tolist())
+        self._positions[1].extend(positions[:, 1].tolist())
+
+        self._advance(final=False)
+        return self._pop_events()
+
+    def flush(self) -> Events:
+        """Complete the fixation at the end of the stream.
+
+        Afterwards, further samples start a new stream, which may have a different interval
+        between timesteps.
+
+        Returns
+        -------
+        Events
+            The fixation at the end of the stream, if there is one.
+        """
+        self._advance(final=True)
+        events = self._pop_events()
+
+        n_samples = self._buffer_start + len(self._timesteps)
+        self._minimum_sample_duration = None
+        self._timestep_interval = None
+        self._buffer_start = n_samples
+        self._timesteps = []
+        self._positions = ([], [])
+        self._window_start = n_samples
+        self._window_end = n_samples
+        self._expanding = False
+        self._maxima = (deque(), deque())
+        self._minima = (deque(), deque())
+        return events
+
+    def _check_timestep_intervals(self, timesteps: np.ndarray) -> None:
+        """Check that the interval between all timesteps of the stream is constant."""
+        if self._timesteps:
+            timesteps = np.concatenate([[self._timesteps[-1]], timesteps])
+        timesteps_diff = np.diff(timesteps)
+        if len(timesteps_diff) == 0:
+            return
+
+        if self._timestep_interval is None:
+            self._timestep_interval = int(timesteps_diff[0])
+            if not self.minimum_duration % self._timestep_interval == 0:
+                raise ValueError(
+                    'minimum_duration must be divisible by the constant interval between '
+                    'timesteps',
+                )
+            minimum_sample_duration = self.minimum_duration // self._timestep_interval
+            if minimum_sample_duration < 2:
+                raise ValueError(
+                    'minimum_duration must be longer than the equivalent of 2 samples',
+                )
+            self._minimum_sample_duration = minimum_sample_duration
+
+        if not np.all(timesteps_diff == self._timestep_interval):
+            raise ValueError('interval between timesteps must be constant')
+
+    def _advance(self, final: bool) -> None:
+        """Move the window over all buffered samples.
+
+        The window moves as in :py:func:`~pymovements.events.idt`, but waits for further samples
+        instead of ending at the last buffered sample, unless the stream is final.
+        """
+        if self._minimum_sample_duration is None:
+            return
+
+        n_samples = self._buffer_start + len(self._timesteps)
+        while True:
+            if not self._expanding:
+                # Initialize window over the minimum number of samples of a fixation.
+                if self._window_start + self._minimum_sample_duration > n_samples:
+                    break
+                self._extend_window(self._window_start + self._minimum_sample_duration)
+
+                dispersion = self._dispersion()
+                if np.isnan(dispersion) or dispersion > self.dispersion_threshold:
+                    # Move window start one step further.
+                    self._window_start += 1
+                    continue
+                self._expanding = True
+
+            # Add additional points to the window until dispersion > threshold.
+            while self._dispersion() < self.dispersion_threshold:
+                if self._window_end == n_samples:
+                    if not final:
+                        self._trim_buffer()
+                        return
+                    break
+                self._extend_window(self._window_end + 1)
+
+            self._add_fixation()
+            self._window_start = self._window_end
+            self._expanding = False
+
+        self._trim_buffer()
+
+    def _extend_window(self, window_end: int) -> None:
+        """Add samples to the monotonic queues until the window ends at ``window_end``."""
+        for sample_index in range(max(self._window_end, self._window_start), window_end):
+            for component in range(2):
+                value = self._positions[component][sample_index - self._buffer_start]
+                if np.isnan(value):
+                    continue
+                self._push(self._maxima[component], sample_index, component, value, maximum=True)
+                self._push(self._minima[component], sample_index, component, value, maximum=False)
+        self._window_end = window_end
+
+    def _push(
+            self,
+            queue: deque[int],
+            sample_index: int,
+            component: int,
+            value: float,
+            maximum: bool,
+    ) -> None:
+        """Push a sample to a monotonic queue, removing all samples it dominates."""
+        values = self._positions[component]
+        while queue:
+            last_value = values[queue[-1] - self._buffer_start]
+            if (last_value > value) if maximum else (last_value < value):
+                break
+            queue.pop()
+        queue.append(sample_index)
+
+    def _dispersion(self) -> float:
+        """Dispersion of the current window, ignoring missing values."""
+        dispersion = 0.0
+        for component in range(2):
+            values = self._positions[component]
+            maxima = self._maxima[component]
+            minima = self._minima[component]
+            while maxima and maxima[0] < self._window_start:
+                maxima.popleft()
+            while minima and minima[0] < self._window_start:
+                minima.popleft()
+            if not maxima:
+                return np.nan
+            dispersion += (
+                values[maxima[0] - self._buffer_start] - values[minima[0] - self._buffer_start]
+            )
+        return dispersion
+
+    def _add_fixation(self) -> None:
+        """Add the fixation of the current window."""
+        start = self._window_start - self._buffer_start
+        end = self._window_end - self._buffer_start
+        positions = np.column_stack([
+            self._positions[0][start:end - 1], self._positions[1][start:end - 1],
+        ])
+
+        if not np.isnan(positions).any():
+            self._onsets.append(self._timesteps[start])
+            self._offsets.append(self._timesteps[end - 1])
+            return
+
+        # A window without any valid sample does not contain a fixation.
+        if np.isnan(positions).any(axis=1).all():
+            return
+
+        candidates = filter_candidates_remove_nans(
+            candidates=[np.arange(len(positions))], values=positions,
+        )
+        if not self.include_nan:
+            candidates = events_split_nans(candidates=candidates, values=positions)
+
+        assert self._minimum_sample_duration is not None
+        for candidate in candidates:
+            if len(candidate) >= self._minimum_sample_duration:
+                self._onsets.append(self._timesteps[start + candidate[0]])
+                self._offsets.append(self._timesteps[start + candidate[-1]])
+
+    def _trim_buffer(self) -> None:
+        """Remove all buffered samples before the current window."""
+        n_obsolete = self._window_start - self._buffer_start
+        if n_obsolete <= 0:
+            return
+        for queue in (*self._maxima, *self._minima):
+            while queue and queue[0] < self._window_start:
+                queue.popleft()
+        del self._timesteps[:n_obsolete]
+        del self._positions[0][:n_obsolete]
+        del self._positions[1][:n_obsolete]
+        self._buffer_start += n_obsolete
+
+    def _pop_events(self) -> Events:
+        """Return the fixations detected since the last call."""
+        events = Events(
+            name=self.name, onsets=np.array(self._onsets), offsets=np.array(self._offsets),
+        )
+        self._onsets = []
+        self._offsets = []
+        return events
@@ -20,8 +20,8 @@
 """Module for event processing."""
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Callable
+from collections.abc import Sequence
 from typing import Any
 
 import polars as pl
@@ -31,6 +31,11 @@ from pymovements.events.events import Events
 from pymovements.events.properties import EVENT_PROPERTIES
 from pymovements.exceptions import InvalidProperty
 
+# Temporary columns of the batched event property computation.
+_RECORDING_INDEX = '__recording_index__'
+_EVENT_INDEX = '__event_index__'
+_SAMPLE_INDEX = '__sample_index__'
+
 
 class EventProcessor:
     """Processes events.
@@ -103,18 +108,7 @@ class EventGazeProcessor:
             event_properties: str | tuple[str, dict[str, Any]]
             | list[str | tuple[str, dict[str, Any]]],
     ):
-        _check_event_properties(event_properties)
-
-        event_properties_with_kwargs: list[tuple[str, dict[str, Any]]]
-        if isinstance(event_properties, str):
-            event_properties_with_kwargs = [(event_properties, {})]
-        elif isinstance(event_properties, tuple):
-            event_properties_with_kwargs = [event_properties]
-        else:  # we already validated above, it must be a list of strings and tuples
-            event_properties_with_kwargs = [
-                (event_property, {}) if isinstance(event_property, str) else event_property
-                for event_property in event_properties
-            ]
+        event_properties_with_kwargs = _event_properties_with_kwargs(event_properties)
 
         for property_name, _ in event_properties_with_kwargs:
             if property_name not in EVENT_PROPERTIES:
@@ -169,51 +163,213 @@ class EventGazeProcessor:
         if len(trial_identifiers) == 0:
             raise ValueError('list of identifiers must not be empty')
 
-        property_expressions: list[Callable[..., pl.Expr]] = [
-            EVENT_PROPERTIES[property_name] for property_name, _ in self.event_properties
-        ]
+        return self._process_batch([events], [gaze.samples], trial_identifiers, name)[0]
+
+    def process_batch(
+            self,
+            events: Sequence[Events],
+            gazes: Sequence[pm.Gaze],
+            identifiers: str | list[str],
+            name: str | None = None,
+    ) -> list[pl.DataFrame]:
+        """Process events and gaze samples of multiple recordings at once.
 
-        property_names: list[str] = [property_name for property_name, _ in self.event_properties]
+        The events and samples of all recordings are concatenated and the event properties are
+        computed in a single grouped query. This is considerably faster than calling
+        :py:meth:`process` for each recording if there are many recordings.
 
-        property_kwargs: list[dict[str, Any]] = [
-            property_kwargs for _, property_kwargs in self.event_properties
+        Parameters
+        ----------
+        events: Sequence[Events]
+            Event data of each recording to process event properties from.
+        gazes: Sequence[pm.Gaze]
+            Gaze data of each recording to process event properties from.
+        identifiers: str | list[str]
+            Column names to join on events and gaze dataframes.
+        name: str | None
+            Process only events that match the name. (default: None)
+
+        Returns
+        -------
+        list[pl.DataFrame]
+            One :py:class:`polars.DataFrame` for each recording with the same content as returned
+            by :py:meth:`process`.
+
+        Raises
+        ------
+        ValueError
+            If list of identifiers is empty or the number of events and gazes differs.
+        RuntimeError
+            If specified event name ``name`` is missing from the events of any recording.
+        """
+        if isinstance(identifiers, str):
+            trial_identifiers = [identifiers]
+        else:
+            trial_identifiers = identifiers
+
+        if len(trial_identifiers) == 0:
+            raise ValueError('list of identifiers must not be empty')
+
+        if len(events) != len(gazes):
+            raise ValueError(
+                f'number of events ({len(events)}) must match number of gazes ({len(gazes)})',
+            )
+
+        return self._process_batch(
+            events, [gaze.samples for gaze in gazes], trial_identifiers, name,
+        )
+
+    def _process_batch(
+            self,
+            events: Sequence[Events],
+            samples: Sequence[pl.DataFrame],
+            trial_identifiers: list[str],
+            name: str | None,
+    ) -> list[pl.DataFrame]:
+        """Compute the event properties of all recordings in a single grouped query."""
+        property_expressions = [
+            EVENT_PROPERTIES[property_name](**property_kwargs).alias(property_name)
+            for property_name, property_kwargs in self.event_properties
         ]
 
         # Each event is uniquely defined by a list of trial identifiers,
         # a name and its on- and offset.
         event_identifiers = [*trial_identifiers, 'name', 'onset', 'offset']
 
-        events_frame = events.frame
-        if name is not None:
-            events_frame = events_frame.filter(pl.col('name').str.contains(f'^{name}$'))
-            if len(events_frame) == 0:
-                raise RuntimeError(f'No events with name "{name}" found in data frame')
-
-        property_values = defaultdict(list)
-        for event in events_frame.iter_rows(named=True):
-            # Find gaze samples that belong to the current event.
-            filtered_gaze = gaze.samples.filter(
-                pl.col('time').is_between(event['onset'], event['offset']),
-                *[pl.col(identifier) == event[identifier] for identifier in trial_identifiers],
-            )
-            # Compute event property values.
-            values = filtered_gaze.select(
-                [
-                    this_property_expression(**this_property_kwargs)
-                    .alias(this_property_name)
-                    for this_property_name, this_property_expression, this_property_kwargs,
-                    in zip(property_names, property_expressions, property_kwargs)
-                ],
+        events_frames = []
+        for events_item in events:
+            events_frame = events_item.frame
+            if name is not None:
+                events_frame = events_frame.filter(pl.col('name').str.contains(f'^{name}$'))
+                if len(events_frame) == 0:
+                    raise RuntimeError(f'No events with name "{name}" found in data frame')
+            events_frames.append(events_frame.select(event_identifiers))
+
+        # Only the columns referenced by the property expressions are gathered for each event.
+        sample_columns = list(dict.fromkeys([
+            *trial_identifiers,
+            'time',
+            *(column for expression in property_expressions
+              for column in expression.meta.root_names()),
+        ]))
+
+        # Recordings without events are skipped. Their result only holds the event identifiers.
+        indices = [index for index, frame in enumerate(events_frames) if len(frame) > 0]
+        if not indices:
+            return events_frames
+
+        # Recordings are told apart by their index, as trial identifiers may repeat across them.
+        group_columns = [_RECORDING_INDEX, *trial_identifiers]
+        all_events = pl.concat(
+            [
+                events_frames[index].with_columns(pl.lit(index, pl.UInt32).alias(_RECORDING_INDEX))
+                for index in indices
+            ],
+            how='vertical_relaxed',
+        ).with_row_index(_EVENT_INDEX)
+        all_samples = pl.concat(
+            [
+                samples[index].select(sample_columns)
+                .with_columns(pl.lit(index, pl.UInt32).alias(_RECORDING_INDEX))
+                for index in indices
+            ],
+            how='vertical_relaxed',
+        )
+
+        properties = _compute_event_properties(
+            all_events, all_samples, group_columns, property_expressions,
+        )
+
+        property_names = [expression.meta.output_name() for expression in property_expressions]
+        results = (
+            all_events.join(properties, on=_EVENT_INDEX, how='left')
+            .sort(_EVENT_INDEX)
+            .partition_by(_RECORDING_INDEX, as_dict=True)
+        )
+        processed_frames = []
+        for index, events_frame in enumerate(events_frames):
+            if (index,) not in results:
+                processed_frames.append(events_frame)
+                continue
+            # Identifier columns are cast back in case concatenating them changed their dtypes.
+            processed_frames.append(
+                results[(index,)].select(*event_identifiers, *property_names).with_columns(
+                    pl.col(column).cast(dtype) for column, dtype in events_frame.schema.items()
+                ),
             )
-            # Collect property values.
-            for property_name in property_names:
-                property_values[property_name].append(values[property_name].item())
+        return processed_frames
+
 
-        # The resulting DataFrame contains the event identifiers and the computed properties.
-        result = events_frame.select(event_identifiers).with_columns(
-            *[pl.Series(name, values) for name, values in property_values.items()],
+def _compute_event_properties(
+        events: pl.DataFrame,
+        samples: pl.DataFrame,
+        group_columns: list[str],
+        property_expressions: list[pl.Expr],
+) -> pl.DataFrame:
+    """Compute event properties from all samples between onset and offset of each event.
+
+    The samples are sorted by group and time, so that the samples of each event are a contiguous
+    range of rows. The first and last row of each event are found with as-of joins, and property
+    values are aggregated over the gathered rows of all events at once.
+    """
+    samples = samples.sort([*group_columns, 'time'])
+    sample_times = samples.select(*group_columns, 'time').with_row_index(_SAMPLE_INDEX)
+
+    events = events.select(
+        _EVENT_INDEX,
+        *[pl.col(column).cast(samples.schema[column]) for column in group_columns],
+        'onset',
+        'offset',
+    )
+    # The on-columns of as-of joins need to have the same dtype.
+    if not events.schema['onset'] == events.schema['offset'] == sample_times.schema['time']:
+        events = events.with_columns(pl.col('onset', 'offset').cast(pl.Float64))
+        sample_times = sample_times.with_columns(pl.col('time').cast(pl.Float64))
+
+    # The first sample at or after the onset and the last sample at or before the offset.
+    first_samples = events.sort('onset').join_asof(
+        sample_times, left_on='onset', right_on='time', by=group_columns,
+        strategy='forward', check_sortedness=False,
+    ).select(_EVENT_INDEX, pl.col(_SAMPLE_INDEX).alias('first'))
+    last_samples = events.sort('offset').join_asof(
+        sample_times, left_on='offset', right_on='time', by=group_columns,
+        strategy='backward', check_sortedness=False,
+    ).select(_EVENT_INDEX, pl.col(_SAMPLE_INDEX).alias('last'))
+
+    event_samples = (
+        first_samples.join(last_samples, on=_EVENT_INDEX)
+        .select(
+            _EVENT_INDEX,
+            pl.int_ranges('first', pl.col('last') + 1, dtype=pl.UInt32).alias(_SAMPLE_INDEX),
         )
-        return result
+        .explode(_SAMPLE_INDEX)
+        .drop_nulls(_SAMPLE_INDEX)
+    )
+
+    return (
+        samples.select(pl.all().gather(event_samples[_SAMPLE_INDEX]))
+        .with_columns(event_samples[_EVENT_INDEX])
+        .group_by(_EVENT_INDEX)
+        .agg(property_expressions)
+    )
+
+
+def _event_properties_with_kwargs(
+        event_properties: str | tuple[str, dict[str, Any]]
+        | list[str | tuple[str, dict[str, Any]]],
+) -> list[tuple[str, dict[str, Any]]]:
+    """Validate event properties and return them as a list of names with keyword arguments."""
+    _check_event_properties(event_properties)
+
+    if isinstance(event_properties, str):
+        return [(event_properties, {})]
+    if isinstance(event_properties, tuple):
+        return [event_properties]
+    # We already validated above, it must be a list of strings and tuples.
+    return [
+        (event_property, {}) if isinstance(event_property, str) else event_property
+        for event_property in event_properties
+    ]
 
 
 def _check_event_properties(
@@ -24,12 +24,19 @@ from pymovements.gaze.experiment import Experiment
 from pymovements.gaze.eyetracker import EyeTracker
 from pymovements.gaze.gaze import Gaze
 from pymovements.gaze.gaze_dataframe import GazeDataFrame
+from pymovements.gaze.instrumentation import Instrumentation
 from pymovements.gaze.integration import from_numpy
 from pymovements.gaze.integration import from_pandas
 from pymovements.gaze.io import from_asc
 from pymovements.gaze.io import from_csv
 from pymovements.gaze.io import from_ipc
+from pymovements.gaze.io import from_parquet
+from pymovements.gaze.live_gaze import LiveGaze
 from pymovements.gaze.screen import Screen
+from pymovements.gaze.stream_server import decode_samples
+from pymovements.gaze.stream_server import encode_samples
+from pymovements.gaze.stream_server import GazeStreamServer
+from pymovements.gaze.visual_angle import VisualAngleConverter
 
 
 __all__ = [
@@ -39,10 +46,17 @@ __all__ = [
     'from_pandas',
     'Gaze',
     'GazeDataFrame',
+    'GazeStreamServer',
+    'Instrumentation',
+    'LiveGaze',
     'Screen',
+    'VisualAngleConverter',
     'transforms_numpy',
     'transforms',
     'from_asc',
     'from_csv',
     'from_ipc',
+    'from_parquet',
+    'decode_samples',
+    'encode_samples',
 ]
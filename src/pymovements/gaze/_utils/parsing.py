@@ -22,11 +22,13 @@ from __future__ import annotations
 
 import calendar
 import datetime
+import io
 import re
 import warnings
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
+from typing import IO
 
 import numpy as np
 import polars as pl
@@ -274,7 +276,7 @@ def parse_eyelink_event_end(line: str) -> tuple[str, str, float, float] | None:
 
 
 def parse_eyelink(
-        filepath: Path | str,
+        filepath: Path | str | IO[bytes],
         patterns: list[dict[str, Any] | str] | None = None,
         schema: dict[str, Any] | None = None,
         metadata_patterns: list[dict[str, Any] | str] | None = None,
@@ -284,8 +286,8 @@ def parse_eyelink(
 
     Parameters
     ----------
-    filepath: Path | str
-        file name of ascii file to convert.
+    filepath: Path | str | IO[bytes]
+        file name of ascii file to convert or binary file object to read from.
     patterns: list[dict[str, Any] | str] | None
         List of patterns to match for additional columns. (default: None)
     schema: dict[str, Any] | None
@@ -344,8 +346,14 @@ def parse_eyelink(
         **{additional_column: [] for additional_column in additional_columns},
     }
 
-    with open(filepath, encoding=encoding) as asc_file:
+    if isinstance(filepath, (str, Path)):
+        with open(filepath, encoding=encoding) as asc_file:
+            lines = asc_file.readlines()
+    else:
+        asc_file = io.TextIOWrapper(filepath, encoding=encoding)
         lines = asc_file.readlines()
+        # Detach to leave closing the binary file object to the caller.
+        asc_file.detach()
 
     # will return an empty string if the key does not exist
     metadata: defaultdict = defaultdict(str)
@@ -43,6 +43,7 @@ from pymovements._utils._html import repr_html
 from pymovements.events.processing import EventGazeProcessor
 from pymovements.gaze import transforms
 from pymovements.gaze.experiment import Experiment
+from pymovements.gaze.instrumentation import instrumented
 
 
 @repr_html(['samples', 'events', 'trial_columns', 'experiment'])
@@ -110,8 +111,6 @@ class Gaze:
     ----------
     samples: pl.DataFrame
         A dataframe of recorded gaze samples.
-    events: pm.Events
-        A dataframe of events in the gaze signal.
     experiment : Experiment | None
         The experiment definition.
     trial_columns: list[str] | None
@@ -213,7 +212,9 @@ class Gaze:
 
     samples: pl.DataFrame
 
-    events: pm.Events
+    _events: pm.Events | None
+
+    _events_pending: bool
 
     experiment: Experiment | None
 
@@ -275,23 +276,80 @@ class Gaze:
         )
 
         if events is None:
-            if self.trial_columns is None:
-                self.events = pm.Events()
-            else:  # Ensure that trial columns with correct dtype are present in event dataframe.
-                self.events = pm.Events(
-                    data=pl.DataFrame(
-                        schema={
-                            column: self.samples.schema[column] for column in self.trial_columns
-                        },
-                    ),
-                    trial_columns=self.trial_columns,
-                )
+            self.events = self._empty_events()
         else:
             self.events = events.clone()
 
         # Remove this attribute once #893 is fixed
         self._metadata: dict[str, Any] | None = None
 
+    @classmethod
+    def _from_validated(
+            cls,
+            samples: pl.DataFrame,
+            *,
+            experiment: Experiment | None,
+            events: pm.Events | None = None,
+            trial_columns: list[str] | None = None,
+            n_components: int | None = None,
+    ) -> Gaze:
+        """Create a Gaze from samples that have already been initialized by another Gaze.
+
+        In contrast to :py:meth:`__init__`, the samples and events are neither copied nor
+        validated. Column renaming and nesting, time unit conversion and replacing NaN values by
+        null values are skipped as well. This is only meant for internal producers of gaze data
+        which is known to be normalized, e.g. partitions of the samples of an existing Gaze.
+
+        Parameters
+        ----------
+        samples: pl.DataFrame
+            The normalized samples. They are assigned without copying.
+        experiment: Experiment | None
+            The experiment definition.
+        events: pm.Events | None
+            The events belonging to the samples. They are assigned without copying. If ``None``,
+            empty events with the trial columns of the samples are created on first access.
+            (default: None)
+        trial_columns: list[str] | None
+            The trial columns of the samples. (default: None)
+        n_components: int | None
+            The number of components of the nested gaze columns. (default: None)
+
+        Returns
+        -------
+        Gaze
+            The Gaze holding the passed samples and events.
+        """
+        gaze = cls.__new__(cls)
+        gaze.samples = samples
+        gaze.experiment = experiment
+        gaze.trial_columns = trial_columns
+        gaze.n_components = n_components
+        # Empty events are only created on first access, as creating them is comparatively slow.
+        gaze._events = events
+        gaze._events_pending = events is None
+        gaze._metadata = None
+        return gaze
+
+    @property
+    def events(self) -> pm.Events:
+        """Events detected in the gaze samples.
+
+        Returns
+        -------
+        pm.Events
+            The events.
+        """
+        if self._events_pending:
+            self._events = self._empty_events()
+            self._events_pending = False
+        return self._events  # type: ignore[return-value]
+
+    @events.setter
+    def events(self, events: pm.Events) -> None:
+        self._events = events
+        self._events_pending = False
+
     def apply(
             self,
             function: str,
@@ -424,8 +482,7 @@ class Gaze:
         by = [by] if isinstance(by, str) else by
 
         if not self.samples.is_empty():
-            # We use as_dict=True here to make sure to map samples to the correct events.
-            grouped_samples = self.samples.partition_by(by=by, as_dict=True)
+            grouped_samples = self._slice_samples_by(by)
             sample_key_dtypes = [dtype.to_python() for dtype in self.samples[by].dtypes]
         else:
             grouped_samples = {}
@@ -444,12 +501,16 @@ class Gaze:
             key=_replace_nones_in_split_keys(sample_key_dtypes, events_key_dtypes),
         )
 
+        # The partitions are already normalized, so they are neither copied nor validated again.
+        # All split gazes share the experiment of this gaze.
+        empty_samples = self.samples.clear()
         gazes = {
-            key: Gaze(
-                samples=grouped_samples.get(key, pl.DataFrame(schema=self.samples.schema)),
+            key: Gaze._from_validated(
+                samples=grouped_samples.get(key, empty_samples),
                 events=grouped_events.get(key, None),
                 experiment=self.experiment,
                 trial_columns=self.trial_columns,
+                n_components=self.n_components,
             )
             for key in keys
         }
@@ -458,6 +519,7 @@ class Gaze:
             return gazes
         return list(gazes.values())
 
+    @instrumented('transform', 'transform_method')
     def transform(
             self,
             transform_method: str | Callable[..., pl.Expr],
@@ -472,6 +534,7 @@ class Gaze:
         **kwargs: Any
             Additional keyword arguments to be passed to the transformation method.
         """
+        # pylint: disable=too-many-branches
         if isinstance(transform_method, str):
             transform_method = transforms.TransformLibrary.get(transform_method)
 
@@ -628,12 +691,23 @@ class Gaze:
                         f'Available columns in samples dataframe are: {self.samples.columns}',
                     )
 
-            if self.trial_columns is None:
-                self.samples = self.samples.with_columns(transform_method(**kwargs))
+            # Transforms with trial columns evaluate their windows within each trial natively.
+            # These transforms treat each contiguous run of samples of a trial as a separate
+            # trial, so that they are applied per trial group if a trial is not contiguous.
+            if (
+                    'trial_columns' in method_kwargs and 'trial_columns' not in kwargs
+                    and self._has_contiguous_trials()
+            ):
+                kwargs['trial_columns'] = self.trial_columns
+
+            # The expression is built once and applied to all trials.
+            expression = transform_method(**kwargs)
+            if self.trial_columns is None or 'trial_columns' in kwargs:
+                self.samples = self.samples.lazy().with_columns(expression).collect()
             else:
                 self.samples = pl.concat(
                     [
-                        df.with_columns(transform_method(**kwargs))
+                        df.with_columns(expression)
                         for group, df in
                         self.samples.group_by(self.trial_columns, maintain_order=True)
                     ],
@@ -930,6 +1004,7 @@ class Gaze:
             **kwargs,
         )
 
+    @instrumented('detect', 'method')
     def detect(
             self,
             method: Callable[..., pm.Events] | str,
@@ -952,20 +1027,12 @@ class Gaze:
             If ``True``, event DataFrame will be overwritten with new DataFrame instead of being
             merged into the existing one. (default: False)
         **kwargs: Any
-            Additional keyword arguments to be passed to the event detection method.
+            Additional keyword arguments to be passed to the event detection method. Built-in
+            methods accept ``event_properties`` to compute event properties during detection
+            without scanning the samples again.
         """
         if self.events is None or clear:
-            if self.trial_columns is None:
-                self.events = pm.Events()
-            else:  # Ensure that trial columns with correct dtype are present in event dataframe.
-                self.events = pm.Events(
-                    data=pl.DataFrame(
-                        schema={
-                            column: self.samples.schema[column] for column in self.trial_columns
-                        },
-                    ),
-                    trial_columns=self.trial_columns,
-                )
+            self.events = self._empty_events()
 
         if isinstance(method, str):
             method = pm.events.EventDetectionLibrary.get(method)
@@ -1057,6 +1124,7 @@ class Gaze:
         """
         self.events.drop(event_properties)
 
+    @instrumented('compute_event_properties', 'event_properties')
     def compute_event_properties(
             self,
             event_properties: str | tuple[str, dict[str, Any]]
@@ -1085,15 +1153,24 @@ class Gaze:
         ValueError
             If the computed property already exists as a column in ``events``.
         """
+        processor = EventGazeProcessor(event_properties)
+        self._check_event_properties(processor)
+
+        identifiers = self.trial_columns if self.trial_columns is not None else []
+        new_properties = processor.process(
+            self.events, self, identifiers=identifiers, name=name,
+        )
+        join_on = identifiers + ['name', 'onset', 'offset']
+        self.events.add_event_properties(new_properties, join_on=join_on)
+
+    def _check_event_properties(self, processor: EventGazeProcessor) -> None:
+        """Check that the event properties of the processor can be added to the events."""
         if len(self.events) == 0:
             warnings.warn(
                 'No events available to compute event properties. '
                 'Did you forget to use detect()?',
             )
 
-        identifiers = self.trial_columns if self.trial_columns is not None else []
-        processor = EventGazeProcessor(event_properties)
-
         event_property_names = [property[0] for property in processor.event_properties]
         existing_columns = set(self.events.columns) & set(event_property_names)
         if existing_columns:
@@ -1102,12 +1179,6 @@ class Gaze:
                 f"{existing_columns}. Please remove them first.",
             )
 
-        new_properties = processor.process(
-            self.events, self, identifiers=identifiers, name=name,
-        )
-        join_on = identifiers + ['name', 'onset', 'offset']
-        self.events.add_event_properties(new_properties, join_on=join_on)
-
     def measure_samples(
             self,
             method: str | Callable[..., pl.Expr],
@@ -1214,6 +1285,7 @@ class Gaze:
     def frame(self, data: pl.DataFrame) -> None:
         self.samples = data
 
+    @instrumented('map_to_aois', 'aoi_dataframe')
     def map_to_aois(
             self,
             aoi_dataframe: pm.stimulus.TextStimulus,
@@ -1420,13 +1492,15 @@ class Gaze:
         Gaze
             A copy of the Gaze.
         """
-        gaze = Gaze(
+        # Cloning a polars dataframe does not copy its data. The samples are only copied once
+        # either of the gazes modifies them.
+        return Gaze._from_validated(
             samples=self.samples.clone(),
             experiment=deepcopy(self.experiment),
-            events=self.events.clone(),
+            events=None if self._events_pending else self.events.clone(),
+            trial_columns=None if self.trial_columns is None else list(self.trial_columns),
+            n_components=self.n_components,
         )
-        gaze.n_components = self.n_components
-        return gaze
 
     def _check_experiment(self) -> None:
         """Check if experiment attribute has been set.
@@ -1633,41 +1707,36 @@ class Gaze:
         """
         # Automatically infer eye to use for event detection.
         method_args = inspect.getfullargspec(method).args
+        method_parameters = inspect.signature(method).parameters
+
+        # Optional sample arrays are only used for computing event properties during detection.
+        if 'event_properties' in method_args and kwargs.get('event_properties') is None:
+            method_args = [
+                arg for arg in method_args
+                if arg not in {'positions', 'velocities'}
+                or method_parameters[arg].default is inspect.Parameter.empty
+            ]
 
-        if 'positions' in method_args:
-            if 'position' not in samples.columns:
-                raise pl.exceptions.ColumnNotFoundError(
-                    f'Column \'position\' not found.'
-                    f' Available columns are: {samples.columns}',
-                )
-
-            if eye_components is None:
-                raise ValueError(
-                    'eye_components must not be None if passing position to event detection',
-                )
-
-            kwargs['positions'] = np.vstack(
-                [
-                    samples.get_column('position').list.get(eye_component)
-                    for eye_component in eye_components
-                ],
-            ).transpose()
+        for arg, column in (('positions', 'position'), ('velocities', 'velocity')):
+            if arg not in method_args:
+                continue
 
-        if 'velocities' in method_args:
-            if 'velocity' not in samples.columns:
+            if column not in samples.columns:
+                if method_parameters[arg].default is not inspect.Parameter.empty:
+                    continue
                 raise pl.exceptions.ColumnNotFoundError(
-                    f'Column \'velocity\' not found.'
+                    f'Column \'{column}\' not found.'
                     f' Available columns are: {samples.columns}',
                 )
 
             if eye_components is None:
                 raise ValueError(
-                    'eye_components must not be None if passing velocity to event detection',
+                    f'eye_components must not be None if passing {column} to event detection',
                 )
 
-            kwargs['velocities'] = np.vstack(
+            kwargs[arg] = np.vstack(
                 [
-                    samples.get_column('velocity').list.get(eye_component)
+                    samples.get_column(column).list.get(eye_component)
                     for eye_component in eye_components
                 ],
             ).transpose()
@@ -1854,6 +1923,48 @@ class Gaze:
                     pl.col('time').cast(pl.Int64),
                 )
 
+    def _slice_samples_by(self, by: Sequence[str]) -> dict[tuple[Any, ...], pl.DataFrame]:
+        """Split the samples into groups which are zero-copy slices of the samples.
+
+        If the rows of each group are not contiguous, the samples are sorted by the group columns
+        once beforehand. The order of rows within each group is kept.
+        """
+        samples = self.samples
+        keys = samples[by]
+        group_lengths = keys.select(pl.struct(by).rle().struct.field('len')).to_series()
+        if len(group_lengths) != keys.select(pl.struct(by).n_unique()).item():
+            samples = samples.sort(by, maintain_order=True)
+            keys = samples[by]
+            group_lengths = keys.select(pl.struct(by).rle().struct.field('len')).to_series()
+
+        grouped_samples = {}
+        offset = 0
+        for length in group_lengths:
+            grouped_samples[keys.row(offset)] = samples.slice(offset, length)
+            offset += length
+        return grouped_samples
+
+    def _has_contiguous_trials(self) -> bool:
+        """Check if the samples of each trial are contiguous."""
+        if self.trial_columns is None:
+            return True
+        keys = self.samples.select(pl.struct(self.trial_columns).alias('trial'))
+        n_runs = keys.select(pl.col('trial').rle_id().max()).item()
+        n_trials = keys.select(pl.col('trial').n_unique()).item()
+        return n_runs is None or n_runs + 1 == n_trials
+
+    def _empty_events(self) -> pm.Events:
+        """Return empty events with the trial columns of the samples."""
+        if self.trial_columns is None:
+            return pm.Events()
+        # Ensure that trial columns with correct dtype are present in event dataframe.
+        return pm.Events(
+            data=pl.DataFrame(
+                schema={column: self.samples.schema[column] for column in self.trial_columns},
+            ),
+            trial_columns=self.trial_columns,
+        )
+
     def _init_experiment(
             self, experiment: Experiment | None, definition: pm.DatasetDefinition | None,
     ) -> None:
@@ -0,0 +1,444 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides per-step timing and memory instrumentation of gaze processing."""
+from __future__ import annotations
+
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+from typing import TypeVar
+
+import polars as pl
+
+Method = TypeVar('Method', bound=Callable[..., Any])
+
+# Instrumentations are shared by all threads, so that steps in worker threads are recorded too.
+_active_instrumentations: list[Instrumentation] = []
+_active_instrumentations_lock = threading.Lock()
+
+# The file is local to the current thread or task.
+_current_file: ContextVar[str | None] = ContextVar('current_file', default=None)
+
+# Peaks of traced memory of all running steps. Starting a step resets the peak of tracemalloc,
+# so the peak reached so far is kept here for all enclosing steps, e.g. of nested method calls.
+_memory_peaks: dict[int, int] = {}
+_memory_peaks_lock = threading.Lock()
+_memory_peak_ids = itertools.count()
+
+RECORD_SCHEMA = {
+    'step': pl.Utf8,
+    'method': pl.Utf8,
+    'file': pl.Utf8,
+    'start_time': pl.Float64,
+    'wall_time': pl.Float64,
+    'samples_in': pl.Int64,
+    'samples_out': pl.Int64,
+    'events_in': pl.Int64,
+    'events_out': pl.Int64,
+    'python_memory_delta': pl.Int64,
+    'python_memory_peak': pl.Int64,
+    'rss_delta': pl.Int64,
+}
+
+
+class Instrumentation:
+    """Record wall time, rows and memory of each processing step of :py:class:`~pymovements.Gaze`.
+
+    While the instrumentation is active, a record is taken for every call of
+    :py:meth:`~pymovements.Gaze.transform`, :py:meth:`~pymovements.Gaze.detect`,
+    :py:meth:`~pymovements.Gaze.compute_event_properties` and
+    :py:meth:`~pymovements.Gaze.map_to_aois`. This includes all calls made by methods of
+    :py:class:`~pymovements.Dataset`, which additionally record the file each step is applied to.
+    If :py:meth:`~pymovements.Dataset.compute_event_properties` computes the event properties of
+    all files at once, this computation is recorded without a file, followed by a record per file
+    for adding the computed event properties.
+
+    Each record contains the following fields:
+
+    - ``step``: The name of the instrumented method, e.g. ``transform``.
+    - ``method``: The name of the applied transformation, detection method or event properties.
+    - ``file``: The path of the processed file relative to the raw data directory, if known.
+    - ``start_time``: Seconds since the epoch at the start of the step.
+    - ``wall_time``: Duration of the step in seconds.
+    - ``samples_in`` and ``samples_out``: Number of samples before and after the step.
+    - ``events_in`` and ``events_out``: Number of events before and after the step.
+    - ``python_memory_delta``: Change of memory traced by :py:mod:`tracemalloc` in bytes.
+    - ``python_memory_peak``: Peak of memory traced by :py:mod:`tracemalloc` above its value at
+      the start of the step in bytes.
+    - ``rss_delta``: Change of the resident set size of the process in bytes. This is only
+      available on Linux.
+
+    The memory fields are only set if ``trace_memory`` is ``True``. :py:mod:`tracemalloc` only
+    traces allocations of the Python memory allocator, e.g. numpy arrays, but not the memory
+    allocated by polars. The resident set size covers all allocations, but has no peak value.
+
+    Parameters
+    ----------
+    trace_memory: bool
+        Trace memory allocations with :py:mod:`tracemalloc` and record the change of the resident
+        set size. Tracing slows down the execution of Python code considerably. (default: False)
+    callbacks: Callable[[dict[str, Any]], None] | list[Callable[[dict[str, Any]], None]] | None
+        Functions which are called with each record right after it was taken. (default: None)
+
+    Attributes
+    ----------
+    records: list[dict[str, Any]]
+        All records taken so far.
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import pymovements as pm
+    >>> gaze = pm.Gaze(
+    ...     pl.DataFrame({'x': [0.0, 1.0, 2.0, 3.0, 4.0], 'y': [0.0, 1.0, 2.0, 3.0, 4.0]}),
+    ...     experiment=pm.Experiment(1280, 1024, 38, 30, 68, 'upper left', 1000),
+    ...     pixel_columns=['x', 'y'],
+    ... )
+
+    All steps applied within the context are recorded:
+    >>> with pm.Instrumentation() as instrumentation:
+    ...     gaze.pix2deg()
+    ...     gaze.pos2vel(method='neighbors')
+    >>> instrumentation.to_frame().select('step', 'method', 'samples_in', 'samples_out')
+    shape: (2, 4)
+    ┌───────────┬─────────┬────────────┬─────────────┐
+    │ step      ┆ method  ┆ samples_in ┆ samples_out │
+    │ ---       ┆ ---     ┆ ---        ┆ ---         │
+    │ str       ┆ str     ┆ i64        ┆ i64         │
+    ╞═══════════╪═════════╪════════════╪═════════════╡
+    │ transform ┆ pix2deg ┆ 5          ┆ 5           │
+    │ transform ┆ pos2vel ┆ 5          ┆ 5           │
+    └───────────┴─────────┴────────────┴─────────────┘
+    """
+
+    records: list[dict[str, Any]]
+
+    def __init__(
+            self,
+            *,
+            trace_memory: bool = False,
+            callbacks: Callable[[dict[str, Any]], None]
+            | list[Callable[[dict[str, Any]], None]] | None = None,
+    ):
+        if callbacks is None:
+            callbacks = []
+        elif callable(callbacks):
+            callbacks = [callbacks]
+
+        self.trace_memory = trace_memory
+        self.callbacks = callbacks
+        self.records: list[dict[str, Any]] = []
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> Instrumentation:
+        """Start recording steps."""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        with _active_instrumentations_lock:
+            _active_instrumentations.append(self)
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop recording steps."""
+        with _active_instrumentations_lock:
+            _active_instrumentations.remove(self)
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def add_record(self, record: dict[str, Any]) -> None:
+        """Add a record and pass it to all callbacks.
+
+        Parameters
+        ----------
+        record: dict[str, Any]
+            The record to add.
+        """
+        self.records.append(record)
+        for callback in self.callbacks:
+            callback(record)
+
+    def to_frame(self) -> pl.DataFrame:
+        """Return all records as a data frame.
+
+        Returns
+        -------
+        pl.DataFrame
+            Data frame with one row per record.
+        """
+        return pl.DataFrame(self.records, schema=RECORD_SCHEMA, orient='row')
+
+    def to_json(self, filepath: str | Path | None = None) -> str | None:
+        """Return all records as a JSON trace or write it to a file.
+
+        The trace is a list of records and can be read back with :py:func:`polars.read_json`.
+
+        Parameters
+        ----------
+        filepath: str | Path | None
+            Write the trace to this file instead of returning it. (default: None)
+
+        Returns
+        -------
+        str | None
+            The JSON trace if no ``filepath`` is passed.
+        """
+        trace = json.dumps(self.records)
+        if filepath is None:
+            return trace
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(trace)
+        return None
+
+
+@contextmanager
+def file_context(file: str | Path | None) -> Iterator[None]:
+    """Attribute all steps recorded in this context to a file.
+
+    Parameters
+    ----------
+    file: str | Path | None
+        The file which is processed in this context.
+
+    Yields
+    ------
+    None
+    """
+    token = _current_file.set(None if file is None else str(file))
+    try:
+        yield
+    finally:
+        _current_file.reset(token)
+
+
+def instrumented(step: str, method_parameter: str) -> Callable[[Method], Method]:
+    """Record calls of a :py:class:`~pymovements.Gaze` method in all active instrumentations.
+
+    Parameters
+    ----------
+    step: str
+        The name of the step in the records.
+    method_parameter: str
+        The name of the parameter of the decorated method which holds the applied
+        transformation, detection method or event properties.
+
+    Returns
+    -------
+    Callable[[Method], Method]
+        The decorator.
+    """
+    def decorator(method: Method) -> Method:
+        # Position of the parameter in the positional arguments after ``self``.
+        method_parameter_index = list(inspect.signature(method).parameters).index(
+            method_parameter,
+        ) - 1
+
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if not _active_instrumentations:
+                return method(self, *args, **kwargs)
+
+            if method_parameter in kwargs:
+                method_argument = kwargs[method_parameter]
+            elif len(args) > method_parameter_index:
+                method_argument = args[method_parameter_index]
+            else:
+                method_argument = None
+
+            with recorded_step(step, method_argument, [self]):
+                return method(self, *args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+@contextmanager
+def recorded_step(step: str, method: Any, gazes: Sequence[Any]) -> Iterator[None]:
+    """Record a step applied to gazes in this context in all active instrumentations.
+
+    The rows of all gazes are summed up in the record. No record is taken if the step raises.
+
+    Parameters
+    ----------
+    step: str
+        The name of the step in the records.
+    method: Any
+        The applied transformation, detection method or event properties.
+    gazes: Sequence[Any]
+        The gazes the step is applied to.
+
+    Yields
+    ------
+    None
+    """
+    if not _active_instrumentations:
+        yield
+        return
+
+    instrumentations = list(_active_instrumentations)
+    trace_memory = tracemalloc.is_tracing() and any(
+        instrumentation.trace_memory for instrumentation in instrumentations
+    )
+
+    samples_in = _sum_counts(_count_rows(gaze.samples) for gaze in gazes)
+    events_in = _sum_counts(_count_events(gaze) for gaze in gazes)
+    memory_peak_id = memory_start = rss_start = None
+    if trace_memory:
+        memory_peak_id, memory_start = _start_memory_peak()
+        rss_start = _read_rss()
+    start_time = time.time()
+    start_counter = time.perf_counter()
+
+    memory_delta = memory_peak = rss_delta = None
+    try:
+        yield
+    finally:
+        # Stop tracking the peak even if the step raises.
+        wall_time = time.perf_counter() - start_counter
+        if memory_peak_id is not None and memory_start is not None:
+            memory_end, memory_peak_absolute = _stop_memory_peak(memory_peak_id)
+            memory_delta = memory_end - memory_start
+            memory_peak = memory_peak_absolute - memory_start
+            rss_end = _read_rss()
+            if rss_start is not None and rss_end is not None:
+                rss_delta = rss_end - rss_start
+
+    record = {
+        'step': step,
+        'method': _describe_method(method),
+        'file': _current_file.get(),
+        'start_time': start_time,
+        'wall_time': wall_time,
+        'samples_in': samples_in,
+        'samples_out': _sum_counts(_count_rows(gaze.samples) for gaze in gazes),
+        'events_in': events_in,
+        'events_out': _sum_counts(_count_events(gaze) for gaze in gazes),
+        'python_memory_delta': memory_delta,
+        'python_memory_peak': memory_peak,
+        'rss_delta': rss_delta,
+    }
+    for instrumentation in instrumentations:
+        instrumentation.add_record(
+            record if instrumentation.trace_memory
+            else {
+                **record,
+                'python_memory_delta': None,
+                'python_memory_peak': None,
+                'rss_delta': None,
+            },
+        )
+
+
+def _start_memory_peak() -> tuple[int, int]:
+    """Start tracking the peak of traced memory of a step.
+
+    Returns
+    -------
+    tuple[int, int]
+        The id of the tracked peak and the currently traced memory in bytes.
+    """
+    with _memory_peaks_lock:
+        _, peak = tracemalloc.get_traced_memory()
+        for peak_id, running_peak in _memory_peaks.items():
+            _memory_peaks[peak_id] = max(running_peak, peak)
+        tracemalloc.reset_peak()
+
+        current, _ = tracemalloc.get_traced_memory()
+        peak_id = next(_memory_peak_ids)
+        _memory_peaks[peak_id] = current
+        return peak_id, current
+
+
+def _stop_memory_peak(peak_id: int) -> tuple[int, int]:
+    """Stop tracking the peak of traced memory of a step.
+
+    Parameters
+    ----------
+    peak_id: int
+        The id returned by :py:func:`_start_memory_peak`.
+
+    Returns
+    -------
+    tuple[int, int]
+        The currently traced memory and its peak since the start of the step in bytes.
+    """
+    with _memory_peaks_lock:
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(_memory_peaks.pop(peak_id), peak)
+        return current, peak
+
+
+def _read_rss() -> int | None:
+    """Return the resident set size of the process in bytes or ``None`` if it is unavailable."""
+    try:
+        with open('/proc/self/statm', encoding='ascii') as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def _count_rows(data: Any) -> int | None:
+    """Return the number of rows of samples or events, or ``None`` if there are none."""
+    if data is None:
+        return None
+    return len(data)
+
+
+def _sum_counts(counts: Iterable[int | None]) -> int | None:
+    """Return the sum of row counts, or ``None`` if there are no rows to count."""
+    counted = [count for count in counts if count is not None]
+    if not counted:
+        return None
+    return sum(counted)
+
+
+def _count_events(gaze: Any) -> int | None:
+    """Return the number of events of a gaze without creating its pending empty events."""
+    if getattr(gaze, '_events_pending', False):
+        return 0
+    return _count_rows(getattr(gaze, '_events', None))
+
+
+def _describe_method(method: Any) -> str | None:
+    """Return a readable name of a transformation, detection method or event properties."""
+    if method is None or isinstance(method, str):
+        return method
+    if isinstance(method, tuple):
+        return _describe_method(method[0])
+    if isinstance(method, list):
+        return ','.join(str(_describe_method(item)) for item in method)
+    return getattr(method, '__name__', type(method).__name__)
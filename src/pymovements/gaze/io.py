@@ -24,6 +24,7 @@ import math
 import warnings
 from pathlib import Path
 from typing import Any
+from typing import IO
 
 import polars as pl
 
@@ -35,7 +36,7 @@ from pymovements.gaze.gaze import Gaze
 
 
 def from_csv(
-        file: str | Path,
+        file: str | Path | IO[bytes],
         experiment: Experiment | None = None,
         *,
         trial_columns: str | list[str] | None = None,
@@ -57,8 +58,8 @@ def from_csv(
 
     Parameters
     ----------
-    file: str | Path
-        Path of gaze file.
+    file: str | Path | IO[bytes]
+        Path of gaze file or binary file object to read from.
     experiment : Experiment | None
         The experiment definition. (default: None)
     trial_columns: str | list[str] | None
@@ -291,7 +292,7 @@ def from_csv(
 
 
 def from_asc(
-        file: str | Path,
+        file: str | Path | IO[bytes],
         *,
         patterns: str | list[dict[str, Any] | str] | None = None,
         metadata_patterns: list[dict[str, Any] | str] | None = None,
@@ -308,8 +309,8 @@ def from_asc(
 
     Parameters
     ----------
-    file: str | Path
-        Path of ASC file.
+    file: str | Path | IO[bytes]
+        Path of ASC file or binary file object to read from.
     patterns: str | list[dict[str, Any] | str] | None
         List of patterns to match for additional columns or a key identifier of eye tracker specific
         default patterns. Supported values are: `'eyelink'`. If `None` is passed, `'eyelink'` is
@@ -511,7 +512,7 @@ def from_asc(
 
 
 def from_ipc(
-        file: str | Path,
+        file: str | Path | IO[bytes],
         experiment: Experiment | None = None,
         *,
         trial_columns: str | list[str] | None = None,
@@ -524,8 +525,8 @@ def from_ipc(
 
     Parameters
     ----------
-    file: str | Path
-        Path of IPC/feather file.
+    file: str | Path | IO[bytes]
+        Path of IPC/feather file or binary file object to read from.
     experiment : Experiment | None
         The experiment definition.
         (default: None)
@@ -612,6 +613,108 @@ def from_ipc(
     return gaze
 
 
+def from_parquet(
+        file: str | Path | IO[bytes],
+        experiment: Experiment | None = None,
+        *,
+        trial_columns: str | list[str] | None = None,
+        column_map: dict[str, str] | None = None,
+        add_columns: dict[str, str] | None = None,
+        column_schema_overrides: dict[str, type] | None = None,
+        **read_parquet_kwargs: Any,
+) -> Gaze:
+    """Initialize a :py:class:`~pymovements.Gaze`.
+
+    Parameters
+    ----------
+    file: str | Path | IO[bytes]
+        Path of parquet file or binary file object to read from.
+    experiment : Experiment | None
+        The experiment definition.
+        (default: None)
+    trial_columns: str | list[str] | None
+        The name of the trial columns in the input data frame. If the list is empty or None,
+        the input data frame is assumed to contain only one trial. If the list is not empty,
+        the input data frame is assumed to contain multiple trials and the transformation
+        methods will be applied to each trial separately. (default: None)
+    column_map: dict[str, str] | None
+        The keys are the columns to read, the values are the names to which they should be renamed.
+        (default: None)
+    add_columns: dict[str, str] | None
+        Dictionary containing columns to add to loaded data frame.
+        (default: None)
+    column_schema_overrides:  dict[str, type] | None
+        Dictionary containing types for columns.
+        (default: None)
+    **read_parquet_kwargs: Any
+            Additional keyword arguments to be passed to polars to read in the parquet file.
+
+    Returns
+    -------
+    Gaze
+        The initialized gaze object read from the parquet file.
+
+    Examples
+    --------
+    Let's assume we have a parquet file stored at `tests/files/monocular_example.parquet`.
+    We can then load the data into a ``Gaze``:
+
+    >>> from pymovements.gaze.io import from_parquet
+    >>> gaze = from_parquet(file='tests/files/monocular_example.parquet')
+    >>> gaze.samples
+    shape: (10, 2)
+    ┌──────┬───────────┐
+    │ time ┆ pixel     │
+    │ ---  ┆ ---       │
+    │ i64  ┆ list[i64] │
+    ╞══════╪═══════════╡
+    │ 0    ┆ [0, 0]    │
+    │ 1    ┆ [0, 0]    │
+    │ 2    ┆ [0, 0]    │
+    │ 3    ┆ [0, 0]    │
+    │ 4    ┆ [0, 0]    │
+    │ 5    ┆ [0, 0]    │
+    │ 6    ┆ [0, 0]    │
+    │ 7    ┆ [0, 0]    │
+    │ 8    ┆ [0, 0]    │
+    │ 9    ┆ [0, 0]    │
+    └──────┴───────────┘
+
+    """
+    # Read data.
+    samples = pl.read_parquet(file, **read_parquet_kwargs)
+
+    if column_map is not None:
+        samples = samples.rename({
+            key: column_map[key] for key in
+            [
+                key for key in column_map.keys()
+                if key in samples.columns
+            ]
+        })
+
+    if add_columns is not None:
+        samples = samples.with_columns([
+            pl.lit(value).alias(column)
+            for column, value in add_columns.items()
+            if column not in samples.columns
+        ])
+
+    if column_schema_overrides is not None:
+        samples = samples.with_columns([
+            pl.col(fileinfo_key).cast(fileinfo_dtype)
+            for fileinfo_key, fileinfo_dtype in column_schema_overrides.items()
+        ])
+
+    # Create gaze object.
+    gaze = Gaze(
+        samples=samples,
+        experiment=experiment,
+        trial_columns=trial_columns,
+    )
+    return gaze
+
+
 def _fill_experiment_from_parsing_metadata(
         experiment: Experiment | None,
         metadata: dict[str, Any],
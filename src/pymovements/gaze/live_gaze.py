@@ -0,0 +1,318 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a fixed-capacity gaze buffer for live eye tracker feeds."""
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+
+from pymovements.gaze.experiment import Experiment
+from pymovements.gaze.gaze import Gaze
+
+
+# Finite difference stencils of the pos2vel methods as terms of sample offsets and signs, with the
+# factor applied to the sampling rate. The terms are summed up in the order of the polars
+# implementation in :py:func:`pymovements.gaze.transforms.pos2vel`.
+_VELOCITY_STENCILS: dict[str, tuple[tuple[tuple[int, int], ...], float]] = {
+    'preceding': (((0, 1), (-1, -1)), 1.0),
+    'neighbors': (((1, 1), (-1, -1)), 1 / 2),
+    'fivepoint': (((2, 1), (1, 1), (-1, -1), (-2, -1)), 1 / 6),
+    'smooth': (((2, 1), (1, 1), (-1, -1), (-2, -1)), 1 / 6),
+}
+
+
+class LiveGaze:
+    """Fixed-capacity ring buffer of gaze samples which are appended by a live eye tracker feed.
+
+    The buffer is preallocated and keeps the latest ``capacity`` samples. Appended pixel
+    coordinates are transformed to positions in degrees of visual angle and velocities right
+    away, as in :py:meth:`~pymovements.Gaze.pix2deg` and :py:meth:`~pymovements.Gaze.pos2vel`. The
+    velocity of a sample is computed as soon as all samples of its difference stencil have been
+    appended, e.g. two samples later for method ``fivepoint``. Until then it is missing.
+    :py:meth:`start_stream` starts a new stream of samples, e.g. after a gap in the timesteps.
+    Velocities are not computed across streams, as for separate trials of a
+    :py:class:`~pymovements.Gaze`.
+
+    :py:meth:`to_gaze` returns a snapshot of the buffered samples as a regular
+    :py:class:`~pymovements.Gaze` with the columns ``time``, ``pixel``, ``position`` and
+    ``velocity``. :py:meth:`pop_completed` returns each sample once as soon as its velocity has
+    been computed, e.g. to pass it on to a streaming event detector.
+
+    Parameters
+    ----------
+    experiment: Experiment
+        The experiment definition. The screen and sampling rate are used for the transformations.
+    capacity: int
+        Maximum number of buffered samples. When the buffer is full, appending samples overwrites
+        the oldest ones. (default: 10000)
+    n_components: int
+        Number of pixel components per sample, e.g. 2 for monocular and 4 for binocular
+        recordings. (default: 2)
+    velocity_method: str
+        Computation method of the velocities. Supported methods are ``preceding``,
+        ``neighbors``, ``fivepoint`` and ``smooth``. See
+        :py:func:`~pymovements.gaze.transforms.pos2vel` for details. (default: 'fivepoint')
+
+    Raises
+    ------
+    ValueError
+        If the velocity method is not supported, if the number of components is not 2, 4 or 6, or
+        if the capacity is too small for the velocity method.
+    AttributeError
+        If the experiment has no eye-to-screen distance or no sampling rate.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pymovements as pm
+    >>> experiment = pm.Experiment(1280, 1024, 38, 30, 68, 'upper left', 1000)
+    >>> live_gaze = pm.gaze.LiveGaze(experiment, capacity=1000, velocity_method='preceding')
+    >>> live_gaze.append(time=[0, 1, 2], pixel=[[640, 512], [641, 512], [643, 512]])
+    >>> live_gaze.to_gaze().samples
+    shape: (3, 4)
+    ┌──────┬────────────────┬──────────────────────┬──────────────────┐
+    │ time ┆ pixel          ┆ position             ┆ velocity         │
+    │ ---  ┆ ---            ┆ ---                  ┆ ---              │
+    │ i64  ┆ list[f64]      ┆ list[f64]            ┆ list[f64]        │
+    ╞══════╪════════════════╪══════════════════════╪══════════════════╡
+    │ 0    ┆ [640.0, 512.0] ┆ [0.012507, 0.012343] ┆ [null, null]     │
+    │ 1    ┆ [641.0, 512.0] ┆ [0.037521, 0.012343] ┆ [25.014237, 0.0] │
+    │ 2    ┆ [643.0, 512.0] ┆ [0.08755, 0.012343]  ┆ [50.028421, 0.0] │
+    └──────┴────────────────┴──────────────────────┴──────────────────┘
+    """
+
+    def __init__(
+            self,
+            experiment: Experiment,
+            capacity: int = 10_000,
+            *,
+            n_components: int = 2,
+            velocity_method: str = 'fivepoint',
+    ):
+        if velocity_method not in _VELOCITY_STENCILS:
+            raise ValueError(
+                f"Unknown method '{velocity_method}'. "
+                f'Supported methods are: {list(_VELOCITY_STENCILS)}',
+            )
+        if n_components not in {2, 4, 6}:
+            raise ValueError(f'n_components must be either 2, 4 or 6 but is {n_components}')
+        if not experiment.screen.distance_cm:
+            raise AttributeError('experiment eye-to-screen distance is not specified')
+        sampling_rate = experiment.sampling_rate
+        if not sampling_rate:
+            raise AttributeError('experiment sampling rate is not specified')
+
+        terms, factor = _VELOCITY_STENCILS[velocity_method]
+        offsets = [offset for offset, _ in terms]
+        self._lookbehind = -min(offsets)
+        self._lookahead = max(offsets)
+        # Each appended chunk needs the preceding and following samples of its stencils.
+        self._max_chunk_size = capacity - self._lookbehind - self._lookahead
+        if self._max_chunk_size < 1:
+            raise ValueError(
+                f"capacity must be greater than {self._lookbehind + self._lookahead} "
+                f"for velocity method '{velocity_method}'",
+            )
+
+        self.experiment = experiment
+        self.capacity = capacity
+        self.n_components = n_components
+        self.velocity_method = velocity_method
+
+        self._velocity_terms = terms
+        self._velocity_factor = sampling_rate * factor
+
+        self._converter = experiment.screen.visual_angle_converter
+
+        self._time = np.empty(capacity, dtype=np.float64)
+        self._pixel = np.empty((capacity, n_components), dtype=np.float64)
+        self._position = np.empty((capacity, n_components), dtype=np.float64)
+        self._velocity = np.empty((capacity, n_components), dtype=np.float64)
+        self._integer_time = True
+        self._n_appended = 0
+        self._n_popped = 0
+        # Index of the first sample of the current stream and number of samples whose velocities
+        # are final.
+        self._stream_start = 0
+        self._n_completed = 0
+
+    def __len__(self) -> int:
+        """Get the number of buffered samples."""
+        return min(self._n_appended, self.capacity)
+
+    @property
+    def n_appended(self) -> int:
+        """Total number of samples appended since creation, including overwritten ones."""
+        return self._n_appended
+
+    def append(
+            self,
+            time: int | float | list[int | float] | np.ndarray,
+            pixel: list[float] | list[list[float]] | np.ndarray,
+    ) -> None:
+        """Append a batch of samples to the buffer.
+
+        Parameters
+        ----------
+        time: int | float | list[int | float] | np.ndarray
+            shape (N, )
+            Timestamps of the samples.
+        pixel: list[float] | list[list[float]] | np.ndarray
+            shape (N, n_components)
+            Pixel coordinates of the samples. A single sample can be passed with shape
+            (n_components, ).
+
+        Raises
+        ------
+        ValueError
+            If the shapes of time and pixel do not match the number of components.
+        """
+        time = np.atleast_1d(np.asarray(time))
+        pixel = np.asarray(pixel, dtype=np.float64)
+        if pixel.ndim == 1:
+            pixel = pixel[np.newaxis, :]
+        if pixel.ndim != 2 or pixel.shape[1] != self.n_components:
+            raise ValueError(
+                f'pixel must have shape (N, {self.n_components}) but has shape {pixel.shape}',
+            )
+        if time.shape != (len(pixel),):
+            raise ValueError(
+                f'time must have shape ({len(pixel)},) but has shape {time.shape}',
+            )
+
+        self._integer_time = self._integer_time and np.issubdtype(time.dtype, np.integer)
+
+        for chunk_start in range(0, len(pixel), self._max_chunk_size):
+            chunk = slice(chunk_start, chunk_start + self._max_chunk_size)
+            self._append_chunk(time[chunk], pixel[chunk])
+
+    def start_stream(self) -> None:
+        """Start a new stream of samples, e.g. after a gap in the timesteps.
+
+        The velocities of the last samples of the previous stream and of the first samples of the
+        new stream, whose difference stencils would span both streams, are missing. The last
+        samples of the previous stream can be popped by :py:meth:`pop_completed` right away.
+        """
+        self._stream_start = self._n_appended
+        self._n_completed = self._n_appended
+
+    def to_gaze(self) -> Gaze:
+        """Get a snapshot of the buffered samples as a :py:class:`~pymovements.Gaze`.
+
+        Returns
+        -------
+        Gaze
+            The buffered samples in chronological order. Velocities which can not be computed yet
+            are missing.
+        """
+        n_samples = len(self)
+        sample_indices = np.arange(self._n_appended - n_samples, self._n_appended)
+        time, pixel, position, velocity = self._read(sample_indices)
+
+        columns: dict[str, np.ndarray] = {'time': time}
+        column_names: dict[str, list[str]] = {}
+        for name, values in (
+                ('pixel', pixel),
+                ('position', position),
+                ('velocity', velocity),
+        ):
+            column_names[name] = [f'{name}_{component}' for component in range(self.n_components)]
+            for component, column_name in enumerate(column_names[name]):
+                columns[column_name] = values[:, component]
+
+        return Gaze(
+            pl.DataFrame(columns),
+            experiment=self.experiment,
+            time_column='time',
+            pixel_columns=column_names['pixel'],
+            position_columns=column_names['position'],
+            velocity_columns=column_names['velocity'],
+        )
+
+    def pop_completed(
+            self,
+            include_incomplete: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the samples whose velocities have been computed since the last call.
+
+        This allows passing each sample exactly once to a streaming event detector. Samples which
+        have been overwritten before they are popped are skipped.
+
+        Parameters
+        ----------
+        include_incomplete: bool
+            Also pop the latest samples whose velocities can not be computed yet, e.g. at the end
+            of a stream. Their velocities are missing. (default: False)
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Time, positions and velocities of the popped samples.
+        """
+        start = max(self._n_popped, self._n_appended - self.capacity)
+        stop = self._n_appended if include_incomplete else self._n_completed
+        stop = max(start, stop)
+        self._n_popped = stop
+
+        time, _, position, velocity = self._read(np.arange(start, stop))
+        return time, position, velocity
+
+    def _read(
+            self,
+            sample_indices: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Read time, pixels, positions and velocities of buffered samples by their index."""
+        slots = sample_indices % self.capacity
+
+        time = self._time[slots]
+        if self._integer_time:
+            time = time.astype(np.int64)
+        return time, self._pixel[slots], self._position[slots], self._velocity[slots]
+
+    def _append_chunk(self, time: np.ndarray, pixel: np.ndarray) -> None:
+        """Write a chunk of samples to the buffer and update all derivable velocities."""
+        chunk_start = self._n_appended
+        slots = np.arange(chunk_start, chunk_start + len(pixel)) % self.capacity
+
+        self._time[slots] = time
+        self._pixel[slots] = pixel
+        self._position[slots] = self._converter.pix2deg(pixel)
+        # Velocities are missing until their stencil is complete. The velocities of the first
+        # samples of a stream stay missing.
+        self._velocity[slots] = np.nan
+        self._n_appended += len(pixel)
+        self._n_completed = max(self._n_completed, self._n_appended - self._lookahead)
+
+        # Velocities of all samples with a complete stencil that have not been computed yet.
+        sample_indices = np.arange(
+            max(chunk_start - self._lookahead, self._stream_start + self._lookbehind),
+            self._n_appended - self._lookahead,
+        )
+        if len(sample_indices) == 0:
+            return
+
+        (first_offset, _), *other_terms = self._velocity_terms
+        velocity = self._position[(sample_indices + first_offset) % self.capacity]
+        for offset, sign in other_terms:
+            if sign > 0:
+                velocity += self._position[(sample_indices + offset) % self.capacity]
+            else:
+                velocity -= self._position[(sample_indices + offset) % self.capacity]
+        self._velocity[sample_indices % self.capacity] = velocity * self._velocity_factor
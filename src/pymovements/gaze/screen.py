@@ -29,6 +29,7 @@ import numpy as np
 from pymovements._utils import _checks
 from pymovements._utils._html import repr_html
 from pymovements.gaze import transforms_numpy
+from pymovements.gaze.visual_angle import VisualAngleConverter
 
 
 @repr_html()
@@ -252,28 +253,51 @@ class Screen:
         >>> screen.pix2deg(arr=arr)
         array([[ 3.07379946, 20.43909054]])
         """
-        self._check_numerical_attribute('width_px')
-        assert self.width_px is not None
+        converter = self.visual_angle_converter
+        self._check_numerical_attribute('distance_cm')
+        return converter.pix2deg(np.asarray(arr))
 
-        self._check_numerical_attribute('height_px')
-        assert self.height_px is not None
+    @property
+    def visual_angle_converter(self) -> VisualAngleConverter:
+        """Converter between pixel coordinates and degrees of visual angle on this screen.
 
-        self._check_numerical_attribute('width_cm')
-        assert self.width_cm is not None
+        The converter is shared by all screens with the same attributes. If the eye-to-screen
+        distance is not specified, it must be passed to each conversion.
 
-        self._check_numerical_attribute('height_cm')
-        assert self.height_cm is not None
+        Returns
+        -------
+        VisualAngleConverter
+            The converter for this screen.
 
-        self._check_numerical_attribute('distance_cm')
-        assert self.distance_cm is not None
+        Raises
+        ------
+        TypeError
+            If the screen resolution, size or origin are not specified.
 
-        _checks.check_is_not_none(origin=self.origin)
+        Examples
+        --------
+        >>> screen = Screen(1280, 1024, 38.0, 30.0, 68.0, 'upper left')
+        >>> screen.visual_angle_converter is Screen(1280, 1024, 38.0, 30.0, 68.0, 'upper left'
+        ...     ).visual_angle_converter
+        True
+        >>> screen.visual_angle_converter.distance_px
+        (2290.5263157894738, 2321.0666666666666)
+        """
+        # Only missing attributes are checked here. All values are validated by the converter when
+        # it is created, so that looking up a cached converter is cheap.
+        if None in (self.width_px, self.height_px, self.width_cm, self.height_cm, self.origin):
+            self._check_numerical_attribute('width_px')
+            self._check_numerical_attribute('height_px')
+            self._check_numerical_attribute('width_cm')
+            self._check_numerical_attribute('height_cm')
+            _checks.check_is_not_none(origin=self.origin)
+        assert self.width_px is not None and self.height_px is not None
+        assert self.width_cm is not None and self.height_cm is not None
         assert self.origin is not None
 
-        return transforms_numpy.pix2deg(
-            arr=arr,
-            screen_px=(self.width_px, self.height_px),
-            screen_cm=(self.width_cm, self.height_cm),
+        return VisualAngleConverter.cached(
+            screen_resolution=(self.width_px, self.height_px),
+            screen_size=(self.width_cm, self.height_cm),
             distance_cm=self.distance_cm,
             origin=self.origin,
         )
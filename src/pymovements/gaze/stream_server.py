@@ -0,0 +1,647 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides an asyncio server which ingests gaze samples streamed by an eye tracker."""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any
+from typing import Literal
+from typing import TYPE_CHECKING
+from typing import Union
+
+import numpy as np
+import polars as pl
+
+from pymovements.events.events import Events
+from pymovements.gaze.live_gaze import LiveGaze
+
+# pymovements.events.detection imports pymovements.gaze, so the detectors are only imported for
+# type checking here and at runtime when they are needed.
+if TYPE_CHECKING:  # pragma: no cover
+    from pymovements.events.detection import StreamingIDT
+    from pymovements.events.detection import StreamingIVT
+    from pymovements.events.detection import StreamingMicrosaccades
+
+    StreamingDetector = Union[StreamingIDT, StreamingIVT, StreamingMicrosaccades]
+
+FRAME_HEADER_SIZE = 4
+
+LATENCY_SCHEMA = {
+    'stage': pl.Utf8,
+    'start_time': pl.Float64,
+    'wall_time': pl.Float64,
+    'samples': pl.Int64,
+}
+
+
+def encode_samples(
+        time_: int | list[int] | np.ndarray,
+        pixel: list[float] | list[list[float]] | np.ndarray,
+) -> bytes:
+    """Encode a batch of samples as a frame for :py:class:`GazeStreamServer`.
+
+    A frame consists of the payload size in bytes as a 4 byte little-endian unsigned integer and
+    the payload. The payload contains each sample as its timestamp as a little-endian 64 bit
+    integer followed by its pixel coordinates as little-endian 64 bit floats.
+
+    Parameters
+    ----------
+    time_: int | list[int] | np.ndarray
+        shape (N, )
+        Integer timestamps of the samples.
+    pixel: list[float] | list[list[float]] | np.ndarray
+        shape (N, n_components)
+        Pixel coordinates of the samples. A single sample can be passed with shape
+        (n_components, ).
+
+    Returns
+    -------
+    bytes
+        The encoded frame.
+
+    Examples
+    --------
+    >>> frame = encode_samples([0, 1], [[640.0, 512.0], [641.0, 512.0]])
+    >>> len(frame)
+    52
+    >>> decode_samples(frame[FRAME_HEADER_SIZE:], n_components=2)
+    (array([0, 1]), array([[640., 512.],
+           [641., 512.]]))
+    """
+    pixel = np.asarray(pixel, dtype=np.float64)
+    if pixel.ndim == 1:
+        pixel = pixel[np.newaxis, :]
+
+    samples = np.empty(len(pixel), dtype=_sample_dtype(pixel.shape[1]))
+    samples['time'] = time_
+    samples['pixel'] = pixel
+    payload = samples.tobytes()
+    return len(payload).to_bytes(FRAME_HEADER_SIZE, 'little') + payload
+
+
+def decode_samples(payload: bytes, n_components: int) -> tuple[np.ndarray, np.ndarray]:
+    """Decode the payload of a frame encoded by :py:func:`encode_samples`.
+
+    Parameters
+    ----------
+    payload: bytes
+        The payload of the frame without its header.
+    n_components: int
+        Number of pixel components per sample.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Timestamps and pixel coordinates of the samples.
+
+    Raises
+    ------
+    ValueError
+        If the payload size is not a multiple of the sample size.
+    """
+    dtype = _sample_dtype(n_components)
+    if len(payload) % dtype.itemsize != 0:
+        raise ValueError(
+            f'payload size {len(payload)} is not a multiple of the sample size {dtype.itemsize}',
+        )
+
+    samples = np.frombuffer(payload, dtype=dtype)
+    return samples['time'].astype(np.int64), samples['pixel'].astype(np.float64)
+
+
+class GazeStreamServer:
+    """Asyncio server which ingests gaze samples streamed by an eye tracker over TCP or UDP.
+
+    The eye tracker publishes frames encoded by :py:func:`encode_samples`. Over TCP, frames are
+    read from a byte stream. Over UDP, each datagram contains exactly one frame.
+
+    Each decoded batch passes through a streaming pipeline: the samples are appended to a
+    :py:class:`~pymovements.gaze.LiveGaze` buffer, which transforms them to positions and
+    velocities, and the completed samples are passed to the streaming event detectors. Detected
+    events are published to all subscribers.
+
+    Decoded batches wait in a bounded queue until they are processed. If the queue is full, TCP
+    connections are not read any further, so that the network stack slows down the publisher.
+    UDP has no flow control, so that datagrams which do not fit into the queue are dropped and
+    counted in :py:attr:`n_dropped`. Subscriber queues can be bounded as well, in which case a
+    slow subscriber holds up processing.
+
+    A gap in the timesteps, e.g. caused by a dropped datagram, ends the current stream and the
+    samples after the gap start a new stream, as separate trials would in offline detection:
+    velocities are not computed across the gap and all detectors are flushed at the gap. If
+    processing fails, the
+    subscribers are notified with ``None`` and the exception is raised by :py:meth:`feed` and
+    :py:meth:`close`.
+
+    The latency of each stage is recorded per batch:
+
+    - ``decode``: Decoding the frame.
+    - ``queue``: Waiting in the queue for processing.
+    - ``transform``: Appending to the buffer and computing positions and velocities.
+    - ``detect``: Processing the completed samples with all detectors.
+    - ``publish``: Putting the detected events into the subscriber queues.
+    - ``total``: From receiving the frame until its events have been published.
+
+    Parameters
+    ----------
+    live_gaze: LiveGaze
+        Buffer of the received samples.
+    detectors: list[StreamingDetector] | None
+        Streaming event detectors. :py:class:`~pymovements.events.StreamingIDT` is passed the
+        positions and all other detectors are passed the velocities of the samples. (default: None)
+    eye: str
+        The eye whose components are passed to the detectors. Supported values are ``auto``,
+        ``left``, ``right`` and ``cyclops``. With ``auto``, cyclops is preferred over right over
+        left. (default: 'auto')
+    queue_size: int
+        Maximum number of decoded batches waiting for processing. (default: 64)
+    latency_window: int
+        Number of latest latency records which are kept. (default: 10000)
+
+    Attributes
+    ----------
+    n_dropped: int
+        Number of received frames which were dropped, because they were malformed or because the
+        queue was full.
+    latencies: deque[dict[str, Any]]
+        The latest latency records.
+
+    Raises
+    ------
+    ValueError
+        If the eye is not supported or not available for the number of components of the buffer.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> import numpy as np
+    >>> import pymovements as pm
+    >>> experiment = pm.Experiment(1280, 1024, 38, 30, 68, 'upper left', 1000)
+
+    A stand-in publisher sends a fixation followed by a saccade to the server:
+    >>> async def iterate(queue):
+    ...     while (event := await queue.get()) is not None:
+    ...         yield event
+    >>> async def main():
+    ...     server = pm.gaze.GazeStreamServer(
+    ...         pm.gaze.LiveGaze(experiment),
+    ...         detectors=[pm.events.StreamingIVT(minimum_duration=50)],
+    ...     )
+    ...     host, port = await server.start()
+    ...     events = server.subscribe()
+    ...     _, writer = await asyncio.open_connection(host, port)
+    ...     pixel = np.full((200, 2), 640.0)
+    ...     pixel[100:, 0] += np.arange(100) * 10
+    ...     for start in range(0, 200, 20):
+    ...         writer.write(encode_samples(np.arange(start, start + 20), pixel[start:start + 20]))
+    ...     await writer.drain()
+    ...     writer.close()
+    ...     await server.close(wait=True)
+    ...     return [event async for event in iterate(events)]
+    >>> asyncio.run(main())
+    [shape: (1, 4)
+    ┌──────────┬───────┬────────┬──────────┐
+    │ name     ┆ onset ┆ offset ┆ duration │
+    │ ---      ┆ ---   ┆ ---    ┆ ---      │
+    │ str      ┆ i64   ┆ i64    ┆ i64      │
+    ╞══════════╪═══════╪════════╪══════════╡
+    │ fixation ┆ 2     ┆ 98     ┆ 96       │
+    └──────────┴───────┴────────┴──────────┘]
+    """
+
+    n_dropped: int
+    latencies: deque[dict[str, Any]]
+
+    def __init__(
+            self,
+            live_gaze: LiveGaze,
+            detectors: list[StreamingDetector] | None = None,
+            *,
+            eye: str = 'auto',
+            queue_size: int = 64,
+            latency_window: int = 10_000,
+    ):
+        self.live_gaze = live_gaze
+        self.detectors = [] if detectors is None else list(detectors)
+        self.queue_size = queue_size
+        self._eye_components = _infer_eye_components(eye, live_gaze.n_components)
+
+        self.n_dropped = 0
+        self.latencies = deque(maxlen=latency_window)
+
+        self._queue: asyncio.Queue[tuple[float, float, np.ndarray, np.ndarray] | None] | None = None
+        self._subscribers: list[asyncio.Queue[Events | None]] = []
+        self._worker: asyncio.Task[None] | None = None
+        self._server: asyncio.base_events.Server | None = None
+        self._transport: asyncio.DatagramTransport | None = None
+        self._connections: dict[asyncio.Task[Any], asyncio.StreamWriter] = {}
+
+        # Last timestep and interval between timesteps of the processed samples.
+        self._last_time: int | None = None
+        self._time_interval: int | None = None
+
+    async def start(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            protocol: Literal['tcp', 'udp'] = 'tcp',
+    ) -> tuple[str, int]:
+        """Start listening for frames and processing received samples.
+
+        Parameters
+        ----------
+        host: str
+            Host to listen on. (default: '127.0.0.1')
+        port: int
+            Port to listen on. With port 0, a free port is chosen. (default: 0)
+        protocol: Literal['tcp', 'udp']
+            Transport protocol of the frames. (default: 'tcp')
+
+        Returns
+        -------
+        tuple[str, int]
+            Host and port the server is listening on.
+
+        Raises
+        ------
+        ValueError
+            If the protocol is not supported.
+        RuntimeError
+            If the server has already been started.
+        """
+        if protocol not in {'tcp', 'udp'}:
+            raise ValueError(f"unknown protocol '{protocol}'. Supported values are: ['tcp', 'udp']")
+        if self._worker is not None:
+            raise RuntimeError('server has already been started')
+
+        self._queue = asyncio.Queue(self.queue_size)
+        self._worker = asyncio.create_task(self._process_batches())
+
+        if protocol == 'tcp':
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+            address = self._server.sockets[0].getsockname()
+        else:
+            self._transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                lambda: _DatagramProtocol(self), local_addr=(host, port),
+            )
+            address = self._transport.get_extra_info('sockname')
+        return address[0], address[1]
+
+    def subscribe(self, maxsize: int = 0) -> asyncio.Queue[Events | None]:
+        """Subscribe to the detected events.
+
+        Parameters
+        ----------
+        maxsize: int
+            Maximum number of events in the queue. If the queue is full, processing waits for the
+            subscriber. If 0, the queue is unbounded. (default: 0)
+
+        Returns
+        -------
+        asyncio.Queue[Events | None]
+            Queue of the detected events of each detector and batch, followed by ``None`` after
+            the server has been closed or processing has failed. If processing has failed and the
+            queue is full, ``None`` replaces the oldest event.
+        """
+        queue: asyncio.Queue[Events | None] = asyncio.Queue(maxsize)
+        self._subscribers.append(queue)
+        return queue
+
+    async def feed(self, payload: bytes) -> None:
+        """Decode the payload of a frame and queue its samples for processing.
+
+        Waits until there is room in the queue.
+
+        Parameters
+        ----------
+        payload: bytes
+            The payload of the frame without its header.
+
+        Raises
+        ------
+        RuntimeError
+            If the server has not been started or has already been closed.
+        """
+        if self._queue is None:
+            raise RuntimeError('server has not been started')
+        if not await self._put(self._decode(payload)):
+            self._raise_worker_exception()
+            raise RuntimeError('server has already been closed')
+
+    async def close(self, wait: bool = False) -> None:
+        """Stop listening and process all queued samples.
+
+        Afterwards the remaining samples are passed to the detectors, the detectors are flushed
+        and ``None`` is put into all subscriber queues. If processing has failed, its exception is
+        raised after closing the server.
+
+        Parameters
+        ----------
+        wait: bool
+            Wait until all publishers have closed their TCP connections instead of closing them.
+            (default: False)
+        """
+        if self._server is not None:
+            self._server.close()
+            if not wait:
+                for writer in self._connections.values():
+                    writer.close()
+            await asyncio.gather(*self._connections)
+            await self._server.wait_closed()
+            self._server = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+        if self._worker is not None:
+            await self._put(None)
+            await self._worker
+
+    def latencies_to_frame(self) -> pl.DataFrame:
+        """Return the latest latency records as a data frame.
+
+        Returns
+        -------
+        pl.DataFrame
+            Data frame with the columns ``stage``, ``start_time`` in seconds of
+            :py:func:`time.perf_counter`, ``wall_time`` in seconds and number of ``samples``.
+        """
+        return pl.DataFrame(list(self.latencies), schema=LATENCY_SCHEMA, orient='row')
+
+    def latency_summary(self) -> pl.DataFrame:
+        """Summarize the latest latency records per stage.
+
+        Returns
+        -------
+        pl.DataFrame
+            Data frame with the number of batches, the number of samples and the mean, median,
+            95th percentile and maximum of the wall time in seconds per stage.
+        """
+        return self.latencies_to_frame().group_by('stage', maintain_order=True).agg(
+            pl.len().alias('batches'),
+            pl.col('samples').sum(),
+            pl.col('wall_time').mean().alias('mean'),
+            pl.col('wall_time').median().alias('median'),
+            pl.col('wall_time').quantile(0.95).alias('p95'),
+            pl.col('wall_time').max().alias('max'),
+        )
+
+    async def _handle_connection(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+    ) -> None:
+        """Read frames from a TCP connection until it is closed."""
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections[task] = writer
+        try:
+            while True:
+                header = await reader.readexactly(FRAME_HEADER_SIZE)
+                payload = await reader.readexactly(int.from_bytes(header, 'little'))
+                try:
+                    batch = self._decode(payload)
+                except ValueError:
+                    # The stream can not be resynchronized after a malformed frame.
+                    self.n_dropped += 1
+                    break
+                if not await self._put(batch):
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            del self._connections[task]
+
+    def _receive_datagram(self, data: bytes) -> None:
+        """Queue the samples of a datagram or drop it if it can not be queued for processing."""
+        assert self._queue is not None and self._worker is not None
+        payload = data[FRAME_HEADER_SIZE:]
+        if int.from_bytes(data[:FRAME_HEADER_SIZE], 'little') != len(payload):
+            self.n_dropped += 1
+            return
+        if self._worker.done():
+            # Datagrams which are not processed any more are dropped as well.
+            self.n_dropped += 1
+            return
+        try:
+            self._queue.put_nowait(self._decode(payload))
+        except (ValueError, asyncio.QueueFull):
+            self.n_dropped += 1
+
+    async def _put(self, batch: tuple[float, float, np.ndarray, np.ndarray] | None) -> bool:
+        """Wait until there is room in the queue and queue a batch.
+
+        Returns False without queueing the batch if processing has stopped.
+        """
+        assert self._queue is not None and self._worker is not None
+        if self._worker.done():
+            return False
+        if not self._queue.full():
+            self._queue.put_nowait(batch)
+            return True
+
+        put = asyncio.ensure_future(self._queue.put(batch))
+        await asyncio.wait([put, self._worker], return_when=asyncio.FIRST_COMPLETED)
+        if put.done():
+            return True
+        put.cancel()
+        return False
+
+    def _raise_worker_exception(self) -> None:
+        """Raise the exception which stopped processing, if there is one."""
+        assert self._worker is not None
+        if self._worker.done() and not self._worker.cancelled():
+            exception = self._worker.exception()
+            if exception is not None:
+                raise exception
+
+    def _decode(self, payload: bytes) -> tuple[float, float, np.ndarray, np.ndarray]:
+        """Decode a payload and record the time it was received and queued."""
+        received = time.perf_counter()
+        time_, pixel = decode_samples(payload, self.live_gaze.n_components)
+        queued = self._record('decode', received, len(time_))
+        return received, queued, time_, pixel
+
+    async def _process_batches(self) -> None:
+        """Process queued batches until ``None`` is queued and notify the subscribers."""
+        try:
+            await self._process_queue()
+        except BaseException:
+            # Processing can not continue, so that full subscriber queues are not waited for.
+            for subscriber in self._subscribers:
+                if subscriber.full():
+                    subscriber.get_nowait()
+                subscriber.put_nowait(None)
+            raise
+
+        for subscriber in self._subscribers:
+            await subscriber.put(None)
+
+    async def _process_queue(self) -> None:
+        """Process queued batches until ``None`` is queued and flush the detectors."""
+        assert self._queue is not None
+        while (batch := await self._queue.get()) is not None:
+            received, queued, time_, pixel = batch
+            start = self._record('queue', queued, len(time_))
+
+            # Completed samples of each stream, which end at the gaps in the timesteps.
+            streams: list[list[tuple[np.ndarray, np.ndarray, np.ndarray]]] = [[]]
+            # Append at most half the capacity at once, which is more than the lookahead of any
+            # velocity method, so that no sample is overwritten before it is popped.
+            chunk_size = max(self.live_gaze.capacity // 2, 1)
+            gaps = self._find_gaps(time_)
+            for stream, (time_stream, pixel_stream) in enumerate(
+                    zip(np.split(time_, gaps), np.split(pixel, gaps)),
+            ):
+                if stream > 0:
+                    self.live_gaze.start_stream()
+                    streams[-1].append(self.live_gaze.pop_completed())
+                    streams.append([])
+                for chunk_start in range(0, len(time_stream), chunk_size):
+                    chunk = slice(chunk_start, chunk_start + chunk_size)
+                    self.live_gaze.append(time_stream[chunk], pixel_stream[chunk])
+                    streams[-1].append(self.live_gaze.pop_completed())
+            start = self._record('transform', start, len(time_))
+
+            await self._detect_and_publish(
+                [
+                    tuple(np.concatenate(arrays) for arrays in zip(*completed))
+                    for completed in streams
+                    if completed
+                ],
+                n_flushes=len(streams) - 1,
+                start=start,
+                n_samples=len(time_),
+            )
+            self._record('total', received, len(time_))
+
+        await self._detect_and_publish(
+            [self.live_gaze.pop_completed(include_incomplete=True)],
+            n_flushes=1,
+            start=time.perf_counter(),
+            n_samples=0,
+        )
+
+    async def _detect_and_publish(
+            self,
+            streams: list[tuple[np.ndarray, ...]],
+            *,
+            n_flushes: int,
+            start: float,
+            n_samples: int,
+    ) -> None:
+        """Pass completed samples of consecutive streams to all detectors and publish the events.
+
+        The detectors are flushed after each of the first ``n_flushes`` streams.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from pymovements.events.detection import StreamingIDT
+
+        detected = []
+        for stream, (time_, position, velocity) in enumerate(streams):
+            for detector in self.detectors:
+                if isinstance(detector, StreamingIDT):
+                    detected.append(detector.process(position[:, self._eye_components], time_))
+                else:
+                    detected.append(detector.process(velocity[:, self._eye_components], time_))
+                if stream < n_flushes:
+                    detected.append(detector.flush())
+        start = self._record('detect', start, n_samples)
+
+        for events in detected:
+            if len(events) == 0:
+                continue
+            for subscriber in self._subscribers:
+                await subscriber.put(events)
+        self._record('publish', start, n_samples)
+
+    def _find_gaps(self, time_: np.ndarray) -> np.ndarray:
+        """Get the indices of the samples which are preceded by a gap in the timesteps.
+
+        The interval between timesteps is inferred from the first two processed samples.
+        """
+        if len(time_) == 0:
+            return np.array([], dtype=np.int64)
+
+        if self._last_time is None:
+            intervals = np.diff(time_)
+            offset = 1
+        else:
+            intervals = np.diff(time_, prepend=self._last_time)
+            offset = 0
+        self._last_time = int(time_[-1])
+
+        if self._time_interval is None:
+            if len(intervals) == 0:
+                return np.array([], dtype=np.int64)
+            self._time_interval = int(intervals[0])
+        return np.flatnonzero(intervals != self._time_interval) + offset
+
+    def _record(self, stage: str, start: float, n_samples: int) -> float:
+        """Record the latency of a stage which started at ``start`` and return the current time."""
+        end = time.perf_counter()
+        self.latencies.append({
+            'stage': stage,
+            'start_time': start,
+            'wall_time': end - start,
+            'samples': n_samples,
+        })
+        return end
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    """Pass received datagrams to a :py:class:`GazeStreamServer`."""
+
+    def __init__(self, server: GazeStreamServer):
+        self.server = server
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        """Queue the samples of a received datagram."""
+        self.server._receive_datagram(data)  # pylint: disable=protected-access
+
+
+def _infer_eye_components(eye: str, n_components: int) -> list[int]:
+    """Get the indices of the components of an eye, as in :py:meth:`~pymovements.Gaze.detect`."""
+    eye_components = {
+        'left': ([0, 1], 4),
+        'right': ([2, 3], 4),
+        'cyclops': ([4, 5], 6),
+    }
+    if eye == 'auto':
+        # Order of inference: cyclops, right, left.
+        return [n_components - 2, n_components - 1]
+    if eye not in eye_components:
+        raise ValueError(
+            f"unknown eye '{eye}'. Supported values are: ['auto', 'left', 'right', 'cyclops']",
+        )
+    components, minimum_n_components = eye_components[eye]
+    if n_components < minimum_n_components:
+        raise ValueError(
+            f'{eye} eye is only supported for data with at least {minimum_n_components} components',
+        )
+    return components
+
+
+def _sample_dtype(n_components: int) -> np.dtype:
+    """Get the structured dtype of an encoded sample."""
+    return np.dtype([('time', '<i8'), ('pixel', '<f8', (n_components,))])
@@ -20,16 +20,20 @@
 """Module for py:func:`pymovements.gaze.transforms."""
 from __future__ import annotations
 
+import operator
 from collections.abc import Callable
 from functools import partial
+from functools import reduce
 from typing import Any
 from typing import TypeVar
 
 import numpy as np
 import polars as pl
-import scipy
 
 from pymovements._utils import _checks
+from pymovements.gaze.visual_angle import check_origin
+from pymovements.gaze.visual_angle import origin_offset
+from pymovements.gaze.visual_angle import VisualAngleConverter
 
 TransformMethod = TypeVar('TransformMethod', bound=Callable[..., pl.Expr])
 
@@ -141,24 +145,11 @@ def center_origin(
     if output_column is None:
         output_column = pixel_column
 
-    if origin == 'center':
-        origin_offset = (0.0, 0.0)
-    elif origin == 'upper left':
-        origin_offset = ((screen_resolution[0] - 1) / 2, (screen_resolution[1] - 1) / 2)
-    elif origin == 'lower left':
-        raise ValueError(
-            'origin string lower left was corrected to upper left. please update your definition',
-        )
-    else:
-        supported_origins = ['center', 'upper left']
-        raise ValueError(
-            f'value `{origin}` for argument `origin` is invalid. '
-            f' Valid values are: {supported_origins}',
-        )
+    offset = origin_offset(screen_resolution, origin)
 
     centered_pixels = pl.concat_list(
         [
-            pl.col(pixel_column).list.get(component) - origin_offset[component % 2]
+            pl.col(pixel_column).list.get(component) - offset[component % 2]
             for component in range(n_components)
         ],
     ).alias(output_column)
@@ -254,42 +245,19 @@ def pix2deg(
     pl.Expr
         The respective polars expression.
     """
-    _check_screen_resolution(screen_resolution)
-    _check_screen_size(screen_size)
-
-    centered_pixels = center_origin(
+    converter, distance_column = _get_converter(
         screen_resolution=screen_resolution,
+        screen_size=screen_size,
+        distance=distance,
         origin=origin,
-        n_components=n_components,
+    )
+    return converter.pix2deg_expr(
+        n_components,
         pixel_column=pixel_column,
+        position_column=position_column,
+        distance_column=distance_column,
     )
 
-    if isinstance(distance, (float, int)):
-        _check_distance(distance)
-        distance_series = pl.lit(distance)
-    elif isinstance(distance, str):
-        # True division by 10 is needed to convert distance from mm to cm
-        distance_series = pl.col(distance).truediv(10)
-    else:
-        raise TypeError(
-            f'`distance` must be of type `float`, `int` or `str`, but is of type'
-            f'`{type(distance).__name__}`',
-        )
-
-    distance_pixels = pl.concat_list([
-        distance_series.mul(screen_resolution[component % 2] / screen_size[component % 2])
-        for component in range(n_components)
-    ])
-
-    degree_components = [
-        pl.arctan2(
-            centered_pixels.list.get(component), distance_pixels.list.get(component),
-        ).degrees()
-        for component in range(n_components)
-    ]
-
-    return pl.concat_list(list(degree_components)).alias(position_column)
-
 
 @register_transform
 def deg2pix(
@@ -329,114 +297,46 @@ def deg2pix(
     pl.Expr
         The respective polars expression.
     """
-    _check_screen_resolution(screen_resolution)
-    _check_screen_size(screen_size)
+    converter, distance_column = _get_converter(
+        screen_resolution=screen_resolution,
+        screen_size=screen_size,
+        distance=distance,
+        origin=pixel_origin,
+        origin_argument='pixel_origin',
+    )
+    return converter.deg2pix_expr(
+        n_components,
+        position_column=position_column,
+        pixel_column=pixel_column,
+        distance_column=distance_column,
+    )
 
+
+def _get_converter(
+        *,
+        screen_resolution: tuple[int, int],
+        screen_size: tuple[float, float],
+        distance: float | str,
+        origin: str,
+        origin_argument: str = 'origin',
+) -> tuple[VisualAngleConverter, str | None]:
+    """Get the cached converter for the screen and the name of the distance column, if any."""
     if isinstance(distance, (float, int)):
-        _check_distance(distance)
-        distance_series = pl.lit(distance)
+        distance_cm: float | None = distance
+        distance_column = None
     elif isinstance(distance, str):
-        # True division by 10 is needed to convert distance from mm to cm
-        distance_series = pl.col(distance).truediv(10)
+        distance_cm = None
+        distance_column = distance
     else:
         raise TypeError(
             f'`distance` must be of type `float`, `int` or `str`, but is of type'
             f'`{type(distance).__name__}`',
         )
 
-    distance_pixels = pl.concat_list([
-        distance_series.mul(screen_resolution[component % 2] / screen_size[component % 2])
-        for component in range(n_components)
-    ])
-
-    centered_pixels = [
-        pl.col(position_column).list.get(component).radians().tan() *
-        distance_pixels.list.get(component)
-        for component in range(n_components)
-    ]
-
-    if pixel_origin == 'center':
-        origin_offset = (0.0, 0.0)
-    elif pixel_origin == 'upper left':
-        origin_offset = ((screen_resolution[0] - 1) / 2, (screen_resolution[1] - 1) / 2)
-    else:
-        supported_origins = ['center', 'upper left']
-        raise ValueError(
-            f'value `{pixel_origin}` for argument `pixel_origin` is invalid. '
-            f' Valid values are: {supported_origins}',
-        )
-
-    pixel_series = pl.concat_list(
-        [
-            centered_pixels[component] + origin_offset[component % 2]
-            for component in range(n_components)
-        ],
-    )
-    return pixel_series.alias(pixel_column)
-
-
-def _check_distance(distance: float) -> None:
-    """Check if all screen values are scalars and are greather than zero.
-
-    Parameters
-    ----------
-    distance: float
-        The distance to check.
-    """
-    _checks.check_is_scalar(distance=distance)
-    _checks.check_is_greater_than_zero(distance=distance)
-
-
-def _check_screen_resolution(screen_resolution: tuple[int, int]) -> None:
-    """Check screen resolution value.
-
-    Parameters
-    ----------
-    screen_resolution: tuple[int, int]
-        The screen resolution to check.
-    """
-    if screen_resolution is None:
-        raise TypeError('screen_resolution must not be None')
-
-    if not isinstance(screen_resolution, (tuple, list)):
-        raise TypeError(
-            'screen_resolution must be of type tuple[int, int],'
-            f' but is of type {type(screen_resolution).__name__}',
-        )
-
-    if len(screen_resolution) != 2:
-        raise ValueError(
-            f'screen_resolution must have length of 2, but is of length {len(screen_resolution)}',
-        )
-
-    for element in screen_resolution:
-        _checks.check_is_scalar(screen_resolution=element)
-        _checks.check_is_greater_than_zero(screen_resolution=element)
-
-
-def _check_screen_size(screen_size: tuple[float, float]) -> None:
-    """Check screen size value.
-
-    Parameters
-    ----------
-    screen_size: tuple[float, float]
-        The screen size to check.
-    """
-    if screen_size is None:
-        raise TypeError('screen_size must not be None')
-
-    if not isinstance(screen_size, (tuple, list)):
-        raise TypeError(
-            'screen_size must be of type tuple[int, int],'
-            f' but is of type {type(screen_size).__name__}',
-        )
-
-    if len(screen_size) != 2:
-        raise ValueError(f'screen_size must have length of 2, but is of length {len(screen_size)}')
-
-    for element in screen_size:
-        _checks.check_is_scalar(screen_size=element)
-        _checks.check_is_greater_than_zero(screen_size=element)
+    # Check the origin first to report the name of the origin argument.
+    check_origin(origin, origin_argument)
+    converter = VisualAngleConverter.cached(screen_resolution, screen_size, distance_cm, origin)
+    return converter, distance_column
 
 
 @register_transform
@@ -449,6 +349,7 @@ def pos2acc(
         padding: str | float | int | None = 'nearest',
         position_column: str = 'position',
         acceleration_column: str = 'acceleration',
+        trial_columns: str | list[str] | None = None,
 ) -> pl.Expr:
     """Compute acceleration data from positional data.
 
@@ -468,6 +369,9 @@ def pos2acc(
         The input position column name. (default: 'position')
     acceleration_column: str
         The output acceleration column name. (default: 'acceleration')
+    trial_columns: str | list[str] | None
+        The trial columns. If specified, the acceleration is computed within each trial. Each
+        contiguous run of samples of a trial is treated as a separate trial. (default: None)
 
     Returns
     -------
@@ -483,6 +387,7 @@ def pos2acc(
         n_components=n_components,
         input_column=position_column,
         output_column=acceleration_column,
+        trial_columns=trial_columns,
     )
 
 
@@ -497,6 +402,7 @@ def pos2vel(
         padding: str | float | int | None = 'nearest',
         position_column: str = 'position',
         velocity_column: str = 'velocity',
+        trial_columns: str | list[str] | None = None,
 ) -> pl.Expr:
     """Compute velocitiy data from positional data.
 
@@ -521,6 +427,9 @@ def pos2vel(
         The input position column name. (default: 'position')
     velocity_column: str
         The output velocity column name. (default: 'velocity')
+    trial_columns: str | list[str] | None
+        The trial columns. If specified, the velocity is computed within each trial. Each
+        contiguous run of samples of a trial is treated as a separate trial. (default: None)
 
     Returns
     -------
@@ -541,21 +450,27 @@ def pos2vel(
       sample to the preceding sample
     """
     if method == 'preceding':
-        return pl.concat_list(
+        return _concat_components(
             [
-                pl.col(position_column).list.get(component)
-                .diff(n=1, null_behavior='ignore') * sampling_rate
+                _within_trials(
+                    pl.col(position_column).list.get(component)
+                    .diff(n=1, null_behavior='ignore') * sampling_rate,
+                    trial_columns,
+                )
                 for component in range(n_components)
             ],
         ).alias(velocity_column)
 
     if method == 'neighbors':
-        return pl.concat_list(
+        return _concat_components(
             [
-                (
-                    pl.col(position_column).shift(n=-1).list.get(component)
-                    - pl.col(position_column).shift(n=1).list.get(component)
-                ) * (sampling_rate / 2)
+                _within_trials(
+                    (
+                        pl.col(position_column).shift(n=-1).list.get(component)
+                        - pl.col(position_column).shift(n=1).list.get(component)
+                    ) * (sampling_rate / 2),
+                    trial_columns,
+                )
                 for component in range(n_components)
             ],
         ).alias(velocity_column)
@@ -565,14 +480,17 @@ def pos2vel(
         # mean(arr_-2, arr_-1) and mean(arr_1, arr_2) needs division by two
         # window is now 3 samples long (arr_-1.5, arr_0, arr_1+5)
         # we therefore need a divison by three, all in all it's a division by 6
-        return pl.concat_list(
+        return _concat_components(
             [
-                (
-                    pl.col(position_column).shift(n=-2).list.get(component)
-                    + pl.col(position_column).shift(n=-1).list.get(component)
-                    - pl.col(position_column).shift(n=1).list.get(component)
-                    - pl.col(position_column).shift(n=2).list.get(component)
-                ) * (sampling_rate / 6)
+                _within_trials(
+                    (
+                        pl.col(position_column).shift(n=-2).list.get(component)
+                        + pl.col(position_column).shift(n=-1).list.get(component)
+                        - pl.col(position_column).shift(n=1).list.get(component)
+                        - pl.col(position_column).shift(n=2).list.get(component)
+                    ) * (sampling_rate / 6),
+                    trial_columns,
+                )
                 for component in range(n_components)
             ],
         ).alias(velocity_column)
@@ -592,6 +510,7 @@ def pos2vel(
             n_components=n_components,
             input_column=position_column,
             output_column=velocity_column,
+            trial_columns=trial_columns,
         )
 
     supported_methods = ['preceding', 'neighbors', 'fivepoint', 'smooth', 'savitzky_golay']
@@ -611,6 +530,7 @@ def savitzky_golay(
         output_column: str | None = None,
         derivative: int = 0,
         padding: str | float | int | None = 'nearest',
+        trial_columns: str | list[str] | None = None,
 ) -> pl.Expr:
     """Apply a 1-D Savitzky-Golay filter to a column|_|:cite:p:`SavitzkyGolay1964`.
 
@@ -646,6 +566,10 @@ def savitzky_golay(
         When passing a scalar value, data will be padded using the passed value.
         See the Notes for more details on the padding methods ``mirror``, ``nearest`` or ``wrap``.
         (default: 'nearest')
+    trial_columns: str | list[str] | None
+        The trial columns. If specified, the filter is applied within each trial, padding the
+        signal at the trial boundaries. Each contiguous run of samples of a trial is treated as a
+        separate trial. (default: None)
 
     Returns
     -------
@@ -693,30 +617,36 @@ def savitzky_golay(
 
     delta = 1 / sampling_rate
 
-    constant_value = 0.0
-    if isinstance(padding, (int, float)):
-        constant_value = padding
-        padding = 'constant'
-    elif padding is None:
-        padding = 'interp'
+    from scipy.signal import savgol_coeffs  # pylint: disable=import-outside-toplevel
 
-    func = partial(
-        scipy.signal.savgol_filter,
-        window_length=window_length,
-        polyorder=degree,
-        deriv=derivative,
-        delta=delta,
-        axis=0,
-        mode=padding,
-        cval=constant_value,
-    )
+    # The coefficients are computed once and applied as a fixed-weight window. This is equivalent
+    # to the convolution in scipy.signal.savgol_filter, centered at window_length // 2.
+    coefficients = savgol_coeffs(window_length, degree, deriv=derivative, delta=delta)
+    offsets = window_length // 2 - np.arange(window_length)
 
-    return pl.concat_list(
-        [
-            pl.col(input_column).list.get(component).map_batches(func).list.explode()
-            for component in range(n_components)
-        ],
-    ).alias(output_column)
+    components = []
+    for component in range(n_components):
+        values = _missing_as_nan(pl.col(input_column).list.get(component))
+        filtered = _convolve(
+            values,
+            offsets=offsets,
+            weights=coefficients,
+            padding=padding,
+            trial_columns=trial_columns,
+        )
+        if padding is None:
+            filtered = _fit_edges(
+                values,
+                filtered,
+                window_length=window_length,
+                degree=degree,
+                derivative=derivative,
+                delta=delta,
+                trial_columns=trial_columns,
+            )
+        components.append(filtered)
+
+    return _concat_components(components).alias(output_column)
 
 
 @register_transform
@@ -874,6 +804,7 @@ def smooth(
         degree: int | None = None,
         column: str = 'position',
         padding: str | float | int | None = 'nearest',
+        trial_columns: str | list[str] | None = None,
 ) -> pl.Expr:
     """Smooth data in a column.
 
@@ -900,6 +831,10 @@ def smooth(
         When passing a scalar value, data will be padded using the passed value.
         See the Notes for more details on the padding methods.
         (default: 'nearest')
+    trial_columns: str | list[str] | None
+        The trial columns. If specified, the data is smoothed within each trial, padding the
+        signal at the trial boundaries. Each contiguous run of samples of a trial is treated as a
+        separate trial. (default: None)
 
     Returns
     -------
@@ -949,51 +884,37 @@ def smooth(
     _check_window_length(window_length=window_length)
     _check_padding(padding=padding)
 
-    if method in {'moving_average', 'exponential_moving_average'}:
-        pad_kwargs: dict[str, Any] = {'pad_width': 0}
-        pad_func = _identity
-
-        if isinstance(padding, (int, float)):
-            pad_kwargs['constant_values'] = padding
-            padding = 'constant'
-        elif padding == 'nearest':
-            # option 'nearest' is called 'edge' for np.pad
-            padding = 'edge'
-        elif padding == 'mirror':
-            # option 'mirror' is called 'reflect' for np.pad
-            padding = 'reflect'
-
-        if padding is not None:
-            pad_kwargs['mode'] = padding
-            pad_kwargs['pad_width'] = int(np.ceil(window_length / 2))
-
-            pad_func = partial(
-                np.pad,
-                **pad_kwargs,
-            )
+    components = [pl.col(column).list.get(component) for component in range(n_components)]
+    if padding is not None:
+        # Missing values of a padded signal are NaN, like the padding in numpy.
+        components = [_missing_as_nan(values) for values in components]
 
-        if method == 'moving_average':
+    if method == 'moving_average':
+        # The mean is taken over the same window as a centered rolling mean.
+        offsets = np.arange(-(window_length // 2), window_length - window_length // 2)
+        weights = np.full(window_length, 1 / window_length)
 
-            return pl.concat_list(
-                [
-                    pl.col(column).list.get(component).map_batches(pad_func).list.explode()
-                    .rolling_mean(window_size=window_length, center=True)
-                    .shift(n=pad_kwargs['pad_width'])
-                    .slice(pad_kwargs['pad_width'] * 2)
-                    for component in range(n_components)
-                ],
-            ).alias(column)
+        return _concat_components(
+            [
+                _convolve(
+                    values,
+                    offsets=offsets,
+                    weights=weights,
+                    padding=padding,
+                    trial_columns=trial_columns,
+                )
+                for values in components
+            ],
+        ).alias(column)
 
-        return pl.concat_list(
+    if method == 'exponential_moving_average':
+        return _concat_components(
             [
-                pl.col(column).list.get(component).map_batches(pad_func).list.explode()
-                .ewm_mean(
-                    span=window_length,
-                    adjust=False,
-                    min_samples=window_length,
-                ).shift(n=pad_kwargs['pad_width'])
-                .slice(pad_kwargs['pad_width'] * 2)
-                for component in range(n_components)
+                _within_trials(
+                    _exponential_moving_average(values, span=window_length, padding=padding),
+                    trial_columns,
+                )
+                for values in components
             ],
         ).alias(column)
 
@@ -1010,6 +931,7 @@ def smooth(
             n_components=n_components,
             input_column=column,
             output_column=None,
+            trial_columns=trial_columns,
         )
 
     supported_methods = ['moving_average', 'exponential_moving_average', 'savitzky_golay']
@@ -1128,6 +1050,398 @@ def _identity(x: Any) -> Any:
     return x
 
 
+def _concat_components(components: list[pl.Expr]) -> pl.Expr:
+    """Concatenate the transformed components to a list column.
+
+    Parameters
+    ----------
+    components: list[pl.Expr]
+        The transformed components.
+
+    Returns
+    -------
+    pl.Expr
+        The list column of the components.
+    """
+    return pl.concat_arr(components).arr.to_list()
+
+
+def _missing_as_nan(values: pl.Expr) -> pl.Expr:
+    """Replace missing values by NaN, as in signals converted to numpy arrays.
+
+    Parameters
+    ----------
+    values: pl.Expr
+        The signal values.
+
+    Returns
+    -------
+    pl.Expr
+        The signal values with NaN instead of null values.
+    """
+    return values.cast(pl.Float64).fill_null(np.nan)
+
+
+def _within_trials(expression: pl.Expr, trial_columns: str | list[str] | None) -> pl.Expr:
+    """Evaluate an expression within each trial.
+
+    As in :py:func:`_signal_positions`, a trial is a contiguous run of samples with the same
+    values in the trial columns.
+
+    Parameters
+    ----------
+    expression: pl.Expr
+        The expression to evaluate.
+    trial_columns: str | list[str] | None
+        The trial columns. If ``None``, the expression is evaluated on all samples.
+
+    Returns
+    -------
+    pl.Expr
+        The expression evaluated within each trial.
+    """
+    if trial_columns is None:
+        return expression
+    return expression.over(_is_trial_change(trial_columns, n=1).cum_sum())
+
+
+def _is_trial_change(trial_columns: str | list[str], n: int) -> pl.Expr:
+    """Check for each sample if the trial changes to the sample ``n`` rows before.
+
+    Parameters
+    ----------
+    trial_columns: str | list[str]
+        The trial columns.
+    n: int
+        The number of rows to shift. Negative values compare with the following samples.
+
+    Returns
+    -------
+    pl.Expr
+        True if a trial column differs from the shifted sample or if there is no such sample.
+    """
+    if isinstance(trial_columns, str):
+        trial_columns = [trial_columns]
+
+    row = pl.int_range(pl.len(), dtype=pl.Int64)
+    is_outside = row < n if n > 0 else row >= pl.len() + n
+    return is_outside | pl.any_horizontal(
+        pl.col(column).ne_missing(pl.col(column).shift(n)) for column in trial_columns
+    )
+
+
+def _signal_positions(
+        trial_columns: str | list[str] | None,
+) -> tuple[pl.Expr, pl.Expr, pl.Expr]:
+    """Get the position of each sample in its signal, the start and the length of the signal.
+
+    If trial columns are specified, the trial boundaries are located by the changes of the trial
+    columns, so that each contiguous run of samples of a trial is a separate signal. Unlike window
+    functions, these expressions are evaluated only once if used for several window values.
+
+    Parameters
+    ----------
+    trial_columns: str | list[str] | None
+        The trial columns. If specified, each trial is a separate signal.
+
+    Returns
+    -------
+    tuple[pl.Expr, pl.Expr, pl.Expr]
+        The position of each sample, the row of the first sample and the length of the signal.
+    """
+    row = pl.int_range(pl.len(), dtype=pl.Int64)
+    length = pl.len().cast(pl.Int64)
+    if trial_columns is None:
+        return row, pl.lit(0, dtype=pl.Int64), length
+
+    is_first = _is_trial_change(trial_columns, n=1)
+    is_last = _is_trial_change(trial_columns, n=-1)
+    start = pl.when(is_first).then(row).otherwise(0).cum_max()
+    end = pl.when(is_last).then(row).otherwise(length).cum_min(reverse=True)
+    return row - start, start, end - start + 1
+
+
+def _window_values(
+        values: pl.Expr,
+        offset: int,
+        padding: str | float | int | None,
+        trial_columns: str | list[str] | None,
+) -> pl.Expr:
+    """Get the values ``offset`` samples after each sample, extending the signal by padding.
+
+    The window values are computed on the whole column. If trial columns are specified, window
+    values of other trials are replaced by the padding.
+
+    Parameters
+    ----------
+    values: pl.Expr
+        The signal values.
+    offset: int
+        The offset of the window values relative to each sample.
+    padding: str | float | int | None
+        The padding to use outside of the signal. ``None`` results in null values.
+    trial_columns: str | list[str] | None
+        The trial columns. If specified, each trial is padded separately.
+
+    Returns
+    -------
+    pl.Expr
+        The window values with the same length as the signal.
+    """
+    if offset == 0:
+        return values
+
+    if trial_columns is None and padding not in {'mirror', 'wrap'}:
+        if padding == 'nearest':
+            return values.shift(-offset, fill_value=values.last() if offset > 0 else values.first())
+        return values.shift(-offset, fill_value=padding)
+
+    row, start, length = _signal_positions(trial_columns)
+    index = row + offset
+
+    if padding is None or isinstance(padding, (int, float)):
+        is_outside = index >= length if offset > 0 else index < 0
+        return pl.when(is_outside).then(padding).otherwise(values.shift(-offset))
+
+    # Padded window values are gathered from the signal by mapping their index into the signal.
+    if padding == 'nearest':
+        index = index.clip(0, length - 1)
+    elif padding == 'wrap':
+        index = index % length
+    else:
+        index = _mirrored_index(index, length)
+    return values.gather(start + index)
+
+
+def _mirrored_index(index: pl.Expr, length: pl.Expr) -> pl.Expr:
+    """Map a sample index outside of the signal to the index of its mirrored value.
+
+    Parameters
+    ----------
+    index: pl.Expr
+        The sample index, which may be negative or exceed the signal length.
+    length: pl.Expr
+        The length of the signal.
+
+    Returns
+    -------
+    pl.Expr
+        The index mirrored into the signal, excluding the edge values from the mirror.
+    """
+    # Within a period of twice the signal length, the mirrored index runs forwards and backwards.
+    period = (2 * (length - 1)).clip(lower_bound=1)
+    return length - 1 - ((index % period) - (length - 1)).abs()
+
+
+def _convolve(
+        values: pl.Expr,
+        *,
+        offsets: np.ndarray,
+        weights: np.ndarray,
+        padding: str | float | int | None,
+        trial_columns: str | list[str] | None,
+) -> pl.Expr:
+    """Compute the weighted sum of a fixed window around each sample.
+
+    The window values are computed by shifting the signal, so that the expression is evaluated
+    natively on all samples at once. Null values propagate to all windows containing them.
+
+    Parameters
+    ----------
+    values: pl.Expr
+        The signal values.
+    offsets: np.ndarray
+        The offsets of the window values relative to each sample.
+    weights: np.ndarray
+        The weight of each window value.
+    padding: str | float | int | None
+        The padding to use outside of the signal. ``None`` results in null values at the edges.
+    trial_columns: str | list[str] | None
+        The trial columns. If specified, the windows do not extend across trials.
+
+    Returns
+    -------
+    pl.Expr
+        The weighted sums with the same length as the signal.
+    """
+    terms = [
+        float(weight) * _window_values(values, int(offset), padding, trial_columns)
+        for offset, weight in zip(offsets, weights)
+    ]
+    return reduce(operator.add, terms)
+
+
+def _fit_edges(
+        values: pl.Expr,
+        filtered: pl.Expr,
+        *,
+        window_length: int,
+        degree: int,
+        derivative: int,
+        delta: float,
+        trial_columns: str | list[str] | None,
+) -> pl.Expr:
+    """Replace the edges of a Savitzky-Golay filtered signal by polynomial fits.
+
+    This corresponds to mode ``interp`` of :py:func:`scipy.signal.savgol_filter`. A polynomial is
+    fit to the first and last `window_length` values, which is used to evaluate the first and
+    last ``window_length // 2`` output values.
+
+    Parameters
+    ----------
+    values: pl.Expr
+        The signal values.
+    filtered: pl.Expr
+        The filtered signal values, with null values at the edges.
+    window_length: int
+        The length of the filter window.
+    degree: int
+        The degree of the polynomial used to fit the samples.
+    derivative: int
+        The order of the derivative to compute.
+    delta: float
+        The spacing of the samples.
+    trial_columns: str | list[str] | None
+        The trial columns. If specified, the edges of each trial are fit separately.
+
+    Returns
+    -------
+    pl.Expr
+        The filtered signal values with the fitted edges.
+    """
+    n_edge_values = window_length // 2
+    if n_edge_values == 0:
+        return filtered
+
+    from scipy.signal import savgol_coeffs  # pylint: disable=import-outside-toplevel
+
+    row, _, length = _signal_positions(trial_columns)
+    length = length.map_batches(
+        partial(_check_signal_length, window_length=window_length),
+        return_dtype=pl.Int64,
+    )
+
+    # Position of each edge sample in the window of its polynomial fit.
+    edge_positions = [
+        (row == position, position) for position in range(n_edge_values)
+    ] + [
+        (row == length - window_length + position, position)
+        for position in range(window_length - n_edge_values, window_length)
+    ]
+
+    # The window of an edge sample at position p starts p samples before it. As the signal is at
+    # least as long as the window, the window values are always part of the same signal.
+    for is_position, position in edge_positions:
+        coefficients = savgol_coeffs(
+            window_length, degree, deriv=derivative, delta=delta, pos=position, use='dot',
+        )
+        fit = reduce(
+            operator.add,
+            [
+                float(coefficient) * values.shift(position - index)
+                for index, coefficient in enumerate(coefficients)
+            ],
+        )
+        filtered = pl.when(is_position).then(fit).otherwise(filtered)
+
+    return filtered
+
+
+def _check_signal_length(lengths: pl.Series, window_length: int) -> pl.Series:
+    """Check that no signal is shorter than the window.
+
+    Parameters
+    ----------
+    lengths: pl.Series
+        The signal lengths.
+    window_length: int
+        The length of the filter window.
+
+    Returns
+    -------
+    pl.Series
+        The signal lengths.
+
+    Raises
+    ------
+    ValueError
+        If a signal is shorter than the window.
+    """
+    if (lengths < window_length).any():
+        raise ValueError(
+            "If mode is 'interp', window_length must be less than or equal to the size of x.",
+        )
+    return lengths
+
+
+def _exponential_moving_average(
+        values: pl.Expr,
+        *,
+        span: int,
+        padding: str | float | int | None,
+) -> pl.Expr:
+    """Compute the exponential moving average of a signal extended by padding.
+
+    The signal is padded by ``ceil(span / 2)`` values at the start. Instead of padding the signal,
+    the moving average of the padding values is propagated into the moving average of the signal,
+    so that the expression keeps the length of the signal.
+
+    Parameters
+    ----------
+    values: pl.Expr
+        The signal values.
+    span: int
+        The span of the exponential moving average.
+    padding: str | float | int | None
+        The padding to use before the signal. ``None`` results in null values for the first
+        ``span - 1`` samples.
+
+    Returns
+    -------
+    pl.Expr
+        The exponential moving average with the same length as the signal.
+    """
+    if padding is None:
+        return values.ewm_mean(span=span, adjust=False, min_samples=span)
+
+    alpha = 2 / (span + 1)
+    pad_width = (span + 1) // 2
+
+    pad_values: list[Any]
+    if isinstance(padding, (int, float)):
+        pad_values = [padding] * pad_width
+    elif padding == 'nearest':
+        pad_values = [values.first()] * pad_width
+    else:
+        length = values.len().cast(pl.Int64)
+        pad_indices = [pl.lit(index - pad_width) for index in range(pad_width)]
+        if padding == 'wrap':
+            pad_values = [values.get(index % length) for index in pad_indices]
+        else:
+            pad_values = [values.get(_mirrored_index(index, length)) for index in pad_indices]
+
+    # Moving average at the last padding value, with the first padding value as initial value.
+    pad_average = reduce(
+        operator.add,
+        [(1 - alpha) ** (pad_width - 1) * pad_values[0]] + [
+            alpha * (1 - alpha) ** (pad_width - 1 - index) * pad_values[index]
+            for index in range(1, pad_width)
+        ],
+    )
+
+    row = pl.int_range(values.len())
+    average = (
+        values.ewm_mean(span=span, adjust=False)
+        + pl.lit(1 - alpha).pow(row + 1) * (pad_average - values.first())
+    )
+
+    # Like a padded moving average, the first values are null until span values are seen.
+    n_null_values = span - 1 - pad_width
+    if n_null_values > 0:
+        return pl.when(row >= n_null_values).then(average)
+    return average
+
+
 def _check_window_length(window_length: Any) -> None:
     """Check that window length is an integer and greater than zero.
 
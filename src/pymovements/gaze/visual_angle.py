@@ -0,0 +1,479 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides conversions between pixel coordinates and degrees of visual angle."""
+from __future__ import annotations
+
+import functools
+
+import numpy as np
+import polars as pl
+
+from pymovements._utils import _checks
+
+
+class VisualAngleConverter:
+    """Convert between pixel coordinates and degrees of visual angle on a fixed screen.
+
+    The pixel density of each screen axis, the eye-to-screen distance in pixels and the offset of
+    the pixel origin from the screen center are computed once when the converter is created.
+    Conversions only apply these constants without validating the screen parameters again, which
+    makes them cheap for repeated calls on small batches of streamed samples.
+
+    Use :py:meth:`cached` or :py:attr:`pymovements.Screen.visual_angle_converter` to reuse a
+    converter for the same screen parameters.
+
+    Coordinates are converted component-wise with x and y components alternating, e.g. the x and
+    y coordinates of the left eye followed by the x and y coordinates of the right eye.
+
+    Parameters
+    ----------
+    screen_resolution: tuple[int, int]
+        Pixel screen resolution as tuple (width, height).
+    screen_size: tuple[float, float]
+        Screen size in centimeters as tuple (width, height).
+    distance_cm: float | None
+        Eye-to-screen distance in centimeters. If None, the eye-to-screen distance must be passed
+        for each sample. (default: None)
+    origin: str
+        The location of the pixel origin. Supported values: ``center``, ``upper left``.
+        (default: 'upper left')
+
+    Attributes
+    ----------
+    pixels_per_cm: tuple[float, float]
+        Pixel density of the horizontal and vertical screen axis.
+    distance_px: tuple[float, float] | None
+        Eye-to-screen distance in horizontal and vertical pixels.
+    origin_offset: tuple[float, float]
+        Horizontal and vertical offset of the pixel origin from the screen center.
+
+    Raises
+    ------
+    TypeError
+        If screen_resolution or screen_size are not tuples.
+    ValueError
+        If screen_resolution, screen_size or distance_cm are not greater than zero or if the
+        origin is not supported.
+
+    Examples
+    --------
+    >>> converter = VisualAngleConverter((1280, 1024), (38.0, 30.0), 68.0)
+    >>> converter.pix2deg([[123.0, 865.0], [639.5, 511.5]])
+    array([[-12.70732231,   8.65963972],
+           [  0.        ,   0.        ]])
+    >>> converter.deg2pix(converter.pix2deg([[123.0, 865.0]]))
+    array([[123., 865.]])
+
+    Polars expressions apply the same conversion to list columns:
+    >>> df = pl.DataFrame({'pixel': [[123.0, 865.0]]})
+    >>> df.select(converter.pix2deg_expr(n_components=2))
+    shape: (1, 1)
+    ┌───────────────────────┐
+    │ position              │
+    │ ---                   │
+    │ list[f64]             │
+    ╞═══════════════════════╡
+    │ [-12.707322, 8.65964] │
+    └───────────────────────┘
+    """
+
+    pixels_per_cm: tuple[float, float]
+    distance_px: tuple[float, float] | None
+    origin_offset: tuple[float, float]
+
+    def __init__(
+            self,
+            screen_resolution: tuple[int, int],
+            screen_size: tuple[float, float],
+            distance_cm: float | None = None,
+            origin: str = 'upper left',
+    ):
+        _check_screen_resolution(screen_resolution)
+        _check_screen_size(screen_size)
+        if distance_cm is not None:
+            _check_distance(distance_cm)
+
+        self.screen_resolution = (screen_resolution[0], screen_resolution[1])
+        self.screen_size = (screen_size[0], screen_size[1])
+        self.distance_cm = distance_cm
+        self.origin = origin
+
+        self.origin_offset = origin_offset(screen_resolution, origin)
+        self.pixels_per_cm = (
+            screen_resolution[0] / screen_size[0],
+            screen_resolution[1] / screen_size[1],
+        )
+        self.distance_px = None
+        if distance_cm is not None:
+            self.distance_px = (
+                distance_cm * self.pixels_per_cm[0],
+                distance_cm * self.pixels_per_cm[1],
+            )
+
+        # Constants tiled to the number of components, e.g. 4 for binocular samples.
+        self._tiled_constants: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray | None]] = {}
+
+    @classmethod
+    def cached(
+            cls,
+            screen_resolution: tuple[int, int],
+            screen_size: tuple[float, float],
+            distance_cm: float | None = None,
+            origin: str = 'upper left',
+    ) -> VisualAngleConverter:
+        """Get a converter which is shared by all calls with the same screen parameters.
+
+        Parameters
+        ----------
+        screen_resolution: tuple[int, int]
+            Pixel screen resolution as tuple (width, height).
+        screen_size: tuple[float, float]
+            Screen size in centimeters as tuple (width, height).
+        distance_cm: float | None
+            Eye-to-screen distance in centimeters. (default: None)
+        origin: str
+            The location of the pixel origin. (default: 'upper left')
+
+        Returns
+        -------
+        VisualAngleConverter
+            The cached converter.
+        """
+        # Hashable tuples are validated by the constructor when they are not cached yet.
+        if not isinstance(screen_resolution, tuple) or not isinstance(screen_size, tuple):
+            _check_screen_resolution(screen_resolution)
+            _check_screen_size(screen_size)
+            screen_resolution = (screen_resolution[0], screen_resolution[1])
+            screen_size = (screen_size[0], screen_size[1])
+        return _cached_converter(screen_resolution, screen_size, distance_cm, origin)
+
+    def pix2deg(
+            self,
+            arr: list[float] | list[list[float]] | np.ndarray,
+            distance_cm: float | list[float] | np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Convert pixel coordinates to degrees of visual angle.
+
+        Parameters
+        ----------
+        arr: list[float] | list[list[float]] | np.ndarray
+            shape (..., n_components)
+            Pixel coordinates with an even number of components.
+        distance_cm: float | list[float] | np.ndarray | None
+            shape (...)
+            Eye-to-screen distance in centimeters for each sample. If None, the distance of the
+            converter is used. (default: None)
+
+        Returns
+        -------
+        np.ndarray
+            Coordinates in degrees of visual angle with the same shape as ``arr``.
+
+        Raises
+        ------
+        ValueError
+            If the number of components is not even or if no distance is available.
+        """
+        arr = np.asarray(arr, dtype=np.float64)
+        offset, distance_px = self._get_constants(arr, distance_cm)
+        return np.degrees(np.arctan2(arr - offset, distance_px))
+
+    def deg2pix(
+            self,
+            arr: list[float] | list[list[float]] | np.ndarray,
+            distance_cm: float | list[float] | np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Convert degrees of visual angle to pixel coordinates.
+
+        Parameters
+        ----------
+        arr: list[float] | list[list[float]] | np.ndarray
+            shape (..., n_components)
+            Coordinates in degrees of visual angle with an even number of components.
+        distance_cm: float | list[float] | np.ndarray | None
+            shape (...)
+            Eye-to-screen distance in centimeters for each sample. If None, the distance of the
+            converter is used. (default: None)
+
+        Returns
+        -------
+        np.ndarray
+            Pixel coordinates with the same shape as ``arr``.
+
+        Raises
+        ------
+        ValueError
+            If the number of components is not even or if no distance is available.
+        """
+        arr = np.asarray(arr, dtype=np.float64)
+        offset, distance_px = self._get_constants(arr, distance_cm)
+        return np.tan(np.radians(arr)) * distance_px + offset
+
+    def pix2deg_expr(
+            self,
+            n_components: int,
+            *,
+            pixel_column: str = 'pixel',
+            position_column: str = 'position',
+            distance_column: str | None = None,
+    ) -> pl.Expr:
+        """Get a polars expression which converts pixel coordinates to degrees of visual angle.
+
+        Parameters
+        ----------
+        n_components: int
+            Number of components in the pixel column.
+        pixel_column: str
+            The input pixel column name. (default: 'pixel')
+        position_column: str
+            The output position column name. (default: 'position')
+        distance_column: str | None
+            Name of a column containing the eye-to-screen distance in millimeters for each
+            sample. If None, the distance of the converter is used. (default: None)
+
+        Returns
+        -------
+        pl.Expr
+            The respective polars expression.
+
+        Raises
+        ------
+        ValueError
+            If no distance is available.
+        """
+        distance_px = self._get_distance_px_exprs(distance_column)
+        return pl.concat_list([
+            pl.arctan2(
+                self._center_expr(pl.col(pixel_column).list.get(component), component % 2),
+                distance_px[component % 2],
+            ).degrees()
+            for component in range(n_components)
+        ]).alias(position_column)
+
+    def deg2pix_expr(
+            self,
+            n_components: int,
+            *,
+            position_column: str = 'position',
+            pixel_column: str = 'pixel',
+            distance_column: str | None = None,
+    ) -> pl.Expr:
+        """Get a polars expression which converts degrees of visual angle to pixel coordinates.
+
+        Parameters
+        ----------
+        n_components: int
+            Number of components in the position column.
+        position_column: str
+            The input position column name. (default: 'position')
+        pixel_column: str
+            The output pixel column name. (default: 'pixel')
+        distance_column: str | None
+            Name of a column containing the eye-to-screen distance in millimeters for each
+            sample. If None, the distance of the converter is used. (default: None)
+
+        Returns
+        -------
+        pl.Expr
+            The respective polars expression.
+
+        Raises
+        ------
+        ValueError
+            If no distance is available.
+        """
+        distance_px = self._get_distance_px_exprs(distance_column)
+        return pl.concat_list([
+            pl.col(position_column).list.get(component).radians().tan()
+            * distance_px[component % 2]
+            + self.origin_offset[component % 2]
+            for component in range(n_components)
+        ]).alias(pixel_column)
+
+    def _get_constants(
+            self,
+            arr: np.ndarray,
+            distance_cm: float | list[float] | np.ndarray | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the origin offset and eye-to-screen distance in pixels for each component."""
+        if arr.ndim == 0 or arr.shape[-1] % 2 != 0:
+            raise ValueError(
+                'the last dimension of arr must contain an even number of components'
+                f' (arr.shape: {arr.shape})',
+            )
+
+        n_components = arr.shape[-1]
+        if n_components not in self._tiled_constants:
+            n_eyes = n_components // 2
+            self._tiled_constants[n_components] = (
+                np.tile(self.origin_offset, n_eyes),
+                np.tile(self.pixels_per_cm, n_eyes),
+                None if self.distance_px is None else np.tile(self.distance_px, n_eyes),
+            )
+        offset, pixels_per_cm, distance_px = self._tiled_constants[n_components]
+
+        if distance_cm is not None:
+            distance_cm = np.asarray(distance_cm, dtype=np.float64)
+            return offset, distance_cm[..., np.newaxis] * pixels_per_cm
+        if distance_px is None:
+            raise ValueError(
+                'distance_cm must be passed, because the converter has no eye-to-screen distance',
+            )
+        return offset, distance_px
+
+    def _get_distance_px_exprs(self, distance_column: str | None) -> list[pl.Expr]:
+        """Get the horizontal and vertical eye-to-screen distance in pixels as expressions."""
+        if distance_column is not None:
+            # True division by 10 is needed to convert distance from mm to cm
+            distance_cm = pl.col(distance_column).truediv(10)
+            return [distance_cm.mul(pixels_per_cm) for pixels_per_cm in self.pixels_per_cm]
+        if self.distance_px is None:
+            raise ValueError(
+                'distance_column must be passed, because the converter has no eye-to-screen '
+                'distance',
+            )
+        return [pl.lit(distance_px) for distance_px in self.distance_px]
+
+    def _center_expr(self, expr: pl.Expr, axis: int) -> pl.Expr:
+        """Shift the origin of a pixel coordinate expression to the screen center."""
+        if self.origin_offset[axis] == 0:
+            return expr
+        return expr - self.origin_offset[axis]
+
+
+def origin_offset(screen_resolution: tuple[int, int], origin: str) -> tuple[float, float]:
+    """Get the offset of the pixel origin from the screen center.
+
+    Parameters
+    ----------
+    screen_resolution: tuple[int, int]
+        Pixel screen resolution as tuple (width, height).
+    origin: str
+        The location of the pixel origin. Supported values: ``center``, ``upper left``.
+
+    Returns
+    -------
+    tuple[float, float]
+        Horizontal and vertical offset of the pixel origin from the screen center.
+
+    Raises
+    ------
+    ValueError
+        If the origin is not supported.
+    """
+    check_origin(origin)
+    if origin == 'center':
+        return 0.0, 0.0
+    return (screen_resolution[0] - 1) / 2, (screen_resolution[1] - 1) / 2
+
+
+def check_origin(origin: str, argument: str = 'origin') -> None:
+    """Check if the location of the pixel origin is supported.
+
+    Parameters
+    ----------
+    origin: str
+        The location of the pixel origin.
+    argument: str
+        Name of the origin argument in error messages. (default: 'origin')
+
+    Raises
+    ------
+    ValueError
+        If the origin is not supported.
+    """
+    if origin in {'center', 'upper left'}:
+        return
+    if origin == 'lower left':
+        raise ValueError(
+            'origin string lower left was corrected to upper left. please update your definition',
+        )
+    supported_origins = ['center', 'upper left']
+    raise ValueError(
+        f'value `{origin}` for argument `{argument}` is invalid. '
+        f' Valid values are: {supported_origins}',
+    )
+
+
+_cached_converter = functools.lru_cache(maxsize=128)(VisualAngleConverter)
+
+
+def _check_distance(distance: float) -> None:
+    """Check if all screen values are scalars and are greather than zero.
+
+    Parameters
+    ----------
+    distance: float
+        The distance to check.
+    """
+    _checks.check_is_scalar(distance=distance)
+    _checks.check_is_greater_than_zero(distance=distance)
+
+
+def _check_screen_resolution(screen_resolution: tuple[int, int]) -> None:
+    """Check screen resolution value.
+
+    Parameters
+    ----------
+    screen_resolution: tuple[int, int]
+        The screen resolution to check.
+    """
+    if screen_resolution is None:
+        raise TypeError('screen_resolution must not be None')
+
+    if not isinstance(screen_resolution, (tuple, list)):
+        raise TypeError(
+            'screen_resolution must be of type tuple[int, int],'
+            f' but is of type {type(screen_resolution).__name__}',
+        )
+
+    if len(screen_resolution) != 2:
+        raise ValueError(
+            f'screen_resolution must have length of 2, but is of length {len(screen_resolution)}',
+        )
+
+    for element in screen_resolution:
+        _checks.check_is_scalar(screen_resolution=element)
+        _checks.check_is_greater_than_zero(screen_resolution=element)
+
+
+def _check_screen_size(screen_size: tuple[float, float]) -> None:
+    """Check screen size value.
+
+    Parameters
+    ----------
+    screen_size: tuple[float, float]
+        The screen size to check.
+    """
+    if screen_size is None:
+        raise TypeError('screen_size must not be None')
+
+    if not isinstance(screen_size, (tuple, list)):
+        raise TypeError(
+            'screen_size must be of type tuple[int, int],'
+            f' but is of type {type(screen_size).__name__}',
+        )
+
+    if len(screen_size) != 2:
+        raise ValueError(f'screen_size must have length of 2, but is of length {len(screen_size)}')
+
+    for element in screen_size:
+        _checks.check_is_scalar(screen_size=element)
+        _checks.check_is_greater_than_zero(screen_size=element)
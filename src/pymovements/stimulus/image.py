@@ -21,14 +21,17 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot
 import PIL.Image
 
 from pymovements._utils._html import repr_html
 from pymovements._utils._paths import get_filepaths
 from pymovements._utils._strings import curly_to_regex
 
+if TYPE_CHECKING:  # pragma: no cover
+    import matplotlib.pyplot
+
 
 @repr_html()
 class ImageStimulus:
@@ -134,6 +137,8 @@ def _draw_image_stimulus(
     fig: matplotlib.pyplot.figure
     ax: matplotlib.pyplot.Axes
     """
+    import matplotlib.pyplot  # pylint: disable=import-outside-toplevel
+
     img = PIL.Image.open(image_stimulus)
     if not fig:
         fig, ax = matplotlib.pyplot.subplots(figsize=figsize)
@@ -0,0 +1,55 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark mapping gaze samples and events to areas of interest."""
+import pytest
+
+import pymovements as pm
+
+
+@pytest.mark.parametrize('n_samples', [100, 1_000, 10_000])
+@pytest.mark.parametrize('n_aois', [400, 1600], ids=lambda n_aois: f'{n_aois}_aois')
+def test_gaze_map_to_aois(benchmark, make_gaze, make_text_stimulus, n_samples, n_aois):
+    text_stimulus = make_text_stimulus(n_rows=n_aois // 80, n_columns=80)
+
+    def setup():
+        return (make_gaze(n_samples, binocular=True),), {}
+
+    def map_to_aois(gaze):
+        gaze.map_to_aois(text_stimulus)
+
+    benchmark.pedantic(map_to_aois, setup=setup, rounds=3)
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000])
+def test_events_map_to_aois(benchmark, make_gaze, make_text_stimulus, n_samples):
+    text_stimulus = make_text_stimulus()
+    gaze = make_gaze(n_samples, n_trials=10)
+    gaze.pix2deg()
+    gaze.pos2vel()
+    gaze.detect('ivt')
+    gaze.compute_event_properties(('location', {'position_column': 'pixel'}))
+
+    def setup():
+        return (pm.Events(gaze.events.frame),), {}
+
+    def map_to_aois(events):
+        events.map_to_aois(text_stimulus)
+
+    benchmark.pedantic(map_to_aois, setup=setup, rounds=3)
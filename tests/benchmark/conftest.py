@@ -0,0 +1,315 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provide fixtures for creating synthetic benchmark data."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+import pymovements as pm
+
+
+EXPERIMENT_KWARGS = {
+    'screen_width_px': 1280,
+    'screen_height_px': 1024,
+    'screen_width_cm': 38.0,
+    'screen_height_cm': 30.2,
+    'distance_cm': 68.0,
+    'origin': 'upper left',
+}
+
+
+def synthetic_pixel_positions(
+        n_samples: int,
+        *,
+        n_channels: int = 2,
+        sampling_rate: float = 1000.0,
+        fixation_duration_ms: float = 250.0,
+        seed: int = 42,
+) -> np.ndarray:
+    """Create pixel positions of alternating fixations and instantaneous saccades.
+
+    Parameters
+    ----------
+    n_samples: int
+        Number of samples.
+    n_channels: int
+        Number of position channels, e.g. ``2`` for monocular and ``4`` for binocular data.
+        (default: 2)
+    sampling_rate: float
+        Sampling rate in Hz. (default: 1000.0)
+    fixation_duration_ms: float
+        Duration of each fixation in milliseconds. (default: 250.0)
+    seed: int
+        Seed for the random fixation locations and noise. (default: 42)
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape ``(n_samples, n_channels)``.
+
+    """
+    rng = np.random.default_rng(seed)
+    np.random.seed(seed)  # step_function draws its noise from the global random state.
+
+    fixation_samples = max(int(fixation_duration_ms * sampling_rate / 1000), 1)
+    steps = list(range(fixation_samples, n_samples, fixation_samples)) or [0]
+    values = [tuple(rng.uniform(100, 900, size=n_channels)) for _ in steps]
+
+    return pm.synthetic.step_function(
+        length=n_samples,
+        steps=steps,
+        values=values,
+        start_value=tuple(500.0 for _ in range(n_channels)),
+        noise=0.5,
+    )
+
+
+def synthetic_samples(
+        n_samples: int,
+        *,
+        binocular: bool = False,
+        sampling_rate: float = 1000.0,
+        n_trials: int = 1,
+        nested: bool = False,
+) -> pl.DataFrame:
+    """Create a samples frame with a time column and one column per pixel component.
+
+    Parameters
+    ----------
+    n_samples: int
+        Number of samples.
+    binocular: bool
+        Create columns ``xl``, ``yl``, ``xr``, ``yr`` instead of ``x``, ``y``. (default: False)
+    sampling_rate: float
+        Sampling rate in Hz. (default: 1000.0)
+    n_trials: int
+        If greater than one, add a ``trial`` column splitting the samples into equally sized
+        trials. (default: 1)
+    nested: bool
+        Combine the pixel components into a single list column ``pixel``, as in preprocessed
+        files. (default: False)
+
+    Returns
+    -------
+    pl.DataFrame
+        The synthetic samples.
+
+    """
+    pixel_columns = ['xl', 'yl', 'xr', 'yr'] if binocular else ['x', 'y']
+    positions = synthetic_pixel_positions(
+        n_samples, n_channels=len(pixel_columns), sampling_rate=sampling_rate,
+    )
+
+    samples = pl.DataFrame(
+        {
+            'time': np.arange(n_samples) * (1000 / sampling_rate),
+            **{column: positions[:, i] for i, column in enumerate(pixel_columns)},
+        },
+    )
+
+    if n_trials > 1:
+        samples = samples.with_columns(trial=pl.int_range(pl.len()) * n_trials // pl.len())
+    if nested:
+        samples = samples.with_columns(pixel=pl.concat_list(pixel_columns)).drop(pixel_columns)
+    return samples
+
+
+@pytest.fixture(name='make_gaze', scope='session')
+def fixture_make_gaze() -> Callable[..., pm.Gaze]:
+    """Make a new :py:class:`~pymovements.Gaze` with synthetic pixel data for each call."""
+    def _make_gaze(
+            n_samples: int,
+            *,
+            binocular: bool = False,
+            sampling_rate: float = 1000.0,
+            n_trials: int = 1,
+    ) -> pm.Gaze:
+        samples = synthetic_samples(
+            n_samples, binocular=binocular, sampling_rate=sampling_rate, n_trials=n_trials,
+        )
+        return pm.Gaze(
+            samples,
+            experiment=pm.Experiment(**EXPERIMENT_KWARGS, sampling_rate=sampling_rate),
+            trial_columns=['trial'] if n_trials > 1 else None,
+            time_column='time',
+            time_unit='ms',
+            pixel_columns=['xl', 'yl', 'xr', 'yr'] if binocular else ['x', 'y'],
+        )
+    return _make_gaze
+
+
+@pytest.fixture(name='make_samples_file', scope='session')
+def fixture_make_samples_file(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., Path]:
+    """Write synthetic samples to a CSV or IPC file, reusing previously written files."""
+    dirpath = tmp_path_factory.mktemp('samples')
+    cache: dict[tuple[int, bool, str], Path] = {}
+
+    def _make_samples_file(
+            n_samples: int,
+            *,
+            binocular: bool = False,
+            fileformat: str = 'csv',
+    ) -> Path:
+        key = (n_samples, binocular, fileformat)
+        if key not in cache:
+            # IPC files are read without a column definition, so store them like preprocessed files.
+            samples = synthetic_samples(
+                n_samples, binocular=binocular, nested=fileformat != 'csv',
+            )
+            filepath = dirpath / f'{n_samples}_{binocular}.{fileformat}'
+            if fileformat == 'csv':
+                samples.write_csv(filepath)
+            else:
+                samples.write_ipc(filepath)
+            cache[key] = filepath
+        return cache[key]
+    return _make_samples_file
+
+
+@pytest.fixture(name='make_asc_file', scope='session')
+def fixture_make_asc_file(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., Path]:
+    """Write a synthetic EyeLink ASC file, reusing previously written files with equal content."""
+    dirpath = tmp_path_factory.mktemp('asc')
+    cache: dict[tuple[int, bool, int], Path] = {}
+
+    def _make_asc_file(
+            n_samples: int,
+            *,
+            binocular: bool = False,
+            sampling_rate: int = 1000,
+    ) -> Path:
+        key = (n_samples, binocular, sampling_rate)
+        if key in cache:
+            return cache[key]
+
+        n_channels = 6 if binocular else 3
+        positions = synthetic_pixel_positions(
+            n_samples, n_channels=n_channels, sampling_rate=sampling_rate,
+        )
+        # Every third channel holds the pupil area.
+        positions[:, 2::3] = 800.0
+
+        start = 1_000_000
+        interval = 1000 / sampling_rate
+        timestamps = start + np.arange(n_samples) * interval
+
+        def format_time(timestamp: float) -> str:
+            # EyeLink writes fractional timestamps only for sampling rates above 1000 Hz.
+            return f'{timestamp:.1f}' if sampling_rate > 1000 else f'{int(timestamp)}'
+
+        eyes = 'LEFT\tRIGHT' if binocular else 'LEFT'
+        eyes_short = 'LR' if binocular else 'L'
+        flags = '.....' if binocular else '...'
+        lines = [
+            '** CONVERTED FROM synthetic.edf',
+            f'MSG\t{format_time(start - 1)} RECCFG CR {sampling_rate} 2 1 {eyes_short}',
+            f'MSG\t{format_time(start - 1)} ELCLCFG BTABLER',
+            f'MSG\t{format_time(start - 1)} GAZE_COORDS 0.00 0.00 1279.00 1023.00',
+            f'START\t{format_time(start)} \t{eyes}\tSAMPLES\tEVENTS',
+            'PRESCALER\t1',
+            'VPRESCALER\t1',
+            'PUPIL\tAREA',
+            f'EVENTS\tGAZE\t{eyes}\tRATE\t{sampling_rate:.2f}\tTRACKING\tCR\tFILTER\t2',
+            f'SAMPLES\tGAZE\t{eyes}\tRATE\t{sampling_rate:.2f}\tTRACKING\tCR\tFILTER\t2',
+        ]
+        lines.extend(
+            format_time(timestamp) + ''.join(f'\t{value:7.1f}' for value in row) + f'\t{flags}'
+            for timestamp, row in zip(timestamps, positions)
+        )
+        lines.append(f'END\t{format_time(timestamps[-1] + interval)} \tSAMPLES\tEVENTS\tRES')
+
+        filepath = dirpath / f'{n_samples}_{eyes_short}_{sampling_rate}.asc'
+        filepath.write_text('\n'.join(lines) + '\n', encoding='ascii')
+        cache[key] = filepath
+        return filepath
+    return _make_asc_file
+
+
+@pytest.fixture(name='make_text_stimulus', scope='session')
+def fixture_make_text_stimulus() -> Callable[..., pm.stimulus.TextStimulus]:
+    """Make a character grid :py:class:`~pymovements.stimulus.TextStimulus` covering the screen."""
+    def _make_text_stimulus(n_rows: int = 20, n_columns: int = 80) -> pm.stimulus.TextStimulus:
+        width = EXPERIMENT_KWARGS['screen_width_px'] / n_columns
+        height = EXPERIMENT_KWARGS['screen_height_px'] / n_rows
+
+        grid = [(row, column) for row in range(n_rows) for column in range(n_columns)]
+        aois = pl.DataFrame(
+            {
+                'char': [f'{row}_{column}' for row, column in grid],
+                'top_left_x': [column * width for _, column in grid],
+                'top_left_y': [row * height for row, _ in grid],
+                'width': width,
+                'height': height,
+            },
+        )
+        return pm.stimulus.TextStimulus(
+            aois,
+            aoi_column='char',
+            start_x_column='top_left_x',
+            start_y_column='top_left_y',
+            width_column='width',
+            height_column='height',
+        )
+    return _make_text_stimulus
+
+
+@pytest.fixture(name='make_dataset_directory', scope='session')
+def fixture_make_dataset_directory(
+        tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[..., tuple[pm.DatasetDefinition, Path]]:
+    """Write a dataset of synthetic raw gaze files and return its definition and root path."""
+    def _make_dataset_directory(
+            n_files: int,
+            n_samples: int,
+            fileformat: str = 'csv',
+    ) -> tuple[pm.DatasetDefinition, Path]:
+        rootpath = tmp_path_factory.mktemp('dataset')
+        (rootpath / 'raw').mkdir()
+
+        # IPC files are read without a column definition, so store them like preprocessed files.
+        samples = synthetic_samples(n_samples, nested=fileformat != 'csv')
+
+        for subject_id in range(n_files):
+            filepath = rootpath / 'raw' / f'{subject_id}.{fileformat}'
+            if fileformat == 'csv':
+                samples.write_csv(filepath)
+            else:
+                samples.write_ipc(filepath)
+
+        definition = pm.DatasetDefinition(
+            name='SyntheticBenchmarkDataset',
+            experiment=pm.Experiment(**EXPERIMENT_KWARGS, sampling_rate=1000),
+            resources=[
+                {
+                    'content': 'gaze',
+                    'filename_pattern': f'{{subject_id:d}}.{fileformat}',
+                },
+            ],
+            time_column='time',
+            time_unit='ms',
+            pixel_columns=['x', 'y'],
+        )
+        return definition, rootpath
+    return _make_dataset_directory
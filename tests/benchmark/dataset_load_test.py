@@ -0,0 +1,38 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark loading datasets."""
+import pytest
+
+import pymovements as pm
+
+
+@pytest.mark.parametrize('n_files', [1, 10, 50])
+@pytest.mark.parametrize('n_samples', [10_000, 100_000])
+@pytest.mark.parametrize('fileformat', ['csv', 'feather'])
+def test_dataset_load(benchmark, make_dataset_directory, n_files, n_samples, fileformat):
+    definition, rootpath = make_dataset_directory(n_files, n_samples, fileformat)
+    paths = pm.DatasetPaths(root=rootpath, dataset='.')
+
+    def load():
+        return pm.Dataset(definition, path=paths).load()
+
+    dataset = benchmark.pedantic(load, rounds=3)
+
+    assert len(dataset.gaze) == n_files
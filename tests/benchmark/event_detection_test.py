@@ -0,0 +1,99 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark event detection."""
+import numpy as np
+import pytest
+
+import pymovements as pm
+
+
+@pytest.fixture(name='velocity_gaze', scope='module')
+def fixture_velocity_gaze(make_gaze):
+    """Cache gazes with position and velocity columns by number of samples and trials."""
+    gazes = {}
+
+    def _velocity_gaze(n_samples, n_trials=1):
+        if (n_samples, n_trials) not in gazes:
+            gaze = make_gaze(n_samples, n_trials=n_trials)
+            gaze.pix2deg()
+            gaze.pos2vel()
+            gazes[n_samples, n_trials] = gaze
+        return gazes[n_samples, n_trials]
+    return _velocity_gaze
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize('method', ['idt', 'ivt', 'microsaccades'])
+def test_detect(benchmark, velocity_gaze, n_samples, method):
+    gaze = velocity_gaze(n_samples)
+
+    benchmark.pedantic(gaze.detect, args=(method,), kwargs={'clear': True}, rounds=3)
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+def test_fill(benchmark, velocity_gaze, n_samples):
+    gaze = velocity_gaze(n_samples)
+    gaze.detect('ivt', clear=True)
+    timesteps = gaze.samples['time'].to_numpy()
+
+    events = benchmark(pm.events.fill, gaze.events, timesteps)
+
+    assert len(events) > 0
+
+
+@pytest.mark.parametrize('n_samples', [100_000, 1_000_000])
+@pytest.mark.parametrize('single_pass', [False, True], ids=['two_pass', 'single_pass'])
+def test_detect_with_event_properties(benchmark, velocity_gaze, n_samples, single_pass):
+    # Computing event properties after detection requires trial columns.
+    gaze = velocity_gaze(n_samples, n_trials=10)
+    event_properties = ['location', 'dispersion', 'peak_velocity']
+
+    def detect():
+        detected_gaze = gaze.clone()
+        if single_pass:
+            detected_gaze.detect('ivt', event_properties=event_properties)
+        else:
+            detected_gaze.detect('ivt')
+            detected_gaze.compute_event_properties(event_properties)
+
+    benchmark.pedantic(detect, rounds=3)
+
+
+@pytest.mark.parametrize('batch_size', [100, 10_000])
+@pytest.mark.parametrize(
+    ('detector_class', 'column'),
+    [
+        pytest.param(pm.events.StreamingIDT, 'position', id='idt'),
+        pytest.param(pm.events.StreamingIVT, 'velocity', id='ivt'),
+    ],
+)
+def test_streaming_detect(benchmark, velocity_gaze, detector_class, column, batch_size):
+    gaze = velocity_gaze(100_000)
+    values = np.vstack(gaze.samples[column].to_list())
+    timesteps = gaze.samples['time'].to_numpy()
+
+    def detect():
+        detector = detector_class()
+        for batch_start in range(0, len(values), batch_size):
+            batch = slice(batch_start, batch_start + batch_size)
+            detector.process(values[batch], timesteps[batch])
+        detector.flush()
+
+    benchmark.pedantic(detect, rounds=3)
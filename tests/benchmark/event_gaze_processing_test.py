@@ -0,0 +1,69 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark computing event properties from gaze samples."""
+import pytest
+
+import pymovements as pm
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000])
+@pytest.mark.parametrize(
+    'event_properties',
+    [
+        pytest.param('peak_velocity', id='peak_velocity'),
+        pytest.param(['amplitude', 'dispersion', 'location', 'peak_velocity'], id='multiple'),
+    ],
+)
+def test_event_gaze_processor(benchmark, make_gaze, n_samples, event_properties):
+    gaze = make_gaze(n_samples, n_trials=10)
+    gaze.pix2deg()
+    gaze.pos2vel()
+    gaze.detect('ivt')
+    processor = pm.EventGazeProcessor(event_properties)
+
+    properties = benchmark.pedantic(
+        processor.process,
+        args=(gaze.events, gaze),
+        kwargs={'identifiers': 'trial'},
+        rounds=3,
+    )
+
+    assert properties.height == len(gaze.events)
+
+
+@pytest.mark.parametrize('n_recordings', [10, 50])
+def test_event_gaze_processor_batch(benchmark, make_gaze, n_recordings):
+    gazes = []
+    for _ in range(n_recordings):
+        gaze = make_gaze(10_000, n_trials=10)
+        gaze.pix2deg()
+        gaze.pos2vel()
+        gaze.detect('ivt')
+        gazes.append(gaze)
+    processor = pm.EventGazeProcessor(['amplitude', 'dispersion', 'location', 'peak_velocity'])
+
+    properties = benchmark.pedantic(
+        processor.process_batch,
+        args=([gaze.events for gaze in gazes], gazes),
+        kwargs={'identifiers': 'trial'},
+        rounds=3,
+    )
+
+    assert len(properties) == n_recordings
@@ -0,0 +1,36 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark parsing of EyeLink ASC files."""
+import pytest
+
+from pymovements.gaze._utils.parsing import parse_eyelink
+
+
+@pytest.mark.parametrize('duration_s', [10, 60], ids=lambda duration: f'{duration}s')
+@pytest.mark.parametrize('sampling_rate', [500, 1000, 2000], ids=lambda rate: f'{rate}hz')
+@pytest.mark.parametrize('binocular', [False, True], ids=['monocular', 'binocular'])
+def test_parse_eyelink(benchmark, make_asc_file, duration_s, sampling_rate, binocular):
+    filepath = make_asc_file(
+        duration_s * sampling_rate, binocular=binocular, sampling_rate=sampling_rate,
+    )
+
+    samples, _, _ = benchmark(parse_eyelink, filepath)
+
+    assert samples.height == duration_s * sampling_rate
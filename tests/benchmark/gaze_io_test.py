@@ -0,0 +1,57 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark reading gaze files."""
+import pytest
+
+import pymovements as pm
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize('binocular', [False, True], ids=['monocular', 'binocular'])
+def test_from_csv(benchmark, make_samples_file, n_samples, binocular):
+    filepath = make_samples_file(n_samples, binocular=binocular, fileformat='csv')
+    pixel_columns = ['xl', 'yl', 'xr', 'yr'] if binocular else ['x', 'y']
+
+    gaze = benchmark(
+        pm.gaze.from_csv, filepath, time_column='time', time_unit='ms',
+        pixel_columns=pixel_columns,
+    )
+
+    assert gaze.samples.height == n_samples
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize('binocular', [False, True], ids=['monocular', 'binocular'])
+def test_from_ipc(benchmark, make_samples_file, n_samples, binocular):
+    filepath = make_samples_file(n_samples, binocular=binocular, fileformat='feather')
+
+    gaze = benchmark(pm.gaze.from_ipc, filepath)
+
+    assert gaze.samples.height == n_samples
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000])
+@pytest.mark.parametrize('binocular', [False, True], ids=['monocular', 'binocular'])
+def test_from_asc(benchmark, make_asc_file, n_samples, binocular):
+    filepath = make_asc_file(n_samples, binocular=binocular)
+
+    gaze = benchmark(pm.gaze.from_asc, filepath)
+
+    assert gaze.samples.height == n_samples
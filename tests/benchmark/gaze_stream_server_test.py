@@ -0,0 +1,53 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark ingesting streamed samples with GazeStreamServer."""
+import asyncio
+
+import numpy as np
+import pytest
+
+import pymovements as pm
+
+
+@pytest.mark.parametrize('batch_size', [10, 100, 1000])
+def test_stream_server_tcp_ingestion(benchmark, batch_size):
+    experiment = pm.Experiment(1280, 1024, 38, 30, 68, 'upper left', 1000)
+    n_samples = 20_000
+    time = np.arange(n_samples)
+    pixel = 640 + np.cumsum(np.random.default_rng(42).normal(0, 2, size=(n_samples, 2)), axis=0)
+    frames = [
+        pm.gaze.encode_samples(time[start:start + batch_size], pixel[start:start + batch_size])
+        for start in range(0, n_samples, batch_size)
+    ]
+
+    async def ingest():
+        server = pm.gaze.GazeStreamServer(
+            pm.gaze.LiveGaze(experiment),
+            [pm.events.StreamingIVT(), pm.events.StreamingIDT()],
+        )
+        host, port = await server.start()
+        _, writer = await asyncio.open_connection(host, port)
+        for frame in frames:
+            writer.write(frame)
+            await writer.drain()
+        writer.close()
+        await server.close(wait=True)
+
+    benchmark.pedantic(lambda: asyncio.run(ingest()), rounds=3)
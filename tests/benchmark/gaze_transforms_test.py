@@ -0,0 +1,123 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark gaze transformations."""
+import numpy as np
+import pytest
+
+import pymovements as pm
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+def test_pix2deg(benchmark, make_gaze, n_samples):
+    def setup():
+        return (make_gaze(n_samples),), {}
+
+    def pix2deg(gaze):
+        gaze.pix2deg()
+
+    benchmark.pedantic(pix2deg, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize('n_trials', [10, 100])
+def test_pix2deg_trials(benchmark, make_gaze, n_trials):
+    def setup():
+        return (make_gaze(100_000, n_trials=n_trials),), {}
+
+    def pix2deg(gaze):
+        gaze.pix2deg()
+
+    benchmark.pedantic(pix2deg, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize('implementation', ['transforms_numpy', 'converter'])
+def test_pix2deg_batches(benchmark, implementation):
+    screen = pm.Screen(1280, 1024, 38.0, 30.0, 68.0, 'upper left')
+    batches = np.random.default_rng(42).uniform(0, 1024, size=(10_000, 10, 2))
+
+    def pix2deg():
+        for batch in batches:
+            if implementation == 'converter':
+                screen.visual_angle_converter.pix2deg(batch)
+            else:
+                pm.gaze.transforms_numpy.pix2deg(
+                    batch,
+                    screen_px=(screen.width_px, screen.height_px),
+                    screen_cm=(screen.width_cm, screen.height_cm),
+                    distance_cm=screen.distance_cm,
+                    origin=screen.origin,
+                )
+
+    benchmark.pedantic(pix2deg, rounds=3)
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize('method', ['fivepoint', 'smooth', 'savitzky_golay'])
+def test_pos2vel(benchmark, make_gaze, n_samples, method):
+    kwargs = {'window_length': 7, 'degree': 2} if method == 'savitzky_golay' else {}
+
+    def setup():
+        gaze = make_gaze(n_samples)
+        gaze.pix2deg()
+        return (gaze,), {}
+
+    def pos2vel(gaze):
+        gaze.pos2vel(method=method, **kwargs)
+
+    benchmark.pedantic(pos2vel, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize(
+    'method', ['savitzky_golay', 'moving_average', 'exponential_moving_average'],
+)
+def test_smooth(benchmark, make_gaze, n_samples, method):
+    def setup():
+        return (make_gaze(n_samples),), {}
+
+    def smooth(gaze):
+        gaze.smooth(method=method, column='pixel')
+
+    benchmark.pedantic(smooth, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize('n_trials', [10, 100])
+@pytest.mark.parametrize(
+    'method', ['savitzky_golay', 'moving_average', 'exponential_moving_average'],
+)
+def test_smooth_trials(benchmark, make_gaze, n_trials, method):
+    def setup():
+        return (make_gaze(100_000, n_trials=n_trials),), {}
+
+    def smooth(gaze):
+        gaze.smooth(method=method, column='pixel')
+
+    benchmark.pedantic(smooth, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize('resampling_rate', [500, 2000])
+def test_resample(benchmark, make_gaze, n_samples, resampling_rate):
+    def setup():
+        return (make_gaze(n_samples),), {}
+
+    def resample(gaze):
+        gaze.resample(resampling_rate)
+
+    benchmark.pedantic(resample, setup=setup, rounds=5)
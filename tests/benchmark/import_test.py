@@ -21,14 +21,26 @@
 import subprocess
 import sys
 
+import pytest
 
-def import_pymovements_subprocess():
-    cmd = [sys.executable, '-c', 'import pymovements']
+
+def import_pymovements_subprocess(statement):
+    cmd = [sys.executable, '-c', statement]
     subprocess.run(cmd, check=True)
 
 
-def test_import_pymovements_subprocess(benchmark):
+@pytest.mark.parametrize(
+    'statement',
+    [
+        pytest.param('import pymovements', id='import'),
+        pytest.param('import pymovements; pymovements.Gaze', id='import_gaze'),
+        pytest.param('import pymovements; pymovements.Dataset', id='import_dataset'),
+        pytest.param('import pymovements; pymovements.plotting', id='import_plotting'),
+    ],
+)
+def test_import_pymovements_subprocess(benchmark, statement):
     benchmark.pedantic(
         import_pymovements_subprocess,
+        args=(statement,),
         iterations=1, rounds=10,
     )
@@ -0,0 +1,51 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark appending samples to LiveGaze."""
+import numpy as np
+import pytest
+
+import pymovements as pm
+
+
+@pytest.mark.parametrize('batch_size', [1, 10, 1000])
+def test_live_gaze_append(benchmark, batch_size):
+    experiment = pm.Experiment(1280, 1024, 38, 30, 68, 'upper left', 1000)
+    n_samples = 10_000
+    time = np.arange(n_samples)
+    pixels = np.random.default_rng(42).uniform(0, 1024, size=(n_samples, 2))
+
+    def append():
+        live_gaze = pm.gaze.LiveGaze(experiment, capacity=1000)
+        for batch_start in range(0, n_samples, batch_size):
+            batch = slice(batch_start, batch_start + batch_size)
+            live_gaze.append(time[batch], pixels[batch])
+
+    benchmark.pedantic(append, rounds=3)
+
+
+@pytest.mark.parametrize('capacity', [1000, 100_000])
+def test_live_gaze_to_gaze(benchmark, capacity):
+    experiment = pm.Experiment(1280, 1024, 38, 30, 68, 'upper left', 1000)
+    live_gaze = pm.gaze.LiveGaze(experiment, capacity=capacity)
+    live_gaze.append(
+        np.arange(capacity), np.random.default_rng(42).uniform(0, 1024, size=(capacity, 2)),
+    )
+
+    benchmark.pedantic(live_gaze.to_gaze, rounds=3)
@@ -0,0 +1,86 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark peak memory usage of memory intensive operations."""
+import pytest
+
+import pymovements as pm
+from pymovements.gaze._utils.parsing import parse_eyelink
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000])
+@pytest.mark.parametrize('binocular', [False, True], ids=['monocular', 'binocular'])
+def test_parse_eyelink_memory(memory_benchmark, make_asc_file, n_samples, binocular):
+    filepath = make_asc_file(n_samples, binocular=binocular)
+
+    def setup():
+        return (filepath,), {}
+
+    memory_benchmark(parse_eyelink, setup=setup)
+
+
+@pytest.mark.parametrize('n_files', [1, 10])
+@pytest.mark.parametrize('n_samples', [10_000, 100_000])
+@pytest.mark.parametrize('fileformat', ['csv', 'feather'])
+def test_dataset_load_memory(
+        memory_benchmark, make_dataset_directory, n_files, n_samples, fileformat,
+):
+    definition, rootpath = make_dataset_directory(n_files, n_samples, fileformat)
+    paths = pm.DatasetPaths(root=rootpath, dataset='.')
+
+    def setup():
+        return (pm.Dataset(definition, path=paths),), {}
+
+    def load(dataset):
+        dataset.load()
+
+    memory_benchmark(load, setup=setup)
+
+
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize('transform', ['pix2deg', 'pos2vel', 'smooth', 'resample'])
+def test_gaze_transform_memory(memory_benchmark, make_gaze, n_samples, transform):
+    def setup():
+        gaze = make_gaze(n_samples, binocular=True)
+        if transform == 'pos2vel':
+            gaze.pix2deg()
+        return (gaze,), {}
+
+    def apply_transform(gaze):
+        if transform == 'smooth':
+            gaze.smooth(column='pixel')
+        elif transform == 'resample':
+            gaze.resample(2000)
+        else:
+            getattr(gaze, transform)()
+
+    memory_benchmark(apply_transform, setup=setup)
+
+
+@pytest.mark.parametrize('n_samples', [100, 1_000])
+def test_gaze_map_to_aois_memory(memory_benchmark, make_gaze, make_text_stimulus, n_samples):
+    text_stimulus = make_text_stimulus()
+
+    def setup():
+        return (make_gaze(n_samples, binocular=True),), {}
+
+    def map_to_aois(gaze):
+        gaze.map_to_aois(text_stimulus)
+
+    memory_benchmark(map_to_aois, setup=setup)
@@ -21,4 +21,6 @@
 
 pytest_plugins = [
     'tests.fixtures.file_fixtures',
+    'tests.fixtures.http_fixtures',
+    'tests.fixtures.memory_fixtures',
 ]
@@ -0,0 +1,125 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provide a local HTTP server fixture for testing downloads."""
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+
+@dataclass
+class LocalHTTPServer:
+    """Local HTTP server serving files from a directory.
+
+    The server supports HTTP range requests, which can be disabled for testing fallbacks.
+    Setting ``content_range_start`` makes the server respond to range requests with a range
+    starting at this byte instead of the requested one.
+    All requests are recorded with their path and HTTP headers.
+    """
+
+    url: str
+    dirpath: Path
+    supports_range: bool = True
+    content_range_start: int | None = None
+    requests: list[tuple[str, dict[str, str]]] = field(default_factory=list)
+
+    def add_file(self, filename: str, content: bytes) -> str:
+        """Add a file to the served directory and return its URL."""
+        (self.dirpath / filename).write_bytes(content)
+        return f'{self.url}/{filename}'
+
+
+def _make_handler(server: LocalHTTPServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # pylint: disable=invalid-name
+            server.requests.append((self.path, dict(self.headers)))
+
+            filepath = server.dirpath / self.path.lstrip('/')
+            if not filepath.is_file():
+                self.send_error(404)
+                return
+            content = filepath.read_bytes()
+
+            range_match = re.fullmatch(r'bytes=(\d+)-', self.headers.get('Range', ''))
+            if server.supports_range and range_match:
+                start = int(range_match.group(1))
+                if server.content_range_start is not None:
+                    start = server.content_range_start
+                if start >= len(content):
+                    self.send_error(416)
+                    return
+                self.send_response(206)
+                content_range = f'bytes {start}-{len(content) - 1}/{len(content)}'
+                self.send_header('Content-Range', content_range)
+                content = content[start:]
+            else:
+                self.send_response(200)
+
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            try:
+                self.wfile.write(content)
+            except (BrokenPipeError, ConnectionResetError):  # client closed connection early.
+                pass
+
+        # pylint: disable=redefined-builtin
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+@pytest.fixture(name='http_server')
+def fixture_http_server(tmp_path: Path) -> Iterator[LocalHTTPServer]:
+    """Run a local HTTP server serving files from a temporary directory.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory in which the served directory is created.
+
+    Yields
+    ------
+    LocalHTTPServer
+        The running server.
+
+    """
+    dirpath = tmp_path / 'served'
+    dirpath.mkdir()
+    server = LocalHTTPServer(url='', dirpath=dirpath)
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _make_handler(server))
+    server.url = f'http://127.0.0.1:{httpd.server_address[1]}'
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
@@ -0,0 +1,212 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provide a fixture for benchmarking peak memory usage alongside execution times."""
+from __future__ import annotations
+
+import gc
+import json
+import threading
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from pymovements.gaze.instrumentation import _read_rss
+
+MEMORY_RESULTS_KEY = pytest.StashKey[list[dict[str, Any]]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add an option for writing peak memory results for regression tracking."""
+    parser.addoption(
+        '--benchmark-memory-json',
+        metavar='PATH',
+        default=None,
+        help='Write peak memory results of memory benchmarks to a JSON file in the '
+             'customSmallerIsBetter format of github-action-benchmark.',
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Initialize the list of collected memory results."""
+    config.stash[MEMORY_RESULTS_KEY] = []
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Write all collected memory results if requested."""
+    filepath = session.config.getoption('--benchmark-memory-json', default=None)
+    results = session.config.stash.get(MEMORY_RESULTS_KEY, [])
+    if filepath is None or not results:
+        return
+
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+
+class RSSSampler:
+    """Sample the resident set size in a background thread and keep its peak.
+
+    Parameters
+    ----------
+    interval: float
+        Time in seconds between two samples. (default: 0.005)
+
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.baseline: int | None = None
+        self.peak: int | None = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def __enter__(self) -> RSSSampler:
+        """Record the baseline and start sampling."""
+        self.baseline = _read_rss()
+        self.peak = self.baseline
+        if self.baseline is not None:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop sampling and take a last sample."""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._update_peak()
+
+    @property
+    def peak_increase(self) -> int | None:
+        """Return the peak increase of the resident set size over its baseline in bytes."""
+        if self.baseline is None or self.peak is None:
+            return None
+        return self.peak - self.baseline
+
+    def _sample(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self._update_peak()
+
+    def _update_peak(self) -> None:
+        rss = _read_rss()
+        if rss is not None and self.peak is not None:
+            self.peak = max(self.peak, rss)
+
+
+def _empty_setup() -> tuple[tuple[Any, ...], dict[str, Any]]:
+    return (), {}
+
+
+@dataclass
+class MemoryBenchmarkFixture:
+    """Benchmark peak memory usage and execution time of a function.
+
+    Peak memory is measured in two separate calls so that the overhead of ``tracemalloc`` does
+    not distort the sampled resident set size. Afterwards the function is timed with the
+    ``benchmark`` fixture. The peak memory values are added to its ``extra_info`` and thereby
+    written to the JSON output of pytest-benchmark.
+
+    ``tracemalloc`` only traces allocations of the Python memory allocator, which includes numpy
+    arrays but not memory allocated by polars. The resident set size covers all allocations but is
+    only available on Linux.
+    """
+
+    benchmark: Any
+    name: str
+    results: list[dict[str, Any]]
+
+    def __call__(
+            self,
+            function: Callable[..., Any],
+            *,
+            setup: Callable[[], tuple[tuple[Any, ...], dict[str, Any]]] | None = None,
+            rounds: int = 1,
+    ) -> Any:
+        """Measure peak memory usage and execution time of ``function``.
+
+        Parameters
+        ----------
+        function: Callable[..., Any]
+            The function to benchmark.
+        setup: Callable[[], tuple[tuple[Any, ...], dict[str, Any]]] | None
+            Called before each call of ``function`` to create its args and kwargs. Setup is
+            neither timed nor included in the memory measurement. (default: None)
+        rounds: int
+            Number of timed rounds. (default: 1)
+
+        Returns
+        -------
+        Any
+            The return value of the last timed call of ``function``.
+
+        """
+        if setup is None:
+            setup = _empty_setup
+
+        args, kwargs = setup()
+        gc.collect()
+        with RSSSampler() as rss_sampler:
+            function(*args, **kwargs)
+        del args, kwargs
+
+        args, kwargs = setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function(*args, **kwargs)
+            _, peak_traced_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del args, kwargs
+
+        self.benchmark.extra_info['peak_traced_memory_bytes'] = peak_traced_memory
+        self.benchmark.extra_info['peak_rss_increase_bytes'] = rss_sampler.peak_increase
+
+        self.results.append(
+            {
+                'name': f'{self.name} (peak traced memory)',
+                'unit': 'bytes',
+                'value': peak_traced_memory,
+            },
+        )
+        if rss_sampler.peak_increase is not None:
+            self.results.append(
+                {
+                    'name': f'{self.name} (peak RSS increase)',
+                    'unit': 'bytes',
+                    'value': rss_sampler.peak_increase,
+                },
+            )
+
+        return self.benchmark.pedantic(function, setup=setup, rounds=rounds)
+
+
+@pytest.fixture(name='memory_benchmark', scope='function')
+def fixture_memory_benchmark(
+        benchmark: Any,
+        request: pytest.FixtureRequest,
+) -> MemoryBenchmarkFixture:
+    """Benchmark peak memory usage alongside the execution time of a function."""
+    return MemoryBenchmarkFixture(
+        benchmark=benchmark,
+        name=request.node.nodeid,
+        results=request.config.stash[MEMORY_RESULTS_KEY],
+    )
@@ -18,6 +18,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Test pymovements paths."""
+import os
 import pathlib
 import re
 import unittest
@@ -25,8 +26,11 @@ from pathlib import Path
 
 import pytest
 
+from pymovements._utils._paths import DirectoryIndex
 from pymovements._utils._paths import get_filepaths
+from pymovements._utils._paths import list_directory
 from pymovements._utils._paths import match_filepaths
+from pymovements._utils._paths import walk_directory
 
 
 def test_get_filepaths_mut_excl_extension_and_regex_error():
@@ -193,3 +197,149 @@ def test_match_filepaths_no_directory_raises_value_error(tmp_path):
 
     assert 'must point to a directory' in msg
     assert str(filepath) in msg
+
+
+def test_match_filepaths_sorted(tmp_path):
+    create_directory(tmp_path, ['b', 'a'], ['2.txt', '1.txt'])
+    (tmp_path / '0.txt').write_text('test')
+
+    result_dicts = match_filepaths(path=tmp_path, regex=re.compile('.*'))
+
+    assert [result_dict['filepath'] for result_dict in result_dicts] == [
+        str(Path('a/1.txt')), str(Path('a/2.txt')),
+        str(Path('b/1.txt')), str(Path('b/2.txt')),
+        '0.txt',
+    ]
+
+
+def test_list_directory(tmp_path):
+    create_directory(tmp_path, ['b', 'a'], ['foo.txt'])
+    (tmp_path / 'bar.txt').write_text('test')
+
+    assert list_directory(tmp_path) == (['a', 'b'], ['bar.txt'])
+
+
+@pytest.fixture(name='index')
+def fixture_index(tmp_path, monkeypatch):
+    # Trust all listings, regardless of how recently the directories have been modified.
+    monkeypatch.setattr(DirectoryIndex, 'racy_interval', 0)
+    return DirectoryIndex(tmp_path / 'index.json')
+
+
+def test_match_filepaths_with_index_equals_without_index(tmp_path, index):
+    create_directory(tmp_path, ['a', 'b'], ['1_2.ext', 'foo.txt'])
+    regex = re.compile(r'(?P<foo>\d+)_(?P<bar>\d+).ext')
+
+    result_dicts = match_filepaths(path=tmp_path, regex=regex, index=index)
+
+    assert result_dicts == match_filepaths(path=tmp_path, regex=regex)
+
+
+def test_directory_index_write_and_reload(tmp_path, index):
+    create_directory(tmp_path, ['data'], ['foo.txt'])
+    index.list_directory(tmp_path / 'data')
+    index.write()
+
+    reloaded_index = DirectoryIndex(tmp_path / 'index.json')
+
+    assert reloaded_index.directories == index.directories
+
+
+def test_directory_index_lists_unmodified_directory_only_once(tmp_path, index, monkeypatch):
+    create_directory(tmp_path, ['data'], ['foo.txt'])
+    index.list_directory(tmp_path / 'data')
+    index.write()
+
+    def list_directory_not_called(path):
+        raise AssertionError(f'{path} has been listed')
+
+    monkeypatch.setattr('pymovements._utils._paths.list_directory', list_directory_not_called)
+    reloaded_index = DirectoryIndex(tmp_path / 'index.json')
+
+    assert reloaded_index.list_directory(tmp_path / 'data') == ([], ['foo.txt'])
+
+
+def test_directory_index_lists_modified_directory_again(tmp_path, index):
+    create_directory(tmp_path, ['data'], ['foo.txt'])
+    index.list_directory(tmp_path / 'data')
+    index.write()
+
+    (tmp_path / 'data' / 'bar.txt').write_text('test')
+    stat = (tmp_path / 'data').stat()
+    os.utime(tmp_path / 'data', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    reloaded_index = DirectoryIndex(tmp_path / 'index.json')
+
+    assert reloaded_index.list_directory(tmp_path / 'data') == ([], ['bar.txt', 'foo.txt'])
+
+
+def test_directory_index_does_not_trust_recently_modified_directory(tmp_path):
+    create_directory(tmp_path, ['data'], ['foo.txt'])
+    index = DirectoryIndex(tmp_path / 'index.json')
+    index.list_directory(tmp_path / 'data')
+
+    assert index.directories['data']['mtime_ns'] is None
+
+
+def test_directory_index_write_removes_unvisited_directories(tmp_path, index):
+    create_directory(tmp_path, ['a', 'b'], ['foo.txt'])
+    index.list_directory(tmp_path / 'a')
+    index.list_directory(tmp_path / 'b')
+    index.write()
+
+    reloaded_index = DirectoryIndex(tmp_path / 'index.json')
+    reloaded_index.list_directory(tmp_path / 'a')
+    reloaded_index.write()
+
+    assert set(DirectoryIndex(tmp_path / 'index.json').directories) == {'a'}
+
+
+def create_directory_tree(path, depth, n_subdirs=3, n_files=2):
+    for file_id in range(n_files):
+        (path / f'{file_id}_{depth}.ext').write_text('test')
+    if depth == 0:
+        return
+    for subdir_id in range(n_subdirs):
+        subdirpath = path / f'dir{subdir_id}'
+        subdirpath.mkdir()
+        create_directory_tree(subdirpath, depth - 1, n_subdirs=n_subdirs, n_files=n_files)
+
+
+@pytest.mark.parametrize('max_workers', [2, 4, 16])
+def test_match_filepaths_max_workers_equals_sequential(tmp_path, max_workers):
+    create_directory_tree(tmp_path, depth=3)
+    regex = re.compile(r'(?P<foo>\d+)_(?P<bar>\d+).ext')
+
+    result_dicts = match_filepaths(path=tmp_path, regex=regex, max_workers=max_workers)
+
+    assert len(result_dicts) == 2 * (1 + 3 + 9 + 27)
+    assert result_dicts == match_filepaths(path=tmp_path, regex=regex)
+
+
+def test_walk_directory_order(tmp_path):
+    create_directory(tmp_path, ['b', 'a'], ['foo.txt'])
+    (tmp_path / 'a' / 'c').mkdir()
+
+    walk = walk_directory(tmp_path, max_workers=4)
+
+    assert walk == [
+        (tmp_path / 'a' / 'c', []),
+        (tmp_path / 'a', ['foo.txt']),
+        (tmp_path / 'b', ['foo.txt']),
+        (tmp_path, []),
+    ]
+
+
+@pytest.mark.parametrize('max_workers', [0, -1])
+def test_walk_directory_raises_value_error_for_invalid_max_workers(tmp_path, max_workers):
+    with pytest.raises(ValueError, match='max_workers must be positive'):
+        walk_directory(tmp_path, max_workers=max_workers)
+
+
+def test_walk_directory_max_workers_with_index(tmp_path, index):
+    (tmp_path / 'data').mkdir()
+    create_directory_tree(tmp_path / 'data', depth=2)
+
+    walk = walk_directory(tmp_path / 'data', index=index, max_workers=4)
+
+    assert walk == walk_directory(tmp_path / 'data')
+    assert len(index.directories) == 1 + 3 + 9
@@ -25,12 +25,16 @@ import os
 import pathlib
 import tarfile
 import zipfile
+from unittest import mock
 
 import pytest
 
 from pymovements.dataset._utils._archives import _decompress
 from pymovements.dataset._utils._archives import _ZIP_COMPRESSION_MAP
 from pymovements.dataset._utils._archives import extract_archive
+from pymovements.dataset._utils._archives import list_archive_members
+from pymovements.dataset._utils._archives import open_archive_member
+from pymovements.exceptions import UnknownFileType
 
 
 def test_extract_archive_wrong_suffix():
@@ -589,3 +593,201 @@ def test_extract_archive_destination_path_not_None_no_remove_top_level_no_remove
     result_files = {str(file.relative_to(destination_path)) for file in destination_path.rglob('*')}
 
     assert result_files == set(expected_files)
+
+
+@pytest.fixture(name='subjects_archive', params=['zip', 'tar'])
+def fixture_subjects_archive(request, tmp_path):
+    """Archive with several subject files and a nested zip archive with more subject files."""
+    nested_archive_path = tmp_path / 'nested.zip'
+    with zipfile.ZipFile(nested_archive_path, 'w') as nested_archive:
+        for subject_id in (3, 4):
+            nested_archive.writestr(f'nested/subject_{subject_id}.csv', f'data {subject_id}')
+        nested_archive.writestr('nested/readme.txt', 'readme')
+
+    archive_path = tmp_path / f'subjects.{request.param}'
+    members = {
+        os.path.join('subjects', f'subject_{subject_id}.csv'): f'data {subject_id}'
+        for subject_id in (1, 2)
+    }
+    members[os.path.join('subjects', 'readme.txt')] = 'readme'
+
+    if request.param == 'zip':
+        with zipfile.ZipFile(archive_path, 'w') as archive:
+            for arcname, data in members.items():
+                archive.writestr(arcname, data)
+            archive.write(nested_archive_path, arcname=os.path.join('subjects', 'nested.zip'))
+    else:
+        with tarfile.TarFile.open(archive_path, 'w') as archive:
+            for arcname, data in members.items():
+                filepath = tmp_path / os.path.basename(arcname)
+                filepath.write_text(data)
+                archive.add(filepath, arcname=arcname)
+                filepath.unlink()
+            archive.add(nested_archive_path, arcname=os.path.join('subjects', 'nested.zip'))
+
+    nested_archive_path.unlink()
+    yield archive_path
+
+
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_extract_archive_member_filter(subjects_archive, tmp_path, max_workers):
+    destination_path = tmp_path / 'extracted'
+    extract_archive(
+        source_path=subjects_archive,
+        destination_path=destination_path,
+        remove_finished=True,
+        member_filter=lambda filename: filename in {'subject_2.csv', 'subject_4.csv'},
+        max_workers=max_workers,
+    )
+
+    result_files = {
+        str(file.relative_to(destination_path))
+        for file in destination_path.rglob('*') if file.is_file()
+    }
+    assert result_files == {
+        os.path.join('subjects', 'subject_2.csv'),
+        os.path.join('subjects', 'nested', 'subject_4.csv'),
+    }
+    assert (destination_path / 'subjects' / 'subject_2.csv').read_text() == 'data 2'
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_extract_archive_max_workers_extracts_all_members(subjects_archive, tmp_path, max_workers):
+    destination_path = tmp_path / 'extracted'
+    extract_archive(
+        source_path=subjects_archive,
+        destination_path=destination_path,
+        remove_finished=True,
+        max_workers=max_workers,
+    )
+
+    result_files = {
+        str(file.relative_to(destination_path)): file.read_text()
+        for file in destination_path.rglob('*') if file.is_file()
+    }
+    assert result_files == {
+        os.path.join('subjects', 'subject_1.csv'): 'data 1',
+        os.path.join('subjects', 'subject_2.csv'): 'data 2',
+        os.path.join('subjects', 'readme.txt'): 'readme',
+        os.path.join('subjects', 'nested', 'subject_3.csv'): 'data 3',
+        os.path.join('subjects', 'nested', 'subject_4.csv'): 'data 4',
+        os.path.join('subjects', 'nested', 'readme.txt'): 'readme',
+    }
+
+
+def test_extract_archive_zip_max_workers_many_members(tmp_path):
+    archive_path = tmp_path / 'many.zip'
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        for directory in ('a', 'b', os.path.join('b', 'c')):
+            for file_id in range(10):
+                archive.writestr(os.path.join(directory, f'{file_id}.txt'), str(file_id))
+
+    destination_path = tmp_path / 'extracted'
+    extract_archive(archive_path, destination_path, remove_top_level=False, max_workers=4)
+
+    result_files = {
+        str(file.relative_to(destination_path))
+        for file in destination_path.rglob('*') if file.is_file()
+    }
+    assert result_files == {
+        os.path.join(directory, f'{file_id}.txt')
+        for directory in ('a', 'b', os.path.join('b', 'c'))
+        for file_id in range(10)
+    }
+
+
+def test_extract_archive_zip_max_workers_tolerates_concurrently_created_directory(tmp_path):
+    archive_path = tmp_path / 'race.zip'
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        for file_id in range(10):
+            archive.writestr(os.path.join('a', 'b', f'{file_id}.txt'), str(file_id))
+
+    makedirs = os.makedirs
+    n_calls = []
+
+    def makedirs_after_other_thread(name, *args, **kwargs):
+        # The first directory is created by another thread right before this one.
+        makedirs(name, *args, **kwargs)
+        n_calls.append(name)
+        if len(n_calls) == 1:
+            raise FileExistsError(name)
+
+    destination_path = tmp_path / 'extracted'
+    with mock.patch('os.makedirs', side_effect=makedirs_after_other_thread):
+        extract_archive(archive_path, destination_path, remove_top_level=False, max_workers=4)
+
+    assert n_calls
+    assert sorted(file.name for file in (destination_path / 'a' / 'b').iterdir()) == [
+        f'{file_id}.txt' for file_id in range(10)
+    ]
+
+
+def test_extract_archive_max_workers_extracts_nested_archives_with_single_thread(tmp_path):
+    archive_path = tmp_path / 'outer.zip'
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        for nested_id in range(3):
+            nested_archive_path = tmp_path / f'nested_{nested_id}.zip'
+            with zipfile.ZipFile(nested_archive_path, 'w') as nested_archive:
+                for file_id in range(3):
+                    nested_archive.writestr(f'{file_id}.txt', str(file_id))
+            archive.write(nested_archive_path, arcname=f'nested_{nested_id}.zip')
+            nested_archive_path.unlink()
+
+    destination_path = tmp_path / 'extracted'
+    with mock.patch(
+            'pymovements.dataset._utils._archives.extract_archive', wraps=extract_archive,
+    ) as nested_extract_archive:
+        extract_archive(archive_path, destination_path, remove_top_level=False, max_workers=4)
+
+    assert nested_extract_archive.call_count == 3
+    assert all(call.kwargs['max_workers'] == 1 for call in nested_extract_archive.call_args_list)
+    assert len(list(destination_path.rglob('*.txt'))) == 9
+
+
+@pytest.mark.parametrize('max_workers', [0, -1])
+def test_extract_archive_invalid_max_workers_raises_value_error(archive, max_workers):
+    with pytest.raises(ValueError, match='max_workers must be positive'):
+        extract_archive(archive, max_workers=max_workers)
+
+
+def test_list_archive_members(subjects_archive):
+    assert sorted(list_archive_members(subjects_archive)) == [
+        os.path.join('subjects', 'nested.zip'),
+        os.path.join('subjects', 'readme.txt'),
+        os.path.join('subjects', 'subject_1.csv'),
+        os.path.join('subjects', 'subject_2.csv'),
+    ]
+
+
+def test_open_archive_member_reads_member(subjects_archive, tmp_path):
+    member_name = os.path.join('subjects', 'subject_2.csv')
+
+    with open_archive_member(subjects_archive, member_name) as member_file:
+        assert member_file.read() == b'data 2'
+
+    assert not (tmp_path / 'subjects').exists()
+
+
+def test_open_archive_member_tar_index_updates_for_modified_archive(tmp_path):
+    archive_path = tmp_path / 'subjects.tar.gz'
+    filepath = tmp_path / 'subject.csv'
+    for data in ('first', 'second version'):
+        filepath.write_text(data)
+        with tarfile.open(archive_path, 'w:gz') as archive:
+            archive.add(filepath, arcname='subject.csv')
+        os.utime(archive_path, ns=(len(data), len(data)))
+
+        with open_archive_member(archive_path, 'subject.csv') as member_file:
+            assert member_file.read().decode() == data
+
+
+@pytest.mark.parametrize('member_name', ['missing.csv', 'subjects'])
+def test_open_archive_member_raises_file_not_found_error(subjects_archive, member_name):
+    with pytest.raises(FileNotFoundError, match=f"No member '{member_name}'"):
+        with open_archive_member(subjects_archive, member_name):
+            pass
+
+
+def test_list_archive_members_compressed_file_raises_unknown_file_type(compressed_file):
+    with pytest.raises(UnknownFileType, match='is a compressed file but not an archive'):
+        list_archive_members(compressed_file)
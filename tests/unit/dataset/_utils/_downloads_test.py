@@ -19,11 +19,14 @@
 # SOFTWARE.
 """Test pymovements utils downloads."""
 import hashlib
+import json
 import os.path
 from unittest import mock
+from urllib.error import HTTPError
 
 import pytest
 
+from pymovements.dataset._utils._downloads import _download_url
 from pymovements.dataset._utils._downloads import _DownloadProgressBar
 from pymovements.dataset._utils._downloads import _get_redirected_url
 from pymovements.dataset._utils._downloads import download_file
@@ -149,13 +152,165 @@ def test__get_redirected_url_with_redirects_max_hops():
         'https://codeload.github.com/aeye-lab/pymovements/zip/main.'
 
 
-def test__DownloadProgressBar_tsize_not_None():
-    download_progress_bar = _DownloadProgressBar()
-    assert download_progress_bar.n == 0
-    assert download_progress_bar.total is None
-    download_progress_bar.update_to()
-    assert download_progress_bar.n == 1
-    assert download_progress_bar.total is None
-    download_progress_bar.update_to(tsize=100)
-    assert download_progress_bar.n == 1
-    assert download_progress_bar.total == 100
+def test_download_file_from_local_server(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+
+    filepath = download_file(
+        url, tmp_path / 'downloads', 'file.bin', hashlib.md5(content).hexdigest(), verbose=False,
+    )
+
+    assert filepath.read_bytes() == content
+    assert not (tmp_path / 'downloads' / 'file.bin.part').exists()
+
+
+def test_download_url_resumes_part_file(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+    destination = tmp_path / 'file.bin'
+    destination.with_name('file.bin.part').write_bytes(content[:4000])
+
+    _download_url(url, destination, verbose=False)
+
+    assert destination.read_bytes() == content
+    assert http_server.requests[-1][1]['Range'] == 'bytes=4000-'
+
+
+def test_download_url_restarts_if_range_not_supported(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+    http_server.supports_range = False
+    destination = tmp_path / 'file.bin'
+    destination.with_name('file.bin.part').write_bytes(b'x' * 4000)
+
+    _download_url(url, destination, verbose=False)
+
+    assert destination.read_bytes() == content
+
+
+def test_download_url_restarts_if_range_not_satisfiable(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+    destination = tmp_path / 'file.bin'
+    destination.with_name('file.bin.part').write_bytes(b'x' * 20_000)
+
+    _download_url(url, destination, verbose=False)
+
+    assert destination.read_bytes() == content
+
+
+def test_download_url_restarts_if_content_range_does_not_match_part_file(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+    http_server.content_range_start = 2000
+    destination = tmp_path / 'file.bin'
+    destination.with_name('file.bin.part').write_bytes(content[:4000])
+
+    _download_url(url, destination, verbose=False)
+
+    assert destination.read_bytes() == content
+    assert 'Range' not in http_server.requests[-1][1]
+
+
+def test_download_url_keeps_part_file_on_interruption(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+    destination = tmp_path / 'file.bin'
+
+    class InterruptedProgressBar(_DownloadProgressBar):  # pylint: disable=inconsistent-mro
+        n_bytes = 0
+
+        def update(self, n=1):
+            InterruptedProgressBar.n_bytes += n
+            if InterruptedProgressBar.n_bytes > 5000:
+                raise ConnectionResetError()
+            return super().update(n)
+
+    with mock.patch(
+        'pymovements.dataset._utils._downloads._DownloadProgressBar', InterruptedProgressBar,
+    ):
+        with pytest.raises(ConnectionResetError):
+            _download_url(url, destination, verbose=False, chunk_size=1000)
+
+    part_content = destination.with_name('file.bin.part').read_bytes()
+    assert 0 < len(part_content) < len(content)
+    assert content.startswith(part_content)
+    assert not destination.exists()
+
+    _download_url(url, destination, verbose=False, chunk_size=1000)
+
+    assert destination.read_bytes() == content
+
+
+def test_download_url_404_raises_http_error(tmp_path, http_server):
+    with pytest.raises(HTTPError):
+        _download_url(f'{http_server.url}/missing.bin', tmp_path / 'missing.bin', verbose=False)
+
+
+def test_download_file_does_not_read_downloaded_file_for_md5(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+
+    with mock.patch(
+        'pymovements.dataset._utils._downloads._calculate_md5',
+        side_effect=AssertionError('file has been read again'),
+    ):
+        filepath = download_file(
+            url, tmp_path, 'file.bin', hashlib.md5(content).hexdigest(), verbose=False,
+        )
+
+    verified = json.loads((tmp_path / 'file.bin.verified.json').read_text())
+    assert verified == {
+        'md5': hashlib.md5(content).hexdigest(),
+        'size': 10_000,
+        'mtime_ns': filepath.stat().st_mtime_ns,
+    }
+
+
+def test_download_file_resumed_download_has_correct_md5(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+    (tmp_path / 'file.bin.part').write_bytes(content[:4000])
+
+    download_file(url, tmp_path, 'file.bin', hashlib.md5(content).hexdigest(), verbose=False)
+
+    assert (tmp_path / 'file.bin').read_bytes() == content
+
+
+def test_download_file_skips_verified_file_without_hashing(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+    md5 = hashlib.md5(content).hexdigest()
+    download_file(url, tmp_path, 'file.bin', md5, verbose=False)
+    n_requests = len(http_server.requests)
+
+    with mock.patch(
+        'pymovements.dataset._utils._downloads._calculate_md5',
+        side_effect=AssertionError('file has been hashed again'),
+    ):
+        download_file(url, tmp_path, 'file.bin', md5, verbose=False)
+
+    assert len(http_server.requests) == n_requests
+
+
+def test_download_file_rehashes_modified_file(tmp_path, http_server):
+    content = os.urandom(10_000)
+    url = http_server.add_file('file.bin', content)
+    md5 = hashlib.md5(content).hexdigest()
+    download_file(url, tmp_path, 'file.bin', md5, verbose=False)
+    n_requests = len(http_server.requests)
+
+    (tmp_path / 'file.bin').write_bytes(os.urandom(10_000))
+    download_file(url, tmp_path, 'file.bin', md5, verbose=False)
+
+    assert len(http_server.requests) > n_requests
+    assert (tmp_path / 'file.bin').read_bytes() == content
+
+
+def test_download_file_invalid_md5_writes_no_verified_file(tmp_path, http_server):
+    url = http_server.add_file('file.bin', os.urandom(10_000))
+
+    with pytest.raises(RuntimeError, match='not found or download corrupted'):
+        download_file(url, tmp_path, 'file.bin', '00000000000000000000000000000000', verbose=False)
+
+    assert not (tmp_path / 'file.bin.verified.json').exists()
@@ -0,0 +1,176 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test pymovements preprocessing manifests."""
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from pymovements.dataset._utils._manifest import pipeline_fingerprint
+from pymovements.dataset._utils._manifest import PipelineManifest
+
+
+@pytest.mark.parametrize(
+    ('pipeline1', 'pipeline2', 'equal'),
+    [
+        pytest.param([('pix2deg', {})], [('pix2deg', {})], True, id='same'),
+        pytest.param(
+            [('pos2vel', {'a': 1, 'b': 2})], [('pos2vel', {'b': 2, 'a': 1})], True,
+            id='same_kwargs_different_order',
+        ),
+        pytest.param(
+            [('pix2deg', {}), ('pos2vel', {})], [('pos2vel', {}), ('pix2deg', {})], False,
+            id='different_order',
+        ),
+        pytest.param(
+            [('pos2vel', {'method': 'neighbors'})], [('pos2vel', {'method': 'fivepoint'})], False,
+            id='different_kwargs',
+        ),
+    ],
+)
+def test_pipeline_fingerprint(pipeline1, pipeline2, equal):
+    assert (pipeline_fingerprint(pipeline1) == pipeline_fingerprint(pipeline2)) is equal
+
+
+def test_pipeline_fingerprint_context():
+    pipeline = [('pix2deg', {})]
+    fingerprint_csv = pipeline_fingerprint(pipeline, extension='csv')
+    fingerprint_feather = pipeline_fingerprint(pipeline, extension='feather')
+    assert fingerprint_csv != fingerprint_feather
+
+
+@pytest.fixture(name='input_filepath')
+def fixture_input_filepath(tmp_path):
+    filepath = tmp_path / 'raw' / 'input.csv'
+    filepath.parent.mkdir()
+    filepath.write_text('a,b\n1,2\n')
+    return filepath
+
+
+@pytest.fixture(name='output_filepath')
+def fixture_output_filepath(tmp_path):
+    filepath = tmp_path / 'preprocessed' / 'input.feather'
+    filepath.parent.mkdir()
+    filepath.write_text('output')
+    return filepath
+
+
+def test_manifest_is_not_complete_without_record(tmp_path, input_filepath):
+    manifest = PipelineManifest(tmp_path / 'preprocessed' / 'manifest.json', 'abc')
+    input_hash = manifest.input_hash('input.csv', input_filepath)
+    assert not manifest.is_complete('input.csv', input_hash)
+
+
+def test_manifest_is_complete_after_reload(tmp_path, input_filepath, output_filepath):
+    manifest_filepath = tmp_path / 'preprocessed' / 'manifest.json'
+    manifest = PipelineManifest(manifest_filepath, 'abc')
+    input_hash = manifest.input_hash('input.csv', input_filepath)
+    manifest.mark_complete('input.csv', input_filepath, input_hash, [output_filepath])
+
+    manifest = PipelineManifest(manifest_filepath, 'abc')
+    assert manifest.records['input.csv']['outputs'] == ['input.feather']
+    assert manifest.is_complete('input.csv', input_hash)
+
+
+def test_manifest_is_not_complete_with_other_fingerprint(tmp_path, input_filepath, output_filepath):
+    manifest_filepath = tmp_path / 'preprocessed' / 'manifest.json'
+    manifest = PipelineManifest(manifest_filepath, 'abc')
+    input_hash = manifest.input_hash('input.csv', input_filepath)
+    manifest.mark_complete('input.csv', input_filepath, input_hash, [output_filepath])
+
+    manifest = PipelineManifest(manifest_filepath, 'def')
+    assert not manifest.is_complete('input.csv', input_hash)
+
+
+def test_manifest_is_not_complete_with_missing_output(tmp_path, input_filepath, output_filepath):
+    manifest = PipelineManifest(tmp_path / 'preprocessed' / 'manifest.json', 'abc')
+    input_hash = manifest.input_hash('input.csv', input_filepath)
+    manifest.mark_complete('input.csv', input_filepath, input_hash, [output_filepath])
+
+    output_filepath.unlink()
+    assert not manifest.is_complete('input.csv', input_hash)
+
+
+def test_manifest_input_hash_detects_changed_input(tmp_path, input_filepath, output_filepath):
+    manifest = PipelineManifest(tmp_path / 'preprocessed' / 'manifest.json', 'abc')
+    input_hash = manifest.input_hash('input.csv', input_filepath)
+    manifest.mark_complete('input.csv', input_filepath, input_hash, [output_filepath])
+
+    input_filepath.write_text('a,b\n3,4\n')
+    new_input_hash = manifest.input_hash('input.csv', input_filepath)
+
+    assert new_input_hash != input_hash
+    assert not manifest.is_complete('input.csv', new_input_hash)
+
+
+def test_manifest_input_hash_uses_record_for_unchanged_input(
+        tmp_path, input_filepath, output_filepath, monkeypatch,
+):
+    manifest = PipelineManifest(tmp_path / 'preprocessed' / 'manifest.json', 'abc')
+    input_hash = manifest.input_hash('input.csv', input_filepath)
+    manifest.mark_complete('input.csv', input_filepath, input_hash, [output_filepath])
+
+    def _raise(*args, **kwargs):
+        raise AssertionError('checksum must not be recalculated')
+
+    monkeypatch.setattr('pymovements.dataset._utils._manifest._calculate_md5', _raise)
+    assert manifest.input_hash('input.csv', input_filepath) == input_hash
+
+
+def test_manifest_input_hash_of_archive_member_equals_input_hash_of_file(
+        tmp_path, input_filepath,
+):
+    archive_path = tmp_path / 'raw.zip'
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.write(input_filepath, arcname='input.csv')
+
+    manifest = PipelineManifest(tmp_path / 'preprocessed' / 'manifest.json', 'abc')
+    member_hash = manifest.input_hash('input.csv', Path('input.csv'), archive_path=archive_path)
+
+    assert member_hash == manifest.input_hash('input.csv', input_filepath)
+
+
+def test_manifest_input_hash_detects_changed_archive(tmp_path, input_filepath, output_filepath):
+    archive_path = tmp_path / 'raw.zip'
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.write(input_filepath, arcname='input.csv')
+
+    manifest = PipelineManifest(tmp_path / 'preprocessed' / 'manifest.json', 'abc')
+    input_hash = manifest.input_hash('input.csv', Path('input.csv'), archive_path=archive_path)
+    manifest.mark_complete(
+        'input.csv', Path('input.csv'), input_hash, [output_filepath], archive_path=archive_path,
+    )
+    assert manifest.is_complete('input.csv', input_hash)
+
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.writestr('input.csv', 'a,b\n3,4\n')
+    new_input_hash = manifest.input_hash('input.csv', Path('input.csv'), archive_path=archive_path)
+
+    assert new_input_hash != input_hash
+    assert not manifest.is_complete('input.csv', new_input_hash)
+
+
+def test_manifest_write_leaves_no_temporary_file(tmp_path, input_filepath, output_filepath):
+    manifest = PipelineManifest(tmp_path / 'preprocessed' / 'manifest.json', 'abc')
+    input_hash = manifest.input_hash('input.csv', input_filepath)
+    manifest.mark_complete('input.csv', input_filepath, input_hash, [output_filepath])
+
+    assert sorted(os.listdir(tmp_path / 'preprocessed')) == ['input.feather', 'manifest.json']
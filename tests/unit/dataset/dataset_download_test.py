@@ -20,7 +20,10 @@
 """Test all download and extract functionality of pymovements.Dataset."""
 from __future__ import annotations
 
+import hashlib
 import shutil
+import threading
+import zipfile
 from pathlib import Path
 from unittest import mock
 
@@ -310,6 +313,7 @@ def test_dataset_download_both_mirrors_fail_gaze_only(
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://another_example.com/test.gz.tar',
@@ -317,6 +321,7 @@ def test_dataset_download_both_mirrors_fail_gaze_only(
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -348,6 +353,7 @@ def test_dataset_download_without_mirrors_fail_gaze_only(
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -380,6 +386,7 @@ def test_dataset_download_precomputed_events_both_mirrors_fail(
             filename='test_pc.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://another_example.com/test_pc.gz.tar',
@@ -387,6 +394,7 @@ def test_dataset_download_precomputed_events_both_mirrors_fail(
             filename='test_pc.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -418,6 +426,7 @@ def test_dataset_download_precomputed_events_without_mirrors_fail(
             filename='test_pc.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -450,6 +459,7 @@ def test_dataset_download_precomputed_reading_measures_both_mirrors_fail(
             filename='test_rm.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://another_example.com/test_rm.gz.tar',
@@ -457,6 +467,7 @@ def test_dataset_download_precomputed_reading_measures_both_mirrors_fail(
             filename='test_rm.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -488,6 +499,7 @@ def test_dataset_download_precomputed_reading_measures_without_mirrors_fail(
             filename='test_rm.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -519,6 +531,7 @@ def test_dataset_download_precomputed_and_gaze_both_mirrors_fail(
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://another_example.com/test.gz.tar',
@@ -526,6 +539,7 @@ def test_dataset_download_precomputed_and_gaze_both_mirrors_fail(
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -556,6 +570,7 @@ def test_dataset_download_precomputed_and_gaze_without_mirrors_fail(
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -579,6 +594,7 @@ def test_dataset_download_first_mirror_gaze_fails(mock_download_file, tmp_path,
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://another_example.com/test.gz.tar',
@@ -586,6 +602,7 @@ def test_dataset_download_first_mirror_gaze_fails(mock_download_file, tmp_path,
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -610,6 +627,7 @@ def test_dataset_download_first_mirror_precomputed_fails(
             filename='test_pc.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://another_example.com/test_pc.gz.tar',
@@ -617,6 +635,7 @@ def test_dataset_download_first_mirror_precomputed_fails(
             filename='test_pc.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -641,6 +660,7 @@ def test_dataset_download_first_mirror_precomputed_fails_rm(
             filename='test_rm.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://another_example.com/test_rm.gz.tar',
@@ -648,6 +668,7 @@ def test_dataset_download_first_mirror_precomputed_fails_rm(
             filename='test_rm.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -670,6 +691,7 @@ def test_dataset_download_first_mirror_fails(mock_download_file, tmp_path, datas
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://another_example.com/test.gz.tar',
@@ -677,6 +699,7 @@ def test_dataset_download_first_mirror_fails(mock_download_file, tmp_path, datas
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://example.com/test_pc.gz.tar',
@@ -684,6 +707,7 @@ def test_dataset_download_first_mirror_fails(mock_download_file, tmp_path, datas
             filename='test_pc.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
         mock.call(
             url='https://another_example.com/test_pc.gz.tar',
@@ -691,6 +715,7 @@ def test_dataset_download_first_mirror_fails(mock_download_file, tmp_path, datas
             filename='test_pc.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -721,6 +746,7 @@ def test_dataset_download_file_not_found(mock_download_file, tmp_path, dataset_d
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -750,6 +776,7 @@ def test_dataset_download_file_precomputed_not_found(
             filename='test_pc.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -777,6 +804,7 @@ def test_dataset_download_no_extract(mock_download_file, tmp_path, dataset_defin
             filename='test.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -801,6 +829,7 @@ def test_dataset_download_precomputed_no_extract(mock_download_file, tmp_path, d
             filename='test_pc.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -827,6 +856,7 @@ def test_dataset_download_precomputed_no_extract_rm(
             filename='test_rm.gz.tar',
             md5='52bbf03a7c50ee7152ccb9d357c2bb30',
             verbose=True,
+            position=None,
         ),
     ])
 
@@ -857,6 +887,8 @@ def test_dataset_extract_remove_finished_true_gaze(
             remove_top_level=False,
             resume=True,
             verbose=1,
+            member_filter=None,
+            max_workers=1,
         ),
     ])
 
@@ -887,6 +919,8 @@ def test_dataset_extract_rm(
             remove_top_level=True,
             resume=True,
             verbose=1,
+            member_filter=None,
+            max_workers=1,
         ),
     ])
 
@@ -917,6 +951,8 @@ def test_dataset_extract_remove_finished_true_both(
             remove_top_level=False,
             resume=True,
             verbose=1,
+            member_filter=None,
+            max_workers=1,
         ),
         mock.call(
             source_path=tmp_path / 'downloads' / 'test_pc.gz.tar',
@@ -926,6 +962,8 @@ def test_dataset_extract_remove_finished_true_both(
             remove_top_level=False,
             resume=True,
             verbose=1,
+            member_filter=None,
+            max_workers=1,
         ),
     ])
 
@@ -956,6 +994,8 @@ def test_dataset_extract_remove_finished_true_precomputed(
             remove_top_level=False,
             resume=True,
             verbose=1,
+            member_filter=None,
+            max_workers=1,
         ),
     ])
 
@@ -986,6 +1026,8 @@ def test_dataset_extract_remove_finished_false_both(
             remove_top_level=True,
             resume=True,
             verbose=1,
+            member_filter=None,
+            max_workers=1,
         ),
         mock.call(
             source_path=tmp_path / 'downloads' / 'test_pc.gz.tar',
@@ -995,6 +1037,8 @@ def test_dataset_extract_remove_finished_false_both(
             remove_top_level=True,
             resume=True,
             verbose=1,
+            member_filter=None,
+            max_workers=1,
         ),
     ])
 
@@ -1025,6 +1069,8 @@ def test_dataset_extract_remove_finished_false_gaze(
             remove_top_level=True,
             resume=True,
             verbose=1,
+            member_filter=None,
+            max_workers=1,
         ),
     ])
 
@@ -1055,6 +1101,8 @@ def test_dataset_extract_remove_finished_false_precomputed(
             remove_top_level=True,
             resume=True,
             verbose=1,
+            member_filter=None,
+            max_workers=1,
         ),
     ])
 
@@ -1331,3 +1379,148 @@ def test_extract_dataset_precomputed_rm_move_single_file(tmp_path, testfiles_dir
     )
 
     Dataset(definition, path=tmp_path).extract()
+
+
+@pytest.fixture(name='local_dataset_definition')
+def fixture_local_dataset_definition(http_server):
+    resources = []
+    for resource_id in range(3):
+        content = f'subject_id,x\n{resource_id},0.0\n'.encode()
+        http_server.add_file(f'{resource_id}.csv', content)
+        resources.append({
+            'content': 'gaze',
+            'url': f'{http_server.url}/{resource_id}.csv',
+            'filename': f'{resource_id}.csv',
+            'md5': hashlib.md5(content).hexdigest(),
+        })
+    return DatasetDefinition(name='CustomPublicDataset', resources=resources)
+
+
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_dataset_download_from_local_server(local_dataset_definition, tmp_path, max_workers):
+    dataset = Dataset(local_dataset_definition, path=DatasetPaths(root=tmp_path, dataset='.'))
+
+    dataset.download(extract=False, max_workers=max_workers, verbose=0)
+
+    for resource_id in range(3):
+        filepath = tmp_path / 'downloads' / f'{resource_id}.csv'
+        assert filepath.read_text() == f'subject_id,x\n{resource_id},0.0\n'
+
+
+@mock.patch('pymovements.dataset.dataset_download.download_file')
+def test_dataset_download_max_workers_downloads_concurrently(
+        mock_download_file, local_dataset_definition, tmp_path,
+):
+    # Each download only finishes if all three downloads are running at the same time.
+    barrier = threading.Barrier(3, timeout=10)
+    mock_download_file.side_effect = lambda **kwargs: barrier.wait()
+    dataset = Dataset(local_dataset_definition, path=DatasetPaths(root=tmp_path, dataset='.'))
+
+    dataset.download(extract=False, max_workers=3, verbose=0)
+
+    assert mock_download_file.call_count == 3
+
+
+@mock.patch('pymovements.dataset.dataset_download.download_file')
+def test_dataset_download_max_workers_uses_distinct_progress_bar_positions(
+        mock_download_file, local_dataset_definition, tmp_path,
+):
+    barrier = threading.Barrier(3, timeout=10)
+    mock_download_file.side_effect = lambda **kwargs: barrier.wait()
+    dataset = Dataset(local_dataset_definition, path=DatasetPaths(root=tmp_path, dataset='.'))
+
+    dataset.download(extract=False, max_workers=3, verbose=0)
+
+    positions = [call.kwargs['position'] for call in mock_download_file.call_args_list]
+    assert sorted(positions) == [0, 1, 2]
+
+
+def test_dataset_download_max_workers_raises_failed_download(
+        local_dataset_definition, tmp_path,
+):
+    local_dataset_definition.resources[1].md5 = '00000000000000000000000000000000'
+    dataset = Dataset(local_dataset_definition, path=DatasetPaths(root=tmp_path, dataset='.'))
+
+    with pytest.raises(RuntimeError, match='downloading resource .*/1.csv failed'):
+        dataset.download(extract=False, max_workers=3, verbose=0)
+
+    assert (tmp_path / 'downloads' / '0.csv').is_file()
+    assert (tmp_path / 'downloads' / '2.csv').is_file()
+
+
+@pytest.mark.parametrize('max_workers', [0, -1])
+def test_dataset_download_raises_value_error_for_invalid_max_workers(
+        local_dataset_definition, tmp_path, max_workers,
+):
+    dataset = Dataset(local_dataset_definition, path=DatasetPaths(root=tmp_path, dataset='.'))
+
+    with pytest.raises(ValueError, match='max_workers must be positive'):
+        dataset.download(max_workers=max_workers)
+
+
+@pytest.fixture(name='subject_archive_definition')
+def fixture_subject_archive_definition(tmp_path):
+    (tmp_path / 'downloads').mkdir(parents=True)
+    with zipfile.ZipFile(tmp_path / 'downloads' / 'gaze.zip', 'w') as archive:
+        for subject_id in range(1, 5):
+            archive.writestr(f'gaze/subject_{subject_id}.csv', f'x\n{subject_id}\n')
+        archive.writestr('gaze/readme.txt', 'readme')
+
+    return DatasetDefinition(
+        name='CustomPublicDataset',
+        resources=[
+            {
+                'content': 'gaze',
+                'filename': 'gaze.zip',
+                'filename_pattern': 'subject_{subject_id:d}.csv',
+                'filename_pattern_schema_overrides': {'subject_id': int},
+            },
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    ('subset', 'expected_filenames'),
+    [
+        pytest.param(
+            None,
+            {'readme.txt', 'subject_1.csv', 'subject_2.csv', 'subject_3.csv', 'subject_4.csv'},
+            id='none',
+        ),
+        pytest.param(
+            {},
+            {'subject_1.csv', 'subject_2.csv', 'subject_3.csv', 'subject_4.csv'},
+            id='empty',
+        ),
+        pytest.param({'subject_id': 2}, {'subject_2.csv'}, id='single_value'),
+        pytest.param({'subject_id': [1, 3]}, {'subject_1.csv', 'subject_3.csv'}, id='list'),
+        pytest.param({'subject_id': range(3, 10)}, {'subject_3.csv', 'subject_4.csv'}, id='range'),
+    ],
+)
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_dataset_extract_subset(
+        subject_archive_definition, tmp_path, subset, expected_filenames, max_workers,
+):
+    dataset = Dataset(subject_archive_definition, path=DatasetPaths(root=tmp_path, dataset='.'))
+
+    dataset.extract(subset=subset, max_workers=max_workers, verbose=0)
+
+    extracted_filenames = {path.name for path in (tmp_path / 'raw').rglob('*') if path.is_file()}
+    assert extracted_filenames == expected_filenames
+
+
+def test_dataset_extract_subset_scan_finds_subset(subject_archive_definition, tmp_path):
+    dataset = Dataset(subject_archive_definition, path=DatasetPaths(root=tmp_path, dataset='.'))
+
+    dataset.extract(subset={'subject_id': [1, 4]}, verbose=0).scan()
+
+    assert dataset.fileinfo['gaze']['subject_id'].to_list() == [1, 4]
+
+
+def test_dataset_extract_subset_raises_value_error_for_unknown_key(
+        subject_archive_definition, tmp_path,
+):
+    dataset = Dataset(subject_archive_definition, path=DatasetPaths(root=tmp_path, dataset='.'))
+
+    with pytest.raises(ValueError, match='subset key session_id must be a named group'):
+        dataset.extract(subset={'session_id': 1}, verbose=0)
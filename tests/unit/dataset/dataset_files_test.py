@@ -336,7 +336,7 @@ def test_load_gaze_file_unsupported_load_function(make_example_file):
     msg, = exc.value.args
     assert msg == (
         'Unsupported load_function "from_a_land_down_under". '
-        'Available options are: [\'from_csv\', \'from_ipc\', \'from_asc\']'
+        'Available options are: [\'from_csv\', \'from_ipc\', \'from_parquet\', \'from_asc\']'
     )
 
 
@@ -121,3 +121,57 @@ def test__add_shipped_datasets():
     with mock.patch('pymovements.dataset.dataset_library._add_shipped_datasets') as mock_add:
         dataset_library._add_shipped_datasets()
         mock_add.assert_called_once()
+
+
+def test__add_shipped_datasets_does_not_parse_definitions(monkeypatch):
+    monkeypatch.setattr(DatasetLibrary, 'definitions', dataset_library._DatasetDefinitions())
+
+    with mock.patch.object(DatasetDefinition, 'from_yaml') as mock_from_yaml:
+        dataset_library._add_shipped_datasets()
+
+        assert 'ToyDataset' in DatasetLibrary.names()
+        mock_from_yaml.assert_not_called()
+
+
+def test_shipped_definition_is_parsed_once_on_first_get(monkeypatch):
+    monkeypatch.setattr(DatasetLibrary, 'definitions', dataset_library._DatasetDefinitions())
+    dataset_library._add_shipped_datasets()
+
+    with mock.patch.object(
+            DatasetDefinition, 'from_yaml', wraps=DatasetDefinition.from_yaml,
+    ) as mock_from_yaml:
+        first_definition = DatasetLibrary.get('ToyDataset')
+        second_definition = DatasetLibrary.get('ToyDataset')
+
+    mock_from_yaml.assert_called_once()
+    assert first_definition.name == 'ToyDataset'
+    assert first_definition == second_definition
+
+
+@pytest.mark.parametrize('name', DatasetLibrary.names())
+def test_shipped_definition_name_matches_registered_name(name):
+    assert DatasetLibrary.get(name).name == name
+
+
+def test_read_definition_name_with_multiline_name(tmp_path):
+    filepath = tmp_path / 'definition.yaml'
+    filepath.write_text('long_name: Custom dataset\nname:\n  CustomDataset\n', encoding='utf-8')
+
+    assert dataset_library._read_definition_name(filepath) == 'CustomDataset'
+
+
+def test_definitions_add_file_replaces_definition(tmp_path):
+    filepath = tmp_path / 'definition.yaml'
+    with open(filepath, 'w', encoding='utf-8') as f:
+        yaml.dump({'name': 'CustomDataset', 'long_name': 'From file'}, f)
+
+    definitions = dataset_library._DatasetDefinitions()
+    definitions['CustomDataset'] = DatasetDefinition(name='CustomDataset', long_name='In memory')
+    definitions.add_file('CustomDataset', filepath)
+
+    assert len(definitions) == 1
+    assert list(definitions) == ['CustomDataset']
+    assert definitions['CustomDataset'].long_name == 'From file'
+
+    del definitions['CustomDataset']
+    assert 'CustomDataset' not in definitions
@@ -0,0 +1,313 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test Dataset.process."""
+import json
+import shutil
+import zipfile
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pymovements import Dataset
+from pymovements import DatasetDefinition
+from pymovements import DatasetPaths
+from pymovements import Experiment
+from pymovements import Gaze
+from pymovements import PipelineCache
+from pymovements.dataset import dataset_files
+
+
+def write_raw_gaze_file(filepath, n_samples=500, offset=0.0):
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame({
+        'time': np.arange(n_samples),
+        'x_pix': np.linspace(0, 10, n_samples) + offset,
+        'y_pix': np.linspace(0, 5, n_samples) + offset,
+    }).write_csv(filepath)
+
+
+@pytest.fixture(name='dataset')
+def fixture_dataset(tmp_path):
+    for subject_id in range(1, 4):
+        write_raw_gaze_file(tmp_path / 'raw' / f'{subject_id}.csv')
+
+    definition = DatasetDefinition(
+        name='ProcessTest',
+        experiment=Experiment(
+            screen_width_px=1280,
+            screen_height_px=1024,
+            screen_width_cm=38,
+            screen_height_cm=30.2,
+            distance_cm=68,
+            origin='upper left',
+            sampling_rate=1000,
+        ),
+        resources=[{
+            'content': 'gaze',
+            'filename_pattern': '{subject_id:d}.csv',
+            'filename_pattern_schema_overrides': {'subject_id': pl.Int64},
+        }],
+        time_column='time',
+        time_unit='ms',
+        pixel_columns=['x_pix', 'y_pix'],
+    )
+    return Dataset(definition, path=DatasetPaths(root=tmp_path, dataset='.'))
+
+
+PIPELINE = ['pix2deg', ('pos2vel', {'method': 'neighbors'}), 'ivt']
+
+
+def test_process_writes_preprocessed_and_event_files(dataset):
+    dataset.scan()
+    dataset.process(PIPELINE, verbose=0)
+
+    for subject_id in range(1, 4):
+        assert (dataset.paths.preprocessed / f'{subject_id}.feather').is_file()
+        assert (dataset.paths.events / f'{subject_id}.feather').is_file()
+    assert (dataset.paths.preprocessed / 'manifest.json').is_file()
+
+
+def test_process_without_event_detection_writes_no_event_files(dataset):
+    dataset.scan()
+    dataset.process(PIPELINE[:2], verbose=0)
+
+    assert not dataset.paths.events.exists()
+
+
+def test_process_events_can_be_loaded(dataset):
+    dataset.scan()
+    dataset.process(PIPELINE, verbose=0)
+
+    dataset.load(preprocessed=True, events=True)
+
+    for events in dataset.events:
+        assert events.frame['name'].unique().to_list() == ['fixation']
+
+
+def test_process_results_equal_apply(dataset):
+    dataset.scan()
+    dataset.process(PIPELINE[:2], verbose=0)
+
+    processed = Dataset(dataset.definition, path=dataset.paths).load(preprocessed=True)
+    expected = Dataset(dataset.definition, path=dataset.paths).load()
+    expected.pix2deg(verbose=False)
+    expected.pos2vel('neighbors', verbose=False)
+
+    for processed_gaze, expected_gaze in zip(processed.gaze, expected.gaze):
+        assert_frame_equal(
+            processed_gaze.samples, expected_gaze.samples, check_column_order=False,
+        )
+
+
+def test_process_skips_completed_files(dataset, monkeypatch):
+    dataset.scan()
+    dataset.process(PIPELINE, verbose=0)
+
+    processed = []
+    monkeypatch.setattr(
+        'pymovements.dataset.dataset_files.save_preprocessed_file',
+        lambda **kwargs: processed.append(kwargs['filepath']),
+    )
+    dataset.process(PIPELINE, verbose=0)
+
+    assert not processed
+
+
+def test_process_resumes_after_interruption(dataset, monkeypatch):
+    dataset.scan()
+
+    # Make the second file fail.
+    raw_filepath = dataset.paths.raw / '2.csv'
+    valid_content = raw_filepath.read_text()
+    raw_filepath.write_text('invalid')
+    with pytest.raises(Exception):
+        dataset.process(PIPELINE, verbose=0)
+    raw_filepath.write_text(valid_content)
+
+    manifest = json.loads((dataset.paths.preprocessed / 'manifest.json').read_text())
+    assert list(manifest['files']) == ['1.csv']
+
+    assert dataset_processed_filepaths(dataset, monkeypatch) == ['2.csv', '3.csv']
+
+
+def test_process_reprocesses_changed_and_new_files(dataset, monkeypatch):
+    dataset.scan()
+    dataset.process(PIPELINE, verbose=0)
+
+    write_raw_gaze_file(dataset.paths.raw / '2.csv', offset=10.0)
+    write_raw_gaze_file(dataset.paths.raw / '4.csv')
+    dataset.scan()
+
+    assert dataset_processed_filepaths(dataset, monkeypatch) == ['2.csv', '4.csv']
+
+
+def test_process_reprocesses_all_files_for_changed_pipeline(dataset, monkeypatch):
+    dataset.scan()
+    dataset.process(PIPELINE, verbose=0)
+
+    pipeline = ['pix2deg', ('pos2vel', {'method': 'fivepoint'}), 'ivt']
+    processed = dataset_processed_filepaths(dataset, monkeypatch, pipeline=pipeline)
+    assert processed == ['1.csv', '2.csv', '3.csv']
+
+
+def test_process_reprocesses_missing_outputs(dataset, monkeypatch):
+    dataset.scan()
+    dataset.process(PIPELINE, verbose=0)
+
+    (dataset.paths.events / '3.feather').unlink()
+
+    assert dataset_processed_filepaths(dataset, monkeypatch) == ['3.csv']
+
+
+def test_process_resume_false_reprocesses_all_files(dataset, monkeypatch):
+    dataset.scan()
+    dataset.process(PIPELINE, verbose=0)
+
+    processed = dataset_processed_filepaths(dataset, monkeypatch, resume=False)
+    assert processed == ['1.csv', '2.csv', '3.csv']
+
+
+def dataset_processed_filepaths(dataset, monkeypatch, pipeline=None, **kwargs):
+    processed = []
+    monkeypatch.setattr(
+        'pymovements.dataset.dataset_files.PipelineManifest.mark_complete',
+        lambda self, key, *args, **kwargs: processed.append(key),
+    )
+    dataset.process(PIPELINE if pipeline is None else pipeline, verbose=0, **kwargs)
+    return processed
+
+
+@pytest.mark.parametrize(
+    ('pipeline', 'exception', 'message'),
+    [
+        pytest.param(
+            'foobar', ValueError, "unsupported method 'foobar'",
+            id='unknown_method',
+        ),
+        pytest.param(
+            [('pix2deg', 'foo')], TypeError,
+            'each pipeline step must be either a string or a tuple of a string and a '
+            "dictionary, but received ('pix2deg', 'foo')",
+            id='invalid_step',
+        ),
+    ],
+)
+def test_process_raises_on_invalid_pipeline(dataset, pipeline, exception, message):
+    dataset.scan()
+
+    with pytest.raises(exception) as excinfo:
+        dataset.process(pipeline, verbose=0)
+
+    assert excinfo.value.args[0] == message
+
+
+def move_raw_files_to_archive(dataset):
+    archive_path = dataset.paths.downloads / 'raw.zip'
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        for filepath in sorted(dataset.paths.raw.iterdir()):
+            archive.write(filepath, arcname=filepath.name)
+    shutil.rmtree(dataset.paths.raw)
+    dataset.definition.resources.filter('gaze')[0].filename = 'raw.zip'
+
+
+@pytest.mark.parametrize('use_cache', [False, True])
+def test_process_from_archives_equals_process(dataset, tmp_path, use_cache):
+    dataset.scan()
+    dataset.process(PIPELINE, verbose=0)
+    expected = Dataset(dataset.definition, path=dataset.paths).load(preprocessed=True, events=True)
+    shutil.rmtree(dataset.paths.preprocessed)
+    shutil.rmtree(dataset.paths.events)
+
+    move_raw_files_to_archive(dataset)
+    dataset.scan(from_archives=True)
+    cache = tmp_path / 'cache' if use_cache else None
+    dataset.process(PIPELINE, cache=cache, verbose=0)
+
+    processed = Dataset(dataset.definition, path=dataset.paths).load(
+        preprocessed=True, events=True, from_archives=True,
+    )
+    for processed_gaze, expected_gaze in zip(processed.gaze, expected.gaze):
+        assert_frame_equal(processed_gaze.samples, expected_gaze.samples)
+    for processed_events, expected_events in zip(processed.events, expected.events):
+        assert_frame_equal(processed_events.frame, expected_events.frame)
+
+
+def test_process_from_archives_skips_completed_files(dataset, monkeypatch):
+    move_raw_files_to_archive(dataset)
+    dataset.scan(from_archives=True)
+    dataset.process(PIPELINE, verbose=0)
+
+    assert not dataset_processed_filepaths(dataset, monkeypatch)
+
+
+def test_process_raises_on_invalid_extension(dataset):
+    dataset.scan()
+
+    with pytest.raises(ValueError, match='unsupported file format "txt"'):
+        dataset.process(PIPELINE, extension='txt', verbose=0)
+
+
+def test_process_with_cache_equals_process_without_cache(dataset, tmp_path):
+    dataset.scan()
+    dataset.process(PIPELINE, verbose=0)
+    expected = Dataset(dataset.definition, path=dataset.paths).load(preprocessed=True, events=True)
+
+    dataset.process(PIPELINE, cache=tmp_path / 'cache', resume=False, verbose=0)
+    dataset.process(PIPELINE, cache=tmp_path / 'cache', resume=False, verbose=0)
+    processed = Dataset(dataset.definition, path=dataset.paths).load(preprocessed=True, events=True)
+
+    for processed_gaze, expected_gaze in zip(processed.gaze, expected.gaze):
+        assert_frame_equal(processed_gaze.samples, expected_gaze.samples)
+    for processed_events, expected_events in zip(processed.events, expected.events):
+        assert_frame_equal(processed_events.frame, expected_events.frame)
+
+
+def test_process_with_cache_applies_only_uncached_steps(dataset, tmp_path, monkeypatch):
+    dataset.scan()
+    cache = PipelineCache(tmp_path / 'cache')
+    dataset.process(PIPELINE[:2], cache=cache, verbose=0)
+
+    applied = []
+    apply = Gaze.apply
+
+    def recording_apply(self, function, **kwargs):
+        applied.append(function)
+        return apply(self, function, **kwargs)
+
+    monkeypatch.setattr(Gaze, 'apply', recording_apply)
+    monkeypatch.setattr(dataset_files, 'load_gaze_file', None)
+    dataset.process(PIPELINE, cache=cache, verbose=0)
+
+    assert applied == ['ivt'] * 3
+
+
+def test_process_with_cache_reloads_changed_files(dataset, tmp_path):
+    dataset.scan()
+    cache = PipelineCache(tmp_path / 'cache')
+    dataset.process(PIPELINE, cache=cache, verbose=0)
+
+    write_raw_gaze_file(dataset.paths.raw / '2.csv', offset=1.0)
+    dataset.process(PIPELINE, cache=cache, verbose=0)
+
+    processed = Dataset(dataset.definition, path=dataset.paths).load(preprocessed=True)
+    assert processed.gaze[1].samples['pixel'].list.get(0)[0] == 1.0
@@ -20,6 +20,8 @@
 """Test all functionality in pymovements.dataset.dataset."""
 import os
 import shutil
+import tarfile
+import zipfile
 from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import Mock
@@ -36,6 +38,7 @@ from pymovements import DatasetPaths
 from pymovements import Events
 from pymovements import Experiment
 from pymovements import Gaze
+from pymovements.dataset import LazyGazeList
 from pymovements.events import fill
 from pymovements.events import idt
 from pymovements.events import ivt
@@ -517,6 +520,36 @@ def test_load_correct_fileinfo(gaze_dataset_configuration):
     assert_frame_equal(dataset.fileinfo['gaze'], expected_fileinfo['gaze'])
 
 
+def test_scan_with_index_correct_fileinfo(gaze_dataset_configuration):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    dataset.scan(use_index=True)
+    dataset.scan(use_index=True)
+
+    expected_fileinfo = gaze_dataset_configuration['fileinfo']
+    assert_frame_equal(dataset.fileinfo['gaze'], expected_fileinfo['gaze'])
+    assert (dataset.path / '.scan_index.json').is_file()
+
+
+def test_scan_max_workers_correct_fileinfo(gaze_dataset_configuration):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    dataset.scan(max_workers=4)
+
+    expected_fileinfo = gaze_dataset_configuration['fileinfo']
+    assert_frame_equal(dataset.fileinfo['gaze'], expected_fileinfo['gaze'])
+
+
+def test_load_with_index_finds_new_files(gaze_dataset_configuration):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    dataset.load(use_index=True)
+    n_files = len(dataset.fileinfo['gaze'])
+
+    filepath = dataset.paths.raw / dataset.fileinfo['gaze']['filepath'][0]
+    shutil.copy(filepath, filepath.parent / '9999.csv')
+    dataset.load(use_index=True)
+
+    assert len(dataset.fileinfo['gaze']) == n_files + 1
+
+
 def test_load_correct_raw_gazes(gaze_dataset_configuration):
     dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
     dataset.load()
@@ -530,6 +563,144 @@ def test_load_correct_raw_gazes(gaze_dataset_configuration):
         )
 
 
+def test_load_lazy_equals_load(gaze_dataset_configuration):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    dataset.load(lazy=True, max_memory=0)
+
+    assert isinstance(dataset.gaze, LazyGazeList)
+    expected_gazes = gaze_dataset_configuration['raw_gazes']
+    assert len(dataset.gaze) == len(expected_gazes)
+    for result_gaze, expected_gaze in zip(dataset.gaze, expected_gazes):
+        assert_frame_equal(
+            result_gaze.samples,
+            expected_gaze.samples,
+            check_column_order=False,
+        )
+
+
+def test_load_lazy_spill_keeps_transformations(gaze_dataset_configuration):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    dataset.load(lazy=True, max_memory=0, spill=True)
+
+    dataset.pix2deg(verbose=False)
+
+    assert dataset.gaze.held_indices == [len(dataset.gaze) - 1]
+    for gaze in dataset.gaze:
+        assert 'position' in gaze.columns
+
+
+def move_raw_files_to_archive(dataset, archive_filename):
+    archive_path = dataset.paths.downloads / archive_filename
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    raw_filepaths = sorted(path for path in dataset.paths.raw.rglob('*') if path.is_file())
+
+    if archive_filename.endswith('.zip'):
+        with zipfile.ZipFile(archive_path, 'w') as archive:
+            for filepath in raw_filepaths:
+                archive.write(filepath, arcname=f'raw/{filepath.relative_to(dataset.paths.raw)}')
+    else:
+        with tarfile.open(archive_path, 'w:gz') as archive:
+            for filepath in raw_filepaths:
+                archive.add(filepath, arcname=f'raw/{filepath.relative_to(dataset.paths.raw)}')
+
+    shutil.rmtree(dataset.paths.raw)
+    dataset.definition.resources.filter('gaze')[0].filename = archive_filename
+
+
+@pytest.mark.parametrize('archive_filename', ['raw.zip', 'raw.tar.gz'])
+def test_load_from_archives_equals_load(gaze_dataset_configuration, archive_filename):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    move_raw_files_to_archive(dataset, archive_filename)
+
+    dataset.load(from_archives=True)
+
+    assert not dataset.paths.raw.exists()
+    expected_fileinfo = gaze_dataset_configuration['fileinfo']['gaze']
+    assert_frame_equal(
+        dataset.fileinfo['gaze'].select(expected_fileinfo.columns).drop('filepath'),
+        expected_fileinfo.drop('filepath'),
+    )
+    assert dataset.fileinfo['gaze']['archive'].unique().to_list() == [archive_filename]
+
+    expected_gazes = gaze_dataset_configuration['raw_gazes']
+    assert len(dataset.gaze) == len(expected_gazes)
+    for result_gaze, expected_gaze in zip(dataset.gaze, expected_gazes):
+        assert_frame_equal(
+            result_gaze.samples,
+            expected_gaze.samples,
+            check_column_order=False,
+        )
+        assert result_gaze.trial_columns == gaze_dataset_configuration['trial_columns']
+
+
+def test_load_from_archives_subset_and_save_preprocessed(gaze_dataset_configuration):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    move_raw_files_to_archive(dataset, 'raw.zip')
+
+    dataset.load(from_archives=True, subset={'subject_id': [1, 2]}, lazy=True)
+    dataset.pix2deg(verbose=False)
+    dataset.save_preprocessed(preprocessed_dirname='from_archive')
+
+    assert dataset.fileinfo['gaze']['subject_id'].to_list() == [1, 2]
+    assert (dataset.path / 'from_archive' / 'raw' / '1.feather').is_file()
+
+
+@pytest.mark.parametrize('extension', ['feather', 'parquet'])
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_ingest_from_archives_equals_load(gaze_dataset_configuration, extension, max_workers):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    move_raw_files_to_archive(dataset, 'raw.zip')
+
+    dataset.ingest(
+        preprocessed_dirname='ingested', extension=extension, max_workers=max_workers, verbose=0,
+    )
+
+    # Fileinfo columns are kept as partition columns in the converted files.
+    converted_filepaths = sorted((dataset.path / 'ingested').rglob(f'*.{extension}'))
+    assert len(converted_filepaths) == len(dataset.fileinfo['gaze'])
+    converted_samples = pl.read_ipc if extension == 'feather' else pl.read_parquet
+    assert 'subject_id' in converted_samples(converted_filepaths[0]).columns
+
+    dataset.load(
+        preprocessed=True, preprocessed_dirname='ingested', extension=extension,
+        from_archives=True,
+    )
+    expected_dataset = Dataset(dataset.definition, path=dataset.paths)
+    expected_dataset.load(from_archives=True)
+
+    assert len(dataset.gaze) == len(expected_dataset.gaze)
+    for result_gaze, expected_gaze in zip(dataset.gaze, expected_dataset.gaze):
+        assert_frame_equal(
+            result_gaze.samples,
+            expected_gaze.samples,
+            check_column_order=False,
+        )
+
+
+def test_ingest_subset_from_raw_directory(gaze_dataset_configuration):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+
+    dataset.ingest(subset={'subject_id': [1, 2]}, from_archives=False, verbose=0)
+
+    converted_filenames = {path.name for path in dataset.paths.preprocessed.glob('*.feather')}
+    assert {'1.feather', '2.feather'} <= converted_filenames
+    assert dataset.fileinfo['gaze']['subject_id'].to_list() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    ('ingest_kwargs', 'message'),
+    [
+        pytest.param({'extension': 'csv'}, 'unsupported file format "csv"', id='csv'),
+        pytest.param({'max_workers': 0}, 'max_workers must be positive', id='max_workers_0'),
+    ],
+)
+def test_ingest_raises_value_error(gaze_dataset_configuration, ingest_kwargs, message):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+
+    with pytest.raises(ValueError, match=message):
+        dataset.ingest(from_archives=False, **ingest_kwargs)
+
+
 def test_loaded_gazes_do_not_share_experiment_with_definition(gaze_dataset_configuration):
     dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
     dataset.load()
@@ -1731,6 +1902,24 @@ def test_event_dataframe_add_property_has_expected_height(
         assert events_df.frame.height == expected_height
 
 
+def test_compute_event_properties_equals_computing_them_per_gaze(gaze_dataset_configuration):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    dataset.load(preprocessed=True, events=True)
+    event_properties = ['amplitude', 'dispersion', 'location', 'peak_velocity']
+
+    expected_events = []
+    for gaze, events in zip(dataset.gaze, dataset.events):
+        gaze = gaze.clone()
+        gaze.events = events.clone()
+        gaze.compute_event_properties(event_properties)
+        expected_events.append(gaze.events.frame)
+
+    dataset.compute_event_properties(event_properties)
+
+    for gaze, expected_frame in zip(dataset.gaze, expected_events):
+        assert_frame_equal(gaze.events.frame, expected_frame)
+
+
 @pytest.mark.parametrize(
     ('property_kwargs', 'expected_schema'),
     [
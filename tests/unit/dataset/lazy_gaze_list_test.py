@@ -0,0 +1,189 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test LazyGazeList."""
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import pymovements as pm
+from pymovements.dataset import LazyGazeList
+
+
+def make_gaze(index):
+    return pm.gaze.from_numpy(
+        time=np.arange(1000),
+        pixel=np.full((2, 1000), float(index)),
+        experiment=pm.Experiment(1280, 1024, 38, 30.2, 68, 'upper left', 1000),
+    )
+
+
+class RecordingLoader:
+    """Loader that records the indices of all loaded gazes."""
+
+    def __init__(self):
+        self.loaded = []
+
+    def __call__(self, index):
+        """Record the index and load the gaze."""
+        self.loaded.append(index)
+        return make_gaze(index)
+
+
+@pytest.fixture(name='loader')
+def fixture_loader():
+    return RecordingLoader()
+
+
+def gaze_size():
+    gaze = make_gaze(0)
+    return gaze.samples.estimated_size() + gaze.events.frame.estimated_size()
+
+
+def test_lazy_gaze_list_loads_on_first_access(loader):
+    gazes = LazyGazeList(loader, 3)
+    assert loader.loaded == []
+
+    gaze = gazes[1]
+
+    assert loader.loaded == [1]
+    assert gaze.samples['pixel'].list.get(0)[0] == 1.0
+    assert gazes[1] is gaze
+    assert loader.loaded == [1]
+
+
+def test_lazy_gaze_list_len_and_iter(loader):
+    gazes = LazyGazeList(loader, 3)
+
+    assert len(gazes) == 3
+    assert len(list(gazes)) == 3
+    assert loader.loaded == [0, 1, 2]
+
+
+def test_lazy_gaze_list_negative_index_and_slice(loader):
+    gazes = LazyGazeList(loader, 3)
+
+    assert gazes[-1] is gazes[2]
+    assert gazes[1:] == [gazes[1], gazes[2]]
+
+
+@pytest.mark.parametrize('index', [3, -4])
+def test_lazy_gaze_list_raises_index_error(loader, index):
+    gazes = LazyGazeList(loader, 3)
+
+    with pytest.raises(IndexError):
+        gazes[index]  # pylint: disable=pointless-statement
+
+
+def test_lazy_gaze_list_evicts_least_recently_used(loader):
+    gazes = LazyGazeList(loader, 3, max_memory=2 * gaze_size())
+
+    gazes[0]  # pylint: disable=pointless-statement
+    gazes[1]  # pylint: disable=pointless-statement
+    gazes[0]  # pylint: disable=pointless-statement
+    gazes[2]  # pylint: disable=pointless-statement
+
+    assert gazes.held_indices == [0, 2]
+    assert gazes.memory_usage <= gazes.max_memory
+
+    gazes[1]  # pylint: disable=pointless-statement
+    assert loader.loaded == [0, 1, 2, 1]
+
+
+def test_lazy_gaze_list_holds_most_recent_gaze_exceeding_max_memory(loader):
+    gazes = LazyGazeList(loader, 3, max_memory=0)
+
+    gaze = gazes[0]
+
+    assert gazes.held_indices == [0]
+    assert gazes[0] is gaze
+
+
+def test_lazy_gaze_list_eviction_without_spill_loses_modifications(loader):
+    gazes = LazyGazeList(loader, 2, max_memory=gaze_size())
+    gazes[0].pix2deg()
+    gazes[1]  # pylint: disable=pointless-statement
+
+    assert 'position' not in gazes[0].columns
+
+
+def test_lazy_gaze_list_spills_modified_gaze(loader, tmp_path):
+    spill_dirpaths = [tmp_path / 'spill' / str(index) for index in range(2)]
+    gazes = LazyGazeList(loader, 2, max_memory=gaze_size(), spill_dirpaths=spill_dirpaths)
+
+    gazes[0].pix2deg()
+    gazes[0].events = pm.Events(pl.DataFrame({'name': ['fixation'], 'onset': [0], 'offset': [9]}))
+    expected_samples = gazes[0].samples
+    expected_events = gazes[0].events.frame
+    gazes[1]  # pylint: disable=pointless-statement
+    assert gazes.held_indices == [1]
+    assert spill_dirpaths[0].is_dir()
+    assert not spill_dirpaths[1].exists()
+
+    gaze = gazes[0]
+
+    assert loader.loaded == [0, 1]
+    assert_frame_equal(gaze.samples, expected_samples)
+    assert_frame_equal(gaze.events.frame, expected_events)
+    assert gaze.experiment == make_gaze(0).experiment
+
+
+def test_lazy_gaze_list_does_not_spill_unmodified_gaze(loader, tmp_path):
+    spill_dirpaths = [tmp_path / 'spill' / str(index) for index in range(2)]
+    gazes = LazyGazeList(loader, 2, max_memory=gaze_size(), spill_dirpaths=spill_dirpaths)
+
+    gazes[0]  # pylint: disable=pointless-statement
+    gazes[1]  # pylint: disable=pointless-statement
+
+    assert not spill_dirpaths[0].exists()
+
+
+def test_lazy_gaze_list_removes_existing_spill_dirs(loader, tmp_path):
+    spill_dirpaths = [tmp_path / 'spill' / str(index) for index in range(2)]
+    spill_dirpaths[0].mkdir(parents=True)
+
+    LazyGazeList(loader, 2, spill_dirpaths=spill_dirpaths)
+
+    assert not spill_dirpaths[0].exists()
+
+
+def test_lazy_gaze_list_attaches_events(loader):
+    gazes = LazyGazeList(loader, 2)
+    events = [
+        pm.Events(pl.DataFrame({'name': [str(i)], 'onset': [0], 'offset': [1]}))
+        for i in range(2)
+    ]
+    gazes.events = events
+
+    assert gazes[1].events is events[1]
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'message'),
+    [
+        pytest.param({'max_memory': -1}, 'max_memory must not be negative', id='max_memory'),
+        pytest.param(
+            {'spill_dirpaths': []}, 'number of spill directories', id='spill_dirpaths',
+        ),
+    ],
+)
+def test_lazy_gaze_list_raises_value_error(loader, kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        LazyGazeList(loader, 2, **kwargs)
@@ -0,0 +1,169 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test PipelineCache."""
+import os
+import stat
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import pymovements as pm
+from pymovements.dataset import PipelineCache
+
+
+@pytest.fixture(name='gaze')
+def fixture_gaze():
+    gaze = pm.gaze.from_numpy(
+        time=np.arange(100),
+        pixel=np.ones((2, 100)),
+        experiment=pm.Experiment(1280, 1024, 38, 30.2, 68, 'upper left', 1000),
+        trial=np.repeat([1, 2], 50),
+        trial_columns='trial',
+    )
+    gaze.pix2deg()
+    gaze.events = pm.Events(
+        pl.DataFrame({'trial': [1], 'name': ['fixation'], 'onset': [0], 'offset': [10]}),
+        trial_columns='trial',
+    )
+    return gaze
+
+
+def test_pipeline_cache_get_missing_key_returns_none(tmp_path):
+    cache = PipelineCache(tmp_path)
+    assert cache.get('abcdef') is None
+
+
+def test_pipeline_cache_put_get_roundtrip(tmp_path, gaze):
+    cache = PipelineCache(tmp_path)
+    cache.put('abcdef', gaze)
+
+    cached_gaze = cache.get('abcdef')
+
+    assert_frame_equal(cached_gaze.samples, gaze.samples)
+    assert_frame_equal(cached_gaze.events.frame, gaze.events.frame)
+    assert cached_gaze.experiment == gaze.experiment
+    assert cached_gaze.trial_columns == gaze.trial_columns
+    assert cached_gaze.n_components == gaze.n_components
+
+
+def test_pipeline_cache_put_existing_key_keeps_entry(tmp_path, gaze):
+    cache = PipelineCache(tmp_path)
+    cache.put('abcdef', gaze)
+
+    other_gaze = gaze.clone()
+    other_gaze.samples = other_gaze.samples.head(1)
+    cache.put('abcdef', other_gaze)
+
+    assert_frame_equal(cache.get('abcdef').samples, gaze.samples)
+
+
+def test_pipeline_cache_without_experiment(tmp_path):
+    gaze = pm.Gaze(
+        pl.DataFrame({'time': [1, 2], 'x': [0.1, 0.2], 'y': [0.1, 0.2]}),
+        time_column='time',
+        position_columns=['x', 'y'],
+    )
+    cache = PipelineCache(tmp_path)
+    cache.put('abcdef', gaze)
+
+    assert cache.get('abcdef').experiment is None
+
+
+def test_pipeline_cache_evicts_least_recently_used(tmp_path, gaze):
+    cache = PipelineCache(tmp_path)
+    cache.put('aa0', gaze)
+    entry_size = cache.size
+    cache.max_size = 2 * entry_size
+
+    cache.put('bb0', gaze)
+    # Access first entry, so that the second entry becomes least recently used.
+    cache.get('aa0')
+    cache.put('cc0', gaze)
+
+    assert cache.get('aa0') is not None
+    assert cache.get('bb0') is None
+    assert cache.get('cc0') is not None
+    assert cache.size <= cache.max_size
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='file modes are not supported on windows')
+def test_pipeline_cache_entry_respects_umask(tmp_path, gaze):
+    umask = os.umask(0o022)
+    try:
+        cache = PipelineCache(tmp_path)
+        cache.put('abcdef', gaze)
+    finally:
+        os.umask(umask)
+
+    entry_dirpath = tmp_path / 'ab' / 'abcdef'
+    assert stat.S_IMODE(entry_dirpath.stat().st_mode) == 0o755
+
+
+def test_pipeline_cache_get_ignores_failing_utime(tmp_path, gaze, monkeypatch):
+    cache = PipelineCache(tmp_path)
+    cache.put('abcdef', gaze)
+
+    def raise_permission_error(*args, **kwargs):
+        raise PermissionError('entry of another user')
+
+    monkeypatch.setattr(os, 'utime', raise_permission_error)
+
+    assert_frame_equal(cache.get('abcdef').samples, gaze.samples)
+
+
+def test_pipeline_cache_raises_on_negative_max_size(tmp_path):
+    with pytest.raises(ValueError, match='max_size must not be negative'):
+        PipelineCache(tmp_path, max_size=-1)
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'other_kwargs'),
+    [
+        pytest.param(
+            {'input_hash': 'abc', 'pipeline': [('pix2deg', {})]},
+            {'input_hash': 'abd', 'pipeline': [('pix2deg', {})]},
+            id='input_hash',
+        ),
+        pytest.param(
+            {'input_hash': 'abc', 'pipeline': [('pix2deg', {}), ('pos2vel', {})]},
+            {'input_hash': 'abc', 'pipeline': [('pos2vel', {}), ('pix2deg', {})]},
+            id='order',
+        ),
+        pytest.param(
+            {'input_hash': 'abc', 'pipeline': [('pos2vel', {'method': 'preceding'})]},
+            {'input_hash': 'abc', 'pipeline': [('pos2vel', {'method': 'neighbors'})]},
+            id='kwargs',
+        ),
+        pytest.param(
+            {'input_hash': 'abc', 'pipeline': [], 'definition': {'name': 'a'}},
+            {'input_hash': 'abc', 'pipeline': [], 'definition': {'name': 'b'}},
+            id='context',
+        ),
+    ],
+)
+def test_pipeline_cache_key_differs(kwargs, other_kwargs):
+    assert PipelineCache.key(**kwargs) != PipelineCache.key(**other_kwargs)
+
+
+def test_pipeline_cache_key_is_deterministic():
+    pipeline = [('pos2vel', {'method': 'smooth', 'window_length': 7, 'degree': 2})]
+    assert PipelineCache.key('abc', pipeline) == PipelineCache.key('abc', list(pipeline))
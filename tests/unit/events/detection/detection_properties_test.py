@@ -0,0 +1,126 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test event properties computed during event detection."""
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pymovements import Events
+from pymovements.events.detection._properties import add_event_properties
+from pymovements.exceptions import InvalidProperty
+
+
+@pytest.fixture(name='positions')
+def fixture_positions():
+    return np.array(
+        [[0, 0], [1, 2], [np.nan, 4], [3, 1], [5, 5], [6, 6], [9, 7], [9, 9]],
+        dtype=np.float64,
+    )
+
+
+@pytest.mark.parametrize(
+    ('event_properties', 'expected_column'),
+    [
+        pytest.param(
+            'amplitude',
+            pl.Series('amplitude', [np.sqrt(3 ** 2 + 4 ** 2), np.sqrt(4 ** 2 + 4 ** 2)]),
+            id='amplitude',
+        ),
+        pytest.param(
+            'dispersion',
+            pl.Series('dispersion', [7.0, 8.0]),
+            id='dispersion',
+        ),
+        pytest.param(
+            'disposition',
+            pl.Series('disposition', [np.sqrt(3 ** 2 + 1 ** 2), np.sqrt(4 ** 2 + 4 ** 2)]),
+            id='disposition',
+        ),
+        pytest.param(
+            'location',
+            pl.Series('location', [[4 / 3, 1.75], [7.25, 6.75]]),
+            id='location_mean',
+        ),
+        pytest.param(
+            ('location', {'method': 'median'}),
+            pl.Series('location', [[1.0, 1.5], [7.5, 6.5]]),
+            id='location_median',
+        ),
+    ],
+)
+def test_add_event_properties_from_positions(event_properties, expected_column, positions):
+    events = Events(name='fixation', onsets=[0, 4], offsets=[3, 7])
+
+    events = add_event_properties(events, event_properties, [0, 4], [3, 7], positions=positions)
+
+    assert_frame_equal(events.frame.select(expected_column.name), expected_column.to_frame())
+
+
+@pytest.mark.parametrize('method', ['mean', 'median'])
+def test_add_event_properties_location_all_nan_component(method):
+    positions = np.array([[np.nan, 1], [np.nan, 3]], dtype=np.float64)
+    events = Events(name='fixation', onsets=[0], offsets=[1])
+
+    events = add_event_properties(
+        events, ('location', {'method': method}), [0], [1], positions=positions,
+    )
+
+    assert_frame_equal(
+        events.frame.select('location'),
+        pl.Series('location', [[np.nan, 2.0]]).to_frame(),
+    )
+
+
+def test_add_event_properties_peak_velocity():
+    velocities = np.array([[3, 4], [0, 1], [6, 8], [0, 0], [np.nan, 1], [1, 0]])
+    events = Events(name='saccade', onsets=[1, 4], offsets=[2, 5])
+
+    events = add_event_properties(events, 'peak_velocity', [1, 4], [2, 5], velocities=velocities)
+
+    assert events.frame['peak_velocity'].to_list() == [10.0, 1.0]
+
+
+def test_add_event_properties_duration_is_kept():
+    events = Events(name='fixation', onsets=[0], offsets=[3])
+
+    events = add_event_properties(events, 'duration', [0], [3])
+
+    assert events.frame.columns == ['name', 'onset', 'offset', 'duration']
+
+
+def test_add_event_properties_no_events(positions):
+    events = Events()
+
+    events = add_event_properties(events, ['location', 'dispersion'], [], [], positions=positions)
+
+    assert events.frame.schema['location'] == pl.List(pl.Float64)
+    assert events.frame.schema['dispersion'] == pl.Float64
+    assert len(events) == 0
+
+
+def test_add_event_properties_invalid_property_raises_exception():
+    with pytest.raises(InvalidProperty, match="property 'foo' is invalid"):
+        add_event_properties(Events(), 'foo', [], [])
+
+
+def test_add_event_properties_missing_array_raises_exception():
+    with pytest.raises(ValueError, match="event property 'peak_velocity' requires velocities"):
+        add_event_properties(Events(), 'peak_velocity', [], [], positions=np.zeros((1, 2)))
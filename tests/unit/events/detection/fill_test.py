@@ -89,6 +89,48 @@ from pymovements.events import fill
             ),
             id='fixation_10_ms_break_then_saccade_until_end_single_fill',
         ),
+        pytest.param(
+            {
+                'events': Events(
+                    name=['fixation', 'saccade', 'fixation'],
+                    onsets=[20, 30, 70],
+                    offsets=[40, 35, 80],
+                ),
+                'timesteps': np.arange(0, 100),
+            },
+            Events(
+                name='unclassified',
+                onsets=[0, 40, 80],
+                offsets=[19, 69, 99],
+            ),
+            id='overlapping_events_multiple_fills',
+        ),
+        pytest.param(
+            {
+                'events': Events(
+                    name='fixation', onsets=[-50, 20, 200], offsets=[10, 150, 300],
+                ),
+                'timesteps': np.arange(0, 100),
+            },
+            Events(
+                name='unclassified',
+                onsets=[10],
+                offsets=[19],
+            ),
+            id='events_exceeding_timesteps_single_fill',
+        ),
+        pytest.param(
+            {
+                'events': Events(name='fixation', onsets=[20], offsets=[60]),
+                'timesteps': np.arange(0, 100, 10),
+            },
+            Events(
+                name='unclassified',
+                onsets=[0, 60],
+                offsets=[10, 90],
+            ),
+            id='fixation_with_10_ms_sampling_interval_two_fills',
+        ),
     ],
 )
 def test_fill_fills_events(kwargs, expected):
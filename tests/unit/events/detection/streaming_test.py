@@ -0,0 +1,221 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test streaming event detection."""
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pymovements.events import idt
+from pymovements.events import ivt
+from pymovements.events import microsaccades
+from pymovements.events import StreamingIDT
+from pymovements.events import StreamingIVT
+from pymovements.events import StreamingMicrosaccades
+from pymovements.events.detection._streaming import _StreamingRunDetector
+
+
+@pytest.fixture(name='positions')
+def fixture_positions():
+    rng = np.random.default_rng(42)
+    steps = rng.normal(0, 0.05, size=(2000, 2))
+    steps[rng.random(2000) < 0.03] *= 100
+    positions = np.cumsum(steps, axis=0)
+    positions[[300, 301, 1200]] = np.nan
+    return positions
+
+
+@pytest.fixture(name='velocities')
+def fixture_velocities(positions):
+    return np.gradient(positions, axis=0) * 100
+
+
+def process_in_batches(detector, values, timesteps, batch_size):
+    frames = []
+    for batch_start in range(0, len(values), batch_size):
+        batch = slice(batch_start, batch_start + batch_size)
+        frames.append(detector.process(values[batch], timesteps[batch]).frame)
+    frames.append(detector.flush().frame)
+    return pl.concat(frames)
+
+
+@pytest.mark.parametrize('batch_size', [1, 7, 100, 2000])
+@pytest.mark.parametrize('include_nan', [False, True])
+def test_streaming_ivt_equals_ivt(velocities, batch_size, include_nan):
+    timesteps = np.arange(1000, 5000, 2)
+    kwargs = {'minimum_duration': 10, 'velocity_threshold': 5, 'include_nan': include_nan}
+    expected = ivt(velocities, timesteps, **kwargs)
+
+    detected = process_in_batches(StreamingIVT(**kwargs), velocities, timesteps, batch_size)
+
+    assert len(expected) > 0
+    assert_frame_equal(detected, expected.frame)
+
+
+@pytest.mark.parametrize('batch_size', [1, 7, 100, 2000])
+@pytest.mark.parametrize('include_nan', [False, True])
+def test_streaming_microsaccades_equals_microsaccades(velocities, batch_size, include_nan):
+    timesteps = np.arange(1000, 5000, 2)
+    kwargs = {'minimum_duration': 4, 'threshold_factor': 2, 'include_nan': include_nan}
+    expected = microsaccades(velocities, timesteps, threshold=(1., 1.), **kwargs)
+
+    detected = process_in_batches(
+        StreamingMicrosaccades((1., 1.), **kwargs), velocities, timesteps, batch_size,
+    )
+
+    assert len(expected) > 0
+    assert_frame_equal(detected, expected.frame)
+
+
+@pytest.mark.parametrize('batch_size', [1, 7, 100, 2000])
+@pytest.mark.parametrize('include_nan', [False, True])
+def test_streaming_idt_equals_idt(positions, batch_size, include_nan):
+    timesteps = np.arange(1000, 5000, 2)
+    kwargs = {'minimum_duration': 10, 'dispersion_threshold': 1.0, 'include_nan': include_nan}
+    expected = idt(positions, timesteps, **kwargs)
+
+    detected = process_in_batches(StreamingIDT(**kwargs), positions, timesteps, batch_size)
+
+    assert len(expected) > 0
+    assert_frame_equal(detected, expected.frame)
+
+
+@pytest.mark.parametrize(
+    ('detector', 'values'),
+    [
+        pytest.param(
+            StreamingIVT(minimum_duration=2, velocity_threshold=1),
+            np.zeros((10, 2)),
+            id='ivt',
+        ),
+        pytest.param(
+            StreamingMicrosaccades((1, 1), minimum_duration=2, threshold_factor=1),
+            np.full((10, 2), 5.),
+            id='microsaccades',
+        ),
+        pytest.param(
+            StreamingIDT(minimum_duration=2, dispersion_threshold=1),
+            np.zeros((10, 2)),
+            id='idt',
+        ),
+    ],
+)
+def test_streaming_detector_returns_last_event_on_flush(detector, values):
+    assert len(detector.process(values[:5])) == 0
+    assert len(detector.process(values[5:])) == 0
+
+    events = detector.flush()
+
+    assert events.frame.select('onset', 'offset').rows() == [(0, 9)]
+
+
+def test_streaming_ivt_returns_event_with_first_sample_above_threshold():
+    detector = StreamingIVT(minimum_duration=2, velocity_threshold=1)
+    assert len(detector.process(np.zeros((5, 2)))) == 0
+
+    events = detector.process(np.array([[0, 0], [5, 5]]))
+
+    assert events.frame.select('onset', 'offset').rows() == [(0, 5)]
+
+
+def test_streaming_idt_returns_event_with_first_sample_exceeding_dispersion():
+    detector = StreamingIDT(minimum_duration=2, dispersion_threshold=1)
+    assert len(detector.process(np.zeros((5, 2)))) == 0
+
+    events = detector.process(np.array([[0, 0], [5, 5], [5, 5]]))
+
+    assert events.frame.select('onset', 'offset').rows() == [(0, 6)]
+
+
+@pytest.mark.parametrize(
+    ('detector_class', 'kwargs', 'exception', 'message'),
+    [
+        pytest.param(
+            StreamingIVT,
+            {'velocity_threshold': 0},
+            ValueError,
+            'velocity threshold must be greater than 0',
+            id='ivt_velocity_threshold_zero',
+        ),
+        pytest.param(
+            StreamingMicrosaccades,
+            {'threshold': 'engbert2015'},
+            ValueError,
+            'threshold must be two-dimensional',
+            id='microsaccades_data_driven_threshold',
+        ),
+        pytest.param(
+            StreamingMicrosaccades,
+            {'threshold': (1, 2, 3)},
+            ValueError,
+            'threshold must be two-dimensional',
+            id='microsaccades_threshold_three_dimensional',
+        ),
+        pytest.param(
+            StreamingIDT,
+            {'dispersion_threshold': 0},
+            ValueError,
+            'dispersion_threshold must be greater than 0',
+            id='idt_dispersion_threshold_zero',
+        ),
+        pytest.param(
+            StreamingIDT,
+            {'minimum_duration': 1.5},
+            TypeError,
+            'minimum_duration must be of type int',
+            id='idt_minimum_duration_float',
+        ),
+    ],
+)
+def test_streaming_detector_init_raises_exception(detector_class, kwargs, exception, message):
+    with pytest.raises(exception, match=message):
+        detector_class(**kwargs)
+
+
+def test_streaming_idt_non_constant_interval_across_batches_raises_exception():
+    detector = StreamingIDT(minimum_duration=4, dispersion_threshold=1)
+    detector.process(np.zeros((3, 2)), timesteps=[0, 2, 4])
+
+    with pytest.raises(ValueError, match='interval between timesteps must be constant'):
+        detector.process(np.zeros((2, 2)), timesteps=[7, 9])
+
+
+def test_streaming_idt_starts_new_stream_after_flush(positions):
+    # The second stream is sampled at half the rate of the first stream.
+    timesteps = np.concatenate([np.arange(1000, 3000, 2), np.arange(5001, 9001, 4)])
+    kwargs = {'minimum_duration': 12, 'dispersion_threshold': 1.0}
+    expected = pl.concat([
+        idt(positions[:1000], timesteps[:1000], **kwargs).frame,
+        idt(positions[1000:], timesteps[1000:], **kwargs).frame,
+    ])
+
+    detector = StreamingIDT(**kwargs)
+    detected = pl.concat([
+        process_in_batches(detector, positions[:1000], timesteps[:1000], batch_size=100),
+        process_in_batches(detector, positions[1000:], timesteps[1000:], batch_size=100),
+    ])
+
+    assert_frame_equal(detected, expected)
+
+
+def test_streaming_run_detector_requires_candidate_mask():
+    with pytest.raises(TypeError, match='_candidate_mask'):
+        # pylint: disable-next=abstract-class-instantiated
+        _StreamingRunDetector(minimum_duration=1, include_nan=False, name='event')
@@ -747,3 +747,89 @@ def test_event_processor_process_exceptions(
     msg, = excinfo.value.args
     for msg_substring in msg_substrings:
         assert msg_substring.lower() in msg.lower()
+
+
+@pytest.fixture(name='make_recording')
+def fixture_make_recording():
+    def _make_recording(offset):
+        gaze = pm.Gaze(
+            pl.from_dict(
+                {
+                    'trial': np.repeat([2, 1], 50),
+                    'time': np.tile(np.arange(50), 2),
+                    'x_pos': np.arange(100, dtype=float) + offset,
+                    'y_pos': np.zeros(100),
+                    'x_vel': np.arange(100, dtype=float) + offset,
+                    'y_vel': np.zeros(100),
+                },
+            ),
+            position_columns=['x_pos', 'y_pos'],
+            velocity_columns=['x_vel', 'y_vel'],
+        )
+        events = pm.Events(
+            pl.from_dict({
+                'trial': [1, 1, 2, 3],
+                'name': ['fixation', 'saccade', 'fixation', 'fixation'],
+                'onset': [0, 5, 10, 0],
+                'offset': [20, 8, 30, 10],
+            }),
+        )
+        return events, gaze
+
+    return _make_recording
+
+
+def test_event_gaze_processor_process_batch_equals_process(make_recording):
+    recordings = [make_recording(offset) for offset in (0, 100, 200)]
+    processor = pm.EventGazeProcessor(
+        ['amplitude', 'dispersion', 'disposition', 'location', 'peak_velocity'],
+    )
+
+    results = processor.process_batch(
+        [events for events, _ in recordings],
+        [gaze for _, gaze in recordings],
+        identifiers='trial',
+    )
+
+    assert len(results) == 3
+    for result, (events, gaze) in zip(results, recordings):
+        assert_frame_equal(result, processor.process(events, gaze, identifiers='trial'))
+
+
+def test_event_gaze_processor_process_batch_expected_values(make_recording):
+    processor = pm.EventGazeProcessor(['peak_velocity', 'location'])
+    events, gaze = make_recording(100)
+
+    result = processor.process_batch([events], [gaze], identifiers='trial', name='fixation')[0]
+
+    expected = pl.from_dict(
+        {
+            'trial': [1, 2, 3],
+            'name': ['fixation', 'fixation', 'fixation'],
+            'onset': [0, 10, 0],
+            'offset': [20, 30, 10],
+            'peak_velocity': [170.0, 130.0, None],
+            'location': [[160.0, 0.0], [120.0, 0.0], None],
+        },
+        schema_overrides={'location': pl.List(pl.Float64)},
+    )
+    assert_frame_equal(result, expected)
+
+
+def test_event_gaze_processor_process_batch_recording_without_events(make_recording):
+    processor = pm.EventGazeProcessor('peak_velocity')
+    events, gaze = make_recording(0)
+    empty_events = pm.Events(pl.DataFrame(schema={'trial': pl.Int64}), trial_columns='trial')
+
+    results = processor.process_batch([empty_events, events], [gaze, gaze], identifiers='trial')
+
+    assert results[0].is_empty()
+    assert results[1]['peak_velocity'].to_list() == [70.0, 58.0, 30.0, None]
+
+
+def test_event_gaze_processor_process_batch_raises_on_length_mismatch(make_recording):
+    processor = pm.EventGazeProcessor('peak_velocity')
+    events, gaze = make_recording(0)
+
+    with pytest.raises(ValueError, match='number of events'):
+        processor.process_batch([events, events], [gaze], identifiers='trial')
@@ -1087,3 +1087,81 @@ def test_gaze_detect_missing_missing_eye_components_raises_exception(method, col
 
     msg, = exc_info.value.args
     assert msg == f'eye_components must not be None if passing {column} to event detection'
+
+
+@pytest.mark.parametrize(
+    ('method', 'kwargs'),
+    [
+        pytest.param('ivt', {'velocity_threshold': 30, 'minimum_duration': 20}, id='ivt'),
+        pytest.param('idt', {'dispersion_threshold': 5, 'minimum_duration': 20}, id='idt'),
+        pytest.param('microsaccades', {'minimum_duration': 2}, id='microsaccades'),
+    ],
+)
+def test_gaze_detect_event_properties_equals_compute_event_properties(method, kwargs):
+    rng = np.random.default_rng(42)
+    steps = rng.normal(0, 0.01, size=(1000, 2))
+    steps[rng.random(1000) < 0.02] *= 1000
+    gaze = pm.gaze.from_numpy(
+        trial=np.repeat([1, 2], 500),
+        time=np.arange(1000),
+        position=np.cumsum(steps, axis=0),
+        orient='row',
+        experiment=pm.Experiment(1024, 768, 38, 30, 60, 'center', 1000),
+    )
+    gaze.pos2vel()
+    event_properties = ['amplitude', 'dispersion', 'disposition', 'location', 'peak_velocity']
+
+    expected = gaze.clone()
+    expected.detect(method, **kwargs)
+    expected.compute_event_properties(event_properties)
+
+    gaze.detect(method, event_properties=event_properties, **kwargs)
+
+    assert len(gaze.events) > 0
+    assert_frame_equal(gaze.events.frame, expected.events.frame, check_exact=False)
+
+
+@pytest.mark.parametrize(
+    'event_properties',
+    [
+        pytest.param('location', id='mean'),
+        pytest.param(('location', {'method': 'median'}), id='median'),
+    ],
+)
+def test_gaze_detect_event_properties_with_nan_equals_compute_event_properties(event_properties):
+    position = np.full((100, 2), 1.0)
+    position[::10] += 0.001
+    position[50] = np.nan
+    velocity = np.zeros((100, 2))
+    velocity[50] = np.nan
+    gaze = pm.gaze.from_numpy(
+        trial=np.ones(100),
+        time=np.arange(100),
+        position=position,
+        velocity=velocity,
+        orient='row',
+        experiment=pm.Experiment(1024, 768, 38, 30, 60, 'center', 1000),
+    )
+
+    expected = gaze.clone()
+    expected.detect('ivt', include_nan=True, minimum_duration=10)
+    expected.compute_event_properties(event_properties)
+
+    gaze.detect('ivt', include_nan=True, minimum_duration=10, event_properties=event_properties)
+
+    assert len(gaze.events) == 1
+    assert_frame_equal(gaze.events.frame, expected.events.frame, check_exact=False)
+
+
+def test_gaze_detect_event_properties_without_position_column_raises_exception():
+    gaze = pm.gaze.from_numpy(
+        velocity=step_function(length=100, steps=[0], values=[(0, 0)]),
+        orient='row',
+        experiment=pm.Experiment(1024, 768, 38, 30, 60, 'center', 10),
+    )
+
+    with pytest.raises(ValueError) as exc_info:
+        gaze.detect('ivt', event_properties='location')
+
+    msg, = exc_info.value.args
+    assert msg == "event property 'location' requires positions"
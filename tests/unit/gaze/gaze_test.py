@@ -432,6 +432,106 @@ def test_gaze_split_example():
     assert len(gazes) == 5
 
 
+def test_gaze_split_keeps_experiment_trial_columns_and_n_components():
+    experiment = Experiment(1280, 1024, 38, 30, 68, 'upper left', 1000)
+    samples = pl.from_dict(
+        {'x': range(100), 'y': range(100), 'trial': np.repeat([1, 2, 3, 4, 5], 20)},
+    )
+    gaze = Gaze(
+        samples=samples, experiment=experiment, pixel_columns=['x', 'y'], trial_columns='trial',
+    )
+
+    for split_gaze in gaze.split():
+        assert split_gaze.experiment is experiment
+        assert split_gaze.trial_columns == ['trial']
+        assert split_gaze.n_components == 2
+        assert split_gaze.samples.columns == gaze.samples.columns
+
+
+def test_gaze_split_non_contiguous_trials_keeps_sample_order():
+    gaze = Gaze(
+        pl.from_dict({
+            'x': [0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+            'y': [0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+            'trial': [2, 1, 2, None, 1, None],
+        }),
+        pixel_columns=['x', 'y'],
+        trial_columns='trial',
+    )
+
+    split_gazes = gaze.split(as_dict=True)
+
+    assert list(split_gazes) == [(None,), (1,), (2,)]
+    for (trial,), split_gaze in split_gazes.items():
+        trial_filter = pl.col('trial').is_null() if trial is None else pl.col('trial') == trial
+        assert_frame_equal(split_gaze.samples, gaze.samples.filter(trial_filter))
+
+
+def test_gaze_split_events_are_independent():
+    gaze = Gaze(
+        pl.from_dict({'x': [0.0, 1.0, 2.0], 'y': [0.0, 1.0, 2.0], 'trial': [1, 1, 2]}),
+        pixel_columns=['x', 'y'],
+        trial_columns='trial',
+    )
+
+    first_gaze, second_gaze = gaze.split()
+    first_gaze.events.frame = first_gaze.events.frame.with_columns(marker=pl.lit(1))
+
+    assert 'marker' in first_gaze.events.frame.columns
+    assert 'marker' not in second_gaze.events.frame.columns
+    assert 'marker' not in gaze.events.frame.columns
+    assert second_gaze.events.frame.schema['trial'] == pl.Int64
+
+
+def test_gaze_clone_keeps_trial_columns_and_n_components():
+    gaze = Gaze(
+        pl.from_dict({'x': [0.0, 1.0], 'y': [0.0, 1.0], 'trial': [1, 2]}),
+        pixel_columns=['x', 'y'],
+        trial_columns='trial',
+    )
+
+    gaze_copy = gaze.clone()
+
+    assert gaze_copy == gaze
+    assert gaze_copy.trial_columns == ['trial']
+    assert gaze_copy.trial_columns is not gaze.trial_columns
+    assert gaze_copy.n_components == 2
+
+
+def test_gaze_from_validated_does_not_copy_samples_and_events():
+    gaze = Gaze(
+        pl.from_dict({'x': [0.0, 1.0], 'y': [0.0, float('nan')], 'trial': [1, 1]}),
+        pixel_columns=['x', 'y'],
+        trial_columns='trial',
+    )
+    events = Events(pl.from_dict({'trial': [1], 'name': ['fixation'], 'onset': [0], 'offset': [1]}))
+
+    validated_gaze = Gaze._from_validated(
+        gaze.samples,
+        experiment=None,
+        events=events,
+        trial_columns=['trial'],
+        n_components=2,
+    )
+
+    assert validated_gaze.samples is gaze.samples
+    assert validated_gaze.events is events
+    assert validated_gaze == Gaze(
+        gaze.samples, events=events, trial_columns='trial', auto_column_detect=True,
+    )
+
+
+def test_gaze_from_validated_creates_events_with_trial_columns():
+    samples = pl.DataFrame(schema={'trial': pl.Int8, 'pixel': pl.List(pl.Float64)})
+
+    gaze = Gaze._from_validated(
+        samples, experiment=None, trial_columns=['trial'],
+    )
+
+    assert gaze.events.frame.schema['trial'] == pl.Int8
+    assert gaze.events.trial_columns == ['trial']
+
+
 @pytest.mark.parametrize(
     ('gaze', 'by', 'expected_splits'),
     [
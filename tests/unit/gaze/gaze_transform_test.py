@@ -790,6 +790,42 @@ def fixture_experiment():
             ),
             id='pos2vel_preceding_trialize_single_column_str',
         ),
+        pytest.param(
+            {
+                'samples': pl.from_dict(
+                    {
+                        'trial_id': [1, 1, 1, 2, 2, 2],
+                        'time': [1000, 1001, 1002, 1003, 1004, 1005],
+                        'x_dva': [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+                        'y_dva': [1.0, 1.3, 1.6, 2.0, 2.3, 2.6],
+                    },
+                ),
+                'experiment': pm.Experiment(
+                    sampling_rate=1000,
+                    screen_width_px=100,
+                    screen_height_px=100,
+                    screen_width_cm=100,
+                    screen_height_cm=100,
+                    distance_cm=100,
+                    origin='upper left',
+                ),
+                'position_columns': ['x_dva', 'y_dva'],
+                'trial_columns': 'trial_id',
+            },
+            'smooth', {'method': 'moving_average', 'window_length': 3},
+            pm.Gaze(
+                samples=pl.from_dict(
+                    {
+                        'trial_id': [1, 1, 1, 2, 2, 2],
+                        'time': [1000, 1001, 1002, 1003, 1004, 1005],
+                        'x_dva': [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+                        'y_dva': [1.1, 1.3, 1.5, 2.1, 2.3, 2.5],
+                    },
+                ),
+                position_columns=['x_dva', 'y_dva'],
+            ),
+            id='smooth_moving_average_trialize_single_column_str',
+        ),
         pytest.param(
             {
                 'samples': pl.from_dict(
@@ -1330,6 +1366,60 @@ def test_gaze_clip_creates_new_column(experiment):
     assert 'pixel_new' in gaze.columns
 
 
+@pytest.mark.parametrize(
+    ('transform_method', 'kwargs'),
+    [
+        pytest.param('pos2vel', {'method': 'preceding'}, id='pos2vel_preceding'),
+        pytest.param('pos2vel', {'method': 'fivepoint'}, id='pos2vel_fivepoint'),
+        pytest.param(
+            'pos2vel', {'method': 'savitzky_golay', 'window_length': 5, 'degree': 2},
+            id='pos2vel_savitzky_golay',
+        ),
+        pytest.param(
+            'smooth', {'method': 'moving_average', 'window_length': 3},
+            id='smooth_moving_average',
+        ),
+        pytest.param(
+            'smooth', {'method': 'exponential_moving_average', 'window_length': 3},
+            id='smooth_exponential_moving_average',
+        ),
+    ],
+)
+def test_gaze_transform_non_contiguous_trials_equals_transform_per_trial(
+        experiment, transform_method, kwargs,
+):
+    rng = np.random.default_rng(42)
+    samples = pl.from_dict(
+        {
+            'trial': [1, 2, 1, 2] * 15,
+            'time': np.arange(1000, 1060),
+            'x_dva': rng.normal(size=60),
+            'y_dva': rng.normal(size=60),
+        },
+    )
+    gaze = pm.Gaze(
+        samples,
+        experiment=experiment,
+        time_column='time',
+        position_columns=['x_dva', 'y_dva'],
+        trial_columns='trial',
+    )
+
+    gaze.transform(transform_method, **kwargs)
+
+    expected_samples = []
+    for _, trial_samples in samples.group_by('trial', maintain_order=True):
+        trial_gaze = pm.Gaze(
+            trial_samples,
+            experiment=experiment,
+            time_column='time',
+            position_columns=['x_dva', 'y_dva'],
+        )
+        trial_gaze.transform(transform_method, **kwargs)
+        expected_samples.append(trial_gaze.samples)
+    assert_frame_equal(gaze.samples, pl.concat(expected_samples))
+
+
 @pytest.mark.parametrize(
     ('init_kwargs', 'exception', 'expected_msg'),
     [
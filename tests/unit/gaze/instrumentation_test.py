@@ -0,0 +1,285 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test Instrumentation."""
+import json
+
+import numpy as np
+import polars as pl
+import pytest
+
+import pymovements as pm
+from pymovements.gaze.instrumentation import file_context
+from pymovements.gaze.instrumentation import instrumented
+from pymovements.gaze.instrumentation import RECORD_SCHEMA
+
+
+@pytest.fixture(name='gaze')
+def fixture_gaze():
+    n_samples = 200
+    samples = pl.DataFrame({
+        'trial': np.repeat([1, 2], n_samples // 2),
+        'time': np.arange(n_samples),
+        **{
+            column: np.concatenate([np.full(100, 100.0), np.full(100, 500.0)])
+            for column in ('xl', 'yl', 'xr', 'yr')
+        },
+    })
+    return pm.Gaze(
+        samples,
+        experiment=pm.Experiment(1280, 1024, 38, 30.2, 68, 'upper left', 1000),
+        trial_columns='trial',
+        time_column='time',
+        time_unit='ms',
+        pixel_columns=['xl', 'yl', 'xr', 'yr'],
+    )
+
+
+@pytest.fixture(name='stimulus')
+def fixture_stimulus():
+    return pm.stimulus.TextStimulus(
+        pl.DataFrame({
+            'char': ['a', 'b'],
+            'top_left_x': [0, 400],
+            'top_left_y': [0, 400],
+            'width': [200, 200],
+            'height': [200, 200],
+        }),
+        aoi_column='char',
+        start_x_column='top_left_x',
+        start_y_column='top_left_y',
+        width_column='width',
+        height_column='height',
+    )
+
+
+def test_instrumentation_records_each_step(gaze, stimulus):
+    with pm.Instrumentation() as instrumentation:
+        gaze.pix2deg()
+        gaze.pos2vel(method='neighbors')
+        gaze.detect('idt', dispersion_threshold=1.0, minimum_duration=10)
+        gaze.compute_event_properties('peak_velocity')
+        gaze.map_to_aois(stimulus)
+
+    steps = [(record['step'], record['method']) for record in instrumentation.records]
+    assert steps == [
+        ('transform', 'pix2deg'),
+        ('transform', 'pos2vel'),
+        ('detect', 'idt'),
+        ('compute_event_properties', 'peak_velocity'),
+        ('map_to_aois', 'TextStimulus'),
+    ]
+
+    detect_record = instrumentation.records[2]
+    assert detect_record['samples_in'] == detect_record['samples_out'] == 200
+    assert detect_record['events_in'] == 0
+    assert detect_record['events_out'] == 2
+    assert all(record['wall_time'] >= 0 for record in instrumentation.records)
+    assert all(record['file'] is None for record in instrumentation.records)
+    assert all(record['python_memory_delta'] is None for record in instrumentation.records)
+    assert all(record['rss_delta'] is None for record in instrumentation.records)
+
+
+def test_instrumentation_does_not_record_outside_of_context(gaze):
+    gaze.pix2deg()
+    with pm.Instrumentation() as instrumentation:
+        pass
+    gaze.pos2vel(method='neighbors')
+
+    assert not instrumentation.records
+
+
+def test_instrumentation_calls_callbacks(gaze):
+    records = []
+    with pm.Instrumentation(callbacks=records.append) as instrumentation:
+        gaze.pix2deg()
+
+    assert records == instrumentation.records
+    assert len(records) == 1
+
+
+def test_instrumentation_traces_memory(gaze):
+    with pm.Instrumentation(trace_memory=True) as instrumentation:
+        gaze.pix2deg()
+
+    record = instrumentation.records[0]
+    assert isinstance(record['python_memory_delta'], int)
+    assert record['python_memory_peak'] >= 0
+
+
+def test_nested_instrumentations_record_memory_only_if_requested(gaze):
+    with pm.Instrumentation(trace_memory=True) as outer:
+        with pm.Instrumentation() as inner:
+            gaze.pix2deg()
+
+    assert outer.records[0]['python_memory_peak'] is not None
+    assert inner.records[0]['python_memory_peak'] is None
+
+
+class Recording:
+    """Stand-in for Gaze with nested instrumented steps."""
+
+    samples = None
+    events = None
+
+    @instrumented('outer', 'n_bytes')
+    def outer(self, n_bytes):
+        """Allocate and free memory before calling the inner step."""
+        data = np.ones(n_bytes, dtype=np.uint8)
+        del data
+        self.inner(n_bytes=1)
+
+    @instrumented('inner', 'n_bytes')
+    def inner(self, n_bytes):
+        """Allocate memory."""
+        np.ones(n_bytes, dtype=np.uint8)
+
+
+def test_instrumentation_memory_peak_includes_allocations_before_nested_step():
+    with pm.Instrumentation(trace_memory=True) as instrumentation:
+        Recording().outer(1_000_000)
+
+    records = {record['step']: record for record in instrumentation.records}
+    assert records['outer']['python_memory_peak'] >= 1_000_000
+    assert records['inner']['python_memory_peak'] < 1_000_000
+
+
+def test_instrumentation_describes_method_by_parameter_name(gaze):
+    with pm.Instrumentation() as instrumentation:
+        gaze.pix2deg()
+        gaze.pos2vel(method='neighbors')
+        gaze.detect(eye='auto', method='idt', dispersion_threshold=1.0, minimum_duration=10)
+
+    assert instrumentation.records[-1]['method'] == 'idt'
+
+
+def test_instrumentation_does_not_create_pending_events(gaze):
+    trial_gaze = gaze.split(by='trial')[0]
+
+    with pm.Instrumentation() as instrumentation:
+        trial_gaze.pix2deg()
+
+    assert trial_gaze._events_pending
+    assert instrumentation.records[0]['events_in'] == 0
+    assert instrumentation.records[0]['events_out'] == 0
+
+
+def test_file_context_attributes_records_to_file(gaze):
+    with pm.Instrumentation() as instrumentation:
+        with file_context('subject_1.csv'):
+            gaze.pix2deg()
+        gaze.pos2vel(method='neighbors')
+
+    assert [record['file'] for record in instrumentation.records] == ['subject_1.csv', None]
+
+
+def test_instrumentation_to_frame_has_schema(gaze):
+    with pm.Instrumentation() as instrumentation:
+        gaze.pix2deg()
+        gaze.pos2vel(method='neighbors')
+
+    frame = instrumentation.to_frame()
+    assert frame.schema == RECORD_SCHEMA
+    assert frame.height == 2
+
+
+def test_empty_instrumentation_to_frame_has_schema():
+    frame = pm.Instrumentation().to_frame()
+    assert frame.schema == RECORD_SCHEMA
+    assert frame.is_empty()
+
+
+def test_instrumentation_to_json(gaze, tmp_path):
+    with pm.Instrumentation() as instrumentation:
+        gaze.pix2deg()
+
+    assert json.loads(instrumentation.to_json()) == instrumentation.records
+
+    filepath = tmp_path / 'trace.json'
+    assert instrumentation.to_json(filepath) is None
+    assert json.loads(filepath.read_text(encoding='utf-8')) == instrumentation.records
+
+
+@pytest.fixture(name='dataset')
+def fixture_dataset(tmp_path):
+    for subject_id in range(1, 3):
+        filepath = tmp_path / 'raw' / f'{subject_id}.csv'
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        pl.DataFrame({
+            'time': np.arange(100),
+            'x_pix': np.linspace(0, 10, 100),
+            'y_pix': np.linspace(0, 5, 100),
+        }).write_csv(filepath)
+
+    definition = pm.DatasetDefinition(
+        name='InstrumentationTest',
+        experiment=pm.Experiment(1280, 1024, 38, 30.2, 68, 'upper left', 1000),
+        resources=[{
+            'content': 'gaze',
+            'filename_pattern': '{subject_id:d}.csv',
+            'filename_pattern_schema_overrides': {'subject_id': pl.Int64},
+        }],
+        time_column='time',
+        time_unit='ms',
+        pixel_columns=['x_pix', 'y_pix'],
+    )
+    dataset = pm.Dataset(definition, path=pm.DatasetPaths(root=tmp_path, dataset='.'))
+    return dataset.load()
+
+
+def test_dataset_steps_are_attributed_to_files(dataset):
+    with pm.Instrumentation() as instrumentation:
+        dataset.pix2deg(verbose=False)
+        dataset.pos2vel(method='neighbors', verbose=False)
+        dataset.detect('ivt', verbose=False)
+
+    frame = instrumentation.to_frame()
+    assert frame['file'].to_list() == ['1.csv', '2.csv'] * 3
+    assert frame['step'].to_list() == ['transform'] * 4 + ['detect'] * 2
+
+
+def test_dataset_compute_event_properties_is_recorded_per_file(dataset):
+    dataset.pix2deg(verbose=False)
+    dataset.pos2vel(method='neighbors', verbose=False)
+    dataset.detect('ivt', minimum_duration=10, verbose=False)
+    n_events = sum(len(gaze.events) for gaze in dataset.gaze)
+
+    with pm.Instrumentation() as instrumentation:
+        dataset.compute_event_properties('peak_velocity', verbose=False)
+
+    frame = instrumentation.to_frame()
+    assert frame['step'].to_list() == ['compute_event_properties'] * 3
+    assert frame['method'].to_list() == ['peak_velocity'] * 3
+    # The event properties of all files are computed at once and then added to each file.
+    assert frame['file'].to_list() == [None, '1.csv', '2.csv']
+    assert frame['events_out'].to_list() == [
+        n_events, len(dataset.gaze[0].events), len(dataset.gaze[1].events),
+    ]
+
+
+@pytest.mark.parametrize('verbose', [False, True])
+def test_dataset_compute_event_properties_shows_progress_bar(dataset, verbose, capsys):
+    dataset.pix2deg(verbose=False)
+    dataset.pos2vel(method='neighbors', verbose=False)
+    dataset.detect('ivt', minimum_duration=10, verbose=False)
+    capsys.readouterr()
+
+    dataset.compute_event_properties('peak_velocity', verbose=verbose)
+
+    assert ('2/2' in capsys.readouterr().err) == verbose
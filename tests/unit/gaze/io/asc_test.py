@@ -998,3 +998,15 @@ def test_from_asc_warns(header, body, expected_warning, expected_message, make_c
 
     with pytest.warns(expected_warning, match=expected_message):
         from_asc(filepath)
+
+
+def test_from_asc_binary_file_object_equals_filepath(make_example_file):
+    filepath = make_example_file('eyelink_monocular_example.asc')
+    expected_gaze = from_asc(filepath, patterns='eyelink')
+
+    with open(filepath, 'rb') as asc_file:
+        gaze = from_asc(asc_file, patterns='eyelink')
+        assert not asc_file.closed
+
+    assert_frame_equal(gaze.samples, expected_gaze.samples)
+    assert gaze.experiment == expected_gaze.experiment
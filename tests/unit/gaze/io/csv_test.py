@@ -317,3 +317,14 @@ def test_from_csv_gaze_has_expected_shape_and_columns(
 
     assert gaze.samples.shape == expected_shape
     assert gaze.samples.schema == expected_schema
+
+
+def test_from_csv_binary_file_object_equals_filepath(make_example_file):
+    filepath = make_example_file('monocular_example.csv')
+    kwargs = {'time_column': 'time', 'pixel_columns': ['x_left_pix', 'y_left_pix']}
+    expected_gaze = from_csv(file=filepath, **kwargs)
+
+    with open(filepath, 'rb') as csv_file:
+        gaze = from_csv(file=csv_file, **kwargs)
+
+    assert gaze.samples.equals(expected_gaze.samples)
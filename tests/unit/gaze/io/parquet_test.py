@@ -0,0 +1,74 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test read from parquet."""
+import pytest
+
+import pymovements as pm
+
+
+@pytest.mark.parametrize(
+    ('filename', 'kwargs', 'shape'),
+    [
+        pytest.param(
+            'monocular_example.parquet',
+            {},
+            (10, 2),
+            id='parquet_mono_shape',
+        ),
+        pytest.param(
+            'binocular_example.parquet',
+            {},
+            (10, 3),
+            id='parquet_bino_shape',
+        ),
+        pytest.param(
+            'monocular_example.parquet',
+            {
+                'column_map': {'pixel': 'pixel_coordinates'},
+            },
+            (10, 2),
+            marks=pytest.mark.filterwarnings(
+                'ignore:Gaze contains samples but no.*:UserWarning',
+            ),
+            id='parquet_mono_shape_column_map',
+        ),
+        pytest.param(
+            'monocular_example.parquet',
+            {
+                'add_columns': {'subject_id': '1'},
+                'column_schema_overrides': {'subject_id': int},
+            },
+            (10, 3),
+            id='parquet_mono_shape_add_columns',
+        ),
+    ],
+)
+def test_shapes(filename, kwargs, shape, make_example_file):
+    filepath = make_example_file(filename)
+    gaze = pm.gaze.from_parquet(file=filepath, **kwargs)
+
+    assert gaze.samples.shape == shape
+
+
+def test_from_parquet_equals_from_ipc(make_example_file):
+    gaze = pm.gaze.from_parquet(file=make_example_file('binocular_example.parquet'))
+    expected_gaze = pm.gaze.from_ipc(file=make_example_file('binocular_example.feather'))
+
+    assert gaze.samples.equals(expected_gaze.samples)
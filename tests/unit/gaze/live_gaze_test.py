@@ -0,0 +1,278 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test LiveGaze."""
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import pymovements as pm
+
+
+@pytest.fixture(name='experiment')
+def fixture_experiment():
+    return pm.Experiment(1280, 1024, 38, 30, 68, 'upper left', 500)
+
+
+def make_pixels(n_samples, n_components):
+    rng = np.random.default_rng(42)
+    pixels = rng.uniform(0, 1024, size=(n_samples, n_components))
+    pixels[[10, 11, 50]] = np.nan
+    return pixels
+
+
+def make_expected_gaze(time, pixels, experiment, velocity_method):
+    pixel_columns = [f'pixel_{component}' for component in range(pixels.shape[1])]
+    gaze = pm.Gaze(
+        pl.DataFrame({'time': time, **dict(zip(pixel_columns, pixels.T))}),
+        experiment=experiment,
+        time_column='time',
+        pixel_columns=pixel_columns,
+    )
+    gaze.pix2deg()
+    gaze.pos2vel(method=velocity_method)
+    return gaze
+
+
+@pytest.mark.parametrize('velocity_method', ['preceding', 'neighbors', 'fivepoint', 'smooth'])
+@pytest.mark.parametrize('n_components', [2, 4])
+@pytest.mark.parametrize(
+    ('capacity', 'batch_size'),
+    [
+        pytest.param(1000, 1, id='single_samples'),
+        pytest.param(1000, 7, id='batches'),
+        pytest.param(1000, 300, id='single_batch'),
+        pytest.param(50, 7, id='overwritten_batches'),
+        pytest.param(50, 300, id='batch_exceeding_capacity'),
+    ],
+)
+def test_live_gaze_equals_transformed_gaze(
+        experiment, velocity_method, n_components, capacity, batch_size,
+):
+    time = np.arange(1000, 1600, 2)
+    pixels = make_pixels(len(time), n_components)
+    expected = make_expected_gaze(time, pixels, experiment, velocity_method)
+
+    live_gaze = pm.gaze.LiveGaze(
+        experiment, capacity, n_components=n_components, velocity_method=velocity_method,
+    )
+    for batch_start in range(0, len(time), batch_size):
+        batch = slice(batch_start, batch_start + batch_size)
+        live_gaze.append(time[batch], pixels[batch])
+    gaze = live_gaze.to_gaze()
+
+    assert gaze.n_components == n_components
+    assert_frame_equal(gaze.samples, expected.samples.tail(capacity), rtol=1e-9)
+
+
+def test_live_gaze_computes_velocity_when_stencil_is_complete(experiment):
+    live_gaze = pm.gaze.LiveGaze(experiment, velocity_method='fivepoint')
+    live_gaze.append(np.arange(5), np.zeros((5, 2)))
+    assert live_gaze.to_gaze().samples['velocity'].to_list() == [
+        [None, None], [None, None], [0.0, 0.0], [None, None], [None, None],
+    ]
+
+    live_gaze.append(5, [0.0, 0.0])
+
+    assert live_gaze.to_gaze().samples['velocity'].to_list()[2:4] == [[0.0, 0.0], [0.0, 0.0]]
+
+
+@pytest.mark.parametrize('velocity_method', ['preceding', 'neighbors', 'fivepoint'])
+def test_live_gaze_start_stream_does_not_compute_velocity_across_streams(
+        experiment, velocity_method,
+):
+    time = np.r_[1000:1200:2, 1400:1600:2]
+    pixels = make_pixels(len(time), 2)
+    expected = [
+        make_expected_gaze(time[stream], pixels[stream], experiment, velocity_method).samples
+        for stream in (slice(0, 100), slice(100, 200))
+    ]
+
+    live_gaze = pm.gaze.LiveGaze(experiment, velocity_method=velocity_method)
+    popped = []
+    for stream_start in (0, 100):
+        if stream_start > 0:
+            live_gaze.start_stream()
+        for batch_start in range(stream_start, stream_start + 100, 30):
+            batch = slice(batch_start, min(batch_start + 30, stream_start + 100))
+            live_gaze.append(time[batch], pixels[batch])
+            popped.append(live_gaze.pop_completed())
+    popped.append(live_gaze.pop_completed(include_incomplete=True))
+
+    assert_frame_equal(live_gaze.to_gaze().samples, pl.concat(expected), rtol=1e-9)
+    np.testing.assert_array_equal(np.concatenate([time for time, _, _ in popped]), time)
+
+
+def test_live_gaze_keeps_latest_samples_without_reallocation(experiment):
+    live_gaze = pm.gaze.LiveGaze(experiment, capacity=10)
+    buffers = [live_gaze._time, live_gaze._pixel, live_gaze._position, live_gaze._velocity]
+
+    live_gaze.append(np.arange(25), np.zeros((25, 2)))
+
+    assert len(live_gaze) == 10
+    assert live_gaze.n_appended == 25
+    assert live_gaze.to_gaze().samples['time'].to_list() == list(range(15, 25))
+    assert all(
+        buffer is new_buffer for buffer, new_buffer in zip(
+            buffers,
+            [live_gaze._time, live_gaze._pixel, live_gaze._position, live_gaze._velocity],
+        )
+    )
+
+
+def test_live_gaze_snapshot_is_independent(experiment):
+    live_gaze = pm.gaze.LiveGaze(experiment, capacity=10)
+    live_gaze.append(np.arange(5), np.zeros((5, 2)))
+    gaze = live_gaze.to_gaze()
+
+    live_gaze.append(np.arange(5, 15), np.ones((10, 2)))
+
+    assert gaze.samples['time'].to_list() == [0, 1, 2, 3, 4]
+    assert gaze.samples['pixel'].to_list() == [[0.0, 0.0]] * 5
+
+
+def test_live_gaze_float_time(experiment):
+    live_gaze = pm.gaze.LiveGaze(experiment)
+    live_gaze.append([0.5, 2.5], np.zeros((2, 2)))
+
+    assert live_gaze.to_gaze().samples['time'].to_list() == [0.5, 2.5]
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'message'),
+    [
+        pytest.param(
+            {'velocity_method': 'savitzky_golay'},
+            "Unknown method 'savitzky_golay'. Supported methods are: "
+            "['preceding', 'neighbors', 'fivepoint', 'smooth']",
+            id='unsupported_velocity_method',
+        ),
+        pytest.param(
+            {'n_components': 3},
+            'n_components must be either 2, 4 or 6 but is 3',
+            id='invalid_n_components',
+        ),
+        pytest.param(
+            {'capacity': 4},
+            "capacity must be greater than 4 for velocity method 'fivepoint'",
+            id='capacity_too_small',
+        ),
+    ],
+)
+def test_live_gaze_init_raises_value_error(experiment, kwargs, message):
+    with pytest.raises(ValueError) as exc_info:
+        pm.gaze.LiveGaze(experiment, **kwargs)
+
+    msg, = exc_info.value.args
+    assert msg == message
+
+
+@pytest.mark.parametrize(
+    ('experiment', 'message'),
+    [
+        pytest.param(
+            pm.Experiment(1280, 1024, 38, 30, None, 'upper left', 500),
+            'experiment eye-to-screen distance is not specified',
+            id='no_distance',
+        ),
+        pytest.param(
+            pm.Experiment(1280, 1024, 38, 30, 68, 'upper left'),
+            'experiment sampling rate is not specified',
+            id='no_sampling_rate',
+        ),
+    ],
+)
+def test_live_gaze_init_raises_attribute_error(experiment, message):
+    with pytest.raises(AttributeError) as exc_info:
+        pm.gaze.LiveGaze(experiment)
+
+    msg, = exc_info.value.args
+    assert msg == message
+
+
+@pytest.mark.parametrize(
+    ('time', 'pixel', 'message'),
+    [
+        pytest.param(
+            [0, 1], np.zeros((2, 4)),
+            r'pixel must have shape \(N, 2\) but has shape \(2, 4\)',
+            id='pixel_wrong_n_components',
+        ),
+        pytest.param(
+            [0, 1, 2], np.zeros((2, 2)),
+            r'time must have shape \(2,\) but has shape \(3,\)',
+            id='time_wrong_length',
+        ),
+    ],
+)
+def test_live_gaze_append_raises_value_error(experiment, time, pixel, message):
+    live_gaze = pm.gaze.LiveGaze(experiment)
+
+    with pytest.raises(ValueError, match=message):
+        live_gaze.append(time, pixel)
+
+
+@pytest.mark.parametrize('velocity_method', ['preceding', 'neighbors', 'fivepoint'])
+def test_live_gaze_pop_completed_returns_each_sample_once(experiment, velocity_method):
+    time = np.arange(1000, 1600, 2)
+    pixels = make_pixels(len(time), 2)
+    expected = make_expected_gaze(time, pixels, experiment, velocity_method).samples
+
+    live_gaze = pm.gaze.LiveGaze(experiment, capacity=50, velocity_method=velocity_method)
+    popped = []
+    for batch_start in range(0, len(time), 7):
+        batch = slice(batch_start, batch_start + 7)
+        live_gaze.append(time[batch], pixels[batch])
+        popped.append(live_gaze.pop_completed())
+    popped.append(live_gaze.pop_completed(include_incomplete=True))
+    popped_time, popped_position, popped_velocity = (
+        np.concatenate(arrays) for arrays in zip(*popped)
+    )
+
+    np.testing.assert_array_equal(popped_time, time)
+    np.testing.assert_allclose(
+        popped_position,
+        np.array(expected['position'].to_list(), dtype=np.float64),
+        rtol=1e-9,
+    )
+    np.testing.assert_allclose(
+        popped_velocity,
+        np.array(expected['velocity'].to_list(), dtype=np.float64),
+        rtol=1e-9,
+    )
+
+
+def test_live_gaze_pop_completed_waits_for_velocity(experiment):
+    live_gaze = pm.gaze.LiveGaze(experiment, velocity_method='neighbors')
+
+    live_gaze.append([0, 1], np.zeros((2, 2)))
+    assert live_gaze.pop_completed()[0].tolist() == [0]
+
+    live_gaze.append(2, [0.0, 0.0])
+    assert live_gaze.pop_completed()[0].tolist() == [1]
+    assert live_gaze.pop_completed()[0].tolist() == []
+
+
+def test_live_gaze_pop_completed_skips_overwritten_samples(experiment):
+    live_gaze = pm.gaze.LiveGaze(experiment, capacity=10, velocity_method='preceding')
+
+    live_gaze.append(np.arange(25), np.zeros((25, 2)))
+
+    assert live_gaze.pop_completed()[0].tolist() == list(range(15, 25))
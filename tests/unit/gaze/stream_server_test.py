@@ -0,0 +1,628 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test GazeStreamServer."""
+import asyncio
+import socket
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import pymovements as pm
+from pymovements.gaze import decode_samples
+from pymovements.gaze import encode_samples
+from pymovements.gaze import GazeStreamServer
+from pymovements.gaze import LiveGaze
+
+
+@pytest.fixture(name='experiment')
+def fixture_experiment():
+    return pm.Experiment(1280, 1024, 38, 30, 68, 'upper left', 1000)
+
+
+@pytest.fixture(name='stream')
+def fixture_stream():
+    """Alternating fixations and saccades with a blink, sampled at 1000 Hz."""
+    rng = np.random.default_rng(42)
+    steps = rng.normal(0, 0.2, size=(2000, 2))
+    steps[200:230] += 20
+    steps[900:925] -= 25
+    steps[1500:1520, 1] += 30
+    pixel = 640 + np.cumsum(steps, axis=0)
+    pixel[1200:1260] = np.nan
+    return np.arange(10_000, 12_000), pixel
+
+
+def make_detectors():
+    return [
+        pm.events.StreamingIVT(minimum_duration=50, velocity_threshold=20.0),
+        pm.events.StreamingIDT(minimum_duration=50, dispersion_threshold=1.0),
+        pm.events.StreamingMicrosaccades(minimum_duration=6, threshold=(10.0, 10.0)),
+    ]
+
+
+def detect_offline(time, pixel, experiment, stream=None, velocity_method='fivepoint'):
+    samples = pl.DataFrame({'time': time, 'x': pixel[:, 0], 'y': pixel[:, 1]})
+    if stream is not None:
+        samples = samples.with_columns(stream=stream)
+    gaze = pm.Gaze(
+        samples,
+        experiment=experiment,
+        time_column='time',
+        pixel_columns=['x', 'y'],
+        trial_columns=None if stream is None else 'stream',
+    )
+    gaze.pix2deg()
+    gaze.pos2vel(method=velocity_method)
+    gaze.detect('ivt', minimum_duration=50, velocity_threshold=20.0)
+    gaze.detect('idt', minimum_duration=50, dispersion_threshold=1.0)
+    gaze.detect('microsaccades', minimum_duration=6, threshold=(10.0, 10.0))
+    if stream is not None:
+        return gaze.events.frame.drop('stream')
+    return gaze.events.frame
+
+
+async def collect(queue):
+    events = []
+    while (event := await queue.get()) is not None:
+        events.append(event.frame)
+    return pl.concat(events)
+
+
+async def wait_for_samples(server, n_samples):
+    while server.live_gaze.n_appended < n_samples:
+        await asyncio.sleep(0.001)
+
+
+def assert_events_equal(streamed, expected):
+    sort_columns = ['name', 'onset']
+    assert_frame_equal(
+        streamed.sort(sort_columns), expected.sort(sort_columns), check_dtypes=False,
+    )
+
+
+def test_encode_decode_samples_roundtrip():
+    time = np.array([1, 2, 3])
+    pixel = np.array([[1.0, 2.0, 3.0, 4.0], [np.nan, 6.0, 7.0, 8.0], [9.0, 10.0, 11.0, 12.0]])
+
+    frame = encode_samples(time, pixel)
+    decoded_time, decoded_pixel = decode_samples(frame[4:], n_components=4)
+
+    assert int.from_bytes(frame[:4], 'little') == len(frame) - 4 == 3 * 5 * 8
+    np.testing.assert_array_equal(decoded_time, time)
+    np.testing.assert_array_equal(decoded_pixel, pixel)
+
+
+def test_encode_samples_single_sample():
+    time, pixel = decode_samples(encode_samples(5, [1.0, 2.0])[4:], n_components=2)
+
+    assert time.tolist() == [5]
+    assert pixel.tolist() == [[1.0, 2.0]]
+
+
+def test_decode_samples_raises_value_error():
+    with pytest.raises(ValueError) as exc_info:
+        decode_samples(b'\x00' * 20, n_components=2)
+
+    msg, = exc_info.value.args
+    assert msg == 'payload size 20 is not a multiple of the sample size 24'
+
+
+@pytest.mark.parametrize('batch_size', [1, 16, 500, 2000])
+def test_stream_server_tcp_detects_same_events_as_offline_detection(
+        experiment, stream, batch_size,
+):
+    time, pixel = stream
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment, capacity=1000), make_detectors())
+        host, port = await server.start()
+        events = server.subscribe()
+
+        _, writer = await asyncio.open_connection(host, port)
+        for batch_start in range(0, len(time), batch_size):
+            batch = slice(batch_start, batch_start + batch_size)
+            writer.write(encode_samples(time[batch], pixel[batch]))
+            await writer.drain()
+        writer.close()
+        await server.close(wait=True)
+        return server, await collect(events)
+
+    server, streamed = asyncio.run(run())
+
+    assert server.live_gaze.n_appended == len(time)
+    assert server.n_dropped == 0
+    assert_events_equal(streamed, detect_offline(time, pixel, experiment))
+
+
+def test_stream_server_udp_detects_same_events_as_offline_detection(experiment, stream):
+    time, pixel = stream
+
+    async def run():
+        server = GazeStreamServer(
+            LiveGaze(experiment), make_detectors(), queue_size=len(time),
+        )
+        host, port = await server.start(protocol='udp')
+        events = server.subscribe()
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as publisher:
+            for batch_start in range(0, len(time), 100):
+                batch = slice(batch_start, batch_start + 100)
+                publisher.sendto(encode_samples(time[batch], pixel[batch]), (host, port))
+                await asyncio.sleep(0)
+        await asyncio.wait_for(wait_for_samples(server, len(time)), timeout=10)
+        await server.close()
+        return await collect(events)
+
+    streamed = asyncio.run(run())
+
+    assert_events_equal(streamed, detect_offline(time, pixel, experiment))
+
+
+def test_stream_server_feed_detects_same_events_as_offline_detection(experiment, stream):
+    time, pixel = stream
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment), make_detectors())
+        await server.start()
+        events = server.subscribe()
+        for batch_start in range(0, len(time), 100):
+            batch = slice(batch_start, batch_start + 100)
+            await server.feed(encode_samples(time[batch], pixel[batch])[4:])
+        await server.close()
+        return await collect(events)
+
+    streamed = asyncio.run(run())
+
+    assert_events_equal(streamed, detect_offline(time, pixel, experiment))
+
+
+def test_stream_server_binocular_uses_selected_eye(experiment, stream):
+    time, pixel = stream
+    binocular_pixel = np.concatenate([pixel, np.full_like(pixel, 640.0)], axis=1)
+
+    async def run(eye):
+        server = GazeStreamServer(
+            LiveGaze(experiment, n_components=4),
+            [pm.events.StreamingIVT(minimum_duration=50)],
+            eye=eye,
+        )
+        await server.start()
+        events = server.subscribe()
+        await server.feed(encode_samples(time, binocular_pixel)[4:])
+        await server.close()
+        return await collect(events)
+
+    left_events = asyncio.run(run('left'))
+    right_events = asyncio.run(run('auto'))
+
+    assert left_events.height > 1
+    assert right_events['onset'].to_list() == [time[2]]
+
+
+def test_stream_server_slow_subscriber_holds_up_publisher(experiment, stream):
+    time, pixel = stream
+
+    async def run():
+        server = GazeStreamServer(
+            LiveGaze(experiment),
+            [pm.events.StreamingIVT(minimum_duration=10)],
+            queue_size=1,
+        )
+        host, port = await server.start()
+        events = server.subscribe(maxsize=1)
+
+        async def publish():
+            _, writer = await asyncio.open_connection(host, port)
+            for batch_start in range(0, len(time), 10):
+                batch = slice(batch_start, batch_start + 10)
+                writer.write(encode_samples(time[batch], pixel[batch]))
+                await writer.drain()
+            writer.close()
+
+        publisher = asyncio.create_task(publish())
+        await asyncio.sleep(0.1)
+        n_appended_while_blocked = server.live_gaze.n_appended
+
+        streamed = asyncio.create_task(collect(events))
+        await publisher
+        await server.close(wait=True)
+        return n_appended_while_blocked, await streamed
+
+    n_appended_while_blocked, streamed = asyncio.run(run())
+
+    assert n_appended_while_blocked < len(time)
+    assert streamed.height > 1
+
+
+def test_stream_server_udp_drops_datagrams(experiment):
+
+    async def run():
+        server = GazeStreamServer(
+            LiveGaze(experiment),
+            [pm.events.StreamingIVT(minimum_duration=1, velocity_threshold=1e-6)],
+            queue_size=1,
+        )
+        host, port = await server.start(protocol='udp')
+        # The unread subscriber has room for a single event and then blocks processing.
+        events = server.subscribe(maxsize=1)
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as publisher:
+            publisher.sendto(b'\x05\x00\x00\x00\x00', (host, port))
+            publisher.sendto(encode_samples(0, [0.0, 0.0])[:-1], (host, port))
+            # Each batch contains a fixation.
+            for batch_start in range(0, 200, 20):
+                pixel = np.zeros((20, 2))
+                pixel[10:] = 100
+                publisher.sendto(
+                    encode_samples(np.arange(batch_start, batch_start + 20), pixel), (host, port),
+                )
+        while server.n_dropped < 2 + 10 - 3:
+            await asyncio.sleep(0.001)
+
+        streamed = asyncio.create_task(collect(events))
+        await server.close()
+        await streamed
+        return server
+
+    server = asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+    assert server.n_dropped >= 9
+
+
+def test_stream_server_tcp_malformed_frame_closes_connection(experiment):
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment))
+        host, port = await server.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b'\x05\x00\x00\x00\x00\x00\x00\x00\x00')
+        await writer.drain()
+        closed = await reader.read()
+        writer.close()
+        await server.close()
+        return server, closed
+
+    server, closed = asyncio.run(run())
+
+    assert closed == b''
+    assert server.n_dropped == 1
+
+
+def test_stream_server_close_closes_open_connections(experiment):
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment))
+        host, port = await server.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(encode_samples([0, 1, 2], np.zeros((3, 2))))
+        await writer.drain()
+        await asyncio.wait_for(wait_for_samples(server, 3), timeout=10)
+        await server.close()
+        closed = await reader.read()
+        writer.close()
+        return server, closed
+
+    server, closed = asyncio.run(run())
+
+    assert closed == b''
+    assert server.live_gaze.n_appended == 3
+
+
+def test_stream_server_records_latencies(experiment, stream):
+    time, pixel = stream
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment), make_detectors())
+        await server.start()
+        for batch_start in range(0, len(time), 100):
+            batch = slice(batch_start, batch_start + 100)
+            await server.feed(encode_samples(time[batch], pixel[batch])[4:])
+        await server.close()
+        return server
+
+    server = asyncio.run(run())
+    summary = server.latency_summary()
+
+    assert summary['stage'].to_list() == [
+        'decode', 'queue', 'transform', 'detect', 'publish', 'total',
+    ]
+    assert summary.filter(pl.col('stage') == 'decode')['batches'].item() == 20
+    assert summary.filter(pl.col('stage') == 'total')['samples'].item() == len(time)
+    assert (summary['max'] >= 0).all()
+    assert server.latencies_to_frame().height == 20 * 6 + 2
+
+
+def test_stream_server_keeps_latest_latencies(experiment):
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment), latency_window=5)
+        await server.start()
+        for sample in range(10):
+            await server.feed(encode_samples(sample, [0.0, 0.0])[4:])
+        await server.close()
+        return server
+
+    assert len(asyncio.run(run()).latencies) == 5
+
+
+def test_stream_server_udp_gap_starts_new_idt_stream(experiment, stream):
+    time, pixel = stream
+    # The datagram with the samples 1000 to 1100 is lost.
+    kept = np.r_[0:1000, 1100:2000]
+
+    async def run():
+        server = GazeStreamServer(
+            LiveGaze(experiment),
+            [pm.events.StreamingIDT(minimum_duration=50, dispersion_threshold=1.0)],
+        )
+        host, port = await server.start(protocol='udp')
+        events = server.subscribe()
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as publisher:
+            for batch_start in range(0, len(kept), 100):
+                batch = kept[batch_start:batch_start + 100]
+                publisher.sendto(encode_samples(time[batch], pixel[batch]), (host, port))
+                await asyncio.sleep(0.001)
+        await asyncio.wait_for(wait_for_samples(server, len(kept)), timeout=10)
+        await server.close()
+        return await collect(events)
+
+    streamed = asyncio.run(run())
+
+    # The samples around the gap are processed as two streams.
+    gaze = pm.Gaze(
+        pl.DataFrame({
+            'time': time[kept],
+            'x': pixel[kept, 0],
+            'y': pixel[kept, 1],
+            'stream': np.r_[np.zeros(1000), np.ones(900)],
+        }),
+        experiment=experiment,
+        time_column='time',
+        pixel_columns=['x', 'y'],
+        trial_columns='stream',
+    )
+    gaze.pix2deg()
+    gaze.detect('idt', minimum_duration=50, dispersion_threshold=1.0)
+    expected = gaze.events.frame.drop('stream')
+
+    assert_events_equal(streamed, expected)
+
+
+@pytest.mark.parametrize('velocity_method', ['preceding', 'fivepoint'])
+def test_stream_server_udp_gap_starts_new_stream_of_all_detectors(
+        experiment, stream, velocity_method,
+):
+    time, pixel = stream
+    # The datagram with the samples 1000 to 1100 is lost, the next saccade starts at 900.
+    kept = np.r_[0:1000, 1100:2000]
+
+    async def run():
+        server = GazeStreamServer(
+            LiveGaze(experiment, velocity_method=velocity_method), make_detectors(),
+        )
+        host, port = await server.start(protocol='udp')
+        events = server.subscribe()
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as publisher:
+            for batch_start in range(0, len(kept), 100):
+                batch = kept[batch_start:batch_start + 100]
+                publisher.sendto(encode_samples(time[batch], pixel[batch]), (host, port))
+                await asyncio.sleep(0.001)
+        await asyncio.wait_for(wait_for_samples(server, len(kept)), timeout=10)
+        await server.close()
+        return await collect(events)
+
+    streamed = asyncio.run(run())
+
+    # Velocities are not computed across the gap, as for two separate trials.
+    expected = detect_offline(
+        time[kept],
+        pixel[kept],
+        experiment,
+        stream=np.r_[np.zeros(1000), np.ones(900)],
+        velocity_method=velocity_method,
+    )
+    assert_events_equal(streamed, expected)
+
+
+def test_stream_server_gap_within_batch_starts_new_stream(experiment, stream):
+    time, pixel = stream
+    kept = np.r_[0:1000, 1100:2000]
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment, capacity=1000), make_detectors())
+        await server.start()
+        events = server.subscribe()
+        for batch_start in range(0, len(kept), 300):
+            batch = kept[batch_start:batch_start + 300]
+            await server.feed(encode_samples(time[batch], pixel[batch])[4:])
+        await server.close()
+        return await collect(events)
+
+    streamed = asyncio.run(run())
+
+    expected = detect_offline(
+        time[kept], pixel[kept], experiment, stream=np.r_[np.zeros(1000), np.ones(900)],
+    )
+    assert_events_equal(streamed, expected)
+
+
+class FailingDetector(pm.events.StreamingIVT):
+    """Detector which fails on the first sample with the given timestep."""
+
+    def __init__(self, failing_time):
+        super().__init__(minimum_duration=10)
+        self.failing_time = failing_time
+
+    def process(self, velocities, timesteps=None):
+        """Fail on the given timestep or process the samples."""
+        if timesteps is not None and self.failing_time in timesteps:
+            raise ZeroDivisionError('detection failed')
+        return super().process(velocities, timesteps)
+
+
+def test_stream_server_close_raises_exception_of_failed_processing(experiment):
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment), [FailingDetector(failing_time=0)])
+        await server.start()
+        events = server.subscribe(maxsize=1)
+        await server.feed(encode_samples(np.arange(100), np.zeros((100, 2)))[4:])
+        try:
+            await server.close()
+        finally:
+            end = await events.get()
+        return end
+
+    with pytest.raises(ZeroDivisionError, match='detection failed'):
+        asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+
+def test_stream_server_feed_raises_exception_of_failed_processing(experiment):
+
+    async def run():
+        server = GazeStreamServer(
+            LiveGaze(experiment), [FailingDetector(failing_time=0)], queue_size=1,
+        )
+        await server.start()
+        events = server.subscribe()
+        with pytest.raises(ZeroDivisionError, match='detection failed'):
+            for sample in range(100):
+                await server.feed(encode_samples(sample, [0.0, 0.0])[4:])
+        with pytest.raises(ZeroDivisionError, match='detection failed'):
+            await server.close()
+        return await events.get()
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=10)) is None
+
+
+def test_stream_server_failed_processing_notifies_full_subscriber(experiment):
+
+    async def run():
+        server = GazeStreamServer(
+            LiveGaze(experiment),
+            [
+                pm.events.StreamingIVT(minimum_duration=1, velocity_threshold=1e-6),
+                FailingDetector(failing_time=50),
+            ],
+        )
+        await server.start()
+        events = server.subscribe(maxsize=1)
+        pixel = np.zeros((100, 2))
+        pixel[10:] = 100
+        await server.feed(encode_samples(np.arange(0, 40), pixel[:40])[4:])
+        await server.feed(encode_samples(np.arange(40, 100), pixel[40:])[4:])
+        with pytest.raises(ZeroDivisionError, match='detection failed'):
+            await server.close()
+        return await events.get()
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=10)) is None
+
+
+def test_stream_server_tcp_connection_is_closed_after_failed_processing(experiment):
+
+    async def run():
+        server = GazeStreamServer(
+            LiveGaze(experiment), [FailingDetector(failing_time=0)], queue_size=1,
+        )
+        host, port = await server.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        for sample in range(100):
+            writer.write(encode_samples(sample, [0.0, 0.0]))
+        await writer.drain()
+        closed = await reader.read()
+        writer.close()
+        with pytest.raises(ZeroDivisionError, match='detection failed'):
+            await server.close(wait=True)
+        return closed
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=10)) == b''
+
+
+def test_stream_server_feed_after_close_raises_runtime_error(experiment):
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment))
+        await server.start()
+        await server.close()
+        await server.feed(encode_samples(0, [0.0, 0.0])[4:])
+
+    with pytest.raises(RuntimeError, match='server has already been closed'):
+        asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'message'),
+    [
+        pytest.param(
+            {'eye': 'middle'},
+            "unknown eye 'middle'. Supported values are: ['auto', 'left', 'right', 'cyclops']",
+            id='unknown_eye',
+        ),
+        pytest.param(
+            {'eye': 'left'},
+            'left eye is only supported for data with at least 4 components',
+            id='left_eye_monocular',
+        ),
+        pytest.param(
+            {'eye': 'cyclops'},
+            'cyclops eye is only supported for data with at least 6 components',
+            id='cyclops_eye_monocular',
+        ),
+    ],
+)
+def test_stream_server_init_raises_value_error(experiment, kwargs, message):
+    with pytest.raises(ValueError) as exc_info:
+        GazeStreamServer(LiveGaze(experiment), **kwargs)
+
+    msg, = exc_info.value.args
+    assert msg == message
+
+
+def test_stream_server_start_unknown_protocol_raises_value_error(experiment):
+    server = GazeStreamServer(LiveGaze(experiment))
+
+    with pytest.raises(ValueError) as exc_info:
+        asyncio.run(server.start(protocol='http'))
+
+    msg, = exc_info.value.args
+    assert msg == "unknown protocol 'http'. Supported values are: ['tcp', 'udp']"
+
+
+def test_stream_server_start_twice_raises_runtime_error(experiment):
+
+    async def run():
+        server = GazeStreamServer(LiveGaze(experiment))
+        await server.start()
+        try:
+            await server.start()
+        finally:
+            await server.close()
+
+    with pytest.raises(RuntimeError, match='server has already been started'):
+        asyncio.run(run())
+
+
+def test_stream_server_feed_before_start_raises_runtime_error(experiment):
+    server = GazeStreamServer(LiveGaze(experiment))
+
+    with pytest.raises(RuntimeError, match='server has not been started'):
+        asyncio.run(server.feed(encode_samples(0, [0.0, 0.0])[4:]))
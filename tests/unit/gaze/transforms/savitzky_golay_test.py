@@ -18,9 +18,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Test pymovements.gaze.transforms.savitzky_golay."""
+import numpy as np
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
+from scipy.signal import savgol_filter
 
 import pymovements as pm
 
@@ -263,3 +265,86 @@ def test_savitzky_golay_returns(kwargs, series, expected_df):
         pm.gaze.transforms.savitzky_golay(**kwargs),
     )
     assert_frame_equal(result_df, expected_df.to_frame())
+
+
+@pytest.mark.parametrize(
+    ('padding', 'mode'),
+    [
+        pytest.param(None, 'interp', id='none_padding'),
+        pytest.param(0.5, 'constant', id='constant_padding'),
+        pytest.param('nearest', 'nearest', id='nearest_padding'),
+        pytest.param('mirror', 'mirror', id='mirror_padding'),
+        pytest.param('wrap', 'wrap', id='wrap_padding'),
+    ],
+)
+@pytest.mark.parametrize('window_length', [4, 5])
+@pytest.mark.parametrize('derivative', [0, 1, 2])
+def test_savitzky_golay_equals_savgol_filter(padding, mode, window_length, derivative):
+    values = np.array([1.0, 3.0, 2.0, 5.0, 4.0, 6.0, 9.0, 7.0])
+    df = pl.DataFrame({'A': np.stack([values, -values], axis=1).tolist()})
+
+    result_df = df.select(
+        pm.gaze.transforms.savitzky_golay(
+            window_length=window_length, degree=2, derivative=derivative, sampling_rate=2,
+            padding=padding, n_components=2, input_column='A',
+        ),
+    )
+
+    expected = savgol_filter(
+        values, window_length, polyorder=2, deriv=derivative, delta=0.5, mode=mode, cval=0.5,
+    )
+    expected_negative = savgol_filter(
+        -values, window_length, polyorder=2, deriv=derivative, delta=0.5, mode=mode, cval=0.5,
+    )
+    np.testing.assert_allclose(
+        np.array(result_df['A'].to_list()),
+        np.stack([expected, expected_negative], axis=1),
+        atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize('padding', [None, 0.0, 'nearest', 'mirror', 'wrap'])
+@pytest.mark.parametrize('trial_columns', ['trial', ['subject', 'trial']])
+def test_savitzky_golay_filters_each_trial(padding, trial_columns):
+    df = pl.DataFrame(
+        {
+            'subject': [1, 1, 1, 1, 1, 1, 1, 2, 2, 2],
+            'trial': [1, 1, 1, 1, 2, 2, 2, 2, 2, 2],
+            'A': [
+                [1.0, 2.0], [3.0, 1.0], [2.0, 4.0], [5.0, 3.0], [9.0, 8.0],
+                [7.0, 9.0], [8.0, 7.0], [1.0, 1.0], [2.0, 4.0], [4.0, 9.0],
+            ],
+        },
+    )
+    kwargs = {
+        'window_length': 3, 'degree': 1, 'derivative': 1, 'sampling_rate': 1,
+        'padding': padding, 'n_components': 2, 'input_column': 'A',
+    }
+
+    result_df = df.select(
+        pm.gaze.transforms.savitzky_golay(**kwargs, trial_columns=trial_columns),
+    )
+
+    expected_df = pl.concat(
+        [
+            trial_df.select(pm.gaze.transforms.savitzky_golay(**kwargs))
+            for _, trial_df in df.group_by(trial_columns, maintain_order=True)
+        ],
+    )
+    assert_frame_equal(result_df, expected_df)
+
+
+def test_savitzky_golay_none_padding_trial_shorter_than_window_raises_value_error():
+    df = pl.DataFrame(
+        {
+            'trial': [1, 1, 1, 2, 2],
+            'A': [[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [4.0, 4.0], [5.0, 5.0]],
+        },
+    )
+    expression = pm.gaze.transforms.savitzky_golay(
+        window_length=3, degree=1, sampling_rate=1, padding=None, n_components=2,
+        input_column='A', trial_columns='trial',
+    )
+
+    with pytest.raises(ValueError, match='window_length must be less than or equal'):
+        df.select(expression)
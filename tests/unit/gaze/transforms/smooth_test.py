@@ -18,6 +18,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Test pymovements.gaze.transforms.smooth."""
+import numpy as np
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
@@ -411,3 +412,90 @@ def test_identity_returns_same_series():
     series_identity = pm.gaze.transforms._identity(series)
 
     assert_frame_equal(series.to_frame(), series_identity.to_frame())
+
+
+@pytest.mark.parametrize('method', ['moving_average', 'exponential_moving_average'])
+@pytest.mark.parametrize('padding', [None, 0.0, 'nearest', 'mirror', 'wrap'])
+def test_smooth_smoothes_each_trial(method, padding):
+    """Test if smooth with trial columns returns the same as smoothing each trial separately."""
+    df = pl.DataFrame(
+        {
+            'trial': [1, 1, 1, 1, 1, 2, 2, 2, 2],
+            'position': [
+                [1., 2.], [3., 1.], [2., 4.], [5., 3.], [4., 4.],
+                [9., 8.], [7., 9.], [8., 7.], [1., 1.],
+            ],
+        },
+    )
+    kwargs = {'method': method, 'window_length': 3, 'n_components': 2, 'padding': padding}
+
+    result_df = df.select(
+        pm.gaze.transforms.smooth(**kwargs, trial_columns='trial'),
+    )
+
+    expected_df = pl.concat(
+        [
+            trial_df.select(pm.gaze.transforms.smooth(**kwargs))
+            for _, trial_df in df.group_by('trial', maintain_order=True)
+        ],
+    )
+    assert_frame_equal(result_df, expected_df)
+
+
+@pytest.mark.parametrize('method', ['moving_average', 'exponential_moving_average'])
+def test_smooth_smoothes_each_contiguous_run_of_trial(method):
+    """Test if smooth treats each contiguous run of samples of a trial as a separate trial."""
+    df = pl.DataFrame(
+        {
+            'trial': [1, 1, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2],
+            'run': [1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4],
+            'position': [[float(sample), float(sample % 5)] for sample in range(12)],
+        },
+    )
+    kwargs = {'method': method, 'window_length': 3, 'n_components': 2}
+
+    result_df = df.select(pm.gaze.transforms.smooth(**kwargs, trial_columns='trial'))
+
+    expected_df = df.select(pm.gaze.transforms.smooth(**kwargs, trial_columns='run'))
+    assert_frame_equal(result_df, expected_df)
+
+
+@pytest.mark.parametrize(
+    ('method', 'expected'),
+    [
+        pytest.param(
+            'moving_average',
+            [4 / 3, np.nan, np.nan, np.nan, 5.0, 6.0, 7.0, 23 / 3],
+            id='moving_average',
+        ),
+        pytest.param(
+            'exponential_moving_average',
+            [1.0, 1.5] + [np.nan] * 6,
+            id='exponential_moving_average',
+        ),
+        pytest.param(
+            'savitzky_golay',
+            [4 / 3, np.nan, np.nan, np.nan, 5.0, 6.0, 7.0, 23 / 3],
+            id='savitzky_golay',
+        ),
+    ],
+)
+def test_smooth_missing_sample_results_in_nan(method, expected):
+    df = pl.DataFrame(
+        {
+            'position': [
+                [1.0, 1.0], [2.0, 2.0], None, [4.0, 4.0],
+                [5.0, 5.0], [6.0, 6.0], [7.0, 7.0], [8.0, 8.0],
+            ],
+        },
+    )
+    kwargs = {'degree': 1} if method == 'savitzky_golay' else {}
+
+    result_df = df.select(
+        pm.gaze.transforms.smooth(
+            method=method, window_length=3, n_components=2, padding='nearest', **kwargs,
+        ),
+    )
+
+    result = np.array(result_df['position'].to_list())
+    np.testing.assert_allclose(result, np.stack([expected, expected], axis=1))
@@ -0,0 +1,221 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test VisualAngleConverter."""
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import pymovements as pm
+from pymovements.gaze import VisualAngleConverter
+
+
+@pytest.fixture(name='pixels')
+def fixture_pixels():
+    return np.random.default_rng(42).uniform(-100, 1400, size=(100, 6))
+
+
+@pytest.mark.parametrize('origin', ['upper left', 'center'])
+@pytest.mark.parametrize('n_components', [2, 4, 6])
+def test_pix2deg_equals_transforms_numpy(pixels, origin, n_components):
+    converter = VisualAngleConverter((1280, 1024), (38.0, 30.0), 68.0, origin)
+
+    expected = pm.gaze.transforms_numpy.pix2deg(
+        pixels[:, :n_components],
+        screen_px=(1280, 1024),
+        screen_cm=(38.0, 30.0),
+        distance_cm=68.0,
+        origin=origin,
+    )
+
+    np.testing.assert_allclose(converter.pix2deg(pixels[:, :n_components]), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('origin', ['upper left', 'center'])
+@pytest.mark.parametrize('n_components', [2, 4, 6])
+def test_deg2pix_inverts_pix2deg(pixels, origin, n_components):
+    converter = VisualAngleConverter((1280, 1024), (38.0, 30.0), 68.0, origin)
+
+    positions = converter.pix2deg(pixels[:, :n_components])
+
+    np.testing.assert_allclose(converter.deg2pix(positions), pixels[:, :n_components])
+
+
+def test_pix2deg_single_sample():
+    converter = VisualAngleConverter((1280, 1024), (38.0, 30.0), 68.0)
+
+    np.testing.assert_allclose(
+        converter.pix2deg([123.0, 865.0]), [-12.70732231, 8.65963972], rtol=1e-8,
+    )
+
+
+def test_pix2deg_with_distance_per_sample(pixels):
+    converter = VisualAngleConverter((1280, 1024), (38.0, 30.0))
+    distance_cm = np.linspace(50, 80, len(pixels))
+
+    expected = [
+        VisualAngleConverter((1280, 1024), (38.0, 30.0), distance).pix2deg(sample)
+        for sample, distance in zip(pixels[:, :4], distance_cm)
+    ]
+
+    np.testing.assert_allclose(converter.pix2deg(pixels[:, :4], distance_cm), expected)
+    np.testing.assert_allclose(
+        converter.deg2pix(converter.pix2deg(pixels[:, :4], distance_cm), distance_cm),
+        pixels[:, :4],
+    )
+
+
+@pytest.mark.parametrize('origin', ['upper left', 'center'])
+@pytest.mark.parametrize('n_components', [2, 4])
+def test_expressions_equal_transforms(pixels, origin, n_components):
+    converter = VisualAngleConverter((1280, 1024), (38.0, 30.0), 68.0, origin)
+    df = pl.DataFrame({'pixel': pixels[:, :n_components].tolist()})
+    kwargs = {
+        'screen_resolution': (1280, 1024),
+        'screen_size': (38.0, 30.0),
+        'distance': 68.0,
+        'n_components': n_components,
+    }
+
+    position = df.select(converter.pix2deg_expr(n_components))
+    assert_frame_equal(
+        position, df.select(pm.gaze.transforms.pix2deg(origin=origin, **kwargs)),
+    )
+    np.testing.assert_allclose(
+        np.array(position['position'].to_list()),
+        converter.pix2deg(pixels[:, :n_components]),
+        rtol=1e-12,
+    )
+
+    pixel = position.select(converter.deg2pix_expr(n_components))
+    assert_frame_equal(
+        pixel, position.select(pm.gaze.transforms.deg2pix(pixel_origin=origin, **kwargs)),
+    )
+
+
+def test_expressions_with_distance_column(pixels):
+    converter = VisualAngleConverter((1280, 1024), (38.0, 30.0))
+    distance_cm = np.linspace(50, 80, len(pixels))
+    df = pl.DataFrame({'pixel': pixels[:, :2].tolist(), 'distance': distance_cm * 10})
+
+    position = df.select(
+        converter.pix2deg_expr(2, distance_column='distance'), pl.col('distance'),
+    )
+    pixel = position.select(converter.deg2pix_expr(2, distance_column='distance'))
+
+    np.testing.assert_allclose(
+        np.array(position['position'].to_list()),
+        converter.pix2deg(pixels[:, :2], distance_cm),
+    )
+    np.testing.assert_allclose(np.array(pixel['pixel'].to_list()), pixels[:, :2])
+
+
+def test_cached_returns_same_converter():
+    converter = VisualAngleConverter.cached((1280, 1024), (38.0, 30.0), 68.0)
+
+    assert VisualAngleConverter.cached([1280, 1024], [38.0, 30.0], 68.0) is converter
+    assert VisualAngleConverter.cached((1280, 1024), (38.0, 30.0), 60.0) is not converter
+
+
+def test_screen_visual_angle_converter_follows_screen_attributes():
+    screen = pm.Screen(1280, 1024, 38.0, 30.0, 68.0, 'upper left')
+    converter = screen.visual_angle_converter
+
+    assert screen.visual_angle_converter is converter
+
+    screen.distance_cm = 60.0
+
+    assert screen.visual_angle_converter is not converter
+    assert screen.visual_angle_converter.distance_cm == 60.0
+
+
+def test_converter_attributes():
+    converter = VisualAngleConverter((1280, 1024), (40.0, 32.0), 50.0)
+
+    assert converter.pixels_per_cm == (32.0, 32.0)
+    assert converter.distance_px == (1600.0, 1600.0)
+    assert converter.origin_offset == (639.5, 511.5)
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'exception', 'message'),
+    [
+        pytest.param(
+            {'screen_resolution': (1280, 1024), 'screen_size': (38.0, 30.0), 'origin': 'foobar'},
+            ValueError,
+            "value `foobar` for argument `origin` is invalid.  Valid values are: "
+            "['center', 'upper left']",
+            id='invalid_origin',
+        ),
+        pytest.param(
+            {
+                'screen_resolution': (1280, 1024),
+                'screen_size': (38.0, 30.0),
+                'origin': 'lower left',
+            },
+            ValueError,
+            'origin string lower left was corrected to upper left. please update your definition',
+            id='lower_left_origin',
+        ),
+        pytest.param(
+            {'screen_resolution': (1280, 1024), 'screen_size': (38.0, 30.0), 'distance_cm': 0},
+            ValueError,
+            "'distance' must be greater than zero but is 0",
+            id='zero_distance',
+        ),
+        pytest.param(
+            {'screen_resolution': 1280, 'screen_size': (38.0, 30.0)},
+            TypeError,
+            'screen_resolution must be of type tuple[int, int], but is of type int',
+            id='scalar_screen_resolution',
+        ),
+    ],
+)
+def test_converter_init_raises_error(kwargs, exception, message):
+    with pytest.raises(exception) as exc_info:
+        VisualAngleConverter(**kwargs)
+
+    msg, = exc_info.value.args
+    assert msg == message
+
+
+@pytest.mark.parametrize('arr', [1.0, [[1.0, 2.0, 3.0]]])
+@pytest.mark.parametrize('method', ['pix2deg', 'deg2pix'])
+def test_conversion_odd_components_raises_value_error(arr, method):
+    converter = VisualAngleConverter((1280, 1024), (38.0, 30.0), 68.0)
+
+    with pytest.raises(ValueError, match='must contain an even number of components'):
+        getattr(converter, method)(arr)
+
+
+@pytest.mark.parametrize('method', ['pix2deg', 'deg2pix'])
+def test_conversion_without_distance_raises_value_error(method):
+    converter = VisualAngleConverter((1280, 1024), (38.0, 30.0))
+
+    with pytest.raises(ValueError, match='distance_cm must be passed'):
+        getattr(converter, method)([[1.0, 2.0]])
+
+
+@pytest.mark.parametrize('method', ['pix2deg_expr', 'deg2pix_expr'])
+def test_expression_without_distance_raises_value_error(method):
+    converter = VisualAngleConverter((1280, 1024), (38.0, 30.0))
+
+    with pytest.raises(ValueError, match='distance_column must be passed'):
+        getattr(converter, method)(2)
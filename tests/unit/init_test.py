@@ -0,0 +1,75 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test lazy loading of the top-level pymovements module."""
+import subprocess
+import sys
+
+import pytest
+
+import pymovements as pm
+
+
+@pytest.mark.parametrize('name', pm.__all__)
+def test_public_attribute_is_accessible(name):
+    assert getattr(pm, name) is not None
+
+
+@pytest.mark.parametrize('name', pm.__all__)
+def test_public_attribute_is_listed_in_dir(name):
+    assert name in dir(pm)
+
+
+def test_version_is_str():
+    assert isinstance(pm.__version__, str)
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError) as excinfo:
+        pm.foobar  # pylint: disable=pointless-statement
+
+    assert str(excinfo.value) == "module 'pymovements' has no attribute 'foobar'"
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        pytest.param('import pymovements', id='import'),
+        pytest.param('import pymovements; pymovements.Gaze', id='import_gaze'),
+        pytest.param('import pymovements; pymovements.Dataset', id='import_dataset'),
+    ],
+)
+@pytest.mark.parametrize('module', ['matplotlib', 'scipy'])
+def test_import_does_not_load_heavy_dependencies(statement, module):
+    code = f'{statement}; import sys; assert {module!r} not in sys.modules'
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+@pytest.mark.parametrize(
+    'module',
+    [
+        'pymovements.events',
+        'pymovements.events.detection',
+        'pymovements.gaze',
+        'pymovements.gaze.stream_server',
+        'pymovements.dataset',
+    ],
+)
+def test_submodule_can_be_imported_first(module):
+    subprocess.run([sys.executable, '-c', f'import {module}'], check=True)